@@ -198,6 +198,7 @@ class Transaction:
     amount_sent: Decimal
     amount_received: Decimal
     purpose: str
+    plan_id: Optional[UUID]
 
     def __hash__(self) -> int:
         return hash(self.id)
@@ -219,6 +220,7 @@ class Message:
     sender_remarks: Optional[str]
     user_action: Optional[UserAction]
     is_read: bool
+    sent_on: datetime
 
 
 @dataclass
@@ -27,7 +27,3 @@ class CompanyCantBuyPublicServices(Exception):
         self.company = company
         self.plan = plan
         super().__init__()
-
-
-class CannotSendEmail(Exception):
-    pass
@@ -0,0 +1,59 @@
+"""Keyset pagination for listings that can grow with the size of the
+economy.
+
+A page is requested with an opaque cursor and a page size. The cursor
+encodes the sort key of the last item of the previous page, so that
+the next page starts right after that item no matter how many rows
+were inserted or deleted in the meantime.
+"""
+
+from __future__ import annotations
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from typing import Any, Generic, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class PageRequest:
+    cursor: Optional[str] = None
+    size: int = DEFAULT_PAGE_SIZE
+
+    def __post_init__(self) -> None:
+        self.size = max(1, min(self.size, MAX_PAGE_SIZE))
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(sort_key: Sequence[Any]) -> str:
+    """Encode the sort key of the last item of a page. The values of
+    the sort key must be serializable to json.
+    """
+    serialized = json.dumps(list(sort_key), separators=(",", ":"))
+    return urlsafe_b64encode(serialized.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], length: int) -> Optional[List[Any]]:
+    """Return the sort key encoded in the cursor or None if there is no
+    cursor or it is malformed, in which case the listing starts with
+    its first page.
+    """
+    if not cursor:
+        return None
+    try:
+        decoded = json.loads(urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        return None
+    if not isinstance(decoded, list) or len(decoded) != length:
+        return None
+    return decoded
@@ -6,8 +6,7 @@ from uuid import UUID
 from injector import inject
 
 from arbeitszeit.entities import Plan
-from arbeitszeit.price_calculator import calculate_price
-from arbeitszeit.repositories import PlanCooperationRepository
+from arbeitszeit.price_calculator import PriceCalculator
 
 
 @dataclass
@@ -35,12 +34,10 @@ class PlanSummary:
 @inject
 @dataclass
 class PlanSummaryService:
-    plan_cooperation_repository: PlanCooperationRepository
+    price_calculator: PriceCalculator
 
     def get_summary_from_plan(self, plan: Plan) -> PlanSummary:
-        price_per_unit = calculate_price(
-            self.plan_cooperation_repository.get_cooperating_plans(plan.id)
-        )
+        price_per_unit = self.price_calculator.calculate_cooperative_price(plan)
         return PlanSummary(
             plan_id=plan.id,
             is_active=plan.is_active,
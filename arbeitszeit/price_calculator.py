@@ -1,9 +1,13 @@
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import List
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from injector import inject
 
 from arbeitszeit.decimal import decimal_sum
 from arbeitszeit.entities import Plan
+from arbeitszeit.repositories import CooperationRepository, PlanCooperationRepository
 
 
 @dataclass
@@ -14,6 +18,68 @@ class PriceComponents:
     is_public_service: bool
 
 
+@inject
+@dataclass
+class PriceCalculator:
+    """The price of a cooperation is stored with the cooperation and
+    recalculated whenever plans join or leave it, so that the price of a
+    plan can be looked up without loading the other plans of its
+    cooperation.
+
+    Listings should price all of their plans with one call to
+    calculate_cooperative_prices, which needs a fixed number of queries
+    regardless of the number of plans and cooperations.
+    """
+
+    cooperation_repository: CooperationRepository
+    plan_cooperation_repository: PlanCooperationRepository
+
+    def calculate_individual_price(self, plan: Plan) -> Decimal:
+        return calculate_price([plan])
+
+    def calculate_cooperative_price(self, plan: Plan) -> Decimal:
+        return self.calculate_cooperative_prices([plan])[plan.id]
+
+    def calculate_cooperative_prices(
+        self, plans: Iterable[Plan]
+    ) -> Dict[UUID, Decimal]:
+        """Map the ids of the plans to their prices per unit."""
+        plans = list(plans)
+        cooperation_ids = {plan.cooperation for plan in plans if plan.cooperation}
+        cooperation_prices: Dict[UUID, Decimal] = dict()
+        if cooperation_ids:
+            cooperation_prices = self.cooperation_repository.get_prices_per_unit(
+                cooperation_ids
+            )
+        unpriced_cooperations = cooperation_ids - cooperation_prices.keys()
+        if unpriced_cooperations:
+            repository = self.plan_cooperation_repository
+            plans_by_cooperation = repository.get_plans_in_cooperations(
+                unpriced_cooperations
+            )
+            for cooperation_id, cooperating_plans in plans_by_cooperation.items():
+                cooperation_prices[cooperation_id] = calculate_price(cooperating_plans)
+        return {
+            plan.id: cooperation_prices[plan.cooperation]
+            if plan.cooperation
+            else calculate_price([plan])
+            for plan in plans
+        }
+
+    def update_cooperation_price(self, cooperation_id: UUID) -> None:
+        self.cooperation_repository.set_price_per_unit(
+            cooperation_id, self._calculate_cooperation_price(cooperation_id)
+        )
+
+    def _calculate_cooperation_price(self, cooperation_id: UUID) -> Optional[Decimal]:
+        plans = list(
+            self.plan_cooperation_repository.get_plans_in_cooperation(cooperation_id)
+        )
+        if not plans:
+            return None
+        return calculate_price(plans)
+
+
 def calculate_price(cooperating_plans: List[Plan]) -> Decimal:
     components = [
         PriceComponents(
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Iterable, Iterator, List, Optional, Protocol, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Protocol, Tuple, Union
 from uuid import UUID
 
 from arbeitszeit.entities import (
@@ -21,6 +22,7 @@ from arbeitszeit.entities import (
     SocialAccounting,
     Transaction,
 )
+from arbeitszeit.pagination import Page, PageRequest
 from arbeitszeit.user_action import UserAction
 
 
@@ -33,6 +35,13 @@ class CompanyWorkerRepository(ABC):
     def get_company_workers(self, company: Company) -> Iterable[Member]:
         pass
 
+    @abstractmethod
+    def get_page_of_company_workers(
+        self, company: Company, page: PageRequest
+    ) -> Page[Member]:
+        """Workers ordered by name and id."""
+        pass
+
     @abstractmethod
     def get_member_workplaces(self, member: UUID) -> Iterable[Company]:
         pass
@@ -53,8 +62,8 @@ class PurchaseRepository(ABC):
 
     @abstractmethod
     def get_purchases_descending_by_date(
-        self, user: Union[Member, Company]
-    ) -> Iterator[Purchase]:
+        self, user: Union[Member, Company], page: PageRequest
+    ) -> Page[Purchase]:
         pass
 
 
@@ -89,6 +98,10 @@ class PlanRepository(ABC):
     def increase_payout_count_by_one(self, plan: Plan) -> None:
         pass
 
+    @abstractmethod
+    def increase_payout_counts(self, payout_counts: List[Tuple[Plan, int]]) -> None:
+        pass
+
     @abstractmethod
     def get_plan_by_id(self, id: UUID) -> Optional[Plan]:
         pass
@@ -97,6 +110,11 @@ class PlanRepository(ABC):
     def get_active_plans(self) -> Iterator[Plan]:
         pass
 
+    @abstractmethod
+    def get_page_of_active_plans(self, page: PageRequest) -> Page[Plan]:
+        """Active plans ordered by product name and id."""
+        pass
+
     @abstractmethod
     def get_three_latest_active_plans_ordered_by_activation_date(
         self,
@@ -127,6 +145,18 @@ class PlanRepository(ABC):
     def sum_of_active_planned_means(self) -> Decimal:
         pass
 
+    @abstractmethod
+    def sum_of_active_productive_costs_per_day(self) -> ProductionCosts:
+        """Sum of production costs divided by timeframe over all active
+        productive plans."""
+        pass
+
+    @abstractmethod
+    def sum_of_active_public_costs_per_day(self) -> ProductionCosts:
+        """Sum of production costs divided by timeframe over all active
+        public plans."""
+        pass
+
     @abstractmethod
     def all_plans_approved_and_not_expired(self) -> Iterator[Plan]:
         pass
@@ -148,11 +178,17 @@ class PlanRepository(ABC):
         pass
 
     @abstractmethod
-    def query_active_plans_by_product_name(self, query: str) -> Iterator[Plan]:
+    def query_active_plans_by_product_name(
+        self, query: str, page: PageRequest
+    ) -> Page[Plan]:
+        """Active plans ordered by relevance and id."""
         pass
 
     @abstractmethod
-    def query_active_plans_by_plan_id(self, query: str) -> Iterator[Plan]:
+    def query_active_plans_by_plan_id(
+        self, query: str, page: PageRequest
+    ) -> Page[Plan]:
+        """Active plans ordered by id."""
         pass
 
     @abstractmethod
@@ -168,6 +204,33 @@ class PlanRepository(ABC):
         pass
 
 
+@dataclass
+class NewTransaction:
+    date: datetime
+    sending_account: Account
+    receiving_account: Account
+    amount_sent: Decimal
+    amount_received: Decimal
+    purpose: str
+    plan_id: Optional[UUID] = None
+
+
+@dataclass
+class BalanceHistoryEntry:
+    date: datetime
+    balance: Decimal
+
+
+@dataclass
+class MessageSummary:
+    """What an inbox lists of a message."""
+
+    id: UUID
+    title: str
+    sender_name: str
+    is_read: bool
+
+
 class TransactionRepository(ABC):
     @abstractmethod
     def create_transaction(
@@ -178,9 +241,14 @@ class TransactionRepository(ABC):
         amount_sent: Decimal,
         amount_received: Decimal,
         purpose: str,
+        plan_id: Optional[UUID] = None,
     ) -> Transaction:
         pass
 
+    @abstractmethod
+    def create_transactions(self, transactions: List[NewTransaction]) -> None:
+        pass
+
     @abstractmethod
     def all_transactions_sent_by_account(self, account: Account) -> List[Transaction]:
         pass
@@ -191,10 +259,30 @@ class TransactionRepository(ABC):
     ) -> List[Transaction]:
         pass
 
+    @abstractmethod
+    def get_transactions_of_accounts(
+        self,
+        accounts: List[Account],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        newest_first: bool = False,
+    ) -> Iterator[Transaction]:
+        """All transactions sent or received by any of the accounts,
+        oldest first unless newest_first is set. Transactions between
+        two of the accounts are returned only once. The transactions
+        are dated at or after start and before end.
+        """
+        pass
+
     @abstractmethod
     def get_sales_balance_of_plan(self, plan: Plan) -> Decimal:
         pass
 
+    @abstractmethod
+    def get_sales_balances_of_plans(self, plans: List[Plan]) -> Dict[UUID, Decimal]:
+        """The sales balance of every one of the plans by plan id."""
+        pass
+
 
 class AccountRepository(ABC):
     @abstractmethod
@@ -205,6 +293,25 @@ class AccountRepository(ABC):
     def get_account_balance(self, account: Account) -> Decimal:
         pass
 
+    @abstractmethod
+    def sum_of_balances_by_account_type(self) -> Dict[AccountTypes, Decimal]:
+        pass
+
+    @abstractmethod
+    def get_account_balance_at(self, account: Account, timestamp: datetime) -> Decimal:
+        pass
+
+    @abstractmethod
+    def get_balance_history(self, account: Account) -> List[BalanceHistoryEntry]:
+        """The balance of the account over time, oldest first."""
+        pass
+
+    @abstractmethod
+    def get_balance_history_revision(self, account: Account) -> str:
+        """A value that changes whenever the balance history of the
+        account changes, and that is cheaper to get than the history."""
+        pass
+
 
 class MemberRepository(ABC):
     @abstractmethod
@@ -246,6 +353,11 @@ class AccountOwnerRepository(ABC):
     ) -> Union[Member, Company, SocialAccounting]:
         pass
 
+    @abstractmethod
+    def get_account_owner_names(self, accounts: Iterable[Account]) -> Dict[UUID, str]:
+        """Map the ids of the accounts to the names of their owners."""
+        pass
+
 
 class CompanyRepository(ABC):
     @abstractmethod
@@ -275,15 +387,18 @@ class CompanyRepository(ABC):
         pass
 
     @abstractmethod
-    def query_companies_by_name(self, query: str) -> Iterator[Company]:
+    def query_companies_by_name(self, query: str, page: PageRequest) -> Page[Company]:
+        """Companies ordered by name and id."""
         pass
 
     @abstractmethod
-    def query_companies_by_email(self, query: str) -> Iterator[Company]:
+    def query_companies_by_email(self, query: str, page: PageRequest) -> Page[Company]:
+        """Companies ordered by name and id."""
         pass
 
     @abstractmethod
-    def get_all_companies(self) -> Iterator[Company]:
+    def get_all_companies(self, page: PageRequest) -> Page[Company]:
+        """Companies ordered by name and id."""
         pass
 
     @abstractmethod
@@ -352,6 +467,7 @@ class MessageRepository(ABC):
         content: str,
         sender_remarks: Optional[str],
         reference: Optional[UserAction],
+        sent_on: datetime,
     ) -> Message:
         pass
 
@@ -365,10 +481,14 @@ class MessageRepository(ABC):
 
     @abstractmethod
     def has_unread_messages_for_user(self, user: UUID) -> bool:
+        """Asked on every page, so it should be cheap to answer."""
         pass
 
     @abstractmethod
-    def get_messages_to_user(self, user: UUID) -> Iterable[Message]:
+    def get_messages_to_user(
+        self, user: UUID, page: PageRequest
+    ) -> Page[MessageSummary]:
+        """Messages to the user, newest first."""
         pass
 
 
@@ -409,6 +529,26 @@ class CooperationRepository(ABC):
     def count_cooperations(self) -> int:
         pass
 
+    @abstractmethod
+    def get_price_per_unit(self, cooperation_id: UUID) -> Optional[Decimal]:
+        """The stored price of the cooperation. None if it was not
+        calculated since plans last joined or left the cooperation."""
+        pass
+
+    @abstractmethod
+    def set_price_per_unit(
+        self, cooperation_id: UUID, price_per_unit: Optional[Decimal]
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def get_prices_per_unit(
+        self, cooperation_ids: Iterable[UUID]
+    ) -> Dict[UUID, Decimal]:
+        """The stored prices of the given cooperations. Cooperations
+        without a stored price are left out."""
+        pass
+
 
 class PlanCooperationRepository(ABC):
     @abstractmethod
@@ -425,10 +565,12 @@ class PlanCooperationRepository(ABC):
 
     @abstractmethod
     def add_plan_to_cooperation(self, plan_id: UUID, cooperation_id: UUID) -> None:
+        """Also resets the stored price of the cooperation."""
         pass
 
     @abstractmethod
     def remove_plan_from_cooperation(self, plan_id: UUID) -> None:
+        """Also resets the stored price of the cooperation."""
         pass
 
     @abstractmethod
@@ -447,6 +589,14 @@ class PlanCooperationRepository(ABC):
     def get_plans_in_cooperation(self, cooperation_id: UUID) -> Iterable[Plan]:
         pass
 
+    @abstractmethod
+    def get_plans_in_cooperations(
+        self, cooperation_ids: Iterable[UUID]
+    ) -> Dict[UUID, List[Plan]]:
+        """The plans of the given cooperations grouped by cooperation.
+        Cooperations without plans are left out."""
+        pass
+
 
 class AccountantRepository(Protocol):
     def create_accountant(self, email: str, name: str, password: str) -> UUID:
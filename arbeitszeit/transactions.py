@@ -36,20 +36,11 @@ class UserAccountingService:
     def get_all_transactions_sorted(
         self, user: Union[Member, Company]
     ) -> List[Transaction]:
-        all_transactions = set()
-        for account in user.accounts():
-            all_transactions.update(
-                self.transaction_repository.all_transactions_sent_by_account(account)
+        return list(
+            self.transaction_repository.get_transactions_of_accounts(
+                user.accounts(), newest_first=True
             )
-            all_transactions.update(
-                self.transaction_repository.all_transactions_received_by_account(
-                    account
-                )
-            )
-        all_transactions_sorted = sorted(
-            all_transactions, key=lambda x: x.date, reverse=True
         )
-        return all_transactions_sorted
 
     def get_account_transactions_sorted(
         self, user: Union[Member, Company], queried_account_type: AccountTypes
@@ -57,19 +48,11 @@ class UserAccountingService:
         for acc in user.accounts():
             if acc.account_type == queried_account_type:
                 queried_account = acc
-        transactions = set()
-        transactions.update(
-            self.transaction_repository.all_transactions_sent_by_account(
-                queried_account
-            )
-        )
-        transactions.update(
-            self.transaction_repository.all_transactions_received_by_account(
-                queried_account
+        return list(
+            self.transaction_repository.get_transactions_of_accounts(
+                [queried_account], newest_first=True
             )
         )
-        transactions_sorted = sorted(transactions, key=lambda x: x.date, reverse=True)
-        return transactions_sorted
 
     def user_is_sender(
         self, transaction: Transaction, user: Union[Member, Company]
@@ -133,7 +133,6 @@ from .request_cooperation import (
 from .resend_confirmation_mail import (
     ResendConfirmationMail,
     ResendConfirmationMailRequest,
-    ResendConfirmationMailResponse,
 )
 from .seek_approval import SeekApproval
 from .send_work_certificates_to_worker import (
@@ -268,7 +267,6 @@ __all__ = [
     "RequestCooperationResponse",
     "ResendConfirmationMail",
     "ResendConfirmationMailRequest",
-    "ResendConfirmationMailResponse",
     "SeekApproval",
     "SendWorkCertificatesToWorker",
     "SendWorkCertificatesToWorkerRequest",
@@ -5,6 +5,7 @@ from uuid import UUID
 
 from injector import inject
 
+from arbeitszeit.price_calculator import PriceCalculator
 from arbeitszeit.repositories import (
     CompanyRepository,
     CooperationRepository,
@@ -45,6 +46,7 @@ class AcceptCooperation:
     cooperation_repository: CooperationRepository
     plan_cooperation_repository: PlanCooperationRepository
     company_repository: CompanyRepository
+    price_calculator: PriceCalculator
 
     def __call__(self, request: AcceptCooperationRequest) -> AcceptCooperationResponse:
         try:
@@ -58,6 +60,7 @@ class AcceptCooperation:
         self.plan_cooperation_repository.set_requested_cooperation_to_none(
             request.plan_id
         )
+        self.price_calculator.update_cooperation_price(request.cooperation_id)
         return AcceptCooperationResponse(rejection_reason=None)
 
     def _validate_request(self, request: AcceptCooperationRequest) -> None:
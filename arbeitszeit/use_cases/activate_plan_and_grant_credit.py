@@ -45,4 +45,5 @@ class ActivatePlanAndGrantCredit:
             amount_sent=round(amount, 2),
             amount_received=round(amount, 2),
             purpose=f"Plan-Id: {plan.id}",
+            plan_id=plan.id,
         )
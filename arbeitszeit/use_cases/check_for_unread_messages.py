@@ -3,7 +3,7 @@ from uuid import UUID
 
 from injector import inject
 
-from arbeitszeit.repositories import MemberRepository, MessageRepository
+from arbeitszeit.repositories import MessageRepository
 
 
 @dataclass
@@ -19,18 +19,15 @@ class CheckForUnreadMessagesResponse:
 @inject
 @dataclass
 class CheckForUnreadMessages:
-    member_repository: MemberRepository
     message_repository: MessageRepository
 
     def __call__(
         self, request: CheckForUnreadMessagesRequest
     ) -> CheckForUnreadMessagesResponse:
-        if self.member_repository.get_by_id(request.user) is None:
-            return CheckForUnreadMessagesResponse(has_unread_messages=False)
-        else:
-            has_unread_messages = self.message_repository.has_unread_messages_for_user(
+        # Users that do not exist have no messages, so the user is not
+        # looked up separately.
+        return CheckForUnreadMessagesResponse(
+            has_unread_messages=self.message_repository.has_unread_messages_for_user(
                 request.user
             )
-            return CheckForUnreadMessagesResponse(
-                has_unread_messages=has_unread_messages
-            )
+        )
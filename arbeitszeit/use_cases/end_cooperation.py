@@ -5,6 +5,7 @@ from uuid import UUID
 
 from injector import inject
 
+from arbeitszeit.price_calculator import PriceCalculator
 from arbeitszeit.repositories import (
     CompanyRepository,
     CooperationRepository,
@@ -42,6 +43,7 @@ class EndCooperation:
     cooperation_repository: CooperationRepository
     company_repository: CompanyRepository
     plan_cooperation_repository: PlanCooperationRepository
+    price_calculator: PriceCalculator
 
     def __call__(self, request: EndCooperationRequest) -> EndCooperationResponse:
         try:
@@ -49,6 +51,7 @@ class EndCooperation:
         except EndCooperationResponse.RejectionReason as reason:
             return EndCooperationResponse(rejection_reason=reason)
         self.plan_cooperation_repository.remove_plan_from_cooperation(request.plan_id)
+        self.price_calculator.update_cooperation_price(request.cooperation_id)
         return EndCooperationResponse(rejection_reason=None)
 
     def _validate_request(self, request: EndCooperationRequest) -> None:
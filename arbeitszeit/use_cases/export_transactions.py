@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterator, Optional, Union
+from uuid import UUID
+
+from injector import inject
+
+from arbeitszeit.entities import AccountTypes, Company, Member, Transaction
+from arbeitszeit.repositories import (
+    CompanyRepository,
+    MemberRepository,
+    TransactionRepository,
+)
+from arbeitszeit.transactions import TransactionTypes, UserAccountingService
+
+
+@inject
+@dataclass
+class ExportTransactions:
+    """The transactions of all accounts of a company or a member, oldest
+    first. The transactions are produced one by one while the response
+    is consumed, so that histories of any length can be exported."""
+
+    @dataclass
+    class Request:
+        user: UUID
+        start: Optional[datetime] = None
+        end: Optional[datetime] = None
+
+    @dataclass
+    class ExportedTransaction:
+        date: datetime
+        account_type: AccountTypes
+        transaction_type: TransactionTypes
+        transaction_volume: Decimal
+        purpose: str
+
+    @dataclass
+    class Response:
+        transactions: Iterator[ExportTransactions.ExportedTransaction]
+
+    accounting_service: UserAccountingService
+    company_repository: CompanyRepository
+    member_repository: MemberRepository
+    transaction_repository: TransactionRepository
+
+    def __call__(self, request: Request) -> Response:
+        user: Optional[Union[Company, Member]] = self.company_repository.get_by_id(
+            request.user
+        ) or self.member_repository.get_by_id(request.user)
+        assert user
+        return self.Response(
+            transactions=(
+                self._export_transaction(user, transaction)
+                for transaction in self.transaction_repository.get_transactions_of_accounts(
+                    user.accounts(), start=request.start, end=request.end
+                )
+            )
+        )
+
+    def _export_transaction(
+        self, user: Union[Company, Member], transaction: Transaction
+    ) -> ExportedTransaction:
+        user_is_sender = self.accounting_service.user_is_sender(transaction, user)
+        account = (
+            transaction.sending_account
+            if user_is_sender
+            else transaction.receiving_account
+        )
+        return self.ExportedTransaction(
+            date=transaction.date,
+            account_type=account.account_type,
+            transaction_type=self.accounting_service.get_transaction_type(
+                transaction, user_is_sender
+            ),
+            transaction_volume=self.accounting_service.get_transaction_volume(
+                transaction, user_is_sender
+            ),
+            purpose=transaction.purpose,
+        )
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import List
+from uuid import UUID
+
+from injector import inject
+
+from arbeitszeit.entities import AccountTypes
+from arbeitszeit.repositories import AccountRepository, CompanyRepository
+
+
+@inject
+@dataclass
+class GetCompanyAccountHistory:
+    """The balance history of one of the accounts of a company, as it
+    is shown in the account plots."""
+
+    @dataclass
+    class Request:
+        company_id: UUID
+        account_type: AccountTypes
+
+    @dataclass
+    class Response:
+        timestamps: List[datetime]
+        balances: List[Decimal]
+
+    company_repository: CompanyRepository
+    account_repository: AccountRepository
+
+    def __call__(self, request: Request) -> Response:
+        company = self.company_repository.get_by_id(request.company_id)
+        assert company
+        (account,) = [
+            account
+            for account in company.accounts()
+            if account.account_type == request.account_type
+        ]
+        history = self.account_repository.get_balance_history(account)
+        return self.Response(
+            timestamps=[entry.date for entry in history],
+            balances=[entry.balance for entry in history],
+        )
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from injector import inject
+
+from arbeitszeit.entities import AccountTypes
+from arbeitszeit.repositories import AccountRepository, CompanyRepository
+
+
+@inject
+@dataclass
+class GetCompanyAccountHistoryRevision:
+    """Identifies the balance history that GetCompanyAccountHistory
+    would return for the same request, without reading it. Equal
+    revisions of the same account mean equal histories."""
+
+    @dataclass
+    class Request:
+        company_id: UUID
+        account_type: AccountTypes
+
+    @dataclass
+    class Response:
+        account_id: UUID
+        revision: str
+
+    company_repository: CompanyRepository
+    account_repository: AccountRepository
+
+    def __call__(self, request: Request) -> Response:
+        company = self.company_repository.get_by_id(request.company_id)
+        assert company
+        (account,) = [
+            account
+            for account in company.accounts()
+            if account.account_type == request.account_type
+        ]
+        return self.Response(
+            account_id=account.id,
+            revision=self.account_repository.get_balance_history_revision(account),
+        )
@@ -67,7 +67,10 @@ class GetCompanySummary:
         company = self.company_respository.get_by_id(company_id)
         if company is None:
             return None
-        plans = self.plan_repository.get_all_plans_for_company_descending(company.id)
+        plans = list(
+            self.plan_repository.get_all_plans_for_company_descending(company.id)
+        )
+        sales_balances = self.transaction_repository.get_sales_balances_of_plans(plans)
         expectations = self._get_expectations(company)
         account_balances = self._get_account_balances(company)
         return GetCompanySummarySuccess(
@@ -84,14 +87,15 @@ class GetCompanySummary:
                 )
                 for account_name in ["means", "raw_material", "work", "product"]
             ],
-            plan_details=[self._get_plan_details(plan) for plan in plans],
+            plan_details=[
+                self._get_plan_details(plan, sales_balances[plan.id]) for plan in plans
+            ],
         )
 
-    def _get_plan_details(self, plan: Plan) -> PlanDetails:
+    def _get_plan_details(
+        self, plan: Plan, sales_balance_of_plan: Decimal
+    ) -> PlanDetails:
         expected_sales_volume = plan.expected_sales_value
-        sales_balance_of_plan = self.transaction_repository.get_sales_balance_of_plan(
-            plan
-        )
         return PlanDetails(
             id=plan.id,
             name=plan.prd_name,
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from injector import inject
 
-from arbeitszeit.price_calculator import calculate_price
+from arbeitszeit.price_calculator import PriceCalculator
 from arbeitszeit.repositories import CooperationRepository, PlanCooperationRepository
 
 
@@ -42,26 +42,28 @@ GetCoopSummaryResponse = Optional[GetCoopSummarySuccess]
 class GetCoopSummary:
     cooperation_repository: CooperationRepository
     plan_cooperation_repository: PlanCooperationRepository
+    price_calculator: PriceCalculator
 
     def __call__(self, request: GetCoopSummaryRequest) -> GetCoopSummaryResponse:
         coop = self.cooperation_repository.get_by_id(request.coop_id)
         if coop is None:
             return None
+        plans_in_cooperation = list(
+            self.plan_cooperation_repository.get_plans_in_cooperation(request.coop_id)
+        )
+        coop_prices = self.price_calculator.calculate_cooperative_prices(
+            plans_in_cooperation
+        )
         plans = [
             AssociatedPlan(
                 plan_id=plan.id,
                 plan_name=plan.prd_name,
-                plan_individual_price=plan.production_costs.total_cost()
-                / plan.prd_amount
-                if not plan.is_public_service
-                else Decimal(0),
-                plan_coop_price=calculate_price(
-                    self.plan_cooperation_repository.get_cooperating_plans(plan.id)
+                plan_individual_price=self.price_calculator.calculate_individual_price(
+                    plan
                 ),
+                plan_coop_price=coop_prices[plan.id],
             )
-            for plan in self.plan_cooperation_repository.get_plans_in_cooperation(
-                request.coop_id
-            )
+            for plan in plans_in_cooperation
         ]
         return GetCoopSummarySuccess(
             requester_is_coordinator=bool(coop.coordinator.id == request.requester_id),
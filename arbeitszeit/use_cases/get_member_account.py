@@ -6,13 +6,7 @@ from uuid import UUID
 
 from injector import inject
 
-from arbeitszeit.entities import (
-    AccountTypes,
-    Company,
-    Member,
-    SocialAccounting,
-    Transaction,
-)
+from arbeitszeit.entities import Account, AccountTypes, Company, Member, Transaction
 from arbeitszeit.repositories import (
     AccountOwnerRepository,
     AccountRepository,
@@ -21,7 +15,6 @@ from arbeitszeit.repositories import (
 from arbeitszeit.transactions import UserAccountingService
 
 User = Union[Member, Company]
-UserOrSocialAccounting = Union[User, SocialAccounting]
 
 
 @dataclass
@@ -49,28 +42,33 @@ class GetMemberAccount:
     def __call__(self, member_id: UUID) -> GetMemberAccountResponse:
         member = self.member_repository.get_by_id(member_id)
         assert member
+        transactions = self.accounting_service.get_account_transactions_sorted(
+            member, AccountTypes.member
+        )
+        peer_accounts = [
+            self._get_peer_account(member, transaction) for transaction in transactions
+        ]
+        peer_names = self.acount_owner_repository.get_account_owner_names(peer_accounts)
         transaction_info = [
-            self._create_info(member, transaction)
-            for transaction in self.accounting_service.get_account_transactions_sorted(
-                member, AccountTypes.member
-            )
+            self._create_info(member, transaction, peer_names[peer_account.id])
+            for transaction, peer_account in zip(transactions, peer_accounts)
         ]
         balance = self.account_repository.get_account_balance(member.account)
         return GetMemberAccountResponse(transaction_info, balance)
 
+    def _get_peer_account(self, user: Member, transaction: Transaction) -> Account:
+        if self.accounting_service.user_is_sender(transaction, user):
+            return transaction.receiving_account
+        else:
+            return transaction.sending_account
+
     def _create_info(
         self,
         user: Member,
         transaction: Transaction,
+        peer_name: str,
     ) -> TransactionInfo:
-        sender = self.acount_owner_repository.get_account_owner(
-            transaction.sending_account
-        )
-        receiver = self.acount_owner_repository.get_account_owner(
-            transaction.receiving_account
-        )
         user_is_sender = self.accounting_service.user_is_sender(transaction, user)
-        peer_name = self._get_peer_name(user_is_sender, sender, receiver)
         transaction_volume = self.accounting_service.get_transaction_volume(
             transaction, user_is_sender
         )
@@ -80,14 +78,3 @@ class GetMemberAccount:
             transaction_volume,
             transaction.purpose,
         )
-
-    def _get_peer_name(
-        self,
-        user_is_sender: bool,
-        sender: UserOrSocialAccounting,
-        receiver: UserOrSocialAccounting,
-    ) -> str:
-        if user_is_sender:
-            return receiver.get_name()
-        else:
-            return sender.get_name()
@@ -4,6 +4,7 @@ from typing import Tuple
 
 from injector import inject
 
+from arbeitszeit.entities import AccountTypes
 from arbeitszeit.repositories import (
     AccountRepository,
     CompanyRepository,
@@ -59,35 +60,11 @@ class GetStatistics:
     def _count_certificates_and_available_product(self) -> Tuple[Decimal, Decimal]:
         """
         available certificates is sum of company work account balances and sum of member account balances
+        available product is sum of prd account balances *(-1)
         """
-        (
-            certs_in_company_accounts,
-            available_product,
-        ) = self._count_certs_and_products_from_companies()
-
-        certs_in_member_accounts = self._count_certs_in_member_accounts()
-        certs_total = certs_in_company_accounts + certs_in_member_accounts
+        balances = self.account_respository.sum_of_balances_by_account_type()
+        certs_total = balances.get(AccountTypes.a, Decimal(0)) + balances.get(
+            AccountTypes.member, Decimal(0)
+        )
+        available_product = balances.get(AccountTypes.prd, Decimal(0)) * -1
         return certs_total, available_product
-
-    def _count_certs_and_products_from_companies(self) -> Tuple[Decimal, Decimal]:
-        """available product is sum of prd account balances *(-1)"""
-        certs_in_company_accounts = Decimal(0)
-        available_product = Decimal(0)
-        all_companies = self.company_repository.get_all_companies()
-        for company in all_companies:
-            available_product += self.account_respository.get_account_balance(
-                company.product_account
-            )
-            certs_in_company_accounts += self.account_respository.get_account_balance(
-                company.work_account
-            )
-        return certs_in_company_accounts, available_product * -1
-
-    def _count_certs_in_member_accounts(self) -> Decimal:
-        certs_in_member_accounts = Decimal(0)
-        all_members = self.member_repository.get_all_members()
-        for member in all_members:
-            certs_in_member_accounts += self.account_respository.get_account_balance(
-                member.account
-            )
-        return certs_in_member_accounts
@@ -4,6 +4,7 @@ from uuid import UUID
 
 from injector import inject
 
+from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.repositories import (
     CompanyRepository,
     MemberRepository,
@@ -32,6 +33,7 @@ class InviteWorkerToCompany:
     member_repository: MemberRepository
     company_repository: CompanyRepository
     message_repository: MessageRepository
+    datetime_service: DatetimeService
 
     def __call__(
         self, request: InviteWorkerToCompanyRequest
@@ -60,5 +62,6 @@ class InviteWorkerToCompany:
                     type=UserActionType.answer_invite,
                     reference=invite_id,
                 ),
+                sent_on=self.datetime_service.now(),
             )
             return InviteWorkerToCompanyResponse(is_success=True, invite_id=invite_id)
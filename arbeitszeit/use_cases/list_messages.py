@@ -1,20 +1,17 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional
 from uuid import UUID
 
 from injector import inject
 
-from arbeitszeit.entities import Message
-from arbeitszeit.repositories import (
-    CompanyRepository,
-    MemberRepository,
-    MessageRepository,
-)
+from arbeitszeit.pagination import PageRequest
+from arbeitszeit.repositories import MessageRepository, MessageSummary
 
 
 @dataclass
 class ListMessagesRequest:
     user: UUID
+    page: PageRequest = field(default_factory=PageRequest)
 
 
 @dataclass
@@ -28,34 +25,32 @@ class ListedMessage:
 @dataclass
 class ListMessagesResponse:
     messages: List[ListedMessage]
+    next_cursor: Optional[str]
 
 
 @inject
 @dataclass
 class ListMessages:
-    member_repository: MemberRepository
-    company_repository: CompanyRepository
     message_repository: MessageRepository
 
     def __call__(self, request: ListMessagesRequest) -> ListMessagesResponse:
-        if not self._exists_requesting_user(request.user):
-            return ListMessagesResponse(messages=[])
-        messages = self.message_repository.get_messages_to_user(request.user)
+        # Users that do not exist have no messages, so the user is not
+        # looked up separately.
+        messages = self.message_repository.get_messages_to_user(
+            request.user, request.page
+        )
         return ListMessagesResponse(
             messages=[
-                self._create_message_response_model(message) for message in messages
-            ]
+                self._create_message_response_model(message)
+                for message in messages.items
+            ],
+            next_cursor=messages.next_cursor,
         )
 
-    def _exists_requesting_user(self, id: UUID) -> bool:
-        if self.member_repository.get_by_id(id):
-            return True
-        return bool(self.company_repository.get_by_id(id))
-
-    def _create_message_response_model(self, message: Message) -> ListedMessage:
+    def _create_message_response_model(self, message: MessageSummary) -> ListedMessage:
         return ListedMessage(
             title=message.title,
-            sender_name=message.sender.get_name(),
+            sender_name=message.sender_name,
             message_id=message.id,
             is_read=message.is_read,
         )
@@ -1,10 +1,11 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional
 from uuid import UUID
 
 from injector import inject
 
 from arbeitszeit.entities import Member
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit.repositories import CompanyRepository, CompanyWorkerRepository
 
 
@@ -18,11 +19,13 @@ class ListedWorker:
 @dataclass
 class ListWorkersResponse:
     workers: List[ListedWorker]
+    next_cursor: Optional[str]
 
 
 @dataclass
 class ListWorkersRequest:
     company: UUID
+    page: PageRequest = field(default_factory=PageRequest)
 
 
 @inject
@@ -34,10 +37,15 @@ class ListWorkers:
     def __call__(self, request: ListWorkersRequest) -> ListWorkersResponse:
         company = self.company_repository.get_by_id(request.company)
         if company is None:
-            return ListWorkersResponse(workers=[])
-        members = self.company_worker_repository.get_company_workers(company)
+            return ListWorkersResponse(workers=[], next_cursor=None)
+        members = self.company_worker_repository.get_page_of_company_workers(
+            company, request.page
+        )
         return ListWorkersResponse(
-            workers=[self._create_worker_response_model(member) for member in members]
+            workers=[
+                self._create_worker_response_model(member) for member in members.items
+            ],
+            next_cursor=members.next_cursor,
         )
 
     def _create_worker_response_model(self, member: Member) -> ListedWorker:
@@ -1,17 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from decimal import Decimal
 
 from injector import inject
 
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.entities import Member, Plan, PurposesOfPurchases
-from arbeitszeit.price_calculator import calculate_price
-from arbeitszeit.repositories import (
-    PlanCooperationRepository,
-    PurchaseRepository,
-    TransactionRepository,
-)
+from arbeitszeit.price_calculator import PriceCalculator
+from arbeitszeit.repositories import PurchaseRepository, TransactionRepository
 
 
 @inject
@@ -20,7 +17,7 @@ class ConsumerProductTransactionFactory:
     datetime_service: DatetimeService
     purchase_repository: PurchaseRepository
     transaction_repository: TransactionRepository
-    plan_cooperation_repository: PlanCooperationRepository
+    price_calculator: PriceCalculator
 
     def create_consumer_product_transaction(
         self,
@@ -35,7 +32,10 @@ class ConsumerProductTransactionFactory:
             self.datetime_service,
             self.purchase_repository,
             self.transaction_repository,
-            self.plan_cooperation_repository,
+            coop_price_per_unit=self.price_calculator.calculate_cooperative_price(plan),
+            individual_price_per_unit=self.price_calculator.calculate_individual_price(
+                plan
+            ),
         )
 
 
@@ -47,26 +47,22 @@ class ConsumerProductTransaction:
     datetime_service: DatetimeService
     purchase_repository: PurchaseRepository
     transaction_repository: TransactionRepository
-    plan_cooperation_repository: PlanCooperationRepository
+    coop_price_per_unit: Decimal
+    individual_price_per_unit: Decimal
 
     def record_purchase(self) -> None:
-        price_per_unit = calculate_price(
-            self.plan_cooperation_repository.get_cooperating_plans(self.plan.id)
-        )
         self.purchase_repository.create_purchase(
             purchase_date=self.datetime_service.now(),
             plan=self.plan,
             buyer=self.buyer,
-            price_per_unit=price_per_unit,
+            price_per_unit=self.coop_price_per_unit,
             amount=self.amount,
             purpose=PurposesOfPurchases.consumption,
         )
 
     def exchange_currency(self) -> None:
-        coop_price = self.amount * calculate_price(
-            self.plan_cooperation_repository.get_cooperating_plans(self.plan.id)
-        )
-        individual_price = self.amount * calculate_price([self.plan])
+        coop_price = self.amount * self.coop_price_per_unit
+        individual_price = self.amount * self.individual_price_per_unit
         sending_account = self.buyer.account
         self.transaction_repository.create_transaction(
             date=self.datetime_service.now(),
@@ -75,4 +71,5 @@ class ConsumerProductTransaction:
             amount_sent=coop_price,
             amount_received=individual_price,
             purpose=f"Plan-Id: {self.plan.id}",
+            plan_id=self.plan.id,
         )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from decimal import Decimal
 from enum import Enum, auto
 from typing import Optional, Tuple
 from uuid import UUID
@@ -9,10 +10,9 @@ from injector import inject
 
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.entities import Company, Plan, PurposesOfPurchases
-from arbeitszeit.price_calculator import calculate_price
+from arbeitszeit.price_calculator import PriceCalculator
 from arbeitszeit.repositories import (
     CompanyRepository,
-    PlanCooperationRepository,
     PlanRepository,
     PurchaseRepository,
     TransactionRepository,
@@ -107,30 +107,26 @@ class Payment:
     purchase_repository: PurchaseRepository
     transaction_repository: TransactionRepository
     datetime_service: DatetimeService
-    plan_cooperation_repository: PlanCooperationRepository
     plan: Plan
     buyer: Company
     amount: int
     purpose: PurposesOfPurchases
+    coop_price_per_unit: Decimal
+    individual_price_per_unit: Decimal
 
     def record_purchase(self) -> None:
-        price_per_unit = calculate_price(
-            self.plan_cooperation_repository.get_cooperating_plans(self.plan.id)
-        )
         self.purchase_repository.create_purchase(
             purchase_date=self.datetime_service.now(),
             plan=self.plan,
             buyer=self.buyer,
-            price_per_unit=price_per_unit,
+            price_per_unit=self.coop_price_per_unit,
             amount=self.amount,
             purpose=self.purpose,
         )
 
     def create_transaction(self) -> None:
-        coop_price = self.amount * calculate_price(
-            self.plan_cooperation_repository.get_cooperating_plans(self.plan.id)
-        )
-        individual_price = self.amount * calculate_price([self.plan])
+        coop_price = self.amount * self.coop_price_per_unit
+        individual_price = self.amount * self.individual_price_per_unit
         if self.purpose == PurposesOfPurchases.means_of_prod:
             sending_account = self.buyer.means_account
         elif self.purpose == PurposesOfPurchases.raw_materials:
@@ -143,6 +139,7 @@ class Payment:
             amount_sent=coop_price,
             amount_received=individual_price,
             purpose=f"Plan-Id: {self.plan.id}",
+            plan_id=self.plan.id,
         )
 
 
@@ -152,7 +149,7 @@ class PaymentFactory:
     purchase_repository: PurchaseRepository
     transaction_repository: TransactionRepository
     datetime_service: DatetimeService
-    plan_cooperation_repository: PlanCooperationRepository
+    price_calculator: PriceCalculator
 
     def get_payment(
         self, plan: Plan, buyer: Company, amount: int, purpose: PurposesOfPurchases
@@ -161,9 +158,12 @@ class PaymentFactory:
             self.purchase_repository,
             self.transaction_repository,
             self.datetime_service,
-            self.plan_cooperation_repository,
             plan,
             buyer,
             amount,
             purpose,
+            coop_price_per_unit=self.price_calculator.calculate_cooperative_price(plan),
+            individual_price_per_unit=self.price_calculator.calculate_individual_price(
+                plan
+            ),
         )
@@ -9,6 +9,7 @@ from uuid import UUID
 from injector import inject
 
 from arbeitszeit.entities import Company
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit.repositories import CompanyRepository
 
 
@@ -20,6 +21,7 @@ class CompanyFilter(enum.Enum):
 @dataclass
 class CompanyQueryResponse:
     results: List[QueriedCompany]
+    next_cursor: Optional[str]
 
 
 @dataclass
@@ -38,6 +40,10 @@ class QueryCompaniesRequest(ABC):
     def get_filter_category(self) -> CompanyFilter:
         pass
 
+    @abstractmethod
+    def get_page(self) -> PageRequest:
+        pass
+
 
 @inject
 @dataclass
@@ -47,17 +53,24 @@ class QueryCompanies:
     def __call__(self, request: QueryCompaniesRequest) -> CompanyQueryResponse:
         query = request.get_query_string()
         filter_by = request.get_filter_category()
+        page = request.get_page()
         if query is None:
-            found_companies = self.company_repository.get_all_companies()
+            found_companies = self.company_repository.get_all_companies(page)
         elif filter_by == CompanyFilter.by_name:
-            found_companies = self.company_repository.query_companies_by_name(query)
+            found_companies = self.company_repository.query_companies_by_name(
+                query, page
+            )
         else:
-            found_companies = self.company_repository.query_companies_by_email(query)
+            found_companies = self.company_repository.query_companies_by_email(
+                query, page
+            )
         results = [
-            self._company_to_response_model(company) for company in found_companies
+            self._company_to_response_model(company)
+            for company in found_companies.items
         ]
         return CompanyQueryResponse(
             results=results,
+            next_cursor=found_companies.next_cursor,
         )
 
     def _company_to_response_model(self, company: Company) -> QueriedCompany:
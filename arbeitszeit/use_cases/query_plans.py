@@ -10,8 +10,9 @@ from uuid import UUID
 from injector import inject
 
 from arbeitszeit.entities import Plan
-from arbeitszeit.price_calculator import calculate_price
-from arbeitszeit.repositories import PlanCooperationRepository, PlanRepository
+from arbeitszeit.pagination import PageRequest
+from arbeitszeit.price_calculator import PriceCalculator
+from arbeitszeit.repositories import PlanRepository
 
 
 class PlanFilter(enum.Enum):
@@ -22,6 +23,7 @@ class PlanFilter(enum.Enum):
 @dataclass
 class PlanQueryResponse:
     results: List[QueriedPlan]
+    next_cursor: Optional[str]
 
 
 @dataclass
@@ -46,31 +48,44 @@ class QueryPlansRequest(ABC):
     def get_filter_category(self) -> PlanFilter:
         pass
 
+    @abstractmethod
+    def get_page(self) -> PageRequest:
+        pass
+
 
 @inject
 @dataclass
 class QueryPlans:
     plan_repository: PlanRepository
-    plan_cooperation_repository: PlanCooperationRepository
+    price_calculator: PriceCalculator
 
     def __call__(self, request: QueryPlansRequest) -> PlanQueryResponse:
         query = request.get_query_string()
         filter_by = request.get_filter_category()
+        page = request.get_page()
         if query is None:
-            found_plans = self.plan_repository.get_active_plans()
+            found_plans = self.plan_repository.get_page_of_active_plans(page)
         elif filter_by == PlanFilter.by_plan_id:
-            found_plans = self.plan_repository.query_active_plans_by_plan_id(query)
+            found_plans = self.plan_repository.query_active_plans_by_plan_id(
+                query, page
+            )
         else:
-            found_plans = self.plan_repository.query_active_plans_by_product_name(query)
-        results = [self._plan_to_response_model(plan) for plan in found_plans]
+            found_plans = self.plan_repository.query_active_plans_by_product_name(
+                query, page
+            )
+        prices = self.price_calculator.calculate_cooperative_prices(found_plans.items)
+        results = [
+            self._plan_to_response_model(plan, prices[plan.id])
+            for plan in found_plans.items
+        ]
         return PlanQueryResponse(
             results=results,
+            next_cursor=found_plans.next_cursor,
         )
 
-    def _plan_to_response_model(self, plan: Plan) -> QueriedPlan:
-        price_per_unit = calculate_price(
-            self.plan_cooperation_repository.get_cooperating_plans(plan.id)
-        )
+    def _plan_to_response_model(
+        self, plan: Plan, price_per_unit: Decimal
+    ) -> QueriedPlan:
         return QueriedPlan(
             plan_id=plan.id,
             company_name=plan.planner.name,
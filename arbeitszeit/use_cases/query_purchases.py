@@ -1,12 +1,13 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Iterator, Union
+from typing import Optional, Union
 from uuid import UUID
 
 from injector import inject
 
 from arbeitszeit.entities import Company, Member, Purchase, PurposesOfPurchases
+from arbeitszeit.pagination import Page, PageRequest
 from arbeitszeit.repositories import PurchaseRepository
 
 
@@ -30,12 +31,17 @@ class QueryPurchases:
     def __call__(
         self,
         user: Union[Member, Company],
-    ) -> Iterator[PurchaseQueryResponse]:
-        return (
-            self._purchase_to_response_model(purchase)
-            for purchase in self.purchase_repository.get_purchases_descending_by_date(
-                user
-            )
+        page: Optional[PageRequest] = None,
+    ) -> Page[PurchaseQueryResponse]:
+        purchases = self.purchase_repository.get_purchases_descending_by_date(
+            user, page or PageRequest()
+        )
+        return Page(
+            items=[
+                self._purchase_to_response_model(purchase)
+                for purchase in purchases.items
+            ],
+            next_cursor=purchases.next_cursor,
         )
 
     def _purchase_to_response_model(self, purchase: Purchase) -> PurchaseQueryResponse:
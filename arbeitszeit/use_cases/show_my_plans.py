@@ -6,8 +6,8 @@ from uuid import UUID
 
 from injector import inject
 
-from arbeitszeit.price_calculator import calculate_price
-from arbeitszeit.repositories import PlanCooperationRepository, PlanRepository
+from arbeitszeit.price_calculator import PriceCalculator
+from arbeitszeit.repositories import PlanRepository
 
 
 @dataclass
@@ -42,7 +42,7 @@ class ShowMyPlansResponse:
 @dataclass
 class ShowMyPlansUseCase:
     plan_repository: PlanRepository
-    plan_cooperation_repository: PlanCooperationRepository
+    price_calculator: PriceCalculator
 
     def __call__(self, request: ShowMyPlansRequest) -> ShowMyPlansResponse:
         all_plans_of_company = [
@@ -52,14 +52,15 @@ class ShowMyPlansUseCase:
             )
         ]
         count_all_plans = len(all_plans_of_company)
+        prices = self.price_calculator.calculate_cooperative_prices(
+            all_plans_of_company
+        )
 
         non_active_plans = [
             PlanInfo(
                 id=plan.id,
                 prd_name=plan.prd_name,
-                price_per_unit=calculate_price(
-                    self.plan_cooperation_repository.get_cooperating_plans(plan.id)
-                ),
+                price_per_unit=prices[plan.id],
                 is_public_service=plan.is_public_service,
                 plan_creation_date=plan.plan_creation_date,
                 activation_date=plan.activation_date,
@@ -76,9 +77,7 @@ class ShowMyPlansUseCase:
             PlanInfo(
                 id=plan.id,
                 prd_name=plan.prd_name,
-                price_per_unit=calculate_price(
-                    self.plan_cooperation_repository.get_cooperating_plans(plan.id)
-                ),
+                price_per_unit=prices[plan.id],
                 is_public_service=plan.is_public_service,
                 plan_creation_date=plan.plan_creation_date,
                 activation_date=plan.activation_date,
@@ -95,9 +94,7 @@ class ShowMyPlansUseCase:
             PlanInfo(
                 id=plan.id,
                 prd_name=plan.prd_name,
-                price_per_unit=calculate_price(
-                    self.plan_cooperation_repository.get_cooperating_plans(plan.id)
-                ),
+                price_per_unit=prices[plan.id],
                 is_public_service=plan.is_public_service,
                 plan_creation_date=plan.plan_creation_date,
                 activation_date=plan.activation_date,
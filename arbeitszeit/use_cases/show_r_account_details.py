@@ -3,14 +3,17 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from itertools import accumulate
 from typing import List
 from uuid import UUID
 
 from injector import inject
 
 from arbeitszeit.entities import AccountTypes, Company, Transaction
-from arbeitszeit.repositories import AccountRepository, CompanyRepository
+from arbeitszeit.repositories import (
+    AccountRepository,
+    BalanceHistoryEntry,
+    CompanyRepository,
+)
 from arbeitszeit.transactions import TransactionTypes, UserAccountingService
 
 
@@ -52,9 +55,8 @@ class ShowRAccountDetailsUseCase:
         account_balance = self.account_repository.get_account_balance(
             company.raw_material_account
         )
-        plot = self.PlotDetails(
-            timestamps=self._get_plot_dates(transactions),
-            accumulated_volumes=self._get_plot_volumes(transactions),
+        plot = self._create_plot_details(
+            self.account_repository.get_balance_history(company.raw_material_account)
         )
         return self.Response(
             company_id=company_id,
@@ -83,13 +85,8 @@ class ShowRAccountDetailsUseCase:
             transaction.purpose,
         )
 
-    def _get_plot_dates(self, transactions: List[TransactionInfo]) -> List[datetime]:
-        timestamps = [t.date for t in transactions]
-        timestamps.reverse()
-        return timestamps
-
-    def _get_plot_volumes(self, transactions: List[TransactionInfo]) -> List[Decimal]:
-        volumes = [t.transaction_volume for t in transactions]
-        volumes.reverse()
-        volumes_cumsum = list(accumulate(volumes))
-        return volumes_cumsum
+    def _create_plot_details(self, history: List[BalanceHistoryEntry]) -> PlotDetails:
+        return self.PlotDetails(
+            timestamps=[entry.date for entry in history],
+            accumulated_volumes=[entry.balance for entry in history],
+        )
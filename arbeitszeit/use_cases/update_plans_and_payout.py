@@ -1,18 +1,23 @@
 import datetime
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import List, Tuple
 
 from injector import inject
 
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.entities import Plan, SocialAccounting
 from arbeitszeit.payout_factor import PayoutFactorService
+from arbeitszeit.price_calculator import PriceCalculator
 from arbeitszeit.repositories import (
+    NewTransaction,
     PlanCooperationRepository,
     PlanRepository,
     TransactionRepository,
 )
 
+DuePayouts = List[Tuple[Plan, int]]
+
 
 @inject
 @dataclass
@@ -23,18 +28,36 @@ class UpdatePlansAndPayout:
     social_accounting: SocialAccounting
     plan_cooperation_repository: PlanCooperationRepository
     payout_factor_service: PayoutFactorService
+    price_calculator: PriceCalculator
 
-    def __call__(self) -> None:
+    def __call__(self, use_bulk_payout: bool = False) -> None:
         """
         This function should be called at least once per day,
         preferably more often (e.g. every hour).
+
+        By default every payout is written plan by plan. With
+        use_bulk_payout the due payouts of all plans are collected
+        first and written in one batch, which yields the same
+        transactions and payout counts with far fewer database
+        statements.
         """
         payout_factor = self.payout_factor_service.calculate_payout_factor()
-        self._calculate_plan_expiration(payout_factor)
+        due_payouts: DuePayouts = []
+        self._calculate_plan_expiration(payout_factor, due_payouts, use_bulk_payout)
         for plan in self.plan_repository.all_plans_approved_active_and_not_expired():
-            self._payout_work_certificates(plan, payout_factor)
-
-    def _calculate_plan_expiration(self, payout_factor: Decimal) -> None:
+            if use_bulk_payout:
+                due_payouts.append((plan, self._count_due_payouts(plan)))
+            else:
+                self._payout_work_certificates(plan, payout_factor)
+        if use_bulk_payout:
+            self._payout_in_bulk(due_payouts, payout_factor)
+
+    def _calculate_plan_expiration(
+        self,
+        payout_factor: Decimal,
+        due_payouts: DuePayouts,
+        use_bulk_payout: bool,
+    ) -> None:
         for plan in self.plan_repository.get_active_plans():
             assert plan.is_active, "Plan is not active!"
             assert plan.activation_date, "Plan has no activation date!"
@@ -53,7 +76,14 @@ class UpdatePlansAndPayout:
             assert plan.expiration_date
             assert plan.active_days is not None
             if self._plan_is_expired(plan):
-                self._handle_expired_plan(plan, payout_factor)
+                if use_bulk_payout:
+                    assert plan.active_days
+                    due_payouts.append(
+                        (plan, max(plan.active_days - plan.payout_count, 0))
+                    )
+                    self._expire_plan(plan)
+                else:
+                    self._handle_expired_plan(plan, payout_factor)
 
     def _payout_work_certificates(self, plan: Plan, payout_factor: Decimal) -> None:
         """
@@ -77,18 +107,51 @@ class UpdatePlansAndPayout:
         while plan.payout_count <= plan.active_days:
             self._payout(plan, payout_factor)
 
+    def _count_due_payouts(self, plan: Plan) -> int:
+        """
+        The number of payouts that _payout_work_certificates would
+        trigger for the plan.
+        """
+        assert plan.active_days is not None
+        return max(plan.active_days + 1 - plan.payout_count, 0)
+
     def _payout(self, plan: Plan, payout_factor: Decimal) -> None:
-        amount = payout_factor * plan.production_costs.labour_cost / plan.timeframe
+        amount = self._calculate_payout_amount(plan, payout_factor)
         self.transaction_repository.create_transaction(
             date=self.datetime_service.now(),
             sending_account=self.social_accounting.account,
             receiving_account=plan.planner.work_account,
-            amount_sent=round(amount, 2),
-            amount_received=round(amount, 2),
+            amount_sent=amount,
+            amount_received=amount,
             purpose=f"Plan-Id: {plan.id}",
+            plan_id=plan.id,
         )
         self.plan_repository.increase_payout_count_by_one(plan)
 
+    def _payout_in_bulk(self, due_payouts: DuePayouts, payout_factor: Decimal) -> None:
+        now = self.datetime_service.now()
+        transactions: List[NewTransaction] = []
+        for plan, count in due_payouts:
+            amount = self._calculate_payout_amount(plan, payout_factor)
+            transactions += [
+                NewTransaction(
+                    date=now,
+                    sending_account=self.social_accounting.account,
+                    receiving_account=plan.planner.work_account,
+                    amount_sent=amount,
+                    amount_received=amount,
+                    purpose=f"Plan-Id: {plan.id}",
+                    plan_id=plan.id,
+                )
+                for _ in range(count)
+            ]
+        self.transaction_repository.create_transactions(transactions)
+        self.plan_repository.increase_payout_counts(due_payouts)
+
+    def _calculate_payout_amount(self, plan: Plan, payout_factor: Decimal) -> Decimal:
+        amount = payout_factor * plan.production_costs.labour_cost / plan.timeframe
+        return round(amount, 2)
+
     def _plan_is_expired(self, plan: Plan) -> bool:
         assert plan.expiration_date
         return self.datetime_service.now() > plan.expiration_date
@@ -102,6 +165,9 @@ class UpdatePlansAndPayout:
         assert plan.active_days
         while plan.payout_count < plan.active_days:
             self._payout(plan, payout_factor)
+        self._expire_plan(plan)
+
+    def _expire_plan(self, plan: Plan) -> None:
         self._delete_cooperation_and_coop_request_from_plan(plan)
         self.plan_repository.set_plan_as_expired(plan)
 
@@ -125,5 +191,6 @@ class UpdatePlansAndPayout:
     def _delete_cooperation_and_coop_request_from_plan(self, plan: Plan) -> None:
         if plan.requested_cooperation:
             self.plan_cooperation_repository.set_requested_cooperation_to_none(plan.id)
-        if plan.cooperation:
+        if cooperation := plan.cooperation:
             self.plan_cooperation_repository.remove_plan_from_cooperation(plan.id)
+            self.price_calculator.update_cooperation_price(cooperation)
@@ -8,7 +8,11 @@ from flask_wtf.csrf import CSRFProtect
 import arbeitszeit_flask.extensions
 from arbeitszeit_flask.datetime import RealtimeDatetimeService
 from arbeitszeit_flask.extensions import babel, login_manager, mail
-from arbeitszeit_flask.profiling import show_profile_info, show_sql_queries
+from arbeitszeit_flask.profiling import (
+    show_plot_cache_statistics,
+    show_profile_info,
+    show_sql_queries,
+)
 
 
 def load_configuration(app, configuration=None):
@@ -75,27 +79,37 @@ def create_app(config=None, db=None, template_folder=None):
 
     with app.app_context():
 
-        from arbeitszeit_flask.commands import invite_accountant, update_and_payout
+        from arbeitszeit_flask.commands import (
+            check_account_balances,
+            check_planning_aggregates,
+            invite_accountant,
+            mail_worker,
+            show_index_usage,
+            update_and_payout,
+            write_balance_checkpoints,
+        )
 
         app.cli.command("payout")(update_and_payout)
         app.cli.command("invite-accountant")(invite_accountant)
+        app.cli.command("check-account-balances")(check_account_balances)
+        app.cli.command("check-planning-aggregates")(check_planning_aggregates)
+        app.cli.command("index-usage")(show_index_usage)
+        app.cli.command("write-balance-checkpoints")(write_balance_checkpoints)
+        app.cli.command("mail-worker")(mail_worker)
 
-        from .models import Accountant, Company, Member
+        from .dependency_injection import with_injection
+        from .user_loader import UserLoader
 
         @login_manager.user_loader
-        def load_user(user_id):
+        @with_injection()
+        def load_user(user_id: str, user_loader: UserLoader):
             """
             This callback is used to reload the user object from the user ID
             stored in the session.
             """
-            if "user_type" in session:
-                user_type = session["user_type"]
-                if user_type == "member":
-                    return Member.query.get(user_id)
-                elif user_type == "company":
-                    return Company.query.get(user_id)
-                elif user_type == "accountant":
-                    return Accountant.query.get(user_id)
+            if user_type := session.get("user_type"):
+                return user_loader(user_id, user_type)
+            return None
 
         # register blueprints
         from . import accountant, company, member
@@ -113,6 +127,7 @@ def create_app(config=None, db=None, template_folder=None):
                 # print profiling info to sys.stout
                 show_profile_info(app)
                 show_sql_queries(app)
+                show_plot_cache_statistics(app)
 
         return app
 
@@ -27,6 +27,7 @@ from arbeitszeit_flask.forms import LoginForm
 from arbeitszeit_flask.next_url import save_next_url_in_session
 from arbeitszeit_flask.token import FlaskTokenService
 from arbeitszeit_flask.translator import FlaskTranslator
+from arbeitszeit_flask.user_loader import PrincipalCache
 from arbeitszeit_flask.views.signup_accountant_view import SignupAccountantView
 from arbeitszeit_flask.views.signup_company_view import SignupCompanyView
 from arbeitszeit_flask.views.signup_member_view import SignupMemberView
@@ -70,7 +71,8 @@ def signup_member(view: SignupMemberView):
 
 @auth.route("/member/confirm/<token>")
 @commit_changes
-def confirm_email_member(token):
+@with_injection()
+def confirm_email_member(token, principal_cache: PrincipalCache):
     def redirect_invalid_request():
         flash("Der Bestätigungslink ist ungültig oder ist abgelaufen.")
         return redirect(url_for("auth.unconfirmed_member"))
@@ -87,6 +89,7 @@ def confirm_email_member(token):
         flash("Konto ist bereits bestätigt.")
     else:
         member.confirmed_on = datetime.now()
+        principal_cache.invalidate(member.id)
         flash("Das Konto wurde bestätigt. Danke!")
     return redirect(url_for("auth.login_member"))
 
@@ -127,6 +130,7 @@ def login_member(
 @auth.route("/member/resend")
 @with_injection(modules=[MemberModule()])
 @login_required
+@commit_changes
 def resend_confirmation_member(use_case: ResendConfirmationMail):
     assert (
         current_user.email
@@ -136,11 +140,8 @@ def resend_confirmation_member(use_case: ResendConfirmationMail):
         subject="Bitte bestätige dein Konto",
         recipient=current_user.email,
     )
-    response = use_case(request)
-    if response.is_rejected:
-        flash("Bestätigungsmail konnte nicht gesendet werden!")
-    else:
-        flash("Eine neue Bestätigungsmail wurde gesendet.")
+    use_case(request)
+    flash("Eine neue Bestätigungsmail wurde gesendet.")
 
     return redirect(url_for("auth.unconfirmed_member"))
 
@@ -209,7 +210,8 @@ def signup_company(view: SignupCompanyView):
 
 @auth.route("/company/confirm/<token>")
 @commit_changes
-def confirm_email_company(token):
+@with_injection()
+def confirm_email_company(token, principal_cache: PrincipalCache):
     def redirect_invalid_request():
         flash("Der Bestätigungslink ist ungültig oder ist abgelaufen.")
         return redirect(url_for("auth.unconfirmed_company"))
@@ -226,6 +228,7 @@ def confirm_email_company(token):
         flash("Konto ist bereits bestätigt.")
     else:
         company.confirmed_on = datetime.now()
+        principal_cache.invalidate(company.id)
         flash("Das Konto wurde bestätigt. Danke!")
     return redirect(url_for("auth.login_company"))
 
@@ -233,6 +236,7 @@ def confirm_email_company(token):
 @auth.route("/company/resend")
 @with_injection(modules=[CompanyModule()])
 @login_required
+@commit_changes
 def resend_confirmation_company(use_case: ResendConfirmationMail):
     assert (
         current_user.email
@@ -242,11 +246,8 @@ def resend_confirmation_company(use_case: ResendConfirmationMail):
         subject="Bitte bestätige dein Konto",
         recipient=current_user.email,
     )
-    response = use_case(request)
-    if response.is_rejected:
-        flash("Bestätigungsmail konnte nicht gesendet werden!")
-    else:
-        flash("Eine neue Bestätigungsmail wurde gesendet.")
+    use_case(request)
+    flash("Eine neue Bestätigungsmail wurde gesendet.")
 
     return redirect(url_for("auth.unconfirmed_company"))
 
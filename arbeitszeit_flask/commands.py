@@ -1,23 +1,77 @@
+import time
+from datetime import timedelta
+
 import click
+from flask import current_app
 from flask_babel import force_locale
+from flask_sqlalchemy import SQLAlchemy
 
+from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.use_cases import UpdatePlansAndPayout
 from arbeitszeit.use_cases.send_accountant_registration_token import (
     SendAccountantRegistrationTokenUseCase,
 )
 from arbeitszeit_flask.database import commit_changes
+from arbeitszeit_flask.database.balance_checkpoints import BalanceCheckpoints
+from arbeitszeit_flask.database.index_usage import IndexUsageReport
+from arbeitszeit_flask.database.planning_aggregates import PlanningAggregates
+from arbeitszeit_flask.database.repositories import AccountRepository
 from arbeitszeit_flask.dependency_injection import with_injection
+from arbeitszeit_flask.mail_outbox import MailOutbox
 
 
+@click.option(
+    "--bulk",
+    is_flag=True,
+    help="Collect all due payouts first and write them in one batch.",
+)
 @commit_changes
 @with_injection()
 def update_and_payout(
+    bulk: bool,
     payout: UpdatePlansAndPayout,
+    checkpoints: BalanceCheckpoints,
+    datetime_service: DatetimeService,
 ) -> None:
     """
     Run every hour on production server or call manually from CLI `flask payout`.
+    Balance checkpoints are written afterwards.
+    """
+    payout(use_bulk_payout=bulk)
+    _write_balance_checkpoints(checkpoints, datetime_service)
+
+
+@click.option(
+    "--rebuild",
+    is_flag=True,
+    help="Delete all checkpoints and write them again from all transactions.",
+)
+@commit_changes
+@with_injection()
+def write_balance_checkpoints(
+    rebuild: bool,
+    checkpoints: BalanceCheckpoints,
+    datetime_service: DatetimeService,
+) -> None:
+    """
+    Write the account balances at the end of every checkpoint interval
+    since the last run. Call from CLI `flask write-balance-checkpoints`.
     """
-    payout()
+    if rebuild:
+        checkpoints.delete_checkpoints()
+    written = _write_balance_checkpoints(checkpoints, datetime_service)
+    click.echo(f"Wrote {written} balance checkpoint(s)")
+
+
+def _write_balance_checkpoints(
+    checkpoints: BalanceCheckpoints, datetime_service: DatetimeService
+) -> int:
+    return checkpoints.write_checkpoints(
+        now=datetime_service.now(),
+        interval=timedelta(
+            hours=current_app.config["BALANCE_CHECKPOINT_INTERVAL_HOURS"]
+        ),
+    )
 
 
 @click.argument("email_address")
@@ -30,3 +84,110 @@ def invite_accountant(
         use_case.send_accountant_registration_token(
             SendAccountantRegistrationTokenUseCase.Request(email=email_address)
         )
+
+
+@with_injection()
+def check_account_balances(account_repository: AccountRepository) -> None:
+    """
+    Compare the stored balance of every account with its transaction history.
+    Call from CLI `flask check-account-balances`.
+    """
+    inconsistent_accounts = account_repository.get_accounts_with_inconsistent_balance()
+    for account_id in inconsistent_accounts:
+        click.echo(f"Stored balance of account {account_id} is inconsistent")
+    if inconsistent_accounts:
+        raise click.ClickException(
+            f"{len(inconsistent_accounts)} account balance(s) are inconsistent"
+        )
+    click.echo("All account balances are consistent")
+
+
+@click.option(
+    "--repair",
+    is_flag=True,
+    help="Replace inconsistent totals with the recalculated ones.",
+)
+@commit_changes
+@with_injection()
+def check_planning_aggregates(repair: bool, aggregates: PlanningAggregates) -> None:
+    """
+    Compare the stored totals over all active plans with totals
+    recalculated from the plans themselves.
+    Call from CLI `flask check-planning-aggregates`.
+    """
+    recalculated_totals = aggregates.recalculate_totals()
+    inconsistent_kinds = [
+        is_public_service
+        for is_public_service, totals in recalculated_totals.items()
+        if not aggregates.get_totals(is_public_service).is_close_to(totals)
+    ]
+    for is_public_service in inconsistent_kinds:
+        kind = "public" if is_public_service else "productive"
+        click.echo(f"Stored totals of {kind} plans are inconsistent")
+    if inconsistent_kinds and not repair:
+        raise click.ClickException("Planning aggregates are inconsistent")
+    if inconsistent_kinds:
+        aggregates.store_totals(recalculated_totals)
+        click.echo("Stored the recalculated totals")
+    else:
+        click.echo("All planning aggregates are consistent")
+
+
+@click.option(
+    "--once",
+    is_flag=True,
+    help="Deliver all due emails and exit instead of waiting for new ones.",
+)
+@click.option(
+    "--batch-size",
+    default=100,
+    show_default=True,
+    help="The number of emails sent over one connection to the mail server.",
+)
+@click.option(
+    "--poll-interval",
+    default=5.0,
+    show_default=True,
+    help="Seconds to wait for new emails when the outbox is empty.",
+)
+@with_injection()
+def mail_worker(
+    once: bool,
+    batch_size: int,
+    poll_interval: float,
+    outbox: MailOutbox,
+    db: SQLAlchemy,
+) -> None:
+    """
+    Deliver the emails queued in the outbox. Keep it running next to
+    the web server or call manually from CLI `flask mail-worker --once`.
+    """
+    while True:
+        report = outbox.deliver_due_emails(batch_size)
+        db.session.commit()
+        if report.processed:
+            click.echo(f"Delivered {report.delivered} email(s), {report.failed} failed")
+        if report.processed < batch_size:
+            if once:
+                break
+            time.sleep(poll_interval)
+
+
+@with_injection()
+def show_index_usage(report: IndexUsageReport) -> None:
+    """
+    Show the query plans of the queries issued by the repository methods.
+    Call from CLI `flask index-usage` against a database with representative data.
+    """
+    for method_usage in report():
+        if not method_usage.probed:
+            status = "not probed"
+        elif method_usage.uses_indexes:
+            status = "index"
+        else:
+            status = "NO INDEX"
+        click.echo(f"[{status}] {method_usage.method}")
+        for query in method_usage.queries:
+            click.echo(f"    {query.statement}")
+            for line in query.plan:
+                click.echo(f"        {line}")
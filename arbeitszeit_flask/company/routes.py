@@ -30,6 +30,7 @@ from arbeitszeit.use_cases import (
 )
 from arbeitszeit.use_cases.show_my_plans import ShowMyPlansRequest, ShowMyPlansUseCase
 from arbeitszeit_flask.database import CompanyRepository, commit_changes
+from arbeitszeit_flask.flask_request import FlaskRequest
 from arbeitszeit_flask.forms import (
     CompanySearchForm,
     CreateCooperationForm,
@@ -54,6 +55,7 @@ from arbeitszeit_flask.views import (
 from arbeitszeit_flask.views.create_cooperation_view import CreateCooperationView
 from arbeitszeit_flask.views.create_draft_view import CreateDraftView
 from arbeitszeit_flask.views.dashboard_view import DashboardView
+from arbeitszeit_flask.views.export_transactions_view import ExportTransactionsView
 from arbeitszeit_flask.views.pay_means_of_production import PayMeansOfProductionView
 from arbeitszeit_flask.views.show_my_accounts_view import ShowMyAccountsView
 from arbeitszeit_flask.views.transfer_to_worker_view import TransferToWorkerView
@@ -69,6 +71,7 @@ from arbeitszeit_web.list_all_cooperations import ListAllCooperationsPresenter
 from arbeitszeit_web.list_drafts_of_company import ListDraftsPresenter
 from arbeitszeit_web.list_messages import ListMessagesController, ListMessagesPresenter
 from arbeitszeit_web.list_plans import ListPlansPresenter
+from arbeitszeit_web.pagination import get_next_page_url, get_page_request
 from arbeitszeit_web.presenters.seek_plan_approval import SeekPlanApprovalPresenter
 from arbeitszeit_web.presenters.show_a_account_details_presenter import (
     ShowAAccountDetailsPresenter,
@@ -110,7 +113,9 @@ def query_plans(
     presenter: QueryPlansPresenter,
 ):
     template_name = "company/query_plans.html"
-    search_form = PlanSearchForm(request.form)
+    search_form = PlanSearchForm(
+        request.form if request.method == "POST" else request.args
+    )
     view = QueryPlansView(
         search_form,
         query_plans,
@@ -133,7 +138,9 @@ def query_companies(
     presenter: QueryCompaniesPresenter,
 ):
     template_name = "company/query_companies.html"
-    search_form = CompanySearchForm(request.form)
+    search_form = CompanySearchForm(
+        request.form if request.method == "POST" else request.args
+    )
     view = QueryCompaniesView(
         search_form,
         query_companies,
@@ -153,12 +160,17 @@ def my_purchases(
     query_purchases: use_cases.QueryPurchases,
     company_repository: CompanyRepository,
     template_renderer: UserTemplateRenderer,
+    flask_request: FlaskRequest,
 ):
     company = company_repository.get_by_id(UUID(current_user.id))
     assert company is not None
-    purchases = list(query_purchases(company))
+    purchases = query_purchases(company, get_page_request(flask_request))
     return template_renderer.render_template(
-        "company/my_purchases.html", context=dict(purchases=purchases)
+        "company/my_purchases.html",
+        context=dict(
+            purchases=purchases.items,
+            next_page_url=get_next_page_url(flask_request, purchases.next_cursor),
+        ),
     )
 
 
@@ -264,6 +276,13 @@ def list_all_transactions(
     )
 
 
+@CompanyRoute(
+    "/company/my_accounts/all_transactions/export/<any(csv, ndjson):export_format>"
+)
+def export_all_transactions(export_format: str, view: ExportTransactionsView):
+    return view.respond_to_get(export_format)
+
+
 @CompanyRoute("/company/my_accounts/account_p")
 def account_p(
     show_p_account_details: use_cases.ShowPAccountDetailsUseCase,
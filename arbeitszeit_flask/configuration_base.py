@@ -10,3 +10,10 @@ LANGUAGES = {"en": "English", "de": "Deutsch"}
 MAIL_PORT = "25"
 FORCE_HTTPS = True
 AUTO_MIGRATE = False
+BALANCE_CHECKPOINT_INTERVAL_HOURS = 24
+PLOT_CACHE_SIZE = 128
+PLOT_CACHE_DIRECTORY = None
+PLOT_RENDERING_PROCESSES = 0
+PLOT_RENDERING_QUEUE_SIZE = 8
+PLOT_RENDERING_TIMEOUT = 10
+USER_CACHE_TTL = 60
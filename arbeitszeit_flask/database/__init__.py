@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from injector import inject
+from sqlalchemy import event
+from sqlalchemy import inspect as inspect_orm
+from sqlalchemy.orm import Session
 
 from arbeitszeit import entities
 from arbeitszeit_flask.extensions import db
@@ -30,17 +33,53 @@ __all__ = [
     "MemberRepository",
     "PlanRepository",
     "PurchaseRepository",
+    "SocialAccountingCache",
     "TransactionRepository",
     "commit_changes",
     "get_company_by_mail",
 ]
 
 
+_UNCOMMITTED_SOCIAL_ACCOUNTING_KEY = "uncommitted_social_accounting"
+
+
+class SocialAccountingCache:
+    """The social accounting is created once and never changes
+    afterwards, so it is only loaded from the database until it was
+    found there.
+
+    A social accounting created by the current transaction is not
+    cached, because the transaction might still be rolled back.
+    """
+
+    def __init__(self) -> None:
+        self._social_accounting: Optional[entities.SocialAccounting] = None
+
+    def get(self, repository: AccountingRepository) -> entities.SocialAccounting:
+        if self._social_accounting is not None:
+            return self._social_accounting
+        social_accounting_orm = repository.get_or_create_social_accounting_orm()
+        social_accounting = repository.object_from_orm(social_accounting_orm)
+        session_info = repository.db.session.info
+        if inspect_orm(social_accounting_orm).pending:
+            session_info[_UNCOMMITTED_SOCIAL_ACCOUNTING_KEY] = True
+        elif not session_info.get(_UNCOMMITTED_SOCIAL_ACCOUNTING_KEY):
+            self._social_accounting = social_accounting
+        return social_accounting
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _forget_uncommitted_social_accounting(session: Session) -> None:
+    session.info.pop(_UNCOMMITTED_SOCIAL_ACCOUNTING_KEY, None)
+
+
 @inject
 def get_social_accounting(
     accounting_repo: AccountingRepository,
+    cache: SocialAccountingCache,
 ) -> entities.SocialAccounting:
-    return accounting_repo.get_or_create_social_accounting()
+    return cache.get(accounting_repo)
 
 
 def commit_changes(function: Callable) -> Callable:
@@ -0,0 +1,41 @@
+"""Names of account owners, as shown next to the transactions of an
+account.
+
+Accounts never change their owner and companies keep their names, so
+the name of the owner of an account can be cached for the lifetime of
+the process. Statements list the same few companies and the social
+accounting over and over again, which is why their names are kept in
+a least recently used cache shared by all requests. The names of
+members are not cached.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Iterable
+from uuid import UUID
+
+
+class AccountOwnerNameCache:
+    def __init__(self, max_entries: int = 10000) -> None:
+        self.max_entries = max_entries
+        self._names: OrderedDict[UUID, str] = OrderedDict()
+        self._lock = Lock()
+
+    def get_many(self, account_ids: Iterable[UUID]) -> Dict[UUID, str]:
+        """The cached names of those of the accounts that are cached."""
+        names: Dict[UUID, str] = dict()
+        with self._lock:
+            for account_id in account_ids:
+                if (name := self._names.get(account_id)) is not None:
+                    self._names.move_to_end(account_id)
+                    names[account_id] = name
+        return names
+
+    def put(self, account_id: UUID, name: str) -> None:
+        with self._lock:
+            self._names[account_id] = name
+            self._names.move_to_end(account_id)
+            while len(self._names) > self.max_entries:
+                self._names.popitem(last=False)
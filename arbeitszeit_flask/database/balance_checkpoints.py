@@ -0,0 +1,256 @@
+"""Checkpoints of the account balances.
+
+The balance of an account at a given time, and with it the balance
+history shown in the account plots, can be calculated by replaying
+every transaction of the account. To avoid replaying the whole ledger,
+the running totals of every account are written to the
+account_balance_checkpoint table at the end of each checkpoint interval
+in which the account had transactions. Balances are calculated from the
+latest checkpoint before the requested time plus the transactions after
+that checkpoint.
+
+Checkpoints are written by `flask write-balance-checkpoints` and after
+every payout run. Transactions are dated when they are created, so no
+transactions are expected to appear with a date before the latest
+checkpoint. Should that happen anyway, `flask write-balance-checkpoints
+--rebuild` writes all checkpoints again.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional, Set, Tuple
+
+from flask_sqlalchemy import SQLAlchemy
+from injector import inject
+from sqlalchemy import and_, case, func, or_
+
+from arbeitszeit.repositories import BalanceHistoryEntry
+from arbeitszeit_flask.models import AccountBalanceCheckpoint, Transaction
+
+# Checkpoint intervals are aligned to this date, so daily checkpoints
+# are written at midnight.
+EPOCH = datetime(1970, 1, 1)
+
+# Transactions are dated before they are committed. Intervals that
+# ended less than this long ago are not checkpointed yet, so that
+# transactions still being committed are not missed.
+SETTLING_TIME = timedelta(minutes=1)
+
+
+@inject
+@dataclass
+class BalanceCheckpoints:
+    db: SQLAlchemy
+
+    def write_checkpoints(self, now: datetime, interval: timedelta) -> int:
+        """Write the checkpoints of all intervals that ended after the
+        latest checkpoint. Return the number of checkpoints written."""
+        end_of_last_interval = _start_of_interval(now - SETTLING_TIME, interval)
+        latest_checkpoint = self.db.session.query(
+            func.max(AccountBalanceCheckpoint.timestamp)
+        ).scalar()
+        totals = self._get_latest_totals()
+        query = (
+            self.db.session.query(
+                Transaction.date,
+                Transaction.sending_account,
+                Transaction.receiving_account,
+                Transaction.amount_sent,
+                Transaction.amount_received,
+            )
+            .filter(
+                Transaction.sending_account != Transaction.receiving_account,
+                Transaction.date <= end_of_last_interval,
+            )
+            .order_by(Transaction.date)
+        )
+        if latest_checkpoint is not None:
+            query = query.filter(Transaction.date > latest_checkpoint)
+        checkpoints: List[Dict[str, object]] = []
+        changed_accounts: Set[str] = set()
+        current_interval_end: Optional[datetime] = None
+        for date, sender, receiver, amount_sent, amount_received in query.yield_per(
+            1000
+        ):
+            interval_end = _end_of_interval(date, interval)
+            if interval_end != current_interval_end:
+                checkpoints += _checkpoints(
+                    current_interval_end, changed_accounts, totals
+                )
+                changed_accounts = set()
+                current_interval_end = interval_end
+            sent, received = totals.get(sender, (Decimal(0), Decimal(0)))
+            totals[sender] = (sent + Decimal(amount_sent), received)
+            sent, received = totals.get(receiver, (Decimal(0), Decimal(0)))
+            totals[receiver] = (sent, received + Decimal(amount_received))
+            changed_accounts.update([sender, receiver])
+        checkpoints += _checkpoints(current_interval_end, changed_accounts, totals)
+        if checkpoints:
+            self.db.session.execute(
+                AccountBalanceCheckpoint.__table__.insert(), checkpoints
+            )
+        return len(checkpoints)
+
+    def delete_checkpoints(self) -> None:
+        AccountBalanceCheckpoint.query.delete(synchronize_session=False)
+
+    def get_balance_at(self, account_id: str, timestamp: datetime) -> Decimal:
+        checkpoint = (
+            self.db.session.query(
+                AccountBalanceCheckpoint.timestamp,
+                AccountBalanceCheckpoint.sent,
+                AccountBalanceCheckpoint.received,
+            )
+            .filter(
+                AccountBalanceCheckpoint.account_id == account_id,
+                AccountBalanceCheckpoint.timestamp <= timestamp,
+            )
+            .order_by(AccountBalanceCheckpoint.timestamp.desc())
+            .first()
+        )
+        query = self.db.session.query(
+            func.sum(
+                case(
+                    (
+                        Transaction.sending_account == account_id,
+                        Transaction.amount_sent,
+                    ),
+                    else_=0,
+                )
+            ),
+            func.sum(
+                case(
+                    (
+                        Transaction.receiving_account == account_id,
+                        Transaction.amount_received,
+                    ),
+                    else_=0,
+                )
+            ),
+        ).filter(_transactions_of_account(account_id), Transaction.date <= timestamp)
+        balance = Decimal(0)
+        if checkpoint is not None:
+            query = query.filter(Transaction.date > checkpoint.timestamp)
+            balance = Decimal(checkpoint.received) - Decimal(checkpoint.sent)
+        sent, received = query.one()
+        return balance + Decimal(received or 0) - Decimal(sent or 0)
+
+    def get_balance_history(self, account_id: str) -> List[BalanceHistoryEntry]:
+        """One entry for every checkpoint of the account followed by one
+        entry for every transaction after the latest checkpoint."""
+        history = [
+            BalanceHistoryEntry(
+                date=timestamp, balance=Decimal(received) - Decimal(sent)
+            )
+            for timestamp, sent, received in self.db.session.query(
+                AccountBalanceCheckpoint.timestamp,
+                AccountBalanceCheckpoint.sent,
+                AccountBalanceCheckpoint.received,
+            )
+            .filter(AccountBalanceCheckpoint.account_id == account_id)
+            .order_by(AccountBalanceCheckpoint.timestamp)
+        ]
+        query = (
+            self.db.session.query(
+                Transaction.date,
+                Transaction.sending_account,
+                Transaction.amount_sent,
+                Transaction.amount_received,
+            )
+            .filter(_transactions_of_account(account_id))
+            .order_by(Transaction.date)
+        )
+        balance = Decimal(0)
+        if history:
+            query = query.filter(Transaction.date > history[-1].date)
+            balance = history[-1].balance
+        for date, sender, amount_sent, amount_received in query:
+            if sender == account_id:
+                balance -= Decimal(amount_sent)
+            else:
+                balance += Decimal(amount_received)
+            history.append(BalanceHistoryEntry(date=date, balance=balance))
+        return history
+
+    def get_balance_history_revision(self, account_id: str) -> str:
+        """Identify the balance history by the latest checkpoint of the
+        account and the number and latest date of the transactions
+        after it, without reading the history."""
+        latest_checkpoint = (
+            self.db.session.query(func.max(AccountBalanceCheckpoint.timestamp))
+            .filter(AccountBalanceCheckpoint.account_id == account_id)
+            .scalar()
+        )
+        query = self.db.session.query(
+            func.count(Transaction.id), func.max(Transaction.date)
+        ).filter(_transactions_of_account(account_id))
+        if latest_checkpoint is not None:
+            query = query.filter(Transaction.date > latest_checkpoint)
+        count, latest_transaction = query.one()
+        return f"{latest_checkpoint}/{count}/{latest_transaction}"
+
+    def _get_latest_totals(self) -> Dict[str, Tuple[Decimal, Decimal]]:
+        latest_checkpoints = (
+            self.db.session.query(
+                AccountBalanceCheckpoint.account_id,
+                func.max(AccountBalanceCheckpoint.timestamp).label("timestamp"),
+            )
+            .group_by(AccountBalanceCheckpoint.account_id)
+            .subquery()
+        )
+        return {
+            account_id: (Decimal(sent), Decimal(received))
+            for account_id, sent, received in self.db.session.query(
+                AccountBalanceCheckpoint.account_id,
+                AccountBalanceCheckpoint.sent,
+                AccountBalanceCheckpoint.received,
+            ).join(
+                latest_checkpoints,
+                and_(
+                    AccountBalanceCheckpoint.account_id
+                    == latest_checkpoints.c.account_id,
+                    AccountBalanceCheckpoint.timestamp
+                    == latest_checkpoints.c.timestamp,
+                ),
+            )
+        }
+
+
+def _transactions_of_account(account_id: str):
+    # Like the stored balances, the checkpoints do not count
+    # transactions from an account to itself.
+    return and_(
+        or_(
+            Transaction.sending_account == account_id,
+            Transaction.receiving_account == account_id,
+        ),
+        Transaction.sending_account != Transaction.receiving_account,
+    )
+
+
+def _checkpoints(
+    timestamp: Optional[datetime],
+    account_ids: Set[str],
+    totals: Dict[str, Tuple[Decimal, Decimal]],
+) -> List[Dict[str, object]]:
+    return [
+        dict(
+            account_id=account_id,
+            timestamp=timestamp,
+            sent=totals[account_id][0],
+            received=totals[account_id][1],
+        )
+        for account_id in sorted(account_ids)
+    ]
+
+
+def _start_of_interval(timestamp: datetime, interval: timedelta) -> datetime:
+    return EPOCH + (timestamp - EPOCH) // interval * interval
+
+
+def _end_of_interval(timestamp: datetime, interval: timedelta) -> datetime:
+    """The first interval boundary at or after timestamp."""
+    return EPOCH - (EPOCH - timestamp) // interval * interval
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+from uuid import UUID
+
+from flask_sqlalchemy import SQLAlchemy
+from injector import inject
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+_SESSION_INFO_KEY = "entity_identity_map"
+
+
+@inject
+@dataclass
+class IdentityMap:
+    """Entities that were already hydrated from the database.
+
+    The map is stored on the current database session so that all
+    repositories share it. It is emptied whenever the session commits
+    or rolls back, which makes its lifetime that of a single request
+    (or CLI command) in practice. Repositories must invalidate an
+    entity when they write to it.
+    """
+
+    db: SQLAlchemy
+
+    def get(self, entity_type: Type[T], id: UUID) -> Optional[T]:
+        return self._entities.get((entity_type, id))
+
+    def add(self, id: UUID, entity: T) -> T:
+        self._entities[(type(entity), id)] = entity
+        return entity
+
+    def invalidate(self, entity_type: type, id: UUID) -> None:
+        self._entities.pop((entity_type, id), None)
+
+    def clear(self) -> None:
+        self._entities.clear()
+
+    @property
+    def _entities(self) -> Dict[Tuple[type, UUID], Any]:
+        return self.db.session.info.setdefault(_SESSION_INFO_KEY, dict())
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_identity_map(session: Session) -> None:
+    session.info.pop(_SESSION_INFO_KEY, None)
@@ -0,0 +1,261 @@
+"""Report which indexes the database uses for the queries that the
+repository methods issue. Run `flask index-usage` against a database
+with representative data.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+from flask_sqlalchemy import SQLAlchemy
+from injector import inject
+from sqlalchemy import event
+
+from arbeitszeit.pagination import PageRequest
+from arbeitszeit_flask import models
+from arbeitszeit_flask.database.repositories import (
+    AccountOwnerRepository,
+    AccountRepository,
+    CompanyRepository,
+    CompanyWorkerRepository,
+    CooperationRepository,
+    MemberRepository,
+    MessageRepository,
+    PlanCooperationRepository,
+    PlanRepository,
+    PurchaseRepository,
+    TransactionRepository,
+    WorkerInviteRepository,
+)
+
+# Plan lines that read a whole table: sqlite's SCAN without an index
+# or with an automatic index built for the query, and PostgreSQL's Seq
+# Scan. The table is followed by its alias, if it has one.
+_SQLITE_TABLE_SCAN = re.compile(
+    r"^(?:SCAN (?:TABLE )?(\w+)(?: AS (\w+))?(?!.* USING)"
+    r"|(?:SCAN|SEARCH) (?:TABLE )?(\w+)(?: AS (\w+))? USING AUTOMATIC)"
+)
+_POSTGRES_TABLE_SCAN = re.compile(r"Seq Scan on \"?(\w+)\"?(?: \"?(\w+)\"?)?")
+_WHERE_CLAUSE = re.compile(
+    r"\bWHERE\b(.*?)(?=\bGROUP BY\b|\bORDER BY\b|\bLIMIT\b|$)", re.IGNORECASE
+)
+_QUALIFIED_COLUMN = re.compile(r"\"?(\w+)\"?\.\"?\w+")
+
+
+@dataclass
+class QueryPlan:
+    statement: str
+    plan: List[str]
+
+    @property
+    def uses_index(self) -> bool:
+        """Whether the database reads none of the tables that the
+        query filters on in full."""
+        filtered_tables = self.filtered_tables
+        return not any(filtered_tables & _scanned_tables(line) for line in self.plan)
+
+    @property
+    def filtered_tables(self) -> Set[str]:
+        """The tables and aliases whose columns appear in the WHERE
+        clauses of the statement."""
+        return {
+            table
+            for where_clause in _WHERE_CLAUSE.findall(self.statement)
+            for table in _QUALIFIED_COLUMN.findall(where_clause)
+        }
+
+
+def _scanned_tables(plan_line: str) -> Set[str]:
+    match = _SQLITE_TABLE_SCAN.match(plan_line.strip()) or (
+        _POSTGRES_TABLE_SCAN.search(plan_line)
+    )
+    if match is None:
+        return set()
+    return {name for name in match.groups() if name}
+
+
+@dataclass
+class MethodIndexUsage:
+    method: str
+    queries: List[QueryPlan]
+
+    @property
+    def probed(self) -> bool:
+        """Whether the method sent any queries that could be explained.
+        Methods that answer from the identity map send none."""
+        return bool(self.queries)
+
+    @property
+    def uses_indexes(self) -> bool:
+        return self.probed and all(query.uses_index for query in self.queries)
+
+
+@inject
+@dataclass
+class IndexUsageReport:
+    db: SQLAlchemy
+    account_owner_repository: AccountOwnerRepository
+    account_repository: AccountRepository
+    company_repository: CompanyRepository
+    company_worker_repository: CompanyWorkerRepository
+    cooperation_repository: CooperationRepository
+    member_repository: MemberRepository
+    message_repository: MessageRepository
+    plan_cooperation_repository: PlanCooperationRepository
+    plan_repository: PlanRepository
+    purchase_repository: PurchaseRepository
+    transaction_repository: TransactionRepository
+    worker_invite_repository: WorkerInviteRepository
+
+    def __call__(self) -> Iterator[MethodIndexUsage]:
+        for probe in self._probes():
+            method: Any = probe.func
+            yield MethodIndexUsage(
+                method=f"{type(method.__self__).__name__}.{method.__name__}",
+                queries=[
+                    self._explain(statement, parameters)
+                    for statement, parameters in self._record_queries(probe)
+                ],
+            )
+
+    def _probes(self) -> List[partial[Any]]:
+        """Calls to the repository methods with the hottest filter paths,
+        using the first company, member and plan found in the database.
+        """
+        probes: List[partial[Any]] = [
+            partial(self.plan_repository.get_active_plans),
+            partial(self.plan_repository.get_page_of_active_plans, PageRequest()),
+            partial(self.company_repository.get_all_companies, PageRequest()),
+            partial(
+                self.plan_repository.get_three_latest_active_plans_ordered_by_activation_date
+            ),
+            partial(self.plan_repository.all_plans_approved_active_and_not_expired),
+            partial(
+                self.plan_repository.all_productive_plans_approved_active_and_not_expired
+            ),
+        ]
+        if company_id := self._first_id(models.Company):
+            company = self.company_repository.get_by_id(company_id)
+            assert company
+            probes += [
+                partial(
+                    self.plan_repository.get_all_plans_for_company_descending,
+                    company.id,
+                ),
+                partial(
+                    self.plan_repository.get_all_active_plans_for_company, company.id
+                ),
+                partial(
+                    self.transaction_repository.all_transactions_sent_by_account,
+                    company.work_account,
+                ),
+                partial(
+                    self.transaction_repository.all_transactions_received_by_account,
+                    company.work_account,
+                ),
+                partial(
+                    self.transaction_repository.get_transactions_of_accounts,
+                    company.accounts(),
+                    newest_first=True,
+                ),
+                partial(
+                    self.account_owner_repository.get_account_owner,
+                    company.work_account,
+                ),
+                partial(
+                    self.account_repository.get_balance_history, company.work_account
+                ),
+                partial(
+                    self.purchase_repository.get_purchases_descending_by_date,
+                    company,
+                    PageRequest(),
+                ),
+                partial(self.company_worker_repository.get_company_workers, company),
+                partial(
+                    self.company_worker_repository.get_page_of_company_workers,
+                    company,
+                    PageRequest(),
+                ),
+                partial(
+                    self.cooperation_repository.get_cooperations_coordinated_by_company,
+                    company.id,
+                ),
+                partial(
+                    self.message_repository.has_unread_messages_for_user, company.id
+                ),
+                partial(
+                    self.message_repository.get_messages_to_user,
+                    company.id,
+                    PageRequest(),
+                ),
+            ]
+        if member_id := self._first_id(models.Member):
+            member = self.member_repository.get_by_id(member_id)
+            assert member
+            probes += [
+                partial(
+                    self.purchase_repository.get_purchases_descending_by_date,
+                    member,
+                    PageRequest(),
+                ),
+                partial(
+                    self.company_worker_repository.get_member_workplaces, member.id
+                ),
+                partial(
+                    self.worker_invite_repository.get_companies_worker_is_invited_to,
+                    member.id,
+                ),
+            ]
+        if plan_id := self._first_id(models.Plan):
+            plan = self.plan_repository.get_plan_by_id(plan_id)
+            assert plan
+            probes += [
+                partial(self.transaction_repository.get_sales_balance_of_plan, plan),
+                partial(
+                    self.transaction_repository.get_sales_balances_of_plans, [plan]
+                ),
+                partial(
+                    self.plan_cooperation_repository.get_plans_in_cooperation,
+                    plan.cooperation or plan.id,
+                ),
+            ]
+        return probes
+
+    def _first_id(self, model: Any) -> Optional[UUID]:
+        row = self.db.session.query(model.id).first()
+        return UUID(row.id) if row else None
+
+    def _record_queries(self, probe: Callable[[], Any]) -> List[Tuple[str, Any]]:
+        queries: List[Tuple[str, Any]] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                queries.append((statement, parameters))
+
+        event.listen(self.db.engine, "before_cursor_execute", record)
+        try:
+            result = probe()
+            if isinstance(result, Iterable):
+                list(result)
+        finally:
+            event.remove(self.db.engine, "before_cursor_execute", record)
+        return queries
+
+    def _explain(self, statement: str, parameters: Any) -> QueryPlan:
+        if self.db.engine.dialect.name == "sqlite":
+            prefix = "EXPLAIN QUERY PLAN "
+        else:
+            prefix = "EXPLAIN "
+        rows = (
+            self.db.session.connection()
+            .exec_driver_sql(prefix + statement, parameters)
+            .fetchall()
+        )
+        return QueryPlan(
+            statement=" ".join(statement.split()),
+            plan=[str(row[-1]) for row in rows],
+        )
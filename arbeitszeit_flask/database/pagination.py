@@ -0,0 +1,99 @@
+"""Keyset pagination of sqlalchemy queries.
+
+Instead of skipping rows with OFFSET, the query of a following page is
+restricted to rows sorting after the sort key of the last row of the
+previous page. With an index on the sort key the database reads only
+the rows of the requested page, no matter how deep into the listing
+the page is.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from arbeitszeit.pagination import Page, PageRequest, decode_cursor, encode_cursor
+
+T = TypeVar("T")
+
+
+@dataclass
+class SortKey:
+    expression: Any
+    descending: bool = False
+    # Restores the value of the expression from its json representation
+    # in a cursor.
+    parse: Callable[[Any], Any] = lambda value: value
+
+    def to_cursor_value(self, value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
+
+def paginate(
+    query: Query,
+    sort_keys: List[SortKey],
+    page: PageRequest,
+    object_from_row: Callable[[Any], T],
+) -> Page[T]:
+    """Fetch a page of the rows of query, ordered by sort_keys. The sort
+    keys must identify a row uniquely, usually by ending with the
+    primary key.
+    """
+    if (after := _parse_cursor(page.cursor, sort_keys)) is not None:
+        query = query.filter(_sorts_after(sort_keys, after))
+    rows = (
+        query.add_columns(*(key.expression for key in sort_keys))
+        .order_by(
+            *(
+                key.expression.desc() if key.descending else key.expression
+                for key in sort_keys
+            )
+        )
+        .limit(page.size + 1)
+        .all()
+    )
+    next_cursor: Optional[str] = None
+    if len(rows) > page.size:
+        rows = rows[: page.size]
+        last_row_key = rows[-1][1:]
+        next_cursor = encode_cursor(
+            [key.to_cursor_value(value) for key, value in zip(sort_keys, last_row_key)]
+        )
+    return Page(
+        items=[object_from_row(row[0]) for row in rows],
+        next_cursor=next_cursor,
+    )
+
+
+def _parse_cursor(
+    cursor: Optional[str], sort_keys: List[SortKey]
+) -> Optional[Tuple[Any, ...]]:
+    values = decode_cursor(cursor, len(sort_keys))
+    if values is None:
+        return None
+    try:
+        return tuple(key.parse(value) for key, value in zip(sort_keys, values))
+    except (TypeError, ValueError):
+        return None
+
+
+def _sorts_after(sort_keys: List[SortKey], values: Tuple[Any, ...]) -> Any:
+    # (a, b) > (x, y) expands to a > x OR (a = x AND b > y). Row value
+    # comparisons would be shorter but cannot mix sort directions.
+    conditions = []
+    for index, (key, value) in enumerate(zip(sort_keys, values)):
+        equal_prefix = [
+            previous.expression == previous_value
+            for previous, previous_value in zip(sort_keys[:index], values[:index])
+        ]
+        if key.descending:
+            conditions.append(and_(*equal_prefix, key.expression < value))
+        else:
+            conditions.append(and_(*equal_prefix, key.expression > value))
+    return or_(*conditions)
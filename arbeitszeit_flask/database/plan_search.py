@@ -0,0 +1,154 @@
+"""Text search over the product name and description of plans.
+
+On postgres the search uses expression indexes (a tsvector index for
+ranking by words and a pg_trgm index for substring matches). On sqlite
+it uses an FTS5 table with the trigram tokenizer. Both are kept up to
+date by the database itself whenever a plan row is written, so plans
+show up in the search as soon as they are approved, while filtering
+for active plans happens at query time.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from flask_sqlalchemy import BaseQuery, SQLAlchemy
+from injector import inject
+from sqlalchemy import (
+    DDL,
+    Float,
+    cast,
+    column,
+    event,
+    func,
+    literal_column,
+    or_,
+    table,
+    text,
+)
+
+from arbeitszeit_flask.database.pagination import SortKey
+from arbeitszeit_flask.models import Plan
+
+POSTGRESQL_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_plan_search_words ON plan "
+    "USING gin (to_tsvector('simple', prd_name || ' ' || description))",
+    "CREATE INDEX IF NOT EXISTS ix_plan_search_trigrams ON plan "
+    "USING gin ((prd_name || ' ' || description) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_plan_id_prefix ON plan (id varchar_pattern_ops)",
+]
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS plan_search USING fts5("
+    "plan_id UNINDEXED, prd_name, description, tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS plan_search_insert AFTER INSERT ON plan BEGIN "
+    "INSERT INTO plan_search (plan_id, prd_name, description) "
+    "VALUES (new.id, new.prd_name, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS plan_search_update "
+    "AFTER UPDATE OF prd_name, description ON plan BEGIN "
+    "UPDATE plan_search SET prd_name = new.prd_name, description = new.description "
+    "WHERE plan_id = new.id; END",
+    "CREATE TRIGGER IF NOT EXISTS plan_search_delete AFTER DELETE ON plan BEGIN "
+    "DELETE FROM plan_search WHERE plan_id = old.id; END",
+]
+
+_plan_search_table = table("plan_search", column("plan_id"))
+
+# The trigram tokenizer cannot match queries shorter than three
+# characters.
+_MINIMUM_TRIGRAM_QUERY_LENGTH = 3
+
+for _statement in POSTGRESQL_DDL:
+    event.listen(
+        Plan.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql")
+    )
+for _statement in SQLITE_DDL:
+    event.listen(
+        Plan.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Plan.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS plan_search").execute_if(dialect="sqlite"),
+)
+
+
+@inject
+@dataclass
+class PlanSearch:
+    db: SQLAlchemy
+
+    def filter_by_text(
+        self, plans: BaseQuery, query: str
+    ) -> Tuple[BaseQuery, List[SortKey]]:
+        """Restrict plans to those whose product name or description
+        contains the query. The returned sort keys order them by
+        relevance.
+        """
+        dialect = self.db.engine.dialect.name
+        if dialect == "postgresql":
+            return self._filter_by_text_postgresql(plans, query)
+        elif dialect == "sqlite" and len(query) >= _MINIMUM_TRIGRAM_QUERY_LENGTH:
+            return self._filter_by_text_sqlite(plans, query)
+        plans = plans.filter(
+            or_(
+                Plan.prd_name.ilike(self._contains_pattern(query), escape="/"),
+                Plan.description.ilike(self._contains_pattern(query), escape="/"),
+            )
+        )
+        return plans, [SortKey(Plan.prd_name), SortKey(Plan.id)]
+
+    def filter_by_plan_id(
+        self, plans: BaseQuery, query: str
+    ) -> Tuple[BaseQuery, List[SortKey]]:
+        """Restrict plans to those whose id equals or starts with the
+        query."""
+        query = query.strip().lower()
+        plans = plans.filter(Plan.id.like(self._escape_like(query) + "%", escape="/"))
+        return plans, [SortKey(Plan.id)]
+
+    def _filter_by_text_postgresql(
+        self, plans: BaseQuery, query: str
+    ) -> Tuple[BaseQuery, List[SortKey]]:
+        # The expressions must match the index definitions above
+        # literally, therefore the constants are not passed as bind
+        # parameters.
+        document = Plan.prd_name.op("||")(literal_column("' '")).op("||")(
+            Plan.description
+        )
+        words = func.to_tsvector(literal_column("'simple'"), document)
+        search_query = func.plainto_tsquery(literal_column("'simple'"), query)
+        # The rank is a single precision float. Casting it to double
+        # precision makes it survive the round trip through a page
+        # cursor unchanged.
+        rank = cast(
+            func.ts_rank(words, search_query) + func.similarity(Plan.prd_name, query),
+            Float,
+        )
+        plans = plans.filter(
+            or_(
+                words.op("@@")(search_query),
+                document.ilike(self._contains_pattern(query), escape="/"),
+            )
+        )
+        return plans, [SortKey(rank, descending=True), SortKey(Plan.id)]
+
+    def _filter_by_text_sqlite(
+        self, plans: BaseQuery, query: str
+    ) -> Tuple[BaseQuery, List[SortKey]]:
+        phrase = '"' + query.replace('"', '""') + '"'
+        plans = (
+            plans.join(_plan_search_table, _plan_search_table.c.plan_id == Plan.id)
+            .filter(text("plan_search MATCH :plan_search_phrase"))
+            .params(plan_search_phrase=phrase)
+        )
+        rank = literal_column("bm25(plan_search, 0.0, 10.0, 1.0)")
+        return plans, [SortKey(rank), SortKey(Plan.id)]
+
+    def _contains_pattern(self, query: str) -> str:
+        return "%" + self._escape_like(query) + "%"
+
+    def _escape_like(self, query: str) -> str:
+        return query.replace("/", "//").replace("%", "/%").replace("_", "/_")
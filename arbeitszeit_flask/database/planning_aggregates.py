@@ -0,0 +1,184 @@
+"""Running totals over the production costs of all active plans.
+
+The payout factor and the economy wide statistics are sums over every
+active plan. Instead of loading all of those plans, the sums are kept
+in the planning_aggregate table, which has one row for productive and
+one for public plans. PlanRepository updates the row of a plan whenever
+the plan is activated or expires.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from flask_sqlalchemy import SQLAlchemy
+from injector import inject
+from sqlalchemy import event
+
+from arbeitszeit import entities
+from arbeitszeit_flask.models import Plan, PlanningAggregate
+
+# The costs per day are quotients that sqlite stores as floating point
+# numbers. Totals within this distance are considered equal.
+TOLERANCE = Decimal("0.000001")
+
+
+@event.listens_for(PlanningAggregate.__table__, "after_create")
+def _insert_empty_aggregates(target, connection, **kwargs) -> None:
+    connection.execute(
+        target.insert(),
+        [dict(is_public_service=False), dict(is_public_service=True)],
+    )
+
+
+@dataclass
+class PlanningTotals:
+    active_plans: int
+    timeframe: Decimal
+    costs: entities.ProductionCosts
+    costs_per_day: entities.ProductionCosts
+
+    @classmethod
+    def zero(cls) -> PlanningTotals:
+        return cls(
+            active_plans=0,
+            timeframe=Decimal(0),
+            costs=entities.ProductionCosts(Decimal(0), Decimal(0), Decimal(0)),
+            costs_per_day=entities.ProductionCosts(Decimal(0), Decimal(0), Decimal(0)),
+        )
+
+    @classmethod
+    def of_plan(cls, costs: entities.ProductionCosts, timeframe: int) -> PlanningTotals:
+        return cls(
+            active_plans=1,
+            timeframe=Decimal(timeframe),
+            costs=costs,
+            costs_per_day=costs / timeframe,
+        )
+
+    def __add__(self, other: PlanningTotals) -> PlanningTotals:
+        return PlanningTotals(
+            active_plans=self.active_plans + other.active_plans,
+            timeframe=self.timeframe + other.timeframe,
+            costs=self.costs + other.costs,
+            costs_per_day=self.costs_per_day + other.costs_per_day,
+        )
+
+    def is_close_to(self, other: PlanningTotals) -> bool:
+        return self.active_plans == other.active_plans and all(
+            abs(a - b) < TOLERANCE
+            for a, b in zip(self._decimal_values(), other._decimal_values())
+        )
+
+    def _decimal_values(self) -> List[Decimal]:
+        return [
+            self.timeframe,
+            self.costs.means_cost,
+            self.costs.resource_cost,
+            self.costs.labour_cost,
+            self.costs_per_day.means_cost,
+            self.costs_per_day.resource_cost,
+            self.costs_per_day.labour_cost,
+        ]
+
+
+@inject
+@dataclass
+class PlanningAggregates:
+    db: SQLAlchemy
+
+    def record_activation(self, plan: entities.Plan) -> None:
+        self._add_to_totals(plan, sign=1)
+
+    def record_expiration(self, plan: entities.Plan) -> None:
+        self._add_to_totals(plan, sign=-1)
+
+    def get_totals(self, is_public_service: bool) -> PlanningTotals:
+        row = self._query_totals().filter_by(is_public_service=is_public_service).one()
+        return self._totals_from_row(row)
+
+    def get_totals_of_all_plans(self) -> PlanningTotals:
+        return sum(
+            (self._totals_from_row(row) for row in self._query_totals()),
+            start=PlanningTotals.zero(),
+        )
+
+    def recalculate_totals(self) -> Dict[bool, PlanningTotals]:
+        """Sum up the costs of all active plans from scratch."""
+        totals = {False: PlanningTotals.zero(), True: PlanningTotals.zero()}
+        for is_public_service, timeframe, costs_a, costs_r, costs_p in (
+            self.db.session.query(
+                Plan.is_public_service,
+                Plan.timeframe,
+                Plan.costs_a,
+                Plan.costs_r,
+                Plan.costs_p,
+            )
+            .filter(Plan.is_active == True)
+            .all()
+        ):
+            totals[is_public_service] += PlanningTotals.of_plan(
+                entities.ProductionCosts(
+                    labour_cost=costs_a, resource_cost=costs_r, means_cost=costs_p
+                ),
+                int(timeframe),
+            )
+        return totals
+
+    def store_totals(self, totals: Dict[bool, PlanningTotals]) -> None:
+        for is_public_service, plan_totals in totals.items():
+            PlanningAggregate.query.filter_by(
+                is_public_service=is_public_service
+            ).update(_column_values(plan_totals), synchronize_session=False)
+
+    def _add_to_totals(self, plan: entities.Plan, sign: int) -> None:
+        """Add the costs of a plan to the totals of its kind, or
+        subtract them for a negative sign, with a single UPDATE
+        statement."""
+        plan_totals = PlanningTotals.of_plan(plan.production_costs, plan.timeframe)
+        PlanningAggregate.query.filter_by(
+            is_public_service=plan.is_public_service
+        ).update(
+            {
+                column: column + sign * value
+                for column, value in _column_values(plan_totals).items()
+            },
+            synchronize_session=False,
+        )
+
+    def _query_totals(self):
+        # The totals are changed by UPDATE statements that bypass the
+        # session, therefore the columns are selected instead of
+        # PlanningAggregate instances that the session may have cached.
+        return self.db.session.query(*_column_values(PlanningTotals.zero()).keys())
+
+    def _totals_from_row(self, row) -> PlanningTotals:
+        return PlanningTotals(
+            active_plans=row.active_plans,
+            timeframe=Decimal(row.timeframe),
+            costs=entities.ProductionCosts(
+                labour_cost=Decimal(row.costs_a),
+                resource_cost=Decimal(row.costs_r),
+                means_cost=Decimal(row.costs_p),
+            ),
+            costs_per_day=entities.ProductionCosts(
+                labour_cost=Decimal(row.costs_a_per_day),
+                resource_cost=Decimal(row.costs_r_per_day),
+                means_cost=Decimal(row.costs_p_per_day),
+            ),
+        )
+
+
+def _column_values(totals: PlanningTotals) -> Dict[Any, Any]:
+    return {
+        PlanningAggregate.active_plans: totals.active_plans,
+        PlanningAggregate.timeframe: totals.timeframe,
+        PlanningAggregate.costs_p: totals.costs.means_cost,
+        PlanningAggregate.costs_r: totals.costs.resource_cost,
+        PlanningAggregate.costs_a: totals.costs.labour_cost,
+        PlanningAggregate.costs_p_per_day: totals.costs_per_day.means_cost,
+        PlanningAggregate.costs_r_per_day: totals.costs_per_day.resource_cost,
+        PlanningAggregate.costs_a_per_day: totals.costs_per_day.labour_cost,
+    }
@@ -1,22 +1,32 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Iterable, Iterator, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from uuid import UUID, uuid4
 
-from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy import BaseQuery, SQLAlchemy
 from injector import inject
-from sqlalchemy import desc, func
+from sqlalchemy import and_, case, func, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Bundle, aliased
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from arbeitszeit import entities, repositories
-from arbeitszeit.decimal import decimal_sum
+from arbeitszeit.pagination import Page, PageRequest
 from arbeitszeit.user_action import UserAction
 from arbeitszeit_flask import models
+from arbeitszeit_flask.database.account_owner_names import AccountOwnerNameCache
+from arbeitszeit_flask.database.balance_checkpoints import BalanceCheckpoints
+from arbeitszeit_flask.database.identity_map import IdentityMap
+from arbeitszeit_flask.database.pagination import SortKey, paginate
+from arbeitszeit_flask.database.plan_search import PlanSearch
+from arbeitszeit_flask.database.planning_aggregates import PlanningAggregates
 from arbeitszeit_flask.models import (
     Account,
+    AccountBalance,
     AccountTypes,
     Company,
     CompanyWorkInvite,
@@ -28,6 +38,8 @@ from arbeitszeit_flask.models import (
     Purchase,
     SocialAccounting,
     Transaction,
+    UnreadMessageCount,
+    UserKind,
 )
 
 
@@ -52,6 +64,17 @@ class CompanyWorkerRepository(repositories.CompanyWorkerRepository):
             for member in company_orm.workers
         ]
 
+    def get_page_of_company_workers(
+        self, company: entities.Company, page: PageRequest
+    ) -> Page[entities.Member]:
+        company_orm = self.company_repository.object_to_orm(company)
+        return paginate(
+            company_orm.workers,
+            [SortKey(Member.name), SortKey(Member.id)],
+            page,
+            self.member_repository.object_from_orm,
+        )
+
     def get_member_workplaces(self, member: UUID) -> List[entities.Company]:
         member_orm = Member.query.filter_by(id=str(member)).first()
         if member_orm is None:
@@ -81,8 +104,11 @@ class UserAddressBookImpl:
 class MemberRepository(repositories.MemberRepository):
     account_repository: AccountRepository
     db: SQLAlchemy
+    identity_map: IdentityMap
 
     def get_by_id(self, id: UUID) -> Optional[entities.Member]:
+        if member := self.identity_map.get(entities.Member, UUID(str(id))):
+            return member
         orm_object = Member.query.filter_by(id=str(id)).first()
         if orm_object is None:
             return None
@@ -104,14 +130,20 @@ class MemberRepository(repositories.MemberRepository):
         return member_orm
 
     def object_from_orm(self, orm_object: Member) -> entities.Member:
+        member_id = UUID(orm_object.id)
+        if member := self.identity_map.get(entities.Member, member_id):
+            return member
         member_account = self.account_repository.object_from_orm(orm_object.account)
-        return entities.Member(
-            id=UUID(orm_object.id),
-            name=orm_object.name,
-            account=member_account,
-            email=orm_object.email,
-            registered_on=orm_object.registered_on,
-            confirmed_on=orm_object.confirmed_on,
+        return self.identity_map.add(
+            member_id,
+            entities.Member(
+                id=member_id,
+                name=orm_object.name,
+                account=member_account,
+                email=orm_object.email,
+                registered_on=orm_object.registered_on,
+                confirmed_on=orm_object.confirmed_on,
+            ),
         )
 
     def object_to_orm(self, member: entities.Member) -> Member:
@@ -154,57 +186,65 @@ class MemberRepository(repositories.MemberRepository):
 class CompanyRepository(repositories.CompanyRepository):
     account_repository: AccountRepository
     db: SQLAlchemy
+    identity_map: IdentityMap
 
     def object_to_orm(self, company: entities.Company) -> Company:
         return Company.query.get(str(company.id))
 
     def object_from_orm(self, company_orm: Company) -> entities.Company:
-        return entities.Company(
-            id=UUID(company_orm.id),
-            email=company_orm.email,
-            name=company_orm.name,
-            means_account=self.account_repository.object_from_orm(
-                self._get_means_account(company_orm)
-            ),
-            raw_material_account=self.account_repository.object_from_orm(
-                self._get_resources_account(company_orm)
-            ),
-            work_account=self.account_repository.object_from_orm(
-                self._get_labour_account(company_orm)
-            ),
-            product_account=self.account_repository.object_from_orm(
-                self._get_products_account(company_orm)
+        company_id = UUID(company_orm.id)
+        if company := self.identity_map.get(entities.Company, company_id):
+            return company
+        return self._company_from_orm(company_orm, company_orm.accounts)
+
+    def load_companies(self, ids: Iterable[UUID]) -> None:
+        """Add those of the companies to the identity map that are not
+        in it yet, reading them and their accounts with two queries.
+        Listings call this before hydrating the entities that refer to
+        the companies, instead of looking up every company by itself.
+        """
+        missing = {
+            str(id) for id in ids if not self.identity_map.get(entities.Company, id)
+        }
+        if not missing:
+            return
+        accounts: Dict[str, List[Account]] = defaultdict(list)
+        for account in Account.query.filter(Account.account_owner_company.in_(missing)):
+            accounts[account.account_owner_company].append(account)
+        for company_orm in Company.query.filter(Company.id.in_(missing)):
+            self._company_from_orm(company_orm, accounts[company_orm.id])
+
+    def _company_from_orm(
+        self, company_orm: Company, account_orms: Iterable[Account]
+    ) -> entities.Company:
+        company_id = UUID(company_orm.id)
+        accounts = {
+            account.account_type: self.account_repository.object_from_orm(account)
+            for account in account_orms
+        }
+        return self.identity_map.add(
+            company_id,
+            entities.Company(
+                id=company_id,
+                email=company_orm.email,
+                name=company_orm.name,
+                means_account=accounts[AccountTypes.p],
+                raw_material_account=accounts[AccountTypes.r],
+                work_account=accounts[AccountTypes.a],
+                product_account=accounts[AccountTypes.prd],
+                registered_on=company_orm.registered_on,
+                confirmed_on=company_orm.confirmed_on,
             ),
-            registered_on=company_orm.registered_on,
-            confirmed_on=company_orm.confirmed_on,
         )
 
-    def _get_means_account(self, company: Company) -> Account:
-        account = company.accounts.filter_by(account_type="p").first()
-        assert account
-        return account
-
-    def _get_resources_account(self, company: Company) -> Account:
-        account = company.accounts.filter_by(account_type="r").first()
-        assert account
-        return account
-
-    def _get_labour_account(self, company: Company) -> Account:
-        account = company.accounts.filter_by(account_type="a").first()
-        assert account
-        return account
-
-    def _get_products_account(self, company: Company) -> Account:
-        account = company.accounts.filter_by(account_type="prd").first()
-        assert account
-        return account
-
     def get_company_orm_by_mail(self, email: str) -> Company:
         company_orm = Company.query.filter_by(email=email).first()
         assert company_orm
         return company_orm
 
     def get_by_id(self, id: UUID) -> Optional[entities.Company]:
+        if company := self.identity_map.get(entities.Company, UUID(str(id))):
+            return company
         company_orm = Company.query.filter_by(id=str(id)).first()
         if company_orm is None:
             return None
@@ -247,24 +287,32 @@ class CompanyRepository(repositories.CompanyRepository):
     def count_registered_companies(self) -> int:
         return int(self.db.session.query(func.count(Company.id)).one()[0])
 
-    def query_companies_by_name(self, query: str) -> Iterator[entities.Company]:
-        return (
-            self.object_from_orm(company)
-            for company in Company.query.filter(
-                Company.name.ilike("%" + query + "%")
-            ).all()
+    def query_companies_by_name(
+        self, query: str, page: PageRequest
+    ) -> Page[entities.Company]:
+        return self._paginate_companies(
+            Company.query.filter(Company.name.ilike("%" + query + "%")), page
         )
 
-    def query_companies_by_email(self, query: str) -> Iterator[entities.Company]:
-        return (
-            self.object_from_orm(company)
-            for company in Company.query.filter(
-                Company.email.ilike("%" + query + "%")
-            ).all()
+    def query_companies_by_email(
+        self, query: str, page: PageRequest
+    ) -> Page[entities.Company]:
+        return self._paginate_companies(
+            Company.query.filter(Company.email.ilike("%" + query + "%")), page
         )
 
-    def get_all_companies(self) -> Iterator[entities.Company]:
-        return (self.object_from_orm(company) for company in Company.query.all())
+    def get_all_companies(self, page: PageRequest) -> Page[entities.Company]:
+        return self._paginate_companies(Company.query, page)
+
+    def _paginate_companies(
+        self, companies: BaseQuery, page: PageRequest
+    ) -> Page[entities.Company]:
+        return paginate(
+            companies,
+            [SortKey(Company.name), SortKey(Company.id)],
+            page,
+            self.object_from_orm,
+        )
 
     def validate_credentials(self, email_address: str, password: str) -> Optional[UUID]:
         if (
@@ -281,12 +329,20 @@ class CompanyRepository(repositories.CompanyRepository):
 @dataclass
 class AccountRepository(repositories.AccountRepository):
     db: SQLAlchemy
+    identity_map: IdentityMap
+    balance_checkpoints: BalanceCheckpoints
 
     def object_from_orm(self, account_orm: Account) -> entities.Account:
         assert account_orm
-        return entities.Account(
-            id=UUID(account_orm.id),
-            account_type=self._transform_account_type(account_orm.account_type),
+        account_id = UUID(account_orm.id)
+        if account := self.identity_map.get(entities.Account, account_id):
+            return account
+        return self.identity_map.add(
+            account_id,
+            entities.Account(
+                id=account_id,
+                account_type=self._transform_account_type(account_orm.account_type),
+            ),
         )
 
     def _transform_account_type(
@@ -311,22 +367,126 @@ class AccountRepository(repositories.AccountRepository):
         return account_orm
 
     def create_account(self, account_type: entities.AccountTypes) -> entities.Account:
-        account = Account(id=str(uuid4()), account_type=account_type.value)
+        account = Account(
+            id=str(uuid4()),
+            account_type=AccountTypes(account_type.value),
+            balance=AccountBalance(sent=0, received=0),
+        )
         self.db.session.add(account)
         return self.object_from_orm(account)
 
     def get_account_balance(self, account: entities.Account) -> Decimal:
-        account_orm = self.object_to_orm(account)
-        received = set(account_orm.transactions_received)
-        sent = set(account_orm.transactions_sent)
-        intersection = received & sent
-        received -= intersection
-        sent -= intersection
-        return decimal_sum(t.amount_received for t in received) - decimal_sum(
-            t.amount_sent for t in sent
+        balance = (
+            self.db.session.query(AccountBalance.sent, AccountBalance.received)
+            .filter(AccountBalance.account_id == str(account.id))
+            .first()
+        )
+        assert balance
+        return Decimal(balance.received) - Decimal(balance.sent)
+
+    def sum_of_balances_by_account_type(
+        self,
+    ) -> Dict[entities.AccountTypes, Decimal]:
+        return {
+            self._transform_account_type(account_type): Decimal(received)
+            - Decimal(sent)
+            for account_type, sent, received in self.db.session.query(
+                Account.account_type,
+                func.sum(AccountBalance.sent),
+                func.sum(AccountBalance.received),
+            )
+            .join(AccountBalance, Account.balance)
+            .group_by(Account.account_type)
+        }
+
+    def get_account_balance_at(
+        self, account: entities.Account, timestamp: datetime
+    ) -> Decimal:
+        return self.balance_checkpoints.get_balance_at(str(account.id), timestamp)
+
+    def get_balance_history(
+        self, account: entities.Account
+    ) -> List[repositories.BalanceHistoryEntry]:
+        return self.balance_checkpoints.get_balance_history(str(account.id))
+
+    def get_balance_history_revision(self, account: entities.Account) -> str:
+        return self.balance_checkpoints.get_balance_history_revision(str(account.id))
+
+    def record_sent_amount(self, account: entities.Account, amount: Decimal) -> None:
+        AccountBalance.query.filter_by(account_id=str(account.id)).update(
+            {AccountBalance.sent: AccountBalance.sent + amount},
+            synchronize_session=False,
+        )
+
+    def record_received_amount(
+        self, account: entities.Account, amount: Decimal
+    ) -> None:
+        AccountBalance.query.filter_by(account_id=str(account.id)).update(
+            {AccountBalance.received: AccountBalance.received + amount},
+            synchronize_session=False,
+        )
+
+    def record_sent_amounts(self, amounts: Dict[UUID, Decimal]) -> None:
+        self._add_to_balances(AccountBalance.sent, amounts)
+
+    def record_received_amounts(self, amounts: Dict[UUID, Decimal]) -> None:
+        self._add_to_balances(AccountBalance.received, amounts)
+
+    def _add_to_balances(self, column, amounts: Dict[UUID, Decimal]) -> None:
+        """Add to the balances of many accounts with a single UPDATE
+        statement."""
+        if not amounts:
+            return
+        amounts_by_id = {str(id): amount for id, amount in amounts.items()}
+        AccountBalance.query.filter(
+            AccountBalance.account_id.in_(amounts_by_id.keys())
+        ).update(
+            {column: column + case(amounts_by_id, value=AccountBalance.account_id)},
+            synchronize_session=False,
+        )
+
+    def get_accounts_with_inconsistent_balance(self) -> List[UUID]:
+        """Recalculate the balance of every account from the full
+        transaction history and return the ids of all accounts where
+        the stored totals differ.
+        """
+        is_not_internal = Transaction.sending_account != Transaction.receiving_account
+        sent_totals = dict(
+            self.db.session.query(
+                Transaction.sending_account, func.sum(Transaction.amount_sent)
+            )
+            .filter(is_not_internal)
+            .group_by(Transaction.sending_account)
+            .all()
+        )
+        received_totals = dict(
+            self.db.session.query(
+                Transaction.receiving_account, func.sum(Transaction.amount_received)
+            )
+            .filter(is_not_internal)
+            .group_by(Transaction.receiving_account)
+            .all()
         )
+        inconsistent_accounts = []
+        for account_id, sent, received in (
+            self.db.session.query(
+                Account.id, AccountBalance.sent, AccountBalance.received
+            )
+            .outerjoin(AccountBalance, AccountBalance.account_id == Account.id)
+            .all()
+        ):
+            if (
+                sent is None
+                or received is None
+                or Decimal(sent) != Decimal(sent_totals.get(account_id) or 0)
+                or Decimal(received) != Decimal(received_totals.get(account_id) or 0)
+            ):
+                inconsistent_accounts.append(UUID(account_id))
+        return inconsistent_accounts
 
     def get_by_id(self, id: UUID) -> entities.Account:
+        if account := self.identity_map.get(entities.Account, UUID(str(id))):
+            return account
         return self.object_from_orm(Account.query.get(str(id)))
 
 
@@ -337,6 +497,7 @@ class AccountOwnerRepository(repositories.AccountOwnerRepository):
     member_repository: MemberRepository
     company_repository: CompanyRepository
     social_accounting_repository: AccountingRepository
+    owner_names: AccountOwnerNameCache
 
     def get_account_owner(
         self, account: entities.Account
@@ -357,6 +518,44 @@ class AccountOwnerRepository(repositories.AccountOwnerRepository):
         assert account_owner
         return account_owner
 
+    def get_account_owner_names(
+        self, accounts: Iterable[entities.Account]
+    ) -> Dict[UUID, str]:
+        """Names that are not cached yet are read with a single query,
+        without hydrating the owners."""
+        account_ids = {account.id for account in accounts}
+        names = self.owner_names.get_many(account_ids)
+        missing_ids = account_ids - names.keys()
+        if not missing_ids:
+            return names
+        rows = (
+            self.account_repository.db.session.query(
+                Account.id,
+                Account.account_owner_social_accounting,
+                Member.name,
+                Company.name,
+            )
+            .outerjoin(Member, Member.id == Account.account_owner_member)
+            .outerjoin(Company, Company.id == Account.account_owner_company)
+            .filter(Account.id.in_([str(account_id) for account_id in missing_ids]))
+        )
+        for account_orm_id, social_accounting_id, member_name, company_name in rows:
+            account_id = UUID(account_orm_id)
+            if member_name is not None:
+                names[account_id] = member_name
+                continue
+            if company_name is not None:
+                name = company_name
+            else:
+                assert social_accounting_id
+                social_accounting = (
+                    self.social_accounting_repository.get_or_create_social_accounting()
+                )
+                name = social_accounting.get_name()
+            self.owner_names.put(account_id, name)
+            names[account_id] = name
+        return names
+
 
 @inject
 @dataclass
@@ -472,16 +671,25 @@ class PurchaseRepository(repositories.PurchaseRepository):
         return purchase
 
     def get_purchases_descending_by_date(
-        self, user: Union[entities.Member, entities.Company]
-    ) -> Iterator[entities.Purchase]:
+        self, user: Union[entities.Member, entities.Company], page: PageRequest
+    ) -> Page[entities.Purchase]:
         user_orm: Union[Member, Company]
         if isinstance(user, entities.Company):
             user_orm = self.company_repository.object_to_orm(user)
         else:
             user_orm = self.member_repository.object_to_orm(user)
-        return (
-            self.object_from_orm(purchase)
-            for purchase in user_orm.purchases.order_by(desc("purchase_date")).all()
+        return paginate(
+            user_orm.purchases,
+            [
+                SortKey(
+                    Purchase.purchase_date,
+                    descending=True,
+                    parse=datetime.fromisoformat,
+                ),
+                SortKey(Purchase.id, descending=True),
+            ],
+            page,
+            self.object_from_orm,
         )
 
 
@@ -490,8 +698,14 @@ class PurchaseRepository(repositories.PurchaseRepository):
 class PlanRepository(repositories.PlanRepository):
     company_repository: CompanyRepository
     db: SQLAlchemy
+    identity_map: IdentityMap
+    plan_search: PlanSearch
+    planning_aggregates: PlanningAggregates
 
     def object_from_orm(self, plan: Plan) -> entities.Plan:
+        plan_id = UUID(plan.id)
+        if cached_plan := self.identity_map.get(entities.Plan, plan_id):
+            return cached_plan
         production_costs = entities.ProductionCosts(
             labour_cost=plan.costs_a,
             resource_cost=plan.costs_r,
@@ -499,8 +713,8 @@ class PlanRepository(repositories.PlanRepository):
         )
         planner = self.company_repository.get_by_id(UUID(plan.planner))
         assert planner is not None
-        return entities.Plan(
-            id=UUID(plan.id),
+        plan_entity = entities.Plan(
+            id=plan_id,
             plan_creation_date=plan.plan_creation_date,
             planner=planner,
             production_costs=production_costs,
@@ -526,11 +740,14 @@ class PlanRepository(repositories.PlanRepository):
             is_available=plan.is_available,
             hidden_by_user=plan.hidden_by_user,
         )
+        return self.identity_map.add(plan_id, plan_entity)
 
     def object_to_orm(self, plan: entities.Plan) -> Plan:
         return Plan.query.get(str(plan.id))
 
     def get_plan_by_id(self, id: UUID) -> Optional[entities.Plan]:
+        if plan := self.identity_map.get(entities.Plan, UUID(str(id))):
+            return plan
         plan_orm = Plan.query.filter_by(id=str(id)).first()
         if plan_orm is None:
             return None
@@ -557,10 +774,12 @@ class PlanRepository(repositories.PlanRepository):
             is_public_service=plan.is_public_service,
             is_active=False,
             activation_date=None,
+            expired=False,
             expiration_date=None,
             active_days=None,
             payout_count=0,
             is_available=True,
+            hidden_by_user=False,
         )
         self.db.session.add(plan)
         return plan
@@ -578,16 +797,22 @@ class PlanRepository(repositories.PlanRepository):
         plan.activation_date = activation_date
 
         plan_orm = self.object_to_orm(plan)
+        if not plan_orm.is_active:
+            self.planning_aggregates.record_activation(plan)
         plan_orm.is_active = True
         plan_orm.activation_date = activation_date
+        self.identity_map.invalidate(entities.Plan, plan.id)
 
     def set_plan_as_expired(self, plan: entities.Plan) -> None:
         plan.expired = True
         plan.is_active = False
 
         plan_orm = self.object_to_orm(plan)
+        if plan_orm.is_active:
+            self.planning_aggregates.record_expiration(plan)
         plan_orm.expired = True
         plan_orm.is_active = False
+        self.identity_map.invalidate(entities.Plan, plan.id)
 
     def set_expiration_date(
         self, plan: entities.Plan, expiration_date: datetime
@@ -596,24 +821,45 @@ class PlanRepository(repositories.PlanRepository):
 
         plan_orm = self.object_to_orm(plan)
         plan_orm.expiration_date = expiration_date
+        self.identity_map.invalidate(entities.Plan, plan.id)
 
     def set_expiration_relative(self, plan: entities.Plan, days: int) -> None:
         plan.expiration_relative = days
 
         plan_orm = self.object_to_orm(plan)
         plan_orm.expiration_relative = days
+        self.identity_map.invalidate(entities.Plan, plan.id)
 
     def set_active_days(self, plan: entities.Plan, full_active_days: int) -> None:
         plan.active_days = full_active_days
 
         plan_orm = self.object_to_orm(plan)
         plan_orm.active_days = full_active_days
+        self.identity_map.invalidate(entities.Plan, plan.id)
 
     def increase_payout_count_by_one(self, plan: entities.Plan) -> None:
         plan.payout_count += 1
 
         plan_orm = self.object_to_orm(plan)
         plan_orm.payout_count += 1
+        self.identity_map.invalidate(entities.Plan, plan.id)
+
+    def increase_payout_counts(
+        self, payout_counts: List[Tuple[entities.Plan, int]]
+    ) -> None:
+        increments: Dict[str, int] = defaultdict(int)
+        for plan, count in payout_counts:
+            if not count:
+                continue
+            plan.payout_count += count
+            increments[str(plan.id)] += count
+            self.identity_map.invalidate(entities.Plan, plan.id)
+        if not increments:
+            return
+        Plan.query.filter(Plan.id.in_(increments.keys())).update(
+            {Plan.payout_count: Plan.payout_count + case(increments, value=Plan.id)},
+            synchronize_session="fetch",
+        )
 
     def get_active_plans(self) -> Iterator[entities.Plan]:
         return (
@@ -621,61 +867,70 @@ class PlanRepository(repositories.PlanRepository):
             for plan_orm in Plan.query.filter_by(is_active=True).all()
         )
 
+    def get_page_of_active_plans(self, page: PageRequest) -> Page[entities.Plan]:
+        return self._paginate(
+            Plan.query.filter(Plan.is_active == True),
+            [SortKey(Plan.prd_name), SortKey(Plan.id)],
+            page,
+        )
+
     def get_three_latest_active_plans_ordered_by_activation_date(
         self,
     ) -> Iterator[entities.Plan]:
-        return (
-            self.object_from_orm(plan_orm)
-            for plan_orm in Plan.query.filter_by(is_active=True)
-            .order_by(Plan.activation_date.desc())
-            .limit(3)
+        return iter(
+            self._plans_from_orm(
+                Plan.query.filter_by(is_active=True)
+                .order_by(Plan.activation_date.desc())
+                .limit(3)
+                .all()
+            )
         )
 
-    def count_active_plans(self) -> int:
-        return int(
-            self.db.session.query(func.count(Plan.id))
-            .filter_by(is_active=True)
-            .one()[0]
+    def _paginate(
+        self, query: BaseQuery, sort_keys: List[SortKey], page: PageRequest
+    ) -> Page[entities.Plan]:
+        orm_page = paginate(query, sort_keys, page, lambda plan_orm: plan_orm)
+        return Page(
+            items=self._plans_from_orm(orm_page.items),
+            next_cursor=orm_page.next_cursor,
         )
 
-    def count_active_public_plans(self) -> int:
-        return int(
-            self.db.session.query(func.count(Plan.id))
-            .filter_by(is_active=True, is_public_service=True)
-            .one()[0]
+    def _plans_from_orm(self, plan_orms: List[Plan]) -> List[entities.Plan]:
+        # The planners of a listing are loaded together instead of one
+        # by one while the plans are hydrated.
+        self.company_repository.load_companies(
+            UUID(plan_orm.planner) for plan_orm in plan_orms
         )
+        return [self.object_from_orm(plan_orm) for plan_orm in plan_orms]
+
+    def count_active_plans(self) -> int:
+        return self.planning_aggregates.get_totals_of_all_plans().active_plans
+
+    def count_active_public_plans(self) -> int:
+        return self.planning_aggregates.get_totals(is_public_service=True).active_plans
 
     def avg_timeframe_of_active_plans(self) -> Decimal:
-        return Decimal(
-            self.db.session.query(func.avg(Plan.timeframe))
-            .filter_by(is_active=True)
-            .one()[0]
-            or 0
-        )
+        totals = self.planning_aggregates.get_totals_of_all_plans()
+        if not totals.active_plans:
+            return Decimal(0)
+        return totals.timeframe / totals.active_plans
 
     def sum_of_active_planned_work(self) -> Decimal:
-        return Decimal(
-            self.db.session.query(func.sum(Plan.costs_a))
-            .filter_by(is_active=True)
-            .one()[0]
-            or 0
-        )
+        return self.planning_aggregates.get_totals_of_all_plans().costs.labour_cost
 
     def sum_of_active_planned_resources(self) -> Decimal:
-        return Decimal(
-            self.db.session.query(func.sum(Plan.costs_r))
-            .filter_by(is_active=True)
-            .one()[0]
-            or 0
-        )
+        return self.planning_aggregates.get_totals_of_all_plans().costs.resource_cost
 
     def sum_of_active_planned_means(self) -> Decimal:
-        return Decimal(
-            self.db.session.query(func.sum(Plan.costs_p))
-            .filter_by(is_active=True)
-            .one()[0]
-            or 0
-        )
+        return self.planning_aggregates.get_totals_of_all_plans().costs.means_cost
+
+    def sum_of_active_productive_costs_per_day(self) -> entities.ProductionCosts:
+        return self.planning_aggregates.get_totals(
+            is_public_service=False
+        ).costs_per_day
+
+    def sum_of_active_public_costs_per_day(self) -> entities.ProductionCosts:
+        return self.planning_aggregates.get_totals(is_public_service=True).costs_per_day
 
     def all_plans_approved_and_not_expired(self) -> Iterator[entities.Plan]:
         return (
@@ -718,22 +973,23 @@ class PlanRepository(repositories.PlanRepository):
         plan_orm = Plan.query.filter_by(id=str(plan_id)).first()
         assert plan_orm
         plan_orm.hidden_by_user = True
+        self.identity_map.invalidate(entities.Plan, plan_id)
 
-    def query_active_plans_by_product_name(self, query: str) -> Iterator[entities.Plan]:
-        return (
-            self.object_from_orm(plan)
-            for plan in Plan.query.filter(
-                Plan.is_active == True, Plan.prd_name.ilike(f"%{query}%")
-            ).all()
+    def query_active_plans_by_product_name(
+        self, query: str, page: PageRequest
+    ) -> Page[entities.Plan]:
+        plans, sort_keys = self.plan_search.filter_by_text(
+            Plan.query.filter(Plan.is_active == True), query
         )
+        return self._paginate(plans, sort_keys, page)
 
-    def query_active_plans_by_plan_id(self, query: str) -> Iterator[entities.Plan]:
-        return (
-            self.object_from_orm(plan)
-            for plan in Plan.query.filter(
-                Plan.is_active == True, Plan.id.contains(query)
-            ).all()
+    def query_active_plans_by_plan_id(
+        self, query: str, page: PageRequest
+    ) -> Page[entities.Plan]:
+        plans, sort_keys = self.plan_search.filter_by_plan_id(
+            Plan.query.filter(Plan.is_active == True), query
         )
+        return self._paginate(plans, sort_keys, page)
 
     def get_all_plans_for_company_descending(
         self, company_id: UUID
@@ -760,6 +1016,7 @@ class PlanRepository(repositories.PlanRepository):
 
         plan_orm = self.object_to_orm(plan)
         plan_orm.is_available = True if (plan_orm.is_available == False) else False
+        self.identity_map.invalidate(entities.Plan, plan.id)
 
     def __len__(self) -> int:
         return len(Plan.query.all())
@@ -775,18 +1032,31 @@ class TransactionRepository(repositories.TransactionRepository):
         return Transaction.query.get(str(transaction.id))
 
     def object_from_orm(self, transaction: Transaction) -> entities.Transaction:
-        return entities.Transaction(
-            id=UUID(transaction.id),
-            date=transaction.date,
+        return self._object_from_orm_with_accounts(
+            transaction,
             sending_account=self.account_repository.get_by_id(
                 transaction.sending_account
             ),
             receiving_account=self.account_repository.get_by_id(
                 transaction.receiving_account
             ),
+        )
+
+    def _object_from_orm_with_accounts(
+        self,
+        transaction: Transaction,
+        sending_account: entities.Account,
+        receiving_account: entities.Account,
+    ) -> entities.Transaction:
+        return entities.Transaction(
+            id=UUID(transaction.id),
+            date=transaction.date,
+            sending_account=sending_account,
+            receiving_account=receiving_account,
             amount_sent=Decimal(transaction.amount_sent),
             amount_received=Decimal(transaction.amount_received),
             purpose=transaction.purpose,
+            plan_id=UUID(transaction.plan_id) if transaction.plan_id else None,
         )
 
     def create_transaction(
@@ -797,6 +1067,7 @@ class TransactionRepository(repositories.TransactionRepository):
         amount_sent: Decimal,
         amount_received: Decimal,
         purpose: str,
+        plan_id: Optional[UUID] = None,
     ) -> entities.Transaction:
         transaction = Transaction(
             id=str(uuid4()),
@@ -806,10 +1077,53 @@ class TransactionRepository(repositories.TransactionRepository):
             amount_sent=amount_sent,
             amount_received=amount_received,
             purpose=purpose,
+            plan_id=str(plan_id) if plan_id else None,
         )
         self.db.session.add(transaction)
+        if sending_account.id != receiving_account.id:
+            self.account_repository.record_sent_amount(sending_account, amount_sent)
+            self.account_repository.record_received_amount(
+                receiving_account, amount_received
+            )
         return self.object_from_orm(transaction)
 
+    def create_transactions(
+        self, transactions: List[repositories.NewTransaction]
+    ) -> None:
+        """Insert all transactions with one multi-row INSERT and update
+        the balances of the affected accounts with one UPDATE each for
+        senders and receivers."""
+        if not transactions:
+            return
+        self.db.session.flush()
+        self.db.session.execute(
+            Transaction.__table__.insert(),
+            [
+                dict(
+                    id=str(uuid4()),
+                    date=transaction.date,
+                    sending_account=str(transaction.sending_account.id),
+                    receiving_account=str(transaction.receiving_account.id),
+                    amount_sent=transaction.amount_sent,
+                    amount_received=transaction.amount_received,
+                    purpose=transaction.purpose,
+                    plan_id=str(transaction.plan_id) if transaction.plan_id else None,
+                )
+                for transaction in transactions
+            ],
+        )
+        sent_amounts: Dict[UUID, Decimal] = defaultdict(Decimal)
+        received_amounts: Dict[UUID, Decimal] = defaultdict(Decimal)
+        for transaction in transactions:
+            if transaction.sending_account.id == transaction.receiving_account.id:
+                continue
+            sent_amounts[transaction.sending_account.id] += transaction.amount_sent
+            received_amounts[
+                transaction.receiving_account.id
+            ] += transaction.amount_received
+        self.account_repository.record_sent_amounts(sent_amounts)
+        self.account_repository.record_received_amounts(received_amounts)
+
     def all_transactions_sent_by_account(
         self, account: entities.Account
     ) -> List[entities.Transaction]:
@@ -822,23 +1136,106 @@ class TransactionRepository(repositories.TransactionRepository):
     def all_transactions_received_by_account(
         self, account: entities.Account
     ) -> List[entities.Transaction]:
-        account_orm = self.account_repository.object_to_orm(account)
+        # The sending accounts are loaded by the same query.
+        sender = aliased(Account)
+        rows = (
+            self.db.session.query(Transaction, sender)
+            .join(sender, sender.id == Transaction.sending_account)
+            .filter(Transaction.receiving_account == str(account.id))
+        )
         return [
-            self.object_from_orm(transaction)
-            for transaction in account_orm.transactions_received.all()
+            self._object_from_orm_with_accounts(
+                transaction,
+                sending_account=self.account_repository.object_from_orm(
+                    sending_account
+                ),
+                receiving_account=account,
+            )
+            for transaction, sending_account in rows
         ]
 
+    def get_transactions_of_accounts(
+        self,
+        accounts: List[entities.Account],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        newest_first: bool = False,
+    ) -> Iterator[entities.Transaction]:
+        """Stream the transactions in batches. Both accounts of each
+        transaction are loaded by the same query, so that no further
+        queries are issued per transaction. Filtering on either account
+        instead of querying sent and received transactions separately
+        yields transfers between two of the accounts only once."""
+        account_ids = [str(account.id) for account in accounts]
+        sender = aliased(Account)
+        receiver = aliased(Account)
+        query = (
+            self.db.session.query(Transaction, sender, receiver)
+            .join(sender, sender.id == Transaction.sending_account)
+            .join(receiver, receiver.id == Transaction.receiving_account)
+            .filter(
+                or_(
+                    Transaction.sending_account.in_(account_ids),
+                    Transaction.receiving_account.in_(account_ids),
+                )
+            )
+        )
+        if start is not None:
+            query = query.filter(Transaction.date >= start)
+        if end is not None:
+            query = query.filter(Transaction.date < end)
+        order = Transaction.date.desc() if newest_first else Transaction.date
+        for transaction, sending_account, receiving_account in query.order_by(
+            order
+        ).yield_per(1000):
+            yield self._object_from_orm_with_accounts(
+                transaction,
+                sending_account=self.account_repository.object_from_orm(
+                    sending_account
+                ),
+                receiving_account=self.account_repository.object_from_orm(
+                    receiving_account
+                ),
+            )
+
     def get_sales_balance_of_plan(self, plan: entities.Plan) -> Decimal:
         return Decimal(
             self.db.session.query(func.sum(Transaction.amount_received))
             .filter(
                 Transaction.receiving_account == str(plan.planner.product_account.id),
-                Transaction.purpose.contains(f"{plan.id}"),
+                Transaction.plan_id == str(plan.id),
             )
             .one()[0]
             or 0
         )
 
+    def get_sales_balances_of_plans(
+        self, plans: List[entities.Plan]
+    ) -> Dict[UUID, Decimal]:
+        balances = {plan.id: Decimal(0) for plan in plans}
+        if not plans:
+            return balances
+        product_accounts = {
+            str(plan.id): str(plan.planner.product_account.id) for plan in plans
+        }
+        rows = (
+            self.db.session.query(
+                Transaction.plan_id,
+                Transaction.receiving_account,
+                func.sum(Transaction.amount_received),
+            )
+            .filter(
+                Transaction.plan_id.in_(product_accounts),
+                Transaction.receiving_account.in_(set(product_accounts.values())),
+            )
+            .group_by(Transaction.plan_id, Transaction.receiving_account)
+        )
+        for plan_id, receiving_account, balance in rows:
+            # Only sales to the product account of the planner count.
+            if product_accounts[plan_id] == receiving_account:
+                balances[UUID(plan_id)] = Decimal(balance or 0)
+        return balances
+
 
 @inject
 @dataclass
@@ -968,26 +1365,33 @@ class MessageRepository(repositories.MessageRepository):
     member_repository: MemberRepository
     company_repository: CompanyRepository
     social_accounting_repository: AccountingRepository
+    _social_accounting_name: Optional[str] = field(default=None, init=False)
 
     def get_by_id(self, id: UUID) -> Optional[entities.Message]:
-        orm_message = Message.query.filter_by(id=str(id)).first()
-        if orm_message is None:
+        row = (
+            self.db.session.query(Message, models.UserAction)
+            .outerjoin(models.UserAction, models.UserAction.id == Message.user_action)
+            .filter(Message.id == str(id))
+            .first()
+        )
+        if row is None:
             return None
-        return self.object_from_orm(orm_message)
+        return self.object_from_orm(*row)
 
-    def object_from_orm(self, message: Message) -> entities.Message:
-        addressee = self._get_user(UUID(message.addressee))
-        if addressee is None:
+    def object_from_orm(
+        self, message: Message, user_action_orm: Optional[models.UserAction]
+    ) -> entities.Message:
+        addressee = self._get_user(UUID(message.addressee), message.addressee_kind)
+        if addressee is None or isinstance(addressee, entities.SocialAccounting):
             raise Exception(
                 "Internal error, addressee of message could not be retrieved"
             )
-        sender = self._get_user_or_social_accounting(UUID(message.sender))
+        sender = self._get_user(UUID(message.sender), message.sender_kind)
         if sender is None:
             raise Exception("Internal error, sender of message could not be retrieved")
-        if message.user_action is None:
+        if user_action_orm is None:
             user_action = None
         else:
-            user_action_orm = models.UserAction.query.get(message.user_action)
             user_action = UserAction(
                 type=user_action_orm.action_type,
                 reference=UUID(user_action_orm.reference),
@@ -1001,19 +1405,29 @@ class MessageRepository(repositories.MessageRepository):
             sender_remarks=message.sender_remarks,
             user_action=user_action,
             is_read=message.is_read,
+            sent_on=message.sent_on,
         )
 
-    def _get_user(self, id: UUID) -> Union[None, entities.Member, entities.Company]:
-        member = self.member_repository.get_by_id(id)
-        return member or self.company_repository.get_by_id(id)
-
-    def _get_user_or_social_accounting(
-        self, id: UUID
+    def _get_user(
+        self, id: UUID, kind: UserKind
     ) -> Union[None, entities.Member, entities.Company, entities.SocialAccounting]:
-        user = self._get_user(id)
-        if user is not None:
-            return user
-        return self.social_accounting_repository.get_by_id(id)
+        if kind == UserKind.member:
+            return self.member_repository.get_by_id(id)
+        elif kind == UserKind.company:
+            return self.company_repository.get_by_id(id)
+        else:
+            return self.social_accounting_repository.get_by_id(id)
+
+    def _get_kind(
+        self,
+        user: Union[entities.Member, entities.Company, entities.SocialAccounting],
+    ) -> UserKind:
+        if isinstance(user, entities.Member):
+            return UserKind.member
+        elif isinstance(user, entities.Company):
+            return UserKind.company
+        else:
+            return UserKind.social_accounting
 
     def create_message(
         self,
@@ -1023,6 +1437,7 @@ class MessageRepository(repositories.MessageRepository):
         content: str,
         sender_remarks: Optional[str],
         reference: Optional[UserAction],
+        sent_on: datetime,
     ) -> entities.Message:
         if reference is not None:
             user_action: Optional[models.UserAction] = models.UserAction(
@@ -1037,29 +1452,127 @@ class MessageRepository(repositories.MessageRepository):
         message = Message(
             id=str(uuid4()),
             sender=str(sender.id),
+            sender_kind=self._get_kind(sender),
             addressee=str(addressee.id),
+            addressee_kind=self._get_kind(addressee),
             title=title,
             content=content,
             user_action=user_action.id if user_action is not None else None,
             sender_remarks=sender_remarks,
             is_read=False,
+            sent_on=sent_on,
         )
         self.db.session.add(message)
-        return self.object_from_orm(message)
+        self._count_new_message(addressee.id)
+        return self.object_from_orm(message, user_action)
 
     def mark_as_read(self, message: entities.Message) -> None:
         message.is_read = True
-        Message.query.filter_by(id=str(message.id)).update({Message.is_read: True})
+        if Message.query.filter_by(id=str(message.id), is_read=False).update(
+            {Message.is_read: True}
+        ):
+            UnreadMessageCount.query.filter_by(
+                user_id=str(message.addressee.id)
+            ).update(
+                {
+                    UnreadMessageCount.unread_messages: (
+                        UnreadMessageCount.unread_messages - 1
+                    )
+                }
+            )
 
     def has_unread_messages_for_user(self, user: UUID) -> bool:
-        return bool(Message.query.filter_by(addressee=str(user), is_read=False).count())
+        unread_messages = (
+            self.db.session.query(UnreadMessageCount.unread_messages)
+            .filter(UnreadMessageCount.user_id == str(user))
+            .scalar()
+        )
+        return bool(unread_messages)
 
-    def get_messages_to_user(self, user: UUID) -> Iterable[entities.Message]:
-        return (
-            self.object_from_orm(m)
-            for m in Message.query.filter_by(addressee=str(user))
+    def _count_new_message(self, addressee: UUID) -> None:
+        if self.db.engine.dialect.name == "postgresql":
+            insert = postgresql.insert
+        else:
+            insert = sqlite.insert
+        statement = insert(UnreadMessageCount).values(
+            user_id=str(addressee), unread_messages=1
+        )
+        self.db.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[UnreadMessageCount.user_id],
+                set_={
+                    UnreadMessageCount.unread_messages: (
+                        UnreadMessageCount.unread_messages + 1
+                    )
+                },
+            )
+        )
+
+    def get_messages_to_user(
+        self, user: UUID, page: PageRequest
+    ) -> Page[repositories.MessageSummary]:
+        """The names of senders are joined in, so that a page of messages
+        is read with a single query."""
+        query = (
+            self.db.session.query(
+                Bundle(
+                    "message",
+                    Message.id,
+                    Message.title,
+                    Message.is_read,
+                    Message.sender_kind,
+                    Member.name.label("member_name"),
+                    Company.name.label("company_name"),
+                )
+            )
+            .select_from(Message)
+            .outerjoin(
+                Member,
+                and_(
+                    Message.sender_kind == UserKind.member, Member.id == Message.sender
+                ),
+            )
+            .outerjoin(
+                Company,
+                and_(
+                    Message.sender_kind == UserKind.company,
+                    Company.id == Message.sender,
+                ),
+            )
+            .filter(Message.addressee == str(user))
+        )
+        return paginate(
+            query,
+            [
+                SortKey(Message.sent_on, descending=True, parse=datetime.fromisoformat),
+                SortKey(Message.id, descending=True),
+            ],
+            page,
+            self._summary_from_row,
+        )
+
+    def _summary_from_row(self, row: Any) -> repositories.MessageSummary:
+        if row.sender_kind == UserKind.member:
+            sender_name = row.member_name
+        elif row.sender_kind == UserKind.company:
+            sender_name = row.company_name
+        else:
+            sender_name = self._get_social_accounting_name()
+        return repositories.MessageSummary(
+            id=UUID(row.id),
+            title=row.title,
+            sender_name=sender_name,
+            is_read=row.is_read,
         )
 
+    def _get_social_accounting_name(self) -> str:
+        if self._social_accounting_name is None:
+            social_accounting = (
+                self.social_accounting_repository.get_or_create_social_accounting()
+            )
+            self._social_accounting_name = social_accounting.get_name()
+        return self._social_accounting_name
+
 
 @inject
 @dataclass
@@ -1133,12 +1646,36 @@ class CooperationRepository(repositories.CooperationRepository):
     def count_cooperations(self) -> int:
         return int(self.db.session.query(func.count(Cooperation.id)).one()[0])
 
+    def get_price_per_unit(self, cooperation_id: UUID) -> Optional[Decimal]:
+        return (
+            self.db.session.query(Cooperation.price_per_unit)
+            .filter_by(id=str(cooperation_id))
+            .scalar()
+        )
+
+    def set_price_per_unit(
+        self, cooperation_id: UUID, price_per_unit: Optional[Decimal]
+    ) -> None:
+        Cooperation.query.filter_by(id=str(cooperation_id)).update(
+            {Cooperation.price_per_unit: price_per_unit}
+        )
+
+    def get_prices_per_unit(
+        self, cooperation_ids: Iterable[UUID]
+    ) -> Dict[UUID, Decimal]:
+        rows = self.db.session.query(Cooperation.id, Cooperation.price_per_unit).filter(
+            Cooperation.id.in_([str(id) for id in cooperation_ids]),
+            Cooperation.price_per_unit != None,
+        )
+        return {UUID(id): price_per_unit for id, price_per_unit in rows}
+
 
 @inject
 @dataclass
 class PlanCooperationRepository(repositories.PlanCooperationRepository):
     plan_repository: PlanRepository
     cooperation_repository: CooperationRepository
+    identity_map: IdentityMap
 
     def get_inbound_requests(self, coordinator_id: UUID) -> Iterator[entities.Plan]:
         for plan in self.plan_repository.get_active_plans():
@@ -1180,21 +1717,30 @@ class PlanCooperationRepository(repositories.PlanCooperationRepository):
         plan_orm = Plan.query.filter_by(id=str(plan_id)).first()
         assert plan_orm
         plan_orm.cooperation = str(cooperation_id)
+        self.identity_map.invalidate(entities.Plan, plan_id)
+        self.cooperation_repository.set_price_per_unit(cooperation_id, None)
 
     def remove_plan_from_cooperation(self, plan_id: UUID) -> None:
         plan_orm = Plan.query.filter_by(id=str(plan_id)).first()
         assert plan_orm
+        if plan_orm.cooperation:
+            self.cooperation_repository.set_price_per_unit(
+                UUID(plan_orm.cooperation), None
+            )
         plan_orm.cooperation = None
+        self.identity_map.invalidate(entities.Plan, plan_id)
 
     def set_requested_cooperation(self, plan_id: UUID, cooperation_id: UUID) -> None:
         plan_orm = Plan.query.filter_by(id=str(plan_id)).first()
         assert plan_orm
         plan_orm.requested_cooperation = str(cooperation_id)
+        self.identity_map.invalidate(entities.Plan, plan_id)
 
     def set_requested_cooperation_to_none(self, plan_id: UUID) -> None:
         plan_orm = Plan.query.filter_by(id=str(plan_id)).first()
         assert plan_orm
         plan_orm.requested_cooperation = None
+        self.identity_map.invalidate(entities.Plan, plan_id)
 
     def count_plans_in_cooperation(self, cooperation_id: UUID) -> int:
         count = Plan.query.filter_by(cooperation=str(cooperation_id)).count()
@@ -1205,6 +1751,18 @@ class PlanCooperationRepository(repositories.PlanCooperationRepository):
         for plan in plans:
             yield self.plan_repository.object_from_orm(plan)
 
+    def get_plans_in_cooperations(
+        self, cooperation_ids: Iterable[UUID]
+    ) -> Dict[UUID, List[entities.Plan]]:
+        plans: Dict[UUID, List[entities.Plan]] = dict()
+        for plan_orm in Plan.query.filter(
+            Plan.cooperation.in_([str(id) for id in cooperation_ids])
+        ).order_by(Plan.cooperation):
+            plans.setdefault(UUID(plan_orm.cooperation), []).append(
+                self.plan_repository.object_from_orm(plan_orm)
+            )
+        return plans
+
 
 @inject
 @dataclass
@@ -1,6 +1,9 @@
 from functools import wraps
-from typing import List, Optional
+from threading import Lock
+from typing import Dict, List, Optional, Tuple, Type, TypeVar
 
+from flask import current_app, has_request_context
+from flask import request as flask_request
 from flask_sqlalchemy import SQLAlchemy
 from injector import (
     Binder,
@@ -9,6 +12,9 @@ from injector import (
     Injector,
     InstanceProvider,
     Module,
+    Provider,
+    Scope,
+    ScopeDecorator,
     inject,
     provider,
     singleton,
@@ -44,9 +50,11 @@ from arbeitszeit.use_cases.send_work_certificates_to_worker import (
     SendWorkCertificatesToWorker,
 )
 from arbeitszeit.use_cases.show_my_accounts import ShowMyAccounts
-from arbeitszeit_flask.database import get_social_accounting
+from arbeitszeit_flask.database import SocialAccountingCache, get_social_accounting
+from arbeitszeit_flask.database.account_owner_names import AccountOwnerNameCache
 from arbeitszeit_flask.database.repositories import (
     AccountantRepository,
+    AccountingRepository,
     AccountOwnerRepository,
     AccountRepository,
     CompanyRepository,
@@ -72,9 +80,13 @@ from arbeitszeit_flask.mail_service import (
     FlaskEmailConfiguration,
     FlaskTokenDeliverer,
     MailService,
-    get_mail_service,
+    MailTransport,
+    OutboxMailService,
+    get_mail_transport,
 )
 from arbeitszeit_flask.notifications import FlaskFlashNotifier
+from arbeitszeit_flask.plots.cache import PlotCache
+from arbeitszeit_flask.plots.rendering import PlotRenderer
 from arbeitszeit_flask.template import (
     CompanyTemplateIndex,
     FlaskTemplateRenderer,
@@ -92,6 +104,7 @@ from arbeitszeit_flask.url_index import (
     GeneralUrlIndex,
     MemberUrlIndex,
 )
+from arbeitszeit_flask.user_loader import PrincipalCache
 from arbeitszeit_flask.views import EndCooperationView, Http404View, ReadMessageView
 from arbeitszeit_flask.views.create_draft_view import CreateDraftView
 from arbeitszeit_flask.views.pay_means_of_production import PayMeansOfProductionView
@@ -122,6 +135,7 @@ from arbeitszeit_web.controllers.show_my_accounts_controller import (
     ShowMyAccountsController,
 )
 from arbeitszeit_web.email import EmailConfiguration, UserAddressBook
+from arbeitszeit_web.export_transactions import ExportTransactionsController
 from arbeitszeit_web.get_company_summary import GetCompanySummarySuccessPresenter
 from arbeitszeit_web.get_company_transactions import GetCompanyTransactionsPresenter
 from arbeitszeit_web.get_coop_summary import GetCoopSummarySuccessPresenter
@@ -153,6 +167,7 @@ from arbeitszeit_web.presenters.end_cooperation_presenter import EndCooperationP
 from arbeitszeit_web.presenters.get_latest_activated_plans_presenter import (
     GetLatestActivatedPlansPresenter,
 )
+from arbeitszeit_web.presenters.list_workers_presenter import ListWorkersPresenter
 from arbeitszeit_web.presenters.log_in_member_presenter import LogInMemberPresenter
 from arbeitszeit_web.presenters.register_accountant_presenter import (
     RegisterAccountantPresenter,
@@ -187,8 +202,11 @@ from arbeitszeit_web.presenters.show_prd_account_details_presenter import (
 from arbeitszeit_web.presenters.show_r_account_details_presenter import (
     ShowRAccountDetailsPresenter,
 )
-from arbeitszeit_web.query_companies import QueryCompaniesPresenter
-from arbeitszeit_web.query_plans import QueryPlansPresenter
+from arbeitszeit_web.query_companies import (
+    QueryCompaniesController,
+    QueryCompaniesPresenter,
+)
+from arbeitszeit_web.query_plans import QueryPlansController, QueryPlansPresenter
 from arbeitszeit_web.read_message import ReadMessageController, ReadMessagePresenter
 from arbeitszeit_web.request_cooperation import (
     RequestCooperationController,
@@ -222,6 +240,50 @@ __all__ = [
     "ViewsModule",
 ]
 
+T = TypeVar("T")
+
+_REQUEST_SCOPE_ENVIRON_KEY = "arbeitszeit.request_scope"
+
+
+class RequestScope(Scope):
+    """Instances live as long as the flask request that created them.
+    Outside of a request, e.g. in cli commands, every lookup creates a
+    new instance.
+    """
+
+    def get(self, key: Type[T], provider: Provider[T]) -> Provider[T]:
+        if not has_request_context():
+            return provider
+        instances: Dict[type, Provider] = flask_request.environ.setdefault(
+            _REQUEST_SCOPE_ENVIRON_KEY, dict()
+        )
+        if key not in instances:
+            instances[key] = InstanceProvider(provider.get(self.injector))
+        return instances[key]
+
+
+request_scope = ScopeDecorator(RequestScope)
+
+# The database repositories hold no state of their own, so all objects
+# resolved during a request can share one instance of each.
+REQUEST_SCOPED_REPOSITORIES = [
+    AccountantRepository,
+    AccountingRepository,
+    AccountOwnerRepository,
+    AccountRepository,
+    CompanyRepository,
+    CompanyWorkerRepository,
+    CooperationRepository,
+    MemberRepository,
+    MessageRepository,
+    PlanCooperationRepository,
+    PlanDraftRepository,
+    PlanRepository,
+    PurchaseRepository,
+    TransactionRepository,
+    WorkerInviteRepository,
+]
+
 
 class MemberModule(Module):
     @provider
@@ -600,9 +662,13 @@ class FlaskModule(Module):
         member_repository: MemberRepository,
         company_repository: CompanyRepository,
         accountant_repository: AccountantRepository,
+        principal_cache: PrincipalCache,
     ) -> FlaskSession:
         return FlaskSession(
-            member_repository, company_repository, accountant_repository
+            member_repository,
+            company_repository,
+            accountant_repository,
+            principal_cache,
         )
 
     @provider
@@ -692,9 +758,15 @@ class FlaskModule(Module):
 
     @provider
     def provide_list_workers_controller(
-        self, session: Session
+        self, session: Session, request: FlaskRequest
     ) -> ListWorkersController:
-        return ListWorkersController(session=session)
+        return ListWorkersController(session=session, request=request)
+
+    @provider
+    def provide_list_workers_presenter(
+        self, request: FlaskRequest
+    ) -> ListWorkersPresenter:
+        return ListWorkersPresenter(request=request)
 
     @provider
     def provide_show_company_work_invite_details_presenter(
@@ -793,13 +865,21 @@ class FlaskModule(Module):
         notifier: Notifier,
         company_url_index: CompanySummaryUrlIndex,
         translator: Translator,
+        request: FlaskRequest,
     ) -> QueryCompaniesPresenter:
         return QueryCompaniesPresenter(
             user_notifier=notifier,
             company_url_index=company_url_index,
             translator=translator,
+            request=request,
         )
 
+    @provider
+    def provide_query_companies_controller(
+        self, request: FlaskRequest
+    ) -> QueryCompaniesController:
+        return QueryCompaniesController(request=request)
+
     @provider
     def provide_list_all_cooperations_presenter(
         self, coop_index: CoopSummaryUrlIndex
@@ -827,9 +907,9 @@ class FlaskModule(Module):
 
     @provider
     def provide_list_messages_presenter(
-        self, message_index: MessageUrlIndex
+        self, message_index: MessageUrlIndex, request: FlaskRequest
     ) -> ListMessagesPresenter:
-        return ListMessagesPresenter(message_index)
+        return ListMessagesPresenter(message_index, request)
 
     @provider
     def provide_query_plans_presenter(
@@ -838,14 +918,22 @@ class FlaskModule(Module):
         company_index: CompanySummaryUrlIndex,
         notifier: Notifier,
         trans: Translator,
+        request: FlaskRequest,
     ) -> QueryPlansPresenter:
         return QueryPlansPresenter(
             plan_url_index=plan_index,
             company_url_index=company_index,
             user_notifier=notifier,
             trans=trans,
+            request=request,
         )
 
+    @provider
+    def provide_query_plans_controller(
+        self, request: FlaskRequest
+    ) -> QueryPlansController:
+        return QueryPlansController(request=request)
+
     @provider
     def provide_user_action_resolver(
         self,
@@ -945,9 +1033,15 @@ class FlaskModule(Module):
 
     @provider
     def provide_list_messages_controller(
-        self, session: Session
+        self, session: Session, request: FlaskRequest
     ) -> ListMessagesController:
-        return ListMessagesController(session)
+        return ListMessagesController(session, request)
+
+    @provider
+    def provide_export_transactions_controller(
+        self, session: Session, request: FlaskRequest, translator: Translator
+    ) -> ExportTransactionsController:
+        return ExportTransactionsController(session, request, translator)
 
     @provider
     def provide_request_cooperation_controller(
@@ -975,18 +1069,44 @@ class FlaskModule(Module):
     def provide_notifier(self) -> Notifier:
         return FlaskFlashNotifier()
 
+    @provider
+    def provide_mail_service(self, mail_service: OutboxMailService) -> MailService:
+        return mail_service
+
     @singleton
     @provider
-    def provide_mail_service(self) -> MailService:
-        return get_mail_service()
+    def provide_mail_transport(self) -> MailTransport:
+        return get_mail_transport()
 
     @provider
     def provide_translator(self) -> Translator:
         return FlaskTranslator()
 
     @provider
-    def provide_plotter(self) -> Plotter:
-        return FlaskPlotter()
+    def provide_plotter(self, plotter: FlaskPlotter) -> Plotter:
+        return plotter
+
+    @singleton
+    @provider
+    def provide_plot_renderer(self) -> PlotRenderer:
+        return PlotRenderer(
+            processes=current_app.config["PLOT_RENDERING_PROCESSES"],
+            max_queued_plots=current_app.config["PLOT_RENDERING_QUEUE_SIZE"],
+            timeout=current_app.config["PLOT_RENDERING_TIMEOUT"],
+        )
+
+    @singleton
+    @provider
+    def provide_principal_cache(self) -> PrincipalCache:
+        return PrincipalCache(time_to_live=current_app.config["USER_CACHE_TTL"])
+
+    @singleton
+    @provider
+    def provide_plot_cache(self) -> PlotCache:
+        return PlotCache(
+            max_entries=current_app.config["PLOT_CACHE_SIZE"],
+            directory=current_app.config["PLOT_CACHE_DIRECTORY"],
+        )
 
     @provider
     def provide_colors(self) -> Colors:
@@ -1053,14 +1173,20 @@ class FlaskModule(Module):
         )
 
     def configure(self, binder: Binder) -> None:
+        for repository in REQUEST_SCOPED_REPOSITORIES:
+            binder.bind(repository, to=ClassProvider(repository), scope=request_scope)
         binder.bind(
             interfaces.CompanyWorkerRepository,  # type: ignore
             to=ClassProvider(CompanyWorkerRepository),
+            scope=request_scope,
         )
         binder.bind(
             interfaces.PurchaseRepository,  # type: ignore
             to=ClassProvider(PurchaseRepository),
+            scope=request_scope,
         )
+        binder.bind(SocialAccountingCache, scope=singleton)
+        binder.bind(AccountOwnerNameCache, scope=singleton)
         binder.bind(
             entities.SocialAccounting,
             to=CallableProvider(get_social_accounting),
@@ -1068,30 +1194,37 @@ class FlaskModule(Module):
         binder.bind(
             interfaces.AccountRepository,  # type: ignore
             to=ClassProvider(AccountRepository),
+            scope=request_scope,
         )
         binder.bind(
             interfaces.MemberRepository,  # type: ignore
             to=ClassProvider(MemberRepository),
+            scope=request_scope,
         )
         binder.bind(
             interfaces.CompanyRepository,  # type: ignore
             to=ClassProvider(CompanyRepository),
+            scope=request_scope,
         )
         binder.bind(
             interfaces.PurchaseRepository,  # type: ignore
             to=ClassProvider(PurchaseRepository),
+            scope=request_scope,
         )
         binder.bind(
             interfaces.PlanRepository,  # type: ignore
             to=ClassProvider(PlanRepository),
+            scope=request_scope,
         )
         binder.bind(
             interfaces.AccountOwnerRepository,  # type: ignore
             to=ClassProvider(AccountOwnerRepository),
+            scope=request_scope,
         )
         binder.bind(
             interfaces.PlanDraftRepository,  # type: ignore
             to=ClassProvider(PlanDraftRepository),
+            scope=request_scope,
         )
         binder.bind(
             DatetimeService,  # type: ignore
@@ -1100,6 +1233,7 @@ class FlaskModule(Module):
         binder.bind(
             interfaces.WorkerInviteRepository,  # type: ignore
             to=ClassProvider(WorkerInviteRepository),
+            scope=request_scope,
         )
         binder.bind(
             SQLAlchemy,
@@ -1108,20 +1242,33 @@ class FlaskModule(Module):
         binder.bind(
             interfaces.MessageRepository,  # type: ignore
             to=ClassProvider(MessageRepository),
+            scope=request_scope,
         )
         binder.bind(
             interfaces.CooperationRepository,  # type: ignore
             to=ClassProvider(CooperationRepository),
+            scope=request_scope,
         )
         binder.bind(
             interfaces.PlanCooperationRepository,  # type: ignore
             to=ClassProvider(PlanCooperationRepository),
+            scope=request_scope,
         )
         binder.bind(TokenService, to=ClassProvider(FlaskTokenService))  # type: ignore
         binder.bind(UserAddressBook, to=ClassProvider(inject(UserAddressBookImpl)))  # type: ignore
 
 
 class with_injection:
+    """Call the wrapped function with its dependencies resolved by the
+    injector of the current flask app.
+
+    The injector is built once per app and module combination. Functions
+    decorated without modules share the root injector of the app, the
+    others a child injector of it that adds the given modules.
+    """
+
+    _lock = Lock()
+
     def __init__(self, modules: Optional[List[Module]] = None) -> None:
         self._modules = modules if modules is not None else []
 
@@ -1130,18 +1277,34 @@ class with_injection:
         injected come after the the parameters that the caller should
         provide.
         """
+        injected_function = inject(original_function)
 
         @wraps(original_function)
         def wrapped_function(*args, **kwargs):
             return self.get_injector().call_with_injection(
-                inject(original_function), args=args, kwargs=kwargs
+                injected_function, args=args, kwargs=kwargs
             )
 
         return wrapped_function
 
     def get_injector(self) -> Injector:
-        all_modules: List[Module] = []
-        all_modules.append(FlaskModule())
-        all_modules.append(ViewsModule())
-        all_modules += self._modules
-        return Injector(all_modules)
+        injectors: Dict[
+            Tuple[Type[Module], ...], Injector
+        ] = current_app.extensions.setdefault("arbeitszeit_injectors", dict())
+        key = tuple(type(module) for module in self._modules)
+        if (injector := injectors.get(key)) is None:
+            with self._lock:
+                if (injector := injectors.get(key)) is None:
+                    injector = self._create_injector(injectors)
+                    injectors[key] = injector
+        return injector
+
+    def _create_injector(
+        self, injectors: Dict[Tuple[Type[Module], ...], Injector]
+    ) -> Injector:
+        if (root_injector := injectors.get(())) is None:
+            root_injector = Injector([FlaskModule(), ViewsModule()])
+            injectors[()] = root_injector
+        if not self._modules:
+            return root_injector
+        return root_injector.create_child_injector(self._modules)
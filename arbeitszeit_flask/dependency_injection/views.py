@@ -7,6 +7,7 @@ from arbeitszeit.use_cases import (
     ShowCompanyWorkInviteDetailsUseCase,
 )
 from arbeitszeit.use_cases.create_cooperation import CreateCooperation
+from arbeitszeit.use_cases.export_transactions import ExportTransactions
 from arbeitszeit.use_cases.get_latest_activated_plans import GetLatestActivatedPlans
 from arbeitszeit.use_cases.list_workers import ListWorkers
 from arbeitszeit.use_cases.register_accountant import RegisterAccountantUseCase
@@ -31,6 +32,7 @@ from arbeitszeit_flask.views.accountant_invitation_email_view import (
 )
 from arbeitszeit_flask.views.create_cooperation_view import CreateCooperationView
 from arbeitszeit_flask.views.dashboard_view import DashboardView
+from arbeitszeit_flask.views.export_transactions_view import ExportTransactionsView
 from arbeitszeit_flask.views.invite_worker_to_company import (
     InviteWorkerGetRequestHandler,
     InviteWorkerPostRequestHandler,
@@ -55,6 +57,10 @@ from arbeitszeit_web.controllers.show_my_accounts_controller import (
 )
 from arbeitszeit_web.create_cooperation import CreateCooperationPresenter
 from arbeitszeit_web.email import MailService
+from arbeitszeit_web.export_transactions import (
+    ExportTransactionsController,
+    ExportTransactionsPresenter,
+)
 from arbeitszeit_web.invite_worker_to_company import (
     InviteWorkerToCompanyController,
     InviteWorkerToCompanyPresenter,
@@ -182,6 +188,15 @@ class ViewsModule(Module):
             presenter=presenter,
         )
 
+    @provider
+    def provide_export_transactions_view(
+        self,
+        controller: ExportTransactionsController,
+        use_case: ExportTransactions,
+        presenter: ExportTransactionsPresenter,
+    ) -> ExportTransactionsView:
+        return ExportTransactionsView(controller, use_case, presenter)
+
     @provider
     def provide_show_my_accounts_view(
         self,
@@ -1,22 +1,31 @@
 import io
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional, Tuple, Union
 
+from injector import inject
 from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+from arbeitszeit_flask.plots.downsampling import downsample_time_series
+from arbeitszeit_flask.plots.rendering import PlotRenderer
 
+DPI = 100
+
+
+@inject
+@dataclass
 class FlaskPlotter:
+    renderer: PlotRenderer
+
     def create_line_plot(
         self, x: List[datetime], y: List[Decimal], fig_size: Tuple[int, int] = (10, 5)
     ) -> bytes:
-        fig = Figure()
-        ax = fig.subplots()
-        ax.axhline(linestyle="--", color="black")
-        ax.plot(x, y)
-        fig.set_size_inches(fig_size[0], fig_size[1])
-        return self._figure_to_bytes(fig)
+        # Only the points that fit into the plot are sent to the
+        # renderer.
+        x, y = downsample_time_series(x, y, max_points=fig_size[0] * DPI)
+        return self.renderer.render(render_line_plot, x, y, fig_size)
 
     def create_bar_plot(
         self,
@@ -26,17 +35,46 @@ class FlaskPlotter:
         fig_size: Tuple[int, int],
         y_label: Optional[str],
     ) -> bytes:
-        fig = Figure()
-        ax = fig.subplots()
-        ax.bar(x_coordinates, height_of_bars, color=colors_of_bars)
-        ax.spines["top"].set_visible(False)
-        ax.spines["right"].set_visible(False)
-        if y_label:
-            ax.set_ylabel(y_label)
-        fig.set_size_inches(fig_size[0], fig_size[1])
-        return self._figure_to_bytes(fig)
-
-    def _figure_to_bytes(self, fig: Figure) -> bytes:
-        output = io.BytesIO()
-        FigureCanvas(fig).print_png(output)
-        return output.getvalue()
+        return self.renderer.render(
+            render_bar_plot,
+            x_coordinates,
+            height_of_bars,
+            colors_of_bars,
+            fig_size,
+            y_label,
+        )
+
+
+def render_line_plot(
+    x: List[datetime], y: List[Decimal], fig_size: Tuple[int, int]
+) -> bytes:
+    fig = Figure(dpi=DPI)
+    ax = fig.subplots()
+    ax.axhline(linestyle="--", color="black")
+    ax.plot(x, y)
+    fig.set_size_inches(fig_size[0], fig_size[1])
+    return _figure_to_bytes(fig)
+
+
+def render_bar_plot(
+    x_coordinates: List[Union[int, str]],
+    height_of_bars: List[Decimal],
+    colors_of_bars: List[str],
+    fig_size: Tuple[int, int],
+    y_label: Optional[str],
+) -> bytes:
+    fig = Figure(dpi=DPI)
+    ax = fig.subplots()
+    ax.bar(x_coordinates, height_of_bars, color=colors_of_bars)
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
+    if y_label:
+        ax.set_ylabel(y_label)
+    fig.set_size_inches(fig_size[0], fig_size[1])
+    return _figure_to_bytes(fig)
+
+
+def _figure_to_bytes(fig: Figure) -> bytes:
+    output = io.BytesIO()
+    FigureCanvas(fig).print_png(output)
+    return output.getvalue()
@@ -10,6 +10,7 @@ from arbeitszeit_flask.database.repositories import (
     CompanyRepository,
     MemberRepository,
 )
+from arbeitszeit_flask.user_loader import PrincipalCache
 
 
 @dataclass
@@ -17,6 +18,7 @@ class FlaskSession:
     member_repository: MemberRepository
     company_repository: CompanyRepository
     accountant_repository: AccountantRepository
+    principal_cache: PrincipalCache
 
     def is_logged_in_as_member(self) -> bool:
         return session.get("user_type") == "member"
@@ -46,6 +48,8 @@ class FlaskSession:
         session["user_type"] = "accountant"
 
     def logout(self) -> None:
+        if (user_id := self.get_current_user()) is not None:
+            self.principal_cache.invalidate(str(user_id))
         session["user_type"] = None
         logout_user()
 
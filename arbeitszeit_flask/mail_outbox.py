@@ -0,0 +1,98 @@
+"""Delivery of the emails queued in the outbox.
+
+Due emails are read in batches and sent over a single connection to
+the mail server. Emails that cannot be sent are tried again later,
+waiting twice as long after every failed attempt, until delivery is
+given up after MAX_ATTEMPTS. An email is only removed from the outbox
+when the batch it was sent in is committed, so an email might be sent
+twice if the worker dies in between, but it is never lost.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List
+
+from flask_mail import Message
+from flask_sqlalchemy import SQLAlchemy
+from injector import inject
+
+from arbeitszeit.datetime_service import DatetimeService
+from arbeitszeit_flask.mail_service import MailTransport
+from arbeitszeit_flask.models import OutgoingEmail
+
+MAX_ATTEMPTS = 8
+FIRST_RETRY_DELAY = timedelta(minutes=1)
+MAX_RETRY_DELAY = timedelta(hours=6)
+
+
+@dataclass
+class DeliveryReport:
+    delivered: int = 0
+    failed: int = 0
+
+    @property
+    def processed(self) -> int:
+        return self.delivered + self.failed
+
+
+@inject
+@dataclass
+class MailOutbox:
+    db: SQLAlchemy
+    transport: MailTransport
+    datetime_service: DatetimeService
+
+    def deliver_due_emails(self, batch_size: int) -> DeliveryReport:
+        """Send up to batch_size due emails. Other workers skip the
+        emails of this batch until the changes are committed.
+        """
+        now = self.datetime_service.now()
+        pending: List[OutgoingEmail] = (
+            OutgoingEmail.query.filter(OutgoingEmail.next_attempt_at <= now)
+            .order_by(OutgoingEmail.next_attempt_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        report = DeliveryReport()
+        try:
+            if pending:
+                with self.transport.connect() as send:
+                    while pending:
+                        email = pending.pop(0)
+                        try:
+                            send(self._create_message(email))
+                        except Exception as error:
+                            self._schedule_retry(email, now, error)
+                            report.failed += 1
+                        else:
+                            self.db.session.delete(email)
+                            report.delivered += 1
+        except Exception as error:
+            # The connection to the mail server could not be opened.
+            for email in pending:
+                self._schedule_retry(email, now, error)
+                report.failed += 1
+        return report
+
+    def _create_message(self, email: OutgoingEmail) -> Message:
+        return Message(
+            subject=email.subject,
+            recipients=email.recipients.splitlines(),
+            html=email.html,
+            sender=email.sender,
+        )
+
+    def _schedule_retry(
+        self, email: OutgoingEmail, now: datetime, error: Exception
+    ) -> None:
+        email.attempts += 1
+        email.last_error = repr(error)
+        if email.attempts >= MAX_ATTEMPTS:
+            email.next_attempt_at = None
+        else:
+            email.next_attempt_at = now + min(
+                FIRST_RETRY_DELAY * 2 ** (email.attempts - 1), MAX_RETRY_DELAY
+            )
@@ -1,12 +1,16 @@
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List
+from typing import Callable, ContextManager, Iterator, List, Protocol
 
-from flask import current_app, render_template, url_for
+from flask import current_app, render_template
 from flask_mail import Message
+from flask_sqlalchemy import SQLAlchemy
+from injector import inject
 
-from arbeitszeit.errors import CannotSendEmail
+from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.token import ConfirmationEmail
 from arbeitszeit_flask.extensions import mail
+from arbeitszeit_flask.models import OutgoingEmail
 from arbeitszeit_web.email import MailService
 from arbeitszeit_web.presenters.send_confirmation_email_presenter import (
     SendConfirmationEmailPresenter,
@@ -18,14 +22,19 @@ class FlaskEmailConfiguration:
         return current_app.config["MAIL_DEFAULT_SENDER"]
 
 
-def get_mail_service() -> MailService:
-    if current_app.config.get("MAIL_BACKEND") == "flask_mail":
-        return FlaskMailService()
-    else:
-        return DebugMailService()
+@inject
+@dataclass
+class OutboxMailService:
+    """Queue emails in the outbox instead of sending them right away.
 
+    The emails are stored in the database transaction of the current
+    request, so that they are only sent if the request succeeds. They
+    are delivered by `flask mail-worker`.
+    """
+
+    db: SQLAlchemy
+    datetime_service: DatetimeService
 
-class DebugMailService:
     def send_message(
         self,
         subject: str,
@@ -33,32 +42,57 @@ class DebugMailService:
         html: str,
         sender: str,
     ) -> None:
-        print("Email would be sent:")
-        print(f"recipients: {' '.join(recipients)}")
-        print(f"subject: {subject}")
-        print(f"sender: {sender}")
-        print(f"content: {html}")
+        now = self.datetime_service.now()
+        self.db.session.add(
+            OutgoingEmail(
+                created_at=now,
+                sender=sender,
+                recipients="\n".join(recipients),
+                subject=subject,
+                html=html,
+                attempts=0,
+                next_attempt_at=now,
+            )
+        )
 
-    def create_confirmation_html(
-        self, template_name: str, endpoint: str, token: str
-    ) -> str:
-        confirm_url = url_for(endpoint=endpoint, token=token, _external=True)
-        return render_template(template_name, confirm_url=confirm_url)
 
+class MailTransport(Protocol):
+    def connect(self) -> ContextManager[Callable[[Message], None]]:
+        """Open a connection and return a function that sends messages
+        over it. The connection is closed when the context is left.
+        """
+        ...
 
-class FlaskMailService:
-    def send_message(
-        self,
-        subject: str,
-        recipients: List[str],
-        html: str,
-        sender: str,
-    ) -> None:
-        msg = Message(subject=subject, recipients=recipients, html=html, sender=sender)
-        try:
-            mail.send(msg)
-        except Exception:
-            raise CannotSendEmail
+
+class FlaskMailTransport:
+    @contextmanager
+    def connect(self) -> Iterator[Callable[[Message], None]]:
+        with mail.connect() as connection:
+            yield connection.send
+
+
+class DebugMailSink:
+    """Print emails instead of sending them. The emails are not kept,
+    since the sink lives as long as the process.
+    """
+
+    @contextmanager
+    def connect(self) -> Iterator[Callable[[Message], None]]:
+        yield self._send
+
+    def _send(self, message: Message) -> None:
+        print("Email would be sent:")
+        print(f"recipients: {' '.join(message.recipients)}")
+        print(f"subject: {message.subject}")
+        print(f"sender: {message.sender}")
+        print(f"content: {message.html}")
+
+
+def get_mail_transport() -> MailTransport:
+    if current_app.config.get("MAIL_BACKEND") == "flask_mail":
+        return FlaskMailTransport()
+    else:
+        return DebugMailSink()
 
 
 @dataclass
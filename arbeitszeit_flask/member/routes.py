@@ -7,6 +7,7 @@ from arbeitszeit import use_cases
 from arbeitszeit.use_cases import ListMessages
 from arbeitszeit.use_cases.get_company_summary import GetCompanySummary
 from arbeitszeit_flask.database import MemberRepository, commit_changes
+from arbeitszeit_flask.flask_request import FlaskRequest
 from arbeitszeit_flask.forms import (
     AnswerCompanyWorkInviteForm,
     CompanySearchForm,
@@ -23,12 +24,14 @@ from arbeitszeit_flask.views import (
     QueryPlansView,
     ReadMessageView,
 )
+from arbeitszeit_flask.views.export_transactions_view import ExportTransactionsView
 from arbeitszeit_web.get_company_summary import GetCompanySummarySuccessPresenter
 from arbeitszeit_web.get_coop_summary import GetCoopSummarySuccessPresenter
 from arbeitszeit_web.get_member_profile_info import GetMemberProfileInfoPresenter
 from arbeitszeit_web.get_plan_summary_member import GetPlanSummarySuccessPresenter
 from arbeitszeit_web.get_statistics import GetStatisticsPresenter
 from arbeitszeit_web.list_messages import ListMessagesController, ListMessagesPresenter
+from arbeitszeit_web.pagination import get_next_page_url, get_page_request
 from arbeitszeit_web.pay_consumer_product import (
     PayConsumerProductController,
     PayConsumerProductPresenter,
@@ -47,13 +50,18 @@ def my_purchases(
     query_purchases: use_cases.QueryPurchases,
     member_repository: MemberRepository,
     template_renderer: UserTemplateRenderer,
+    flask_request: FlaskRequest,
 ) -> Response:
     member = member_repository.get_by_id(UUID(current_user.id))
     assert member is not None
-    purchases = list(query_purchases(member))
+    purchases = query_purchases(member, get_page_request(flask_request))
     return Response(
         template_renderer.render_template(
-            "member/my_purchases.html", context=dict(purchases=purchases)
+            "member/my_purchases.html",
+            context=dict(
+                purchases=purchases.items,
+                next_page_url=get_next_page_url(flask_request, purchases.next_cursor),
+            ),
         )
     )
 
@@ -66,7 +74,9 @@ def query_plans(
     presenter: QueryPlansPresenter,
 ) -> Response:
     template_name = "member/query_plans.html"
-    search_form = PlanSearchForm(request.form)
+    search_form = PlanSearchForm(
+        request.form if request.method == "POST" else request.args
+    )
     view = QueryPlansView(
         search_form,
         query_plans,
@@ -89,7 +99,9 @@ def query_companies(
     presenter: QueryCompaniesPresenter,
 ):
     template_name = "member/query_companies.html"
-    search_form = CompanySearchForm(request.form)
+    search_form = CompanySearchForm(
+        request.form if request.method == "POST" else request.args
+    )
     view = QueryCompaniesView(
         search_form,
         query_companies,
@@ -159,6 +171,11 @@ def my_account(
     )
 
 
+@MemberRoute("/member/my_account/export/<any(csv, ndjson):export_format>")
+def export_transactions(export_format: str, view: ExportTransactionsView):
+    return view.respond_to_get(export_format)
+
+
 @MemberRoute("/member/statistics")
 def statistics(
     get_statistics: use_cases.GetStatistics,
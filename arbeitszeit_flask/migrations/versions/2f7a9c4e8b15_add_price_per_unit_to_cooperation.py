@@ -0,0 +1,40 @@
+"""Add price_per_unit to cooperation
+
+Revision ID: 2f7a9c4e8b15
+Revises: 6e2d8b4f1c93
+Create Date: 2026-10-18 05:34:56.537610
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "2f7a9c4e8b15"
+down_revision = "6e2d8b4f1c93"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "cooperation", sa.Column("price_per_unit", sa.Numeric(), nullable=True)
+    )
+    # Backfill the prices of the existing cooperations with the formula
+    # of arbeitszeit.price_calculator. Cooperations without plans keep
+    # a null price.
+    op.execute(
+        """
+        UPDATE cooperation SET price_per_unit = (
+            SELECT
+                SUM((plan.costs_p + plan.costs_r + plan.costs_a) / plan.timeframe)
+                / COALESCE(NULLIF(SUM(plan.prd_amount * 1.0 / plan.timeframe), 0), 1)
+            FROM plan
+            WHERE plan.cooperation = cooperation.id
+        )
+        """
+    )
+
+
+def downgrade():
+    op.drop_column("cooperation", "price_per_unit")
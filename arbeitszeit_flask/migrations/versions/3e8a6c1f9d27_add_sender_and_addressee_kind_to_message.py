@@ -0,0 +1,63 @@
+"""Add sender_kind and addressee_kind to message
+
+Revision ID: 3e8a6c1f9d27
+Revises: e4c7a2d9b361
+Create Date: 2026-10-18 06:25:47.215930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3e8a6c1f9d27"
+down_revision = "e4c7a2d9b361"
+branch_labels = None
+depends_on = None
+
+user_kind = sa.Enum("member", "company", "social_accounting", name="userkind")
+
+
+def upgrade():
+    user_kind.create(op.get_bind(), checkfirst=True)
+    op.add_column("message", sa.Column("sender_kind", user_kind, nullable=True))
+    op.add_column("message", sa.Column("addressee_kind", user_kind, nullable=True))
+    for column, kinds in [
+        ("sender", ["member", "company", "social_accounting"]),
+        ("addressee", ["member", "company"]),
+    ]:
+        for kind in kinds:
+            op.execute(
+                f"""
+                UPDATE message SET {column}_kind = '{kind}'
+                WHERE {column} IN (SELECT id FROM {kind})
+                """
+            )
+    unmatched_messages = [
+        row.id
+        for row in op.get_bind().execute(
+            sa.text(
+                """
+                SELECT id FROM message
+                WHERE sender_kind IS NULL OR addressee_kind IS NULL
+                ORDER BY id
+                """
+            )
+        )
+    ]
+    if unmatched_messages:
+        raise RuntimeError(
+            "Cannot determine the kind of sender or addressee of the following "
+            "messages, because they are neither members, companies nor social "
+            "accounting. Delete or fix these messages and run the migration "
+            "again: " + ", ".join(str(message_id) for message_id in unmatched_messages)
+        )
+    with op.batch_alter_table("message") as batch_op:
+        batch_op.alter_column("sender_kind", existing_type=user_kind, nullable=False)
+        batch_op.alter_column("addressee_kind", existing_type=user_kind, nullable=False)
+
+
+def downgrade():
+    op.drop_column("message", "addressee_kind")
+    op.drop_column("message", "sender_kind")
+    user_kind.drop(op.get_bind(), checkfirst=True)
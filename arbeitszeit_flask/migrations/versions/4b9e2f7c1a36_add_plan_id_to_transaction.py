@@ -0,0 +1,66 @@
+"""Add plan_id to transaction
+
+Revision ID: 4b9e2f7c1a36
+Revises: d81e4b6a0c57
+Create Date: 2026-10-18 05:04:04.203518
+
+"""
+from contextlib import nullcontext
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "4b9e2f7c1a36"
+down_revision = "d81e4b6a0c57"
+branch_labels = None
+depends_on = None
+
+
+def without_blocking_writes():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    # on postgres. Other databases build the index as usual.
+    if op.get_context().dialect.name == "postgresql":
+        return op.get_context().autocommit_block()
+    return nullcontext()
+
+
+def upgrade():
+    with op.batch_alter_table("transaction", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("plan_id", sa.String(), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_transaction_plan_id_plan", "plan", ["plan_id"], ["id"]
+        )
+    # All transactions concerning a plan were created with the purpose
+    # "Plan-Id: <plan id>". Purposes that do not point to an existing
+    # plan are left without a plan reference.
+    op.execute(
+        """
+        UPDATE "transaction"
+        SET plan_id = (
+            SELECT plan.id FROM plan
+            WHERE plan.id = SUBSTR("transaction".purpose, 10)
+        )
+        WHERE "transaction".purpose LIKE 'Plan-Id: %'
+        """
+    )
+    with without_blocking_writes():
+        op.create_index(
+            "ix_transaction_plan_id",
+            "transaction",
+            ["plan_id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with without_blocking_writes():
+        op.drop_index(
+            "ix_transaction_plan_id",
+            table_name="transaction",
+            postgresql_concurrently=True,
+        )
+    with op.batch_alter_table("transaction", schema=None) as batch_op:
+        batch_op.drop_constraint("fk_transaction_plan_id_plan", type_="foreignkey")
+        batch_op.drop_column("plan_id")
@@ -0,0 +1,35 @@
+"""Create account_balance_checkpoint table
+
+Revision ID: 5b9e3d7a1c42
+Revises: 8d4c1f6a2b70
+Create Date: 2026-10-18 06:10:52.604417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5b9e3d7a1c42"
+down_revision = "8d4c1f6a2b70"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "account_balance_checkpoint",
+        sa.Column("account_id", sa.String(), nullable=False),
+        sa.Column("timestamp", sa.DateTime(), nullable=False),
+        sa.Column("sent", sa.Numeric(), nullable=False),
+        sa.Column("received", sa.Numeric(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["account.id"],
+        ),
+        sa.PrimaryKeyConstraint("account_id", "timestamp"),
+    )
+
+
+def downgrade():
+    op.drop_table("account_balance_checkpoint")
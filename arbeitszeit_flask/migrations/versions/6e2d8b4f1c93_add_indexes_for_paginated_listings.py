@@ -0,0 +1,58 @@
+"""Add indexes for paginated listings
+
+Revision ID: 6e2d8b4f1c93
+Revises: 9c3a7d5e2f18
+Create Date: 2026-10-18 05:23:10.482901
+
+"""
+from contextlib import nullcontext
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "6e2d8b4f1c93"
+down_revision = "9c3a7d5e2f18"
+branch_labels = None
+depends_on = None
+
+
+# (name, table, columns, partial index condition for postgres and sqlite)
+INDEXES = [
+    ("ix_company_name_id", "company", ["name", "id"], None),
+    (
+        "ix_plan_active_prd_name_id",
+        "plan",
+        ["prd_name", "id"],
+        ("is_active = true", "is_active = 1"),
+    ),
+    ("ix_message_addressee_id", "message", ["addressee", "id"], None),
+]
+
+
+def without_blocking_writes():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    # on postgres. Other databases build the indexes as usual.
+    if op.get_context().dialect.name == "postgresql":
+        return op.get_context().autocommit_block()
+    return nullcontext()
+
+
+def upgrade():
+    with without_blocking_writes():
+        for name, table, columns, condition in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(condition[0]) if condition else None,
+                sqlite_where=sa.text(condition[1]) if condition else None,
+            )
+
+
+def downgrade():
+    with without_blocking_writes():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,43 @@
+"""Create outgoing_email table
+
+Revision ID: 7d4a1b6e3f85
+Revises: 9c2f5e8b4a13
+Create Date: 2026-10-18 06:39:58.514720
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7d4a1b6e3f85"
+down_revision = "9c2f5e8b4a13"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "outgoing_email",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("sender", sa.String(), nullable=False),
+        sa.Column("recipients", sa.String(), nullable=False),
+        sa.Column("subject", sa.String(), nullable=False),
+        sa.Column("html", sa.Text(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_outgoing_email_next_attempt_at"),
+        "outgoing_email",
+        ["next_attempt_at"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_outgoing_email_next_attempt_at"), table_name="outgoing_email")
+    op.drop_table("outgoing_email")
@@ -0,0 +1,71 @@
+"""Create planning_aggregate table
+
+Revision ID: 8d4c1f6a2b70
+Revises: 2f7a9c4e8b15
+Create Date: 2026-10-18 05:45:53.118254
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "8d4c1f6a2b70"
+down_revision = "2f7a9c4e8b15"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "planning_aggregate",
+        sa.Column("is_public_service", sa.Boolean(), nullable=False),
+        sa.Column("active_plans", sa.Integer(), nullable=False),
+        sa.Column("timeframe", sa.Numeric(), nullable=False),
+        sa.Column("costs_p", sa.Numeric(), nullable=False),
+        sa.Column("costs_r", sa.Numeric(), nullable=False),
+        sa.Column("costs_a", sa.Numeric(), nullable=False),
+        sa.Column("costs_p_per_day", sa.Numeric(), nullable=False),
+        sa.Column("costs_r_per_day", sa.Numeric(), nullable=False),
+        sa.Column("costs_a_per_day", sa.Numeric(), nullable=False),
+        sa.PrimaryKeyConstraint("is_public_service"),
+    )
+    # Backfill one row for productive and one for public plans from
+    # the currently active plans. Both rows are created even if there
+    # are no active plans of their kind.
+    op.execute(
+        """
+        INSERT INTO planning_aggregate (
+            is_public_service,
+            active_plans,
+            timeframe,
+            costs_p,
+            costs_r,
+            costs_a,
+            costs_p_per_day,
+            costs_r_per_day,
+            costs_a_per_day
+        )
+        SELECT
+            kind.is_public_service,
+            COUNT(plan.id),
+            COALESCE(SUM(plan.timeframe), 0),
+            COALESCE(SUM(plan.costs_p), 0),
+            COALESCE(SUM(plan.costs_r), 0),
+            COALESCE(SUM(plan.costs_a), 0),
+            COALESCE(SUM(plan.costs_p * 1.0 / plan.timeframe), 0),
+            COALESCE(SUM(plan.costs_r * 1.0 / plan.timeframe), 0),
+            COALESCE(SUM(plan.costs_a * 1.0 / plan.timeframe), 0)
+        FROM (
+            SELECT false AS is_public_service UNION ALL SELECT true
+        ) AS kind
+        LEFT JOIN plan
+            ON plan.is_public_service = kind.is_public_service
+            AND plan.is_active
+        GROUP BY kind.is_public_service
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("planning_aggregate")
@@ -0,0 +1,39 @@
+"""Create unread_message_count table
+
+Revision ID: 9c2f5e8b4a13
+Revises: 3e8a6c1f9d27
+Create Date: 2026-10-18 06:28:35.330512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9c2f5e8b4a13"
+down_revision = "3e8a6c1f9d27"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "unread_message_count",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("unread_messages", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    # Backfill the counters from the messages that were not read yet.
+    op.execute(
+        """
+        INSERT INTO unread_message_count (user_id, unread_messages)
+        SELECT addressee, COUNT(*)
+        FROM message
+        WHERE NOT is_read
+        GROUP BY addressee
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("unread_message_count")
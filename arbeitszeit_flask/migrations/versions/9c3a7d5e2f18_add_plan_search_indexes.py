@@ -0,0 +1,74 @@
+"""Add plan search indexes
+
+Revision ID: 9c3a7d5e2f18
+Revises: 4b9e2f7c1a36
+Create Date: 2026-10-18 05:08:03.671390
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "9c3a7d5e2f18"
+down_revision = "4b9e2f7c1a36"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_context().dialect.name
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        # block.
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_plan_search_words ON plan "
+                "USING gin (to_tsvector('simple', prd_name || ' ' || description))"
+            )
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_plan_search_trigrams ON plan "
+                "USING gin ((prd_name || ' ' || description) gin_trgm_ops)"
+            )
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_plan_id_prefix ON plan "
+                "(id varchar_pattern_ops)"
+            )
+    elif dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS plan_search USING fts5("
+            "plan_id UNINDEXED, prd_name, description, tokenize='trigram')"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS plan_search_insert AFTER INSERT ON plan BEGIN "
+            "INSERT INTO plan_search (plan_id, prd_name, description) "
+            "VALUES (new.id, new.prd_name, new.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS plan_search_update "
+            "AFTER UPDATE OF prd_name, description ON plan BEGIN "
+            "UPDATE plan_search SET prd_name = new.prd_name, "
+            "description = new.description WHERE plan_id = new.id; END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS plan_search_delete AFTER DELETE ON plan BEGIN "
+            "DELETE FROM plan_search WHERE plan_id = old.id; END"
+        )
+        op.execute(
+            "INSERT INTO plan_search (plan_id, prd_name, description) "
+            "SELECT id, prd_name, description FROM plan"
+        )
+
+
+def downgrade():
+    dialect = op.get_context().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_plan_id_prefix")
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_plan_search_trigrams")
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_plan_search_words")
+    elif dialect == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS plan_search_delete")
+        op.execute("DROP TRIGGER IF EXISTS plan_search_update")
+        op.execute("DROP TRIGGER IF EXISTS plan_search_insert")
+        op.execute("DROP TABLE IF EXISTS plan_search")
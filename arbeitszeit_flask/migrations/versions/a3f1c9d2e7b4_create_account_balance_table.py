@@ -0,0 +1,63 @@
+"""Create account_balance table
+
+Revision ID: a3f1c9d2e7b4
+Revises: c37965cc6adc
+Create Date: 2026-10-18 04:46:47.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a3f1c9d2e7b4"
+down_revision = "c37965cc6adc"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "account_balance",
+        sa.Column("account_id", sa.String(), nullable=False),
+        sa.Column("sent", sa.Numeric(), nullable=False),
+        sa.Column("received", sa.Numeric(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["account.id"],
+        ),
+        sa.PrimaryKeyConstraint("account_id"),
+    )
+    # Backfill the running totals from the existing transaction
+    # history. Transactions from an account to itself do not change
+    # its balance and are therefore not counted.
+    op.execute(
+        """
+        INSERT INTO account_balance (account_id, sent, received)
+        SELECT
+            account.id,
+            COALESCE(
+                (
+                    SELECT SUM(t.amount_sent)
+                    FROM "transaction" AS t
+                    WHERE t.sending_account = account.id
+                    AND t.receiving_account != account.id
+                ),
+                0
+            ),
+            COALESCE(
+                (
+                    SELECT SUM(t.amount_received)
+                    FROM "transaction" AS t
+                    WHERE t.receiving_account = account.id
+                    AND t.sending_account != account.id
+                ),
+                0
+            )
+        FROM account
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("account_balance")
@@ -0,0 +1,63 @@
+"""Add sent_on to message
+
+Revision ID: b6f1d3a8c942
+Revises: 7d4a1b6e3f85
+Create Date: 2026-10-18 08:03:41.275806
+
+"""
+from contextlib import nullcontext
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b6f1d3a8c942"
+down_revision = "7d4a1b6e3f85"
+branch_labels = None
+depends_on = None
+
+
+def without_blocking_writes():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    # on postgres. Other databases build the indexes as usual.
+    if op.get_context().dialect.name == "postgresql":
+        return op.get_context().autocommit_block()
+    return nullcontext()
+
+
+def upgrade():
+    op.add_column("message", sa.Column("sent_on", sa.DateTime(), nullable=True))
+    # When the existing messages were sent is not known. Dating them to
+    # the migration keeps them behind every message sent afterwards.
+    op.execute("UPDATE message SET sent_on = CURRENT_TIMESTAMP")
+    with op.batch_alter_table("message") as batch_op:
+        batch_op.alter_column("sent_on", existing_type=sa.DateTime(), nullable=False)
+    with without_blocking_writes():
+        op.create_index(
+            "ix_message_addressee_sent_on_id",
+            "message",
+            ["addressee", "sent_on", "id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_message_addressee_id",
+            table_name="message",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with without_blocking_writes():
+        op.create_index(
+            "ix_message_addressee_id",
+            "message",
+            ["addressee", "id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_message_addressee_sent_on_id",
+            table_name="message",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("message", "sent_on")
@@ -0,0 +1,110 @@
+"""Add indexes for repository queries
+
+Revision ID: d81e4b6a0c57
+Revises: a3f1c9d2e7b4
+Create Date: 2026-10-18 05:01:27.918634
+
+"""
+from contextlib import nullcontext
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d81e4b6a0c57"
+down_revision = "a3f1c9d2e7b4"
+branch_labels = None
+depends_on = None
+
+
+# (name, table, columns, partial index condition for postgres and sqlite)
+INDEXES = [
+    ("ix_transaction_sending_account", "transaction", ["sending_account"], None),
+    ("ix_transaction_receiving_account", "transaction", ["receiving_account"], None),
+    (
+        "ix_plan_planner_plan_creation_date",
+        "plan",
+        ["planner", "plan_creation_date"],
+        None,
+    ),
+    (
+        "ix_plan_active_activation_date",
+        "plan",
+        ["activation_date"],
+        ("is_active = true", "is_active = 1"),
+    ),
+    (
+        "ix_plan_active_not_expired",
+        "plan",
+        ["is_public_service"],
+        (
+            "is_active = true AND expired = false AND approval_date IS NOT NULL",
+            "is_active = 1 AND expired = 0 AND approval_date IS NOT NULL",
+        ),
+    ),
+    (
+        "ix_plan_cooperation",
+        "plan",
+        ["cooperation"],
+        ("cooperation IS NOT NULL", "cooperation IS NOT NULL"),
+    ),
+    (
+        "ix_plan_requested_cooperation",
+        "plan",
+        ["requested_cooperation"],
+        ("requested_cooperation IS NOT NULL", "requested_cooperation IS NOT NULL"),
+    ),
+    ("ix_message_addressee_is_read", "message", ["addressee", "is_read"], None),
+    ("ix_purchase_member_purchase_date", "purchase", ["member", "purchase_date"], None),
+    (
+        "ix_purchase_company_purchase_date",
+        "purchase",
+        ["company", "purchase_date"],
+        None,
+    ),
+    ("ix_account_account_owner_member", "account", ["account_owner_member"], None),
+    ("ix_account_account_owner_company", "account", ["account_owner_company"], None),
+    (
+        "ix_account_account_owner_social_accounting",
+        "account",
+        ["account_owner_social_accounting"],
+        None,
+    ),
+    (
+        "ix_company_work_invite_member_company",
+        "company_work_invite",
+        ["member", "company"],
+        None,
+    ),
+    ("ix_jobs_company_id_member_id", "jobs", ["company_id", "member_id"], None),
+    ("ix_jobs_member_id_company_id", "jobs", ["member_id", "company_id"], None),
+    ("ix_cooperation_coordinator", "cooperation", ["coordinator"], None),
+]
+
+
+def without_blocking_writes():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    # on postgres. Other databases build the indexes as usual.
+    if op.get_context().dialect.name == "postgresql":
+        return op.get_context().autocommit_block()
+    return nullcontext()
+
+
+def upgrade():
+    with without_blocking_writes():
+        for name, table, columns, condition in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(condition[0]) if condition else None,
+                sqlite_where=sa.text(condition[1]) if condition else None,
+            )
+
+
+def downgrade():
+    with without_blocking_writes():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,45 @@
+"""Add index on transaction date
+
+Revision ID: e4c7a2d9b361
+Revises: 5b9e3d7a1c42
+Create Date: 2026-10-18 06:11:07.529144
+
+"""
+from contextlib import nullcontext
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "e4c7a2d9b361"
+down_revision = "5b9e3d7a1c42"
+branch_labels = None
+depends_on = None
+
+
+def without_blocking_writes():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    # on postgres. Other databases build the index as usual.
+    if op.get_context().dialect.name == "postgresql":
+        return op.get_context().autocommit_block()
+    return nullcontext()
+
+
+def upgrade():
+    # `flask write-balance-checkpoints` reads the transactions by date.
+    with without_blocking_writes():
+        op.create_index(
+            "ix_transaction_date",
+            "transaction",
+            ["date"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with without_blocking_writes():
+        op.drop_index(
+            "ix_transaction_date",
+            table_name="transaction",
+            postgresql_concurrently=True,
+        )
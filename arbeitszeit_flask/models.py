@@ -29,6 +29,8 @@ jobs = db.Table(
     "jobs",
     db.Column("member_id", db.String, db.ForeignKey("member.id")),
     db.Column("company_id", db.String, db.ForeignKey("company.id")),
+    db.Index("ix_jobs_company_id_member_id", "company_id", "member_id"),
+    db.Index("ix_jobs_member_id_company_id", "member_id", "company_id"),
 )
 
 
@@ -64,6 +66,8 @@ class Company(UserMixin, db.Model):
     purchases = db.relationship("Purchase", lazy="dynamic")
     drafts = db.relationship("PlanDraft", lazy="dynamic")
 
+    __table_args__ = (db.Index("ix_company_name_id", name, id),)
+
     def __repr__(self):
         return "<Company(email='%s', name='%s')>" % (
             self.email,
@@ -122,6 +126,61 @@ class Plan(UserMixin, db.Model):
     cooperation = db.Column(db.String, db.ForeignKey("cooperation.id"), nullable=True)
     hidden_by_user = db.Column(db.Boolean, nullable=False, default=False)
 
+    __table_args__ = (
+        db.Index("ix_plan_planner_plan_creation_date", planner, plan_creation_date),
+        db.Index(
+            "ix_plan_active_activation_date",
+            activation_date,
+            postgresql_where=is_active == True,
+            sqlite_where=is_active == True,
+        ),
+        db.Index(
+            "ix_plan_active_not_expired",
+            is_public_service,
+            postgresql_where=db.and_(
+                is_active == True, expired == False, approval_date.isnot(None)
+            ),
+            sqlite_where=db.and_(
+                is_active == True, expired == False, approval_date.isnot(None)
+            ),
+        ),
+        db.Index(
+            "ix_plan_cooperation",
+            cooperation,
+            postgresql_where=cooperation.isnot(None),
+            sqlite_where=cooperation.isnot(None),
+        ),
+        db.Index(
+            "ix_plan_requested_cooperation",
+            requested_cooperation,
+            postgresql_where=requested_cooperation.isnot(None),
+            sqlite_where=requested_cooperation.isnot(None),
+        ),
+        db.Index(
+            "ix_plan_active_prd_name_id",
+            prd_name,
+            id,
+            postgresql_where=is_active == True,
+            sqlite_where=is_active == True,
+        ),
+    )
+
+
+class PlanningAggregate(db.Model):
+    """Running totals over the production costs of all active plans.
+    There is one row for productive plans and one for public plans.
+    """
+
+    is_public_service = db.Column(db.Boolean, primary_key=True)
+    active_plans = db.Column(db.Integer, nullable=False, default=0)
+    timeframe = db.Column(db.Numeric(), nullable=False, default=0)
+    costs_p = db.Column(db.Numeric(), nullable=False, default=0)
+    costs_r = db.Column(db.Numeric(), nullable=False, default=0)
+    costs_a = db.Column(db.Numeric(), nullable=False, default=0)
+    costs_p_per_day = db.Column(db.Numeric(), nullable=False, default=0)
+    costs_r_per_day = db.Column(db.Numeric(), nullable=False, default=0)
+    costs_a_per_day = db.Column(db.Numeric(), nullable=False, default=0)
+
 
 class AccountTypes(Enum):
     p = "p"
@@ -135,13 +194,13 @@ class AccountTypes(Enum):
 class Account(UserMixin, db.Model):
     id = db.Column(db.String, primary_key=True, default=generate_uuid)
     account_owner_social_accounting = db.Column(
-        db.String, db.ForeignKey("social_accounting.id"), nullable=True
+        db.String, db.ForeignKey("social_accounting.id"), nullable=True, index=True
     )
     account_owner_company = db.Column(
-        db.String, db.ForeignKey("company.id"), nullable=True
+        db.String, db.ForeignKey("company.id"), nullable=True, index=True
     )
     account_owner_member = db.Column(
-        db.String, db.ForeignKey("member.id"), nullable=True
+        db.String, db.ForeignKey("member.id"), nullable=True, index=True
     )
     account_type = db.Column(db.Enum(AccountTypes), nullable=False)
     transactions_sent = db.relationship(
@@ -156,18 +215,45 @@ class Account(UserMixin, db.Model):
         lazy="dynamic",
         backref="account_to",
     )
+    balance = db.relationship("AccountBalance", uselist=False, lazy=True)
+
+
+class AccountBalance(db.Model):
+    """Running totals of all transactions sent and received by an
+    account. Transactions where sender and receiver are the same
+    account are not counted.
+    """
+
+    account_id = db.Column(db.String, db.ForeignKey("account.id"), primary_key=True)
+    sent = db.Column(db.Numeric(), nullable=False, default=0)
+    received = db.Column(db.Numeric(), nullable=False, default=0)
+
+
+class AccountBalanceCheckpoint(db.Model):
+    """The running totals of an account at the end of a checkpoint
+    interval. Checkpoints are only written for the intervals in which
+    the account had transactions.
+    """
+
+    account_id = db.Column(db.String, db.ForeignKey("account.id"), primary_key=True)
+    timestamp = db.Column(db.DateTime, primary_key=True)
+    sent = db.Column(db.Numeric(), nullable=False)
+    received = db.Column(db.Numeric(), nullable=False)
 
 
 class Transaction(UserMixin, db.Model):
     id = db.Column(db.String, primary_key=True, default=generate_uuid)
-    date = db.Column(db.DateTime, nullable=False)
-    sending_account = db.Column(db.String, db.ForeignKey("account.id"), nullable=False)
+    date = db.Column(db.DateTime, nullable=False, index=True)
+    sending_account = db.Column(
+        db.String, db.ForeignKey("account.id"), nullable=False, index=True
+    )
     receiving_account = db.Column(
-        db.String, db.ForeignKey("account.id"), nullable=False
+        db.String, db.ForeignKey("account.id"), nullable=False, index=True
     )
     amount_sent = db.Column(db.Numeric(), nullable=False)
     amount_received = db.Column(db.Numeric(), nullable=False)
     purpose = db.Column(db.String(1000), nullable=True)  # Verwendungszweck
+    plan_id = db.Column(db.String, db.ForeignKey("plan.id"), nullable=True, index=True)
 
 
 class Purchase(UserMixin, db.Model):
@@ -181,22 +267,75 @@ class Purchase(UserMixin, db.Model):
     amount = db.Column(db.Integer, nullable=False)
     purpose = db.Column(db.Enum(entities.PurposesOfPurchases), nullable=False)
 
+    __table_args__ = (
+        db.Index("ix_purchase_member_purchase_date", member, purchase_date),
+        db.Index("ix_purchase_company_purchase_date", company, purchase_date),
+    )
+
 
 class CompanyWorkInvite(db.Model):
     id = db.Column(db.String, primary_key=True, default=generate_uuid)
     company = db.Column(db.String, db.ForeignKey("company.id"), nullable=False)
     member = db.Column(db.String, db.ForeignKey("member.id"), nullable=False)
 
+    __table_args__ = (
+        db.Index("ix_company_work_invite_member_company", member, company),
+    )
+
+
+class UserKind(Enum):
+    member = "member"
+    company = "company"
+    social_accounting = "social_accounting"
+
 
 class Message(db.Model):
     id = db.Column(db.String, primary_key=True, default=generate_uuid)
     sender = db.Column(db.String)
+    # Tells which table the sender and the addressee are found in.
+    sender_kind = db.Column(db.Enum(UserKind), nullable=False)
     addressee = db.Column(db.String)
+    addressee_kind = db.Column(db.Enum(UserKind), nullable=False)
     title = db.Column(db.String)
     content = db.Column(db.String)
     sender_remarks = db.Column(db.String, nullable=True)
     is_read = db.Column(db.Boolean)
     user_action = db.Column(db.String, db.ForeignKey("user_action.id"), nullable=True)
+    sent_on = db.Column(db.DateTime, nullable=False)
+
+    __table_args__ = (
+        db.Index("ix_message_addressee_is_read", addressee, is_read),
+        db.Index("ix_message_addressee_sent_on_id", addressee, sent_on, id),
+    )
+
+
+class UnreadMessageCount(db.Model):
+    """The number of unread messages addressed to a member or company,
+    kept up to date whenever messages are sent or read.
+    """
+
+    user_id = db.Column(db.String, primary_key=True)
+    unread_messages = db.Column(db.Integer, nullable=False, default=0)
+
+
+class OutgoingEmail(db.Model):
+    """An email waiting to be delivered by `flask mail-worker`.
+
+    Emails are written in the transaction of the request that sends
+    them and removed once they were delivered.
+    """
+
+    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    created_at = db.Column(db.DateTime, nullable=False)
+    sender = db.Column(db.String, nullable=False)
+    # One address per line.
+    recipients = db.Column(db.String, nullable=False)
+    subject = db.Column(db.String, nullable=False)
+    html = db.Column(db.Text, nullable=False)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    # Null once delivery was given up.
+    next_attempt_at = db.Column(db.DateTime, nullable=True, index=True)
+    last_error = db.Column(db.String, nullable=True)
 
 
 class UserAction(db.Model):
@@ -210,7 +349,11 @@ class Cooperation(db.Model):
     creation_date = db.Column(db.DateTime, nullable=False)
     name = db.Column(db.String(100), nullable=False)
     definition = db.Column(db.String(5000), nullable=False)
-    coordinator = db.Column(db.String, db.ForeignKey("company.id"), nullable=False)
+    coordinator = db.Column(
+        db.String, db.ForeignKey("company.id"), nullable=False, index=True
+    )
+    # Reset to null whenever plans join or leave the cooperation.
+    price_per_unit = db.Column(db.Numeric(), nullable=True)
 
     plans = db.relationship(
         "Plan", foreign_keys="Plan.cooperation", lazy="dynamic", backref="coop"
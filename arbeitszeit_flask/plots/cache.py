@@ -0,0 +1,139 @@
+"""Cache for rendered plots.
+
+Rendering a plot with matplotlib takes far longer than everything else
+a plot request does. Plots are therefore cached under a key derived
+from everything that goes into the image: the kind of plot, its data,
+colors, labels and size, the locale and the matplotlib version. The
+data of account plots is identified by the account and the revision of
+its balance history instead, so that their keys can be built without
+reading the history. Since equal keys mean equal images, the key also
+serves as the ETag of the image.
+
+The cache keeps the most recently used plots in memory. If a directory
+is configured, plots are also written to disk, so that they survive
+restarts and are shared between worker processes. The key does not
+cover the code that draws the plots, so the directory should be
+emptied when that code changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Optional, Tuple
+
+import matplotlib
+
+
+@dataclass
+class PlotCacheStatistics:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+
+class PlotCache:
+    MEMORY = "memory"
+    DISK = "disk"
+    MISS = "miss"
+
+    def __init__(
+        self,
+        max_entries: int,
+        directory: Optional[str] = None,
+        max_disk_entries: int = 1000,
+    ) -> None:
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self.statistics = PlotCacheStatistics()
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def key(cls, kind: str, **parameters: Any) -> str:
+        content = json.dumps(
+            [kind, parameters, matplotlib.__version__], sort_keys=True, default=str
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get_or_create(self, key: str, create: Callable[[], bytes]) -> Tuple[bytes, str]:
+        """Return the plot stored under key and where it was found. The
+        plot is created and stored if it is not cached yet.
+        """
+        with self._lock:
+            if (png := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                self.statistics.memory_hits += 1
+                return png, self.MEMORY
+        if (png := self._read_from_disk(key)) is not None:
+            source = self.DISK
+        else:
+            png = create()
+            source = self.MISS
+            self._write_to_disk(key, png)
+        with self._lock:
+            if source == self.DISK:
+                self.statistics.disk_hits += 1
+            else:
+                self.statistics.misses += 1
+            self._entries[key] = png
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return png, source
+
+    def _read_from_disk(self, key: str) -> Optional[bytes]:
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as png_file:
+                png = png_file.read()
+            # Files are removed oldest first, so reading a plot marks it
+            # as recently used.
+            os.utime(self._path(key))
+        except FileNotFoundError:
+            return None
+        return png
+
+    def _write_to_disk(self, key: str, png: bytes) -> None:
+        if self.directory is None:
+            return
+        # Write to a temporary file first so that concurrent readers
+        # never see a partially written plot.
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(file_descriptor, "wb") as png_file:
+            png_file.write(png)
+        os.replace(temporary_path, self._path(key))
+        self._remove_oldest_files_from_disk()
+
+    def _remove_oldest_files_from_disk(self) -> None:
+        assert self.directory is not None
+        with os.scandir(self.directory) as directory_entries:
+            files = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in directory_entries
+                if entry.name.endswith(".png")
+            ]
+        files.sort()
+        for _, path in files[: max(len(files) - self.max_disk_entries, 0)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _path(self, key: str) -> str:
+        assert self.directory is not None
+        return os.path.join(self.directory, key + ".png")
@@ -0,0 +1,70 @@
+"""Reduce time series to the points that are visible in a plot.
+
+A line plot cannot show more points than it is wide in pixels. Long
+series are therefore downsampled with the largest triangle three
+buckets algorithm (Steinarsson, 2013), which keeps the peaks and dips
+that shape the line.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Tuple
+
+import numpy as np
+
+
+def downsample_time_series(
+    timestamps: List[datetime], values: List[Decimal], max_points: int
+) -> Tuple[List[datetime], List[Decimal]]:
+    """Return at most max_points of the series. The first and the last
+    point are always kept."""
+    if len(timestamps) <= max_points:
+        return timestamps, values
+    # Converting through datetime.timestamp is several times faster
+    # than numpy's datetime64 conversion of datetime objects.
+    x = np.fromiter(
+        (timestamp.timestamp() for timestamp in timestamps),
+        dtype=float,
+        count=len(timestamps),
+    )
+    y = np.fromiter(values, dtype=float, count=len(values))
+    indices = largest_triangle_three_buckets(x, y, max_points)
+    return [timestamps[i] for i in indices], [values[i] for i in indices]
+
+
+def largest_triangle_three_buckets(
+    x: np.ndarray, y: np.ndarray, threshold: int
+) -> np.ndarray:
+    """Indices of the threshold points that represent the series best.
+
+    The points between the first and the last point are split into
+    threshold - 2 buckets. From every bucket the point is chosen that
+    forms the largest triangle with the point chosen from the previous
+    bucket and the average of the next bucket. Each choice depends on
+    the one before, so the buckets are processed one after another,
+    but the areas within a bucket are computed at once.
+    """
+    length = len(x)
+    if threshold >= length:
+        return np.arange(length)
+    if threshold < 3:
+        return np.array([0, length - 1][:threshold], dtype=int)
+    edges = np.linspace(1, length - 1, threshold - 1).astype(int)
+    bucket_sizes = np.diff(edges)
+    average_x = np.add.reduceat(x[1:-1], edges[:-1] - 1) / bucket_sizes
+    average_y = np.add.reduceat(y[1:-1], edges[:-1] - 1) / bucket_sizes
+    # The last bucket is followed by the last point.
+    next_x = np.append(average_x[1:], x[-1])
+    next_y = np.append(average_y[1:], y[-1])
+    indices = np.empty(threshold, dtype=int)
+    indices[0] = 0
+    indices[-1] = length - 1
+    chosen = 0
+    for bucket, (start, end) in enumerate(zip(edges[:-1], edges[1:])):
+        areas = np.abs(
+            (x[chosen] - next_x[bucket]) * (y[start:end] - y[chosen])
+            - (x[chosen] - x[start:end]) * (next_y[bucket] - y[chosen])
+        )
+        chosen = start + int(np.argmax(areas))
+        indices[bucket + 1] = chosen
+    return indices
@@ -0,0 +1,105 @@
+"""Render plots outside of the process that handles the request.
+
+Drawing a plot keeps a CPU busy for a noticeable time. With
+PLOT_RENDERING_PROCESSES set, plots are drawn by a pool of processes
+that have already imported matplotlib and built its font cache, while
+the request handling process only waits for the result. The number of
+plots waiting for the pool is bounded and every plot has a time limit,
+so that a burst of plot requests fails fast instead of tying up the
+workers that serve pages.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, Optional
+
+
+class PlotRenderingUnavailable(Exception):
+    """Raised when a plot could not be rendered in time or too many
+    plots are waiting to be rendered."""
+
+
+class PlotRenderer:
+    def __init__(self, processes: int, max_queued_plots: int, timeout: float) -> None:
+        self.processes = processes
+        self.timeout = timeout
+        self._queue_slots = BoundedSemaphore(max_queued_plots)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = Lock()
+
+    def render(self, render_plot: Callable[..., bytes], *args: Any) -> bytes:
+        """Call render_plot with args in the process pool and return its
+        result. Without a pool, or if the pool has broken down, the plot
+        is rendered in the calling process. render_plot and args must be
+        picklable.
+        """
+        if not self.processes:
+            return render_plot(*args)
+        if not self._queue_slots.acquire(blocking=False):
+            raise PlotRenderingUnavailable("Too many plots are waiting to be rendered")
+        executor = self._get_executor()
+        try:
+            future = executor.submit(render_plot, *args)
+        except BrokenProcessPool:
+            self._queue_slots.release()
+            self._discard_executor(executor)
+            return render_plot(*args)
+        # The slot is released once the plot is done, not when we stop
+        # waiting for it, so that plots which take too long still count
+        # against the limit while they occupy a process.
+        future.add_done_callback(self._release_queue_slot)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise PlotRenderingUnavailable("Rendering the plot took too long")
+        except BrokenProcessPool:
+            self._discard_executor(executor)
+            return render_plot(*args)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    # Processes are started from a fresh interpreter
+                    # rather than forked from a web worker with open
+                    # database connections and running threads.
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=warm_up,
+                )
+                # Start all processes right away so that the first plots
+                # do not have to wait for the import of matplotlib.
+                for _ in range(self.processes):
+                    self._executor.submit(int)
+            return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _release_queue_slot(self, future: Future) -> None:
+        self._queue_slots.release()
+
+
+def warm_up() -> None:
+    """Import matplotlib and draw a text, which builds the font cache."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure()
+    figure.text(0, 0, "warm up")
+    FigureCanvasAgg(figure).draw()
@@ -1,14 +1,20 @@
 from decimal import Decimal
+from inspect import signature
+from typing import Any, Callable
 from uuid import UUID
 
 from flask import Blueprint, Response, request
+from flask_babel import get_locale
 from flask_login import login_required
 
-from arbeitszeit.use_cases.show_a_account_details import ShowAAccountDetailsUseCase
-from arbeitszeit.use_cases.show_p_account_details import ShowPAccountDetailsUseCase
-from arbeitszeit.use_cases.show_prd_account_details import ShowPRDAccountDetailsUseCase
-from arbeitszeit.use_cases.show_r_account_details import ShowRAccountDetailsUseCase
+from arbeitszeit.entities import AccountTypes
+from arbeitszeit.use_cases.get_company_account_history import GetCompanyAccountHistory
+from arbeitszeit.use_cases.get_company_account_history_revision import (
+    GetCompanyAccountHistoryRevision,
+)
 from arbeitszeit_flask.dependency_injection import with_injection
+from arbeitszeit_flask.plots.cache import PlotCache
+from arbeitszeit_flask.plots.rendering import PlotRenderingUnavailable
 from arbeitszeit_web.colors import Colors
 from arbeitszeit_web.plotter import Plotter
 from arbeitszeit_web.translator import Translator
@@ -22,11 +28,13 @@ plots = Blueprint(
 @with_injection()
 @login_required
 def global_barplot_for_certificates(
-    plotter: Plotter, translator: Translator, colors: Colors
+    plotter: Plotter, translator: Translator, colors: Colors, cache: PlotCache
 ):
     certificates_count = Decimal(request.args["certificates_count"])
     available_product = Decimal(request.args["available_product"])
-    png = plotter.create_bar_plot(
+    return _plot_response(
+        cache,
+        plotter.create_bar_plot,
         x_coordinates=[
             translator.gettext("Work certificates"),
             translator.gettext("Available product"),
@@ -39,19 +47,20 @@ def global_barplot_for_certificates(
         fig_size=(5, 4),
         y_label=translator.gettext("Hours"),
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
 
 
 @plots.route("/plots/global_barplot_for_means_of_production")
 @with_injection()
 @login_required
 def global_barplot_for_means_of_production(
-    plotter: Plotter, translator: Translator, colors: Colors
+    plotter: Plotter, translator: Translator, colors: Colors, cache: PlotCache
 ):
     planned_means = Decimal(request.args["planned_means"])
     planned_resources = Decimal(request.args["planned_resources"])
     planned_work = Decimal(request.args["planned_work"])
-    png = plotter.create_bar_plot(
+    return _plot_response(
+        cache,
+        plotter.create_bar_plot,
         x_coordinates=[
             translator.pgettext("Text should be short", "Fixed means"),
             translator.pgettext("Text should be short", "Liquid means"),
@@ -70,16 +79,19 @@ def global_barplot_for_means_of_production(
         fig_size=(5, 4),
         y_label=translator.gettext("Hours"),
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
 
 
 @plots.route("/plots/global_barplot_for_plans")
 @with_injection()
 @login_required
-def global_barplot_for_plans(plotter: Plotter, translator: Translator, colors: Colors):
+def global_barplot_for_plans(
+    plotter: Plotter, translator: Translator, colors: Colors, cache: PlotCache
+):
     productive_plans = Decimal(request.args["productive_plans"])
     public_plans = Decimal(request.args["public_plans"])
-    png = plotter.create_bar_plot(
+    return _plot_response(
+        cache,
+        plotter.create_bar_plot,
         x_coordinates=[
             translator.gettext("Productive plans"),
             translator.gettext("Public plans"),
@@ -89,7 +101,6 @@ def global_barplot_for_plans(plotter: Plotter, translator: Translator, colors: C
         fig_size=(5, 4),
         y_label=translator.gettext("Amount"),
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
 
 
 @plots.route("/plots/line_plot_of_company_prd_account")
@@ -97,15 +108,13 @@ def global_barplot_for_plans(plotter: Plotter, translator: Translator, colors: C
 @login_required
 def line_plot_of_company_prd_account(
     plotter: Plotter,
-    use_case: ShowPRDAccountDetailsUseCase,
+    cache: PlotCache,
+    get_revision: GetCompanyAccountHistoryRevision,
+    get_history: GetCompanyAccountHistory,
 ):
-    company_id = UUID(request.args["company_id"])
-    use_case_response = use_case(company_id)
-    png = plotter.create_line_plot(
-        x=use_case_response.plot.timestamps,
-        y=use_case_response.plot.accumulated_volumes,
+    return _account_plot_response(
+        plotter, cache, get_revision, get_history, AccountTypes.prd
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
 
 
 @plots.route("/plots/line_plot_of_company_r_account")
@@ -113,15 +122,13 @@ def line_plot_of_company_prd_account(
 @login_required
 def line_plot_of_company_r_account(
     plotter: Plotter,
-    use_case: ShowRAccountDetailsUseCase,
+    cache: PlotCache,
+    get_revision: GetCompanyAccountHistoryRevision,
+    get_history: GetCompanyAccountHistory,
 ):
-    company_id = UUID(request.args["company_id"])
-    use_case_response = use_case(company_id)
-    png = plotter.create_line_plot(
-        x=use_case_response.plot.timestamps,
-        y=use_case_response.plot.accumulated_volumes,
+    return _account_plot_response(
+        plotter, cache, get_revision, get_history, AccountTypes.r
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
 
 
 @plots.route("/plots/line_plot_of_company_p_account")
@@ -129,15 +136,13 @@ def line_plot_of_company_r_account(
 @login_required
 def line_plot_of_company_p_account(
     plotter: Plotter,
-    use_case: ShowPAccountDetailsUseCase,
+    cache: PlotCache,
+    get_revision: GetCompanyAccountHistoryRevision,
+    get_history: GetCompanyAccountHistory,
 ):
-    company_id = UUID(request.args["company_id"])
-    use_case_response = use_case(company_id)
-    png = plotter.create_line_plot(
-        x=use_case_response.plot.timestamps,
-        y=use_case_response.plot.accumulated_volumes,
+    return _account_plot_response(
+        plotter, cache, get_revision, get_history, AccountTypes.p
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
 
 
 @plots.route("/plots/line_plot_of_company_a_account")
@@ -145,12 +150,80 @@ def line_plot_of_company_p_account(
 @login_required
 def line_plot_of_company_a_account(
     plotter: Plotter,
-    use_case: ShowAAccountDetailsUseCase,
+    cache: PlotCache,
+    get_revision: GetCompanyAccountHistoryRevision,
+    get_history: GetCompanyAccountHistory,
 ):
+    return _account_plot_response(
+        plotter, cache, get_revision, get_history, AccountTypes.a
+    )
+
+
+def _account_plot_response(
+    plotter: Plotter,
+    cache: PlotCache,
+    get_revision: GetCompanyAccountHistoryRevision,
+    get_history: GetCompanyAccountHistory,
+    account_type: AccountTypes,
+) -> Response:
     company_id = UUID(request.args["company_id"])
-    use_case_response = use_case(company_id)
-    png = plotter.create_line_plot(
-        x=use_case_response.plot.timestamps,
-        y=use_case_response.plot.accumulated_volumes,
+    revision = get_revision(
+        GetCompanyAccountHistoryRevision.Request(
+            company_id=company_id, account_type=account_type
+        )
+    )
+    # The history of the account is only read when the plot has to be
+    # drawn, which is rare compared to revalidations and cache hits.
+    key = cache.key(
+        plotter.create_line_plot.__name__,
+        account_id=revision.account_id,
+        revision=revision.revision,
+    )
+
+    def create_plot() -> bytes:
+        history = get_history(
+            GetCompanyAccountHistory.Request(
+                company_id=company_id, account_type=account_type
+            )
+        )
+        return plotter.create_line_plot(x=history.timestamps, y=history.balances)
+
+    return _cached_plot_response(cache, key, create_plot)
+
+
+def _plot_response(
+    cache: PlotCache, create_plot: Callable[..., bytes], **arguments: Any
+) -> Response:
+    """Respond with the plot that create_plot draws from the arguments."""
+    bound_arguments = signature(create_plot).bind(**arguments)
+    bound_arguments.apply_defaults()
+    key = cache.key(
+        create_plot.__name__, locale=str(get_locale()), **bound_arguments.arguments
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
+    return _cached_plot_response(cache, key, lambda: create_plot(**arguments))
+
+
+def _cached_plot_response(
+    cache: PlotCache, key: str, create_plot: Callable[[], bytes]
+) -> Response:
+    """Respond with the plot cached under key, drawing it with
+    create_plot if needed. Clients that already have the plot get a 304
+    response without the plot being drawn or looked up."""
+    if request.if_none_match.contains(key):
+        cache.statistics.not_modified += 1
+        response = Response(status=304)
+    else:
+        try:
+            png, source = cache.get_or_create(key, create_plot)
+        except PlotRenderingUnavailable:
+            response = Response(status=503)
+            response.headers["Retry-After"] = "5"
+            return response
+        response = Response(png, mimetype="image/png", direct_passthrough=True)
+        response.headers["X-Plot-Cache"] = source
+    response.set_etag(key)
+    # Plots are only shown to logged in users. Browsers keep them but
+    # revalidate them with the ETag on every use.
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
@@ -1,5 +1,6 @@
 from typing import Dict
 
+from flask import request
 from flask_sqlalchemy import get_debug_queries
 from werkzeug.middleware.profiler import ProfilerMiddleware
 
@@ -20,6 +21,24 @@ def show_sql_queries(app):
         return response
 
 
+def show_plot_cache_statistics(app):
+    @app.after_request
+    def after_request(response):
+        if request.blueprint == "plots":
+            from arbeitszeit_flask.dependency_injection import with_injection
+            from arbeitszeit_flask.plots.cache import PlotCache
+
+            statistics = with_injection().get_injector().get(PlotCache).statistics
+            print(
+                "PLOT CACHE:",
+                f"{statistics.memory_hits} memory hits,",
+                f"{statistics.disk_hits} disk hits,",
+                f"{statistics.misses} misses,",
+                f"{statistics.not_modified} not modified",
+            )
+        return response
+
+
 def _update_queries_dict(queries, query):
     if queries.get(query.context) is not None:
         queries[query.context] += 1
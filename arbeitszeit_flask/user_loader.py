@@ -0,0 +1,135 @@
+"""Loading of the logged in user for flask-login.
+
+flask-login asks for the user of the session once per request. Instead
+of an ORM object the user is represented by an immutable principal that
+holds only what templates and views read from ``current_user``. The
+principal is built from the entity loaded by the repositories, so that
+the entity is found in the identity map when the request needs it
+again.
+
+Each worker process also keeps principals for a short time, which
+spares the database lookup on most requests. Principals of members and
+companies that did not confirm their email address yet are not kept,
+since the confirmation might be handled by another process.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from time import monotonic
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from flask_login import UserMixin
+from injector import inject
+
+from arbeitszeit_flask.database.repositories import (
+    AccountantRepository,
+    CompanyRepository,
+    MemberRepository,
+)
+
+
+@dataclass(frozen=True)
+class Principal(UserMixin):
+    id: str
+    user_type: str
+    name: str
+    email: str
+    confirmed_on: Optional[datetime]
+
+
+class PrincipalCache:
+    def __init__(self, time_to_live: float, max_entries: int = 10000) -> None:
+        self.time_to_live = time_to_live
+        self.max_entries = max_entries
+        self._principals: Dict[Tuple[str, str], Tuple[float, Principal]] = dict()
+        self._lock = Lock()
+
+    def get(self, user_id: str, user_type: str) -> Optional[Principal]:
+        with self._lock:
+            entry = self._principals.get((user_id, user_type))
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= monotonic():
+                del self._principals[(user_id, user_type)]
+                return None
+            return principal
+
+    def put(self, principal: Principal) -> None:
+        with self._lock:
+            if len(self._principals) >= self.max_entries:
+                self._remove_expired()
+            if len(self._principals) >= self.max_entries:
+                self._principals.clear()
+            self._principals[(principal.id, principal.user_type)] = (
+                monotonic() + self.time_to_live,
+                principal,
+            )
+
+    def invalidate(self, user_id: str) -> None:
+        with self._lock:
+            for key in [key for key in self._principals if key[0] == user_id]:
+                del self._principals[key]
+
+    def _remove_expired(self) -> None:
+        now = monotonic()
+        for key, (expires_at, _) in list(self._principals.items()):
+            if expires_at <= now:
+                del self._principals[key]
+
+
+@inject
+@dataclass
+class UserLoader:
+    member_repository: MemberRepository
+    company_repository: CompanyRepository
+    accountant_repository: AccountantRepository
+    cache: PrincipalCache
+
+    def __call__(self, user_id: str, user_type: str) -> Optional[Principal]:
+        if (principal := self.cache.get(user_id, user_type)) is not None:
+            return principal
+        principal = self._load_principal(user_id, user_type)
+        if principal is not None and (
+            principal.user_type == "accountant" or principal.confirmed_on is not None
+        ):
+            self.cache.put(principal)
+        return principal
+
+    def _load_principal(self, user_id: str, user_type: str) -> Optional[Principal]:
+        try:
+            id = UUID(user_id)
+        except ValueError:
+            return None
+        if user_type == "member":
+            if member := self.member_repository.get_by_id(id):
+                return Principal(
+                    id=user_id,
+                    user_type=user_type,
+                    name=member.name,
+                    email=member.email,
+                    confirmed_on=member.confirmed_on,
+                )
+        elif user_type == "company":
+            if company := self.company_repository.get_by_id(id):
+                return Principal(
+                    id=user_id,
+                    user_type=user_type,
+                    name=company.name,
+                    email=company.email,
+                    confirmed_on=company.confirmed_on,
+                )
+        elif user_type == "accountant":
+            if accountant := self.accountant_repository.get_by_id(id):
+                return Principal(
+                    id=user_id,
+                    user_type=user_type,
+                    name=accountant.name,
+                    email=accountant.email_address,
+                    confirmed_on=None,
+                )
+        return None
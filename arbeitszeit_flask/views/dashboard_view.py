@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from flask import Response as FlaskResponse
 
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit.use_cases.get_latest_activated_plans import GetLatestActivatedPlans
 from arbeitszeit.use_cases.list_workers import ListWorkers, ListWorkersRequest
 from arbeitszeit_flask.flask_session import FlaskSession
@@ -23,7 +24,9 @@ class DashboardView:
     def respond_to_get(self) -> Response:
         current_user = self.flask_session.get_current_user()
         assert current_user
-        workers = self.list_workers_use_case(ListWorkersRequest(current_user)).workers
+        workers = self.list_workers_use_case(
+            ListWorkersRequest(current_user, page=PageRequest(size=1))
+        ).workers
         latest_plans_use_case_response = self.get_latest_plans_use_case()
         view_model = self.get_latest_plans_presenter.show_latest_plans(
             latest_plans_use_case_response
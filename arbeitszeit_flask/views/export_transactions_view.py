@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterator
+
+from flask import Response, stream_with_context
+
+from arbeitszeit.use_cases.export_transactions import ExportTransactions
+from arbeitszeit_web.export_transactions import (
+    ExportTransactionsController,
+    ExportTransactionsPresenter,
+)
+from arbeitszeit_web.malformed_input_data import MalformedInputData
+
+# Lines are sent in chunks of this many, so that long exports do not
+# cause a write to the client for every single transaction.
+LINES_PER_CHUNK = 500
+
+MIMETYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+@dataclass
+class ExportTransactionsView:
+    controller: ExportTransactionsController
+    use_case: ExportTransactions
+    presenter: ExportTransactionsPresenter
+
+    def respond_to_get(self, export_format: str) -> Response:
+        """Stream the export while the transactions are read from the
+        database, so that memory use does not grow with the length of
+        the history."""
+        use_case_request = self.controller.process_request_data()
+        if use_case_request is None:
+            return Response(status=401)
+        if isinstance(use_case_request, MalformedInputData):
+            return Response(use_case_request.message, status=400)
+        response = self.use_case(use_case_request)
+        if export_format == "csv":
+            lines = self.presenter.present_as_csv(response)
+        else:
+            lines = self.presenter.present_as_ndjson(response)
+        return Response(
+            stream_with_context(_chunks(lines)),
+            mimetype=MIMETYPES[export_format],
+            headers={
+                "Content-Disposition": (
+                    f"attachment; filename=transactions.{export_format}"
+                )
+            },
+        )
+
+
+def _chunks(lines: Iterator[str]) -> Iterator[str]:
+    while chunk := "".join(islice(lines, LINES_PER_CHUNK)):
+        yield chunk
@@ -28,6 +28,12 @@ class QueryCompaniesView:
         return self._handle_use_case_request(use_case_request)
 
     def respond_to_get(self) -> Response:
+        # Links to following pages of search results carry the search
+        # form fields as query arguments.
+        if self.search_form.validate():
+            return self._handle_use_case_request(
+                self.controller.import_form_data(self.search_form)
+            )
         return self._handle_use_case_request(self.controller.import_form_data(None))
 
     def _get_invalid_form_response(self) -> Response:
@@ -1,10 +1,16 @@
 from dataclasses import dataclass
+from typing import List
 from uuid import UUID
 
 from flask import Response
 from flask_login import current_user
 
-from arbeitszeit.use_cases.list_workers import ListWorkers, ListWorkersRequest
+from arbeitszeit.pagination import MAX_PAGE_SIZE, PageRequest
+from arbeitszeit.use_cases.list_workers import (
+    ListedWorker,
+    ListWorkers,
+    ListWorkersRequest,
+)
 from arbeitszeit.use_cases.send_work_certificates_to_worker import (
     SendWorkCertificatesToWorker,
 )
@@ -42,13 +48,23 @@ class TransferToWorkerView:
             return self.create_response(status=status_code)
 
     def create_response(self, status: int) -> Response:
-        workers_list = self.list_workers(
-            ListWorkersRequest(company=UUID(current_user.id))
-        )
         return Response(
             self.template_renderer.render_template(
                 "company/transfer_to_worker.html",
-                context=dict(workers_list=workers_list.workers),
+                context=dict(workers_list=self._list_all_workers()),
             ),
             status=status,
         )
+
+    def _list_all_workers(self) -> List[ListedWorker]:
+        # Every worker must be selectable as the receiver of a transfer.
+        workers: List[ListedWorker] = []
+        page = PageRequest(size=MAX_PAGE_SIZE)
+        while True:
+            response = self.list_workers(
+                ListWorkersRequest(company=UUID(current_user.id), page=page)
+            )
+            workers += response.workers
+            if response.next_cursor is None:
+                return workers
+            page = PageRequest(cursor=response.next_cursor, size=MAX_PAGE_SIZE)
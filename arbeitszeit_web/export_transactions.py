@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterator, Optional, Union
+
+from arbeitszeit.use_cases.export_transactions import ExportTransactions
+
+from .malformed_input_data import MalformedInputData
+from .request import Request
+from .session import Session
+from .translator import Translator
+
+
+@dataclass
+class ExportTransactionsController:
+    session: Session
+    request: Request
+    translator: Translator
+
+    def process_request_data(
+        self,
+    ) -> Union[ExportTransactions.Request, MalformedInputData, None]:
+        """Both ends of the optional date range given as start and end
+        in the query string are included in the export."""
+        current_user = self.session.get_current_user()
+        if current_user is None:
+            return None
+        try:
+            start = self._get_date("start")
+        except ValueError:
+            return MalformedInputData(
+                "start", self.translator.gettext("Invalid start date.")
+            )
+        try:
+            end = self._get_date("end")
+        except ValueError:
+            return MalformedInputData(
+                "end", self.translator.gettext("Invalid end date.")
+            )
+        return ExportTransactions.Request(
+            user=current_user,
+            start=datetime.combine(start, time()) if start else None,
+            end=datetime.combine(end + timedelta(days=1), time()) if end else None,
+        )
+
+    def _get_date(self, arg: str) -> Optional[date]:
+        value = self.request.get_arg(arg)
+        if not value:
+            return None
+        return date.fromisoformat(value)
+
+
+class ExportTransactionsPresenter:
+    FIELDS = [
+        "date",
+        "account_type",
+        "transaction_type",
+        "transaction_volume",
+        "purpose",
+    ]
+
+    def present_as_csv(self, response: ExportTransactions.Response) -> Iterator[str]:
+        """A header line followed by one line per transaction."""
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.FIELDS)
+        writer.writeheader()
+        yield self._pop_contents(buffer)
+        for transaction in response.transactions:
+            writer.writerow(self._get_fields(transaction))
+            yield self._pop_contents(buffer)
+
+    def present_as_ndjson(self, response: ExportTransactions.Response) -> Iterator[str]:
+        """One JSON object per line and transaction."""
+        for transaction in response.transactions:
+            yield json.dumps(self._get_fields(transaction)) + "\n"
+
+    def _get_fields(
+        self, transaction: ExportTransactions.ExportedTransaction
+    ) -> Dict[str, str]:
+        return dict(
+            date=transaction.date.isoformat(),
+            account_type=transaction.account_type.value,
+            transaction_type=transaction.transaction_type.name,
+            transaction_volume=str(transaction.transaction_volume),
+            purpose=transaction.purpose,
+        )
+
+    def _pop_contents(self, buffer: io.StringIO) -> str:
+        contents = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return contents
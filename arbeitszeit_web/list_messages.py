@@ -5,6 +5,8 @@ from typing import List, Optional
 
 from arbeitszeit.use_cases import ListMessagesRequest, ListMessagesResponse
 
+from .pagination import get_next_page_url, get_page_request
+from .request import Request
 from .session import Session
 from .url_index import MessageUrlIndex
 
@@ -12,17 +14,21 @@ from .url_index import MessageUrlIndex
 @dataclass
 class ListMessagesController:
     session: Session
+    request: Request
 
     def process_request_data(self) -> Optional[ListMessagesRequest]:
         current_user = self.session.get_current_user()
         if current_user is None:
             return None
-        return ListMessagesRequest(user=current_user)
+        return ListMessagesRequest(
+            user=current_user, page=get_page_request(self.request)
+        )
 
 
 @dataclass
 class ListMessagesPresenter:
     url_index: MessageUrlIndex
+    request: Request
 
     def present(self, use_case_response: ListMessagesResponse) -> ViewModel:
         return ViewModel(
@@ -34,13 +40,17 @@ class ListMessagesPresenter:
                     message_url=self.url_index.get_message_url(m.message_id),
                 )
                 for m in use_case_response.messages
-            ]
+            ],
+            next_page_url=get_next_page_url(
+                self.request, use_case_response.next_cursor
+            ),
         )
 
 
 @dataclass
 class ViewModel:
     messages: List[Message]
+    next_page_url: Optional[str]
 
 
 @dataclass
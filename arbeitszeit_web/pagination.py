@@ -0,0 +1,37 @@
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlencode
+
+from arbeitszeit.pagination import DEFAULT_PAGE_SIZE, PageRequest
+
+from .request import Request
+
+CURSOR_ARG = "cursor"
+PAGE_SIZE_ARG = "page_size"
+
+
+def get_page_request(request: Request) -> PageRequest:
+    cursor = request.get_arg(CURSOR_ARG) or None
+    try:
+        size = int(request.get_arg(PAGE_SIZE_ARG) or DEFAULT_PAGE_SIZE)
+    except ValueError:
+        size = DEFAULT_PAGE_SIZE
+    return PageRequest(cursor=cursor, size=size)
+
+
+def get_next_page_url(
+    request: Request, next_cursor: Optional[str], preserved_args: Iterable[str] = ()
+) -> Optional[str]:
+    """Return a url relative to the current page that points to the page
+    starting at next_cursor. Search parameters are submitted as form
+    data on the first page and as query arguments on the pages after,
+    so preserved_args are looked up in both.
+    """
+    if next_cursor is None:
+        return None
+    args: Dict[str, str] = dict()
+    for name in [*preserved_args, PAGE_SIZE_ARG]:
+        value = request.get_form(name) or request.get_arg(name)
+        if value:
+            args[name] = value
+    args[CURSOR_ARG] = next_cursor
+    return "?" + urlencode(args)
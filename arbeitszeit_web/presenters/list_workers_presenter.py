@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from arbeitszeit.use_cases.list_workers import ListWorkersResponse
+from arbeitszeit_web.pagination import get_next_page_url
+from arbeitszeit_web.request import Request
 
 
+@dataclass
 class ListWorkersPresenter:
     @dataclass
     class Worker:
@@ -16,6 +19,9 @@ class ListWorkersPresenter:
     class ViewModel:
         is_show_workers: bool
         workers: List[ListWorkersPresenter.Worker]
+        next_page_url: Optional[str]
+
+    request: Request
 
     def show_workers_list(self, use_case_response: ListWorkersResponse) -> ViewModel:
         return self.ViewModel(
@@ -24,4 +30,7 @@ class ListWorkersPresenter:
                 self.Worker(name=worker.name, id=str(worker.id))
                 for worker in use_case_response.workers
             ],
+            next_page_url=get_next_page_url(
+                self.request, use_case_response.next_cursor
+            ),
         )
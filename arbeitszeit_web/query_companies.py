@@ -1,6 +1,7 @@
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional, Protocol
 
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit.use_cases.query_companies import (
     CompanyFilter,
     CompanyQueryResponse,
@@ -10,6 +11,12 @@ from arbeitszeit_web.translator import Translator
 from arbeitszeit_web.url_index import CompanySummaryUrlIndex
 
 from .notification import Notifier
+from .pagination import get_next_page_url, get_page_request
+from .request import Request
+
+# Names of the search form fields, preserved in the links to following
+# pages of the results.
+SEARCH_FORM_FIELDS = ["select", "search"]
 
 
 class QueryCompaniesFormData(Protocol):
@@ -24,6 +31,7 @@ class QueryCompaniesFormData(Protocol):
 class QueryCompaniesRequestImpl(QueryCompaniesRequest):
     query: Optional[str]
     filter_category: CompanyFilter
+    page: PageRequest
 
     def get_query_string(self) -> Optional[str]:
         return self.query
@@ -31,8 +39,14 @@ class QueryCompaniesRequestImpl(QueryCompaniesRequest):
     def get_filter_category(self) -> CompanyFilter:
         return self.filter_category
 
+    def get_page(self) -> PageRequest:
+        return self.page
+
 
+@dataclass
 class QueryCompaniesController:
+    request: Request
+
     def import_form_data(
         self, form: Optional[QueryCompaniesFormData]
     ) -> QueryCompaniesRequest:
@@ -45,7 +59,11 @@ class QueryCompaniesController:
                 filter_category = CompanyFilter.by_email
             else:
                 filter_category = CompanyFilter.by_name
-        return QueryCompaniesRequestImpl(query=query, filter_category=filter_category)
+        return QueryCompaniesRequestImpl(
+            query=query,
+            filter_category=filter_category,
+            page=get_page_request(self.request),
+        )
 
 
 @dataclass
@@ -65,6 +83,7 @@ class ResultsTable:
 class QueryCompaniesViewModel:
     results: ResultsTable
     show_results: bool
+    next_page_url: Optional[str]
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -75,6 +94,7 @@ class QueryCompaniesPresenter:
     user_notifier: Notifier
     company_url_index: CompanySummaryUrlIndex
     translator: Translator
+    request: Request
 
     def present(self, response: CompanyQueryResponse) -> QueryCompaniesViewModel:
         if not response.results:
@@ -94,10 +114,14 @@ class QueryCompaniesPresenter:
                     for result in response.results
                 ],
             ),
+            next_page_url=get_next_page_url(
+                self.request, response.next_cursor, SEARCH_FORM_FIELDS
+            ),
         )
 
     def get_empty_view_model(self) -> QueryCompaniesViewModel:
         return QueryCompaniesViewModel(
             results=ResultsTable(rows=[]),
             show_results=False,
+            next_page_url=None,
         )
@@ -1,6 +1,7 @@
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional, Protocol
 
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit.use_cases.query_plans import (
     PlanFilter,
     PlanQueryResponse,
@@ -9,8 +10,14 @@ from arbeitszeit.use_cases.query_plans import (
 from arbeitszeit_web.translator import Translator
 
 from .notification import Notifier
+from .pagination import get_next_page_url, get_page_request
+from .request import Request
 from .url_index import CompanySummaryUrlIndex, PlanSummaryUrlIndex
 
+# Names of the search form fields, preserved in the links to following
+# pages of the results.
+SEARCH_FORM_FIELDS = ["select", "search"]
+
 
 class QueryPlansFormData(Protocol):
     def get_query_string(self) -> str:
@@ -24,6 +31,7 @@ class QueryPlansFormData(Protocol):
 class QueryPlansRequestImpl(QueryPlansRequest):
     query: Optional[str]
     filter_category: PlanFilter
+    page: PageRequest
 
     def get_query_string(self) -> Optional[str]:
         return self.query
@@ -31,8 +39,14 @@ class QueryPlansRequestImpl(QueryPlansRequest):
     def get_filter_category(self) -> PlanFilter:
         return self.filter_category
 
+    def get_page(self) -> PageRequest:
+        return self.page
+
 
+@dataclass
 class QueryPlansController:
+    request: Request
+
     def import_form_data(self, form: Optional[QueryPlansFormData]) -> QueryPlansRequest:
         if form is None:
             filter_category = PlanFilter.by_product_name
@@ -43,7 +57,11 @@ class QueryPlansController:
                 filter_category = PlanFilter.by_plan_id
             else:
                 filter_category = PlanFilter.by_product_name
-        return QueryPlansRequestImpl(query=query, filter_category=filter_category)
+        return QueryPlansRequestImpl(
+            query=query,
+            filter_category=filter_category,
+            page=get_page_request(self.request),
+        )
 
 
 @dataclass
@@ -68,6 +86,7 @@ class ResultsTable:
 class QueryPlansViewModel:
     results: ResultsTable
     show_results: bool
+    next_page_url: Optional[str]
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -79,6 +98,7 @@ class QueryPlansPresenter:
     company_url_index: CompanySummaryUrlIndex
     user_notifier: Notifier
     trans: Translator
+    request: Request
 
     def present(self, response: PlanQueryResponse) -> QueryPlansViewModel:
         if not response.results:
@@ -105,10 +125,14 @@ class QueryPlansPresenter:
                     for result in response.results
                 ],
             ),
+            next_page_url=get_next_page_url(
+                self.request, response.next_cursor, SEARCH_FORM_FIELDS
+            ),
         )
 
     def get_empty_view_model(self) -> QueryPlansViewModel:
         return QueryPlansViewModel(
             results=ResultsTable(rows=[]),
             show_results=False,
+            next_page_url=None,
         )
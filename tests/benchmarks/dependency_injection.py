@@ -0,0 +1,130 @@
+"""Measure the overhead that dependency injection adds to a request.
+
+The benchmark resolves the dependencies of some company routes inside a
+request context, once with an injector built for every request (how
+with_injection used to work) and once with the injectors that
+with_injection keeps per app. Run it with
+
+    python -m tests.benchmarks.dependency_injection
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from statistics import mean, median
+from time import perf_counter
+from typing import Callable, List
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from injector import Injector, inject
+
+from arbeitszeit import use_cases
+from arbeitszeit.use_cases import GetCompanySummary
+from arbeitszeit_flask.database.repositories import AccountingRepository
+from arbeitszeit_flask.dependency_injection import (
+    CompanyModule,
+    FlaskModule,
+    ViewsModule,
+    with_injection,
+)
+from arbeitszeit_flask.template import UserTemplateRenderer
+from arbeitszeit_flask.views import Http404View
+from arbeitszeit_flask.views.dashboard_view import DashboardView
+from arbeitszeit_flask.views.transfer_to_worker_view import TransferToWorkerView
+from arbeitszeit_web.get_company_summary import GetCompanySummarySuccessPresenter
+from arbeitszeit_web.query_plans import QueryPlansController, QueryPlansPresenter
+from tests.flask_integration.dependency_injection import get_dependency_injector
+
+
+def dashboard(view: DashboardView) -> None:
+    pass
+
+
+def query_plans(
+    query_plans: use_cases.QueryPlans,
+    controller: QueryPlansController,
+    template_renderer: UserTemplateRenderer,
+    presenter: QueryPlansPresenter,
+) -> None:
+    pass
+
+
+def company_summary(
+    get_company_summary: GetCompanySummary,
+    template_renderer: UserTemplateRenderer,
+    presenter: GetCompanySummarySuccessPresenter,
+    http_404_view: Http404View,
+) -> None:
+    pass
+
+
+def transfer_to_worker(view: TransferToWorkerView) -> None:
+    pass
+
+
+ROUTES: List[Callable[..., None]] = [
+    dashboard,
+    query_plans,
+    company_summary,
+    transfer_to_worker,
+]
+
+
+@dataclass
+class Measurement:
+    name: str
+    durations: List[float]
+
+    def report(self) -> str:
+        return (
+            f"{self.name:<24} mean {mean(self.durations) * 1000:8.3f} ms"
+            f"   median {median(self.durations) * 1000:8.3f} ms"
+        )
+
+
+def with_injector_per_request(route: Callable) -> Callable[[], None]:
+    def wrapped_route() -> None:
+        injector = Injector([FlaskModule(), ViewsModule(), CompanyModule()])
+        injector.call_with_injection(inject(route))
+
+    return wrapped_route
+
+
+def measure(
+    app: Flask, name: str, routes: List[Callable[[], None]], iterations: int
+) -> Measurement:
+    durations: List[float] = []
+    for _ in range(iterations):
+        with app.test_request_context():
+            start = perf_counter()
+            for route in routes:
+                route()
+            durations.append(perf_counter() - start)
+    return Measurement(name=name, durations=durations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    arguments = parser.parse_args()
+    injector = get_dependency_injector()
+    app = injector.get(Flask)
+    injector.get(AccountingRepository).get_or_create_social_accounting()
+    injector.get(SQLAlchemy).session.commit()
+    print(f"Resolving the dependencies of {len(ROUTES)} routes per request")
+    for name, routes in [
+        ("injector per request", [with_injector_per_request(r) for r in ROUTES]),
+        (
+            "injector per process",
+            [with_injection([CompanyModule()])(r) for r in ROUTES],
+        ),
+    ]:
+        # The first request builds the injectors and fills the caches.
+        measure(app, name, routes, iterations=1)
+        print(measure(app, name, routes, arguments.iterations).report())
+
+
+if __name__ == "__main__":
+    main()
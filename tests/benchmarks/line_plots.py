@@ -0,0 +1,98 @@
+"""Measure how long it takes to draw the line plot of a large account.
+
+The benchmark creates the accumulated balances of a synthetic account
+with many transactions, the way the account details use cases do, and
+draws them once with every point and once with the points that
+FlaskPlotter keeps after downsampling. Run it with
+
+    python -m tests.benchmarks.line_plots
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from datetime import datetime, timedelta
+from decimal import Decimal
+from itertools import accumulate
+from statistics import median
+from time import perf_counter
+from typing import Callable, List, Tuple
+from unittest.mock import patch
+
+from arbeitszeit_flask.flask_plotter import FlaskPlotter
+from arbeitszeit_flask.plots.downsampling import downsample_time_series
+from arbeitszeit_flask.plots.rendering import PlotRenderer
+
+
+def create_account_history(
+    transaction_count: int,
+) -> Tuple[List[datetime], List[Decimal]]:
+    generator = random.Random(0)
+    start = datetime(2020, 1, 1)
+    timestamps = [start + timedelta(minutes=i) for i in range(transaction_count)]
+    volumes = [
+        Decimal(generator.randint(-10000, 10000)) / 100
+        for _ in range(transaction_count)
+    ]
+    return timestamps, list(accumulate(volumes))
+
+
+def create_plotter() -> FlaskPlotter:
+    return FlaskPlotter(PlotRenderer(processes=0, max_queued_plots=1, timeout=60))
+
+
+def draw_every_point(timestamps: List[datetime], balances: List[Decimal]) -> None:
+    # This is how FlaskPlotter.create_line_plot worked before it
+    # downsampled the series.
+    with patch(
+        "arbeitszeit_flask.flask_plotter.downsample_time_series",
+        lambda x, y, max_points: (x, y),
+    ):
+        create_plotter().create_line_plot(timestamps, balances)
+
+
+def draw_downsampled(timestamps: List[datetime], balances: List[Decimal]) -> None:
+    create_plotter().create_line_plot(timestamps, balances)
+
+
+def measure(
+    name: str, function: Callable[[], object], iterations: int
+) -> Tuple[str, float]:
+    durations = []
+    for _ in range(iterations):
+        start = perf_counter()
+        function()
+        durations.append(perf_counter() - start)
+    return name, median(durations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=1_000_000)
+    parser.add_argument("--iterations", type=int, default=3)
+    arguments = parser.parse_args()
+    timestamps, balances = create_account_history(arguments.transactions)
+    print(f"Line plot of an account with {arguments.transactions} transactions")
+    for name, duration in [
+        measure(
+            "downsampling only",
+            lambda: downsample_time_series(timestamps, balances, max_points=1000),
+            arguments.iterations,
+        ),
+        measure(
+            "draw every point",
+            lambda: draw_every_point(timestamps, balances),
+            arguments.iterations,
+        ),
+        measure(
+            "draw downsampled",
+            lambda: draw_downsampled(timestamps, balances),
+            arguments.iterations,
+        ),
+    ]:
+        print(f"{name:<24} median {duration * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
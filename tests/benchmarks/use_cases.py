@@ -0,0 +1,550 @@
+"""Measure the use cases against a database seeded with a large economy.
+
+The benchmark seeds a database with companies, members, active plans,
+cooperations, transactions and messages, using the generators from
+tests.data_generators, and calls every read use case and the most
+important write use cases on the SQLAlchemy repositories. For every
+use case it records the duration, the number of SQL statements and the
+peak memory allocated by Python. Write use cases are rolled back after
+every call, so all use cases see the same economy.
+
+Transactions are spread over random accounts, but every tenth one
+involves the first company or the first member. Use cases that act on
+behalf of a user are called for those two, so that their cost grows
+with the size of the economy.
+
+The results can be stored as JSON and compared with the results of an
+earlier run, e.g. of another commit:
+
+    python -m tests.benchmarks.use_cases --output before.json
+    git checkout other-branch
+    python -m tests.benchmarks.use_cases --compare before.json
+
+By default an in-memory SQLite database is used. Pass
+--database-uri postgresql:///benchmark to use an empty local Postgres
+database instead. Seeding goes through the repositories, so large
+economies take a while to create.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import subprocess
+import tracemalloc
+import warnings
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+from uuid import UUID
+
+from flask_sqlalchemy import SQLAlchemy
+from injector import Injector, Module, inject, provider
+from sqlalchemy import event
+
+from arbeitszeit.entities import (
+    Company,
+    Cooperation,
+    Member,
+    Message,
+    Plan,
+    PurposesOfPurchases,
+)
+from arbeitszeit.pagination import PageRequest
+from arbeitszeit.repositories import PurchaseRepository
+from arbeitszeit.use_cases import (
+    CheckForUnreadMessages,
+    CheckForUnreadMessagesRequest,
+    CompanyFilter,
+    GetCompanySummary,
+    GetCompanyTransactions,
+    GetCoopSummary,
+    GetCoopSummaryRequest,
+    GetMemberAccount,
+    GetMemberProfileInfo,
+    GetPlanSummaryCompany,
+    GetPlanSummaryMember,
+    GetStatistics,
+    ListAllCooperations,
+    ListCoordinations,
+    ListCoordinationsRequest,
+    ListDraftsOfCompany,
+    ListInboundCoopRequests,
+    ListInboundCoopRequestsRequest,
+    ListMessages,
+    ListMessagesRequest,
+    ListOutboundCoopRequests,
+    ListOutboundCoopRequestsRequest,
+    ListPlans,
+    PayConsumerProduct,
+    PlanFilter,
+    QueryCompanies,
+    QueryCompaniesRequest,
+    QueryPlans,
+    QueryPlansRequest,
+    QueryPurchases,
+    ReadMessage,
+    ReadMessageRequest,
+    ShowAAccountDetailsUseCase,
+    ShowMyPlansRequest,
+    ShowMyPlansUseCase,
+    ShowPAccountDetailsUseCase,
+    ShowPRDAccountDetailsUseCase,
+    ShowRAccountDetailsUseCase,
+    UpdatePlansAndPayout,
+)
+from arbeitszeit.use_cases.export_transactions import ExportTransactions
+from arbeitszeit.use_cases.get_company_account_history import GetCompanyAccountHistory
+from arbeitszeit.use_cases.get_latest_activated_plans import GetLatestActivatedPlans
+from arbeitszeit.use_cases.list_workers import ListWorkers, ListWorkersRequest
+from arbeitszeit.use_cases.show_my_accounts import ShowMyAccounts, ShowMyAccountsRequest
+from arbeitszeit_flask.database.repositories import AccountingRepository
+from tests.company import CompanyManager
+from tests.data_generators import (
+    CompanyGenerator,
+    CooperationGenerator,
+    MemberGenerator,
+    MessageGenerator,
+    PlanGenerator,
+    TransactionGenerator,
+)
+from tests.datetime_service import FakeDatetimeService
+from tests.flask_integration.dependency_injection import (
+    FLASK_TESTING_CONFIGURATION,
+    FlaskConfiguration,
+    get_dependency_injector,
+)
+
+COMMIT_EVERY = 500
+
+
+@dataclass
+class EconomySize:
+    companies: int
+    members: int
+    plans: int
+    transactions: int
+    messages: int
+
+
+@dataclass
+class Economy:
+    companies: List[Company] = field(default_factory=list)
+    members: List[Member] = field(default_factory=list)
+    plans: List[Plan] = field(default_factory=list)
+    cooperations: List[Cooperation] = field(default_factory=list)
+    messages: List[Message] = field(default_factory=list)
+
+
+@inject
+@dataclass
+class EconomySeeder:
+    db: SQLAlchemy
+    company_generator: CompanyGenerator
+    member_generator: MemberGenerator
+    plan_generator: PlanGenerator
+    cooperation_generator: CooperationGenerator
+    transaction_generator: TransactionGenerator
+    message_generator: MessageGenerator
+    company_manager: CompanyManager
+    purchase_repository: PurchaseRepository
+    accounting_repository: AccountingRepository
+    datetime_service: FakeDatetimeService
+
+    def seed(self, size: EconomySize) -> Economy:
+        assert size.companies and size.members and size.plans and size.messages
+        generator = random.Random(0)
+        economy = Economy()
+        for i in self._progress("companies", size.companies):
+            economy.companies.append(
+                self.company_generator.create_company(name=f"company {i}")
+            )
+        for i in self._progress("members", size.members):
+            member = self.member_generator.create_member(name=f"member {i}")
+            self.company_manager.add_worker_to_company(
+                economy.companies[i % size.companies].id, member.id
+            )
+            economy.members.append(member)
+        for i in self._progress("plans", size.plans):
+            economy.plans.append(
+                self.plan_generator.create_plan(
+                    planner=economy.companies[i % size.companies],
+                    product_name=f"product {i}",
+                    activation_date=self.datetime_service.now(),
+                )
+            )
+        for i in self._progress("cooperations", max(1, size.plans // 10)):
+            economy.cooperations.append(
+                self.cooperation_generator.create_cooperation(
+                    name=f"cooperation {i}",
+                    coordinator=economy.companies[i % size.companies],
+                    plans=economy.plans[slice(10 * i, 10 * i + 3)],
+                )
+            )
+        self._seed_transactions(economy, size.transactions, generator)
+        for i in self._progress("messages", size.messages):
+            addressee = (
+                economy.members[0] if i % 10 == 0 else generator.choice(economy.members)
+            )
+            economy.messages.append(
+                self.message_generator.create_message(
+                    sender=economy.companies[i % size.companies],
+                    addressee=addressee,
+                    title=f"message {i}",
+                )
+            )
+        self.db.session.commit()
+        return economy
+
+    def _seed_transactions(
+        self, economy: Economy, count: int, generator: random.Random
+    ) -> None:
+        social_accounting = self.accounting_repository.get_or_create_social_accounting()
+        start = datetime.now() - timedelta(minutes=count)
+        for i in self._progress("transactions", count):
+            self.datetime_service.freeze_time(start + timedelta(minutes=i))
+            is_focused = i % 10 == 0
+            plan = economy.plans[0] if is_focused else generator.choice(economy.plans)
+            buyer: Any
+            if i % 3 == 0:
+                buyer = (
+                    economy.companies[0]
+                    if is_focused
+                    else generator.choice(economy.companies)
+                )
+                sending_account = buyer.means_account
+                purpose = PurposesOfPurchases.means_of_prod
+            elif i % 3 == 1:
+                buyer = (
+                    economy.members[0]
+                    if is_focused
+                    else generator.choice(economy.members)
+                )
+                sending_account = buyer.account
+                purpose = PurposesOfPurchases.consumption
+            else:
+                member = (
+                    economy.members[0]
+                    if is_focused
+                    else generator.choice(economy.members)
+                )
+                self.transaction_generator.create_transaction(
+                    sending_account=social_accounting.account,
+                    receiving_account=member.account,
+                    purpose="wages",
+                )
+                continue
+            self.transaction_generator.create_transaction(
+                sending_account=sending_account,
+                receiving_account=plan.planner.product_account,
+                purpose=f"Plan-Id: {plan.id}",
+                plan_id=plan.id,
+            )
+            self.purchase_repository.create_purchase(
+                purchase_date=self.datetime_service.now_minus_one_day(),
+                plan=plan,
+                buyer=buyer,
+                price_per_unit=Decimal(10),
+                amount=1,
+                purpose=purpose,
+            )
+        self.datetime_service.freeze_time(datetime.now())
+
+    def _progress(self, name: str, count: int) -> Iterator[int]:
+        print(f"Seeding {count} {name}")
+        for i in range(count):
+            if i and i % COMMIT_EVERY == 0:
+                self.db.session.commit()
+            yield i
+
+
+@dataclass
+class PlanQuery(QueryPlansRequest):
+    query: Optional[str]
+    filter_category: PlanFilter = PlanFilter.by_product_name
+
+    def get_query_string(self) -> Optional[str]:
+        return self.query
+
+    def get_filter_category(self) -> PlanFilter:
+        return self.filter_category
+
+    def get_page(self) -> PageRequest:
+        return PageRequest()
+
+
+@dataclass
+class CompanyQuery(QueryCompaniesRequest):
+    query: Optional[str]
+    filter_category: CompanyFilter = CompanyFilter.by_name
+
+    def get_query_string(self) -> Optional[str]:
+        return self.query
+
+    def get_filter_category(self) -> CompanyFilter:
+        return self.filter_category
+
+    def get_page(self) -> PageRequest:
+        return PageRequest()
+
+
+@dataclass
+class Payment:
+    buyer: UUID
+    plan: UUID
+    amount: int
+
+    def get_buyer_id(self) -> UUID:
+        return self.buyer
+
+    def get_plan_id(self) -> UUID:
+        return self.plan
+
+    def get_amount(self) -> int:
+        return self.amount
+
+
+@dataclass
+class UseCaseCall:
+    use_case: Type[Any]
+    arguments: Callable[[Economy], Tuple[Any, ...]]
+    name: Optional[str] = None
+    # Turns lazy responses into values, so that their queries are
+    # measured.
+    consume: Optional[Callable[[Any], object]] = None
+
+    @property
+    def label(self) -> str:
+        return self.name or self.use_case.__name__
+
+
+CALLS: List[UseCaseCall] = [
+    UseCaseCall(QueryPlans, lambda e: (PlanQuery(None),)),
+    UseCaseCall(
+        QueryPlans, lambda e: (PlanQuery("product 1"),), "QueryPlans (product name)"
+    ),
+    UseCaseCall(QueryCompanies, lambda e: (CompanyQuery(None),)),
+    UseCaseCall(
+        QueryCompanies, lambda e: (CompanyQuery("company 1"),), "QueryCompanies (name)"
+    ),
+    UseCaseCall(GetLatestActivatedPlans, lambda e: ()),
+    UseCaseCall(GetStatistics, lambda e: ()),
+    UseCaseCall(ListAllCooperations, lambda e: ()),
+    UseCaseCall(GetCompanySummary, lambda e: (e.companies[0].id,)),
+    UseCaseCall(GetCompanyTransactions, lambda e: (e.companies[0].id,)),
+    UseCaseCall(ShowMyAccounts, lambda e: (ShowMyAccountsRequest(e.companies[0].id),)),
+    UseCaseCall(ShowMyPlansUseCase, lambda e: (ShowMyPlansRequest(e.companies[0].id),)),
+    UseCaseCall(ListPlans, lambda e: (e.companies[0].id,)),
+    UseCaseCall(ListDraftsOfCompany, lambda e: (e.companies[0].id,)),
+    UseCaseCall(ListWorkers, lambda e: (ListWorkersRequest(e.companies[0].id),)),
+    UseCaseCall(
+        ListCoordinations, lambda e: (ListCoordinationsRequest(e.companies[0].id),)
+    ),
+    UseCaseCall(
+        ListInboundCoopRequests,
+        lambda e: (ListInboundCoopRequestsRequest(e.companies[0].id),),
+    ),
+    UseCaseCall(
+        ListOutboundCoopRequests,
+        lambda e: (ListOutboundCoopRequestsRequest(e.companies[0].id),),
+    ),
+    UseCaseCall(ShowAAccountDetailsUseCase, lambda e: (e.companies[0].id,)),
+    UseCaseCall(ShowPAccountDetailsUseCase, lambda e: (e.companies[0].id,)),
+    UseCaseCall(ShowRAccountDetailsUseCase, lambda e: (e.companies[0].id,)),
+    UseCaseCall(ShowPRDAccountDetailsUseCase, lambda e: (e.companies[0].id,)),
+    UseCaseCall(
+        GetCompanyAccountHistory,
+        lambda e: (
+            GetCompanyAccountHistory.Request(
+                e.companies[0].id, e.companies[0].product_account.account_type
+            ),
+        ),
+    ),
+    UseCaseCall(
+        QueryPurchases, lambda e: (e.companies[0],), "QueryPurchases (company)"
+    ),
+    UseCaseCall(GetPlanSummaryMember, lambda e: (e.plans[0].id,)),
+    UseCaseCall(GetPlanSummaryCompany, lambda e: (e.plans[0].id, e.companies[0].id)),
+    UseCaseCall(
+        GetCoopSummary,
+        lambda e: (GetCoopSummaryRequest(e.companies[0].id, e.cooperations[0].id),),
+    ),
+    UseCaseCall(GetMemberAccount, lambda e: (e.members[0].id,)),
+    UseCaseCall(GetMemberProfileInfo, lambda e: (e.members[0].id,)),
+    UseCaseCall(QueryPurchases, lambda e: (e.members[0],), "QueryPurchases (member)"),
+    UseCaseCall(
+        ExportTransactions,
+        lambda e: (ExportTransactions.Request(user=e.members[0].id),),
+        consume=lambda response: list(response.transactions),
+    ),
+    UseCaseCall(ListMessages, lambda e: (ListMessagesRequest(e.members[0].id),)),
+    UseCaseCall(
+        CheckForUnreadMessages,
+        lambda e: (CheckForUnreadMessagesRequest(e.members[0].id),),
+    ),
+    UseCaseCall(
+        ReadMessage,
+        lambda e: (ReadMessageRequest(e.members[0].id, e.messages[0].id),),
+    ),
+    UseCaseCall(
+        PayConsumerProduct, lambda e: (Payment(e.members[0].id, e.plans[0].id, 1),)
+    ),
+    UseCaseCall(UpdatePlansAndPayout, lambda e: ()),
+]
+
+
+@dataclass
+class Result:
+    median_seconds: float
+    min_seconds: float
+    queries: int
+    peak_memory_bytes: int
+
+
+def measure(
+    injector: Injector, economy: Economy, call: UseCaseCall, iterations: int
+) -> Result:
+    db = injector.get(SQLAlchemy)
+    use_case = injector.get(call.use_case)
+    arguments = call.arguments(economy)
+    statements: List[str] = []
+
+    def run() -> float:
+        start = perf_counter()
+        response = use_case(*arguments)
+        if call.consume is not None:
+            call.consume(response)
+        duration = perf_counter() - start
+        # Changes of write use cases are discarded and every call
+        # starts with an empty identity map.
+        db.session.rollback()
+        return duration
+
+    def record(connection, cursor, statement, *args: Any) -> None:
+        statements.append(statement)
+
+    # The first call fills the caches that live as long as the process.
+    run()
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        run()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    durations = [run() for _ in range(iterations)]
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(
+        median_seconds=median(durations),
+        min_seconds=min(durations),
+        queries=len(statements),
+        peak_memory_bytes=peak_memory,
+    )
+
+
+def format_result(name: str, result: Result, previous: Optional[Dict[str, Any]]) -> str:
+    line = (
+        f"{name:<36} {result.median_seconds * 1000:10.2f} ms"
+        f" {result.queries:6d} queries {result.peak_memory_bytes / 1024:10.0f} KiB"
+    )
+    if previous is not None:
+        line += (
+            f"   {result.median_seconds / previous['median_seconds']:6.2f}x time"
+            f" {result.queries - previous['queries']:+5d} queries"
+        )
+    return line
+
+
+class BenchmarkDatabaseModule(Module):
+    def __init__(self, database_uri: str) -> None:
+        self.database_uri = database_uri
+
+    @provider
+    def provide_flask_configuration(self) -> FlaskConfiguration:
+        configuration = FlaskConfiguration(FLASK_TESTING_CONFIGURATION)
+        configuration["SQLALCHEMY_DATABASE_URI"] = self.database_uri
+        return configuration
+
+
+def get_current_commit() -> Optional[str]:
+    try:
+        process = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    return process.stdout.strip() if process.returncode == 0 else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--companies", type=int, default=100)
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--plans", type=int, default=500)
+    parser.add_argument("--transactions", type=int, default=10_000)
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--database-uri", default="sqlite://")
+    parser.add_argument(
+        "--only",
+        action="append",
+        help="Only measure the use cases whose name contains this text",
+    )
+    parser.add_argument("--output", help="Store the results in this JSON file")
+    parser.add_argument("--compare", help="Compare with the results in this file")
+    arguments = parser.parse_args()
+    # Decimals are stored as floats by SQLite, which is good enough here.
+    warnings.filterwarnings("ignore", message="Dialect sqlite")
+    size = EconomySize(
+        companies=arguments.companies,
+        members=arguments.members,
+        plans=arguments.plans,
+        transactions=arguments.transactions,
+        messages=arguments.messages,
+    )
+    previous_results: Dict[str, Dict[str, Any]] = dict()
+    if arguments.compare:
+        with open(arguments.compare) as previous_file:
+            previous_run = json.load(previous_file)
+        if previous_run["economy"] != asdict(size):
+            print("Warning: the compared results were measured on another economy")
+        previous_results = previous_run["results"]
+    injector = get_dependency_injector(
+        [BenchmarkDatabaseModule(arguments.database_uri)]
+    )
+    db = injector.get(SQLAlchemy)
+    start = perf_counter()
+    economy = injector.get(EconomySeeder).seed(size)
+    print(f"Seeded the economy in {perf_counter() - start:.1f} s")
+    results: Dict[str, Result] = dict()
+    for call in CALLS:
+        if arguments.only and not any(text in call.label for text in arguments.only):
+            continue
+        result = measure(injector, economy, call, arguments.iterations)
+        results[call.label] = result
+        print(format_result(call.label, result, previous_results.get(call.label)))
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(
+                dict(
+                    commit=get_current_commit(),
+                    created_at=datetime.now().isoformat(),
+                    database=db.engine.dialect.name,
+                    economy=asdict(size),
+                    iterations=arguments.iterations,
+                    results={name: asdict(result) for name, result in results.items()},
+                ),
+                output_file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
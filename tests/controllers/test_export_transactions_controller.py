@@ -0,0 +1,55 @@
+from datetime import datetime
+from unittest import TestCase
+from uuid import uuid4
+
+from arbeitszeit.use_cases.export_transactions import ExportTransactions
+from arbeitszeit_web.export_transactions import ExportTransactionsController
+from arbeitszeit_web.malformed_input_data import MalformedInputData
+from tests.request import FakeRequest
+from tests.session import FakeSession
+from tests.translator import FakeTranslator
+
+
+class ExportTransactionsControllerTests(TestCase):
+    def setUp(self) -> None:
+        self.session = FakeSession()
+        self.request = FakeRequest()
+        self.controller = ExportTransactionsController(
+            session=self.session, request=self.request, translator=FakeTranslator()
+        )
+        self.user = uuid4()
+        self.session.set_current_user_id(self.user)
+
+    def test_anonymous_user_gets_no_use_case_request(self) -> None:
+        self.session.set_current_user_id(None)
+        self.assertIsNone(self.controller.process_request_data())
+
+    def test_without_date_range_all_transactions_are_requested(self) -> None:
+        self.assertEqual(
+            self.controller.process_request_data(),
+            ExportTransactions.Request(user=self.user, start=None, end=None),
+        )
+
+    def test_date_range_includes_the_whole_end_date(self) -> None:
+        self.request.set_arg("start", "2021-05-02")
+        self.request.set_arg("end", "2021-05-03")
+        self.assertEqual(
+            self.controller.process_request_data(),
+            ExportTransactions.Request(
+                user=self.user,
+                start=datetime(2021, 5, 2),
+                end=datetime(2021, 5, 4),
+            ),
+        )
+
+    def test_malformed_start_date_is_reported(self) -> None:
+        self.request.set_arg("start", "02.05.2021")
+        result = self.controller.process_request_data()
+        assert isinstance(result, MalformedInputData)
+        self.assertEqual(result.field, "start")
+
+    def test_malformed_end_date_is_reported(self) -> None:
+        self.request.set_arg("end", "2021-13-01")
+        result = self.controller.process_request_data()
+        assert isinstance(result, MalformedInputData)
+        self.assertEqual(result.field, "end")
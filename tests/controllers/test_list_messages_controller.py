@@ -2,6 +2,7 @@ from unittest import TestCase
 from uuid import uuid4
 
 from arbeitszeit_web.list_messages import ListMessagesController
+from tests.request import FakeRequest
 from tests.session import FakeSession
 
 
@@ -10,7 +11,7 @@ class ListMessagesControllerTests(TestCase):
         self,
     ) -> None:
         session = FakeSession()
-        controller = ListMessagesController(session=session)
+        controller = ListMessagesController(session=session, request=FakeRequest())
         session.set_current_user_id(None)
         self.assertIsNone(controller.process_request_data())
 
@@ -18,9 +19,21 @@ class ListMessagesControllerTests(TestCase):
         self,
     ) -> None:
         session = FakeSession()
-        controller = ListMessagesController(session=session)
+        controller = ListMessagesController(session=session, request=FakeRequest())
         expected_user_id = uuid4()
         session.set_current_user_id(expected_user_id)
         use_case_request = controller.process_request_data()
         assert use_case_request is not None
         self.assertEqual(use_case_request.user, expected_user_id)
+
+    def test_cursor_from_query_arguments_is_passed_to_use_case_request(
+        self,
+    ) -> None:
+        session = FakeSession()
+        request = FakeRequest()
+        controller = ListMessagesController(session=session, request=request)
+        session.set_current_user_id(uuid4())
+        request.set_arg("cursor", "abc")
+        use_case_request = controller.process_request_data()
+        assert use_case_request is not None
+        self.assertEqual(use_case_request.page.cursor, "abc")
@@ -4,13 +4,16 @@ from dataclasses import dataclass
 from typing import Optional
 from unittest import TestCase
 
+from arbeitszeit.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from arbeitszeit.use_cases import PlanFilter
 from arbeitszeit_web.query_plans import QueryPlansController
+from tests.request import FakeRequest
 
 
 class QueryPlansControllerTests(TestCase):
     def setUp(self) -> None:
-        self.controller = QueryPlansController()
+        self.request = FakeRequest()
+        self.controller = QueryPlansController(request=self.request)
 
     def test_that_empty_query_string_translates_to_no_query_string_in_request(
         self,
@@ -58,6 +61,31 @@ class QueryPlansControllerTests(TestCase):
         request = self.controller.import_form_data(form=None)
         self.assertTrue(request.get_query_string() is None)
 
+    def test_that_first_page_with_default_size_is_requested_by_default(self) -> None:
+        request = self.controller.import_form_data(form=None)
+        self.assertIsNone(request.get_page().cursor)
+        self.assertEqual(request.get_page().size, DEFAULT_PAGE_SIZE)
+
+    def test_that_cursor_is_taken_from_query_arguments(self) -> None:
+        self.request.set_arg("cursor", "abc")
+        request = self.controller.import_form_data(make_fake_form(query="test"))
+        self.assertEqual(request.get_page().cursor, "abc")
+
+    def test_that_page_size_is_taken_from_query_arguments(self) -> None:
+        self.request.set_arg("page_size", "10")
+        request = self.controller.import_form_data(form=None)
+        self.assertEqual(request.get_page().size, 10)
+
+    def test_that_page_size_is_limited(self) -> None:
+        self.request.set_arg("page_size", str(MAX_PAGE_SIZE + 1))
+        request = self.controller.import_form_data(form=None)
+        self.assertEqual(request.get_page().size, MAX_PAGE_SIZE)
+
+    def test_that_invalid_page_size_results_in_default_page_size(self) -> None:
+        self.request.set_arg("page_size", "many")
+        request = self.controller.import_form_data(form=None)
+        self.assertEqual(request.get_page().size, DEFAULT_PAGE_SIZE)
+
 
 def make_fake_form(
     query: Optional[str] = None, filter_category: Optional[str] = None
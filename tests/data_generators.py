@@ -318,6 +318,7 @@ class TransactionGenerator:
         amount_sent=None,
         amount_received=None,
         purpose=None,
+        plan_id=None,
     ) -> Transaction:
         if sending_account is None:
             sending_account = self.account_generator.create_account(
@@ -340,6 +341,7 @@ class TransactionGenerator:
             amount_sent=amount_sent,
             amount_received=amount_received,
             purpose=purpose,
+            plan_id=plan_id,
         )
 
 
@@ -380,6 +382,7 @@ class CooperationGenerator:
 class MessageGenerator:
     message_repository: MessageRepository
     company_generator: CompanyGenerator
+    datetime_service: FakeDatetimeService
 
     def create_message(
         self,
@@ -388,11 +391,14 @@ class MessageGenerator:
         addressee: Union[None, Member, Company],
         title: str = "test title",
         content: str = "test message content",
+        sent_on: Optional[datetime] = None,
     ) -> Message:
         if addressee is None:
             addressee = self.company_generator.create_company()
         if sender is None:
             sender = self.company_generator.create_company()
+        if sent_on is None:
+            sent_on = self.datetime_service.now()
         return self.message_repository.create_message(
             sender=sender,
             addressee=addressee,
@@ -400,6 +406,7 @@ class MessageGenerator:
             content=content,
             sender_remarks=None,
             reference=None,
+            sent_on=sent_on,
         )
 
 
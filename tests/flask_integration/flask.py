@@ -5,6 +5,7 @@ from flask import Flask
 from injector import Module
 
 from arbeitszeit.entities import Company, Member
+from arbeitszeit_flask.mail_outbox import MailOutbox
 from arbeitszeit_flask.token import FlaskTokenService
 from tests.data_generators import CompanyGenerator, EmailGenerator, MemberGenerator
 
@@ -28,6 +29,11 @@ class ViewTestCase(FlaskTestCase):
         self.company_generator = self.injector.get(CompanyGenerator)
         self.email_generator = self.injector.get(EmailGenerator)
 
+    def deliver_emails(self) -> None:
+        """Send the emails queued by previous requests, as the mail
+        worker would."""
+        self.injector.get(MailOutbox).deliver_due_emails(batch_size=100)
+
     def login_member(
         self,
         member: Optional[Member] = None,
@@ -0,0 +1,113 @@
+"""Assertions on the number of SQL statements sent by the use cases.
+
+QueryCounter can be injected into tests like any other dependency and
+records the statements sent while its context is active:
+
+    with query_counter() as statements:
+        use_case(request)
+    assert len(statements) <= 3
+
+The query_budget decorator checks every call of a use case made while
+the decorated test runs. The test fails when a call sends more than
+max_queries statements. With constant=True it also fails when a call
+sends more statements than the first call of the use case in that test,
+so tests can seed more data between two calls to show that the number
+of statements does not grow with it. Every call starts like a new
+request, with an empty identity map and no ORM objects loaded, so that
+the entities created by the test are read from the database again.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Iterator, List, Optional, Type, TypeVar
+from unittest.mock import patch
+
+from flask_sqlalchemy import SQLAlchemy
+from injector import inject
+from sqlalchemy import event
+
+from arbeitszeit_flask.database.identity_map import IdentityMap
+from arbeitszeit_flask.extensions import db
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@inject
+@dataclass
+class QueryCounter:
+    db: SQLAlchemy
+
+    @contextmanager
+    def __call__(self) -> Iterator[List[str]]:
+        statements: List[str] = []
+
+        def record(connection, cursor, statement, *args: Any) -> None:
+            statements.append(statement)
+
+        event.listen(self.db.engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(self.db.engine, "before_cursor_execute", record)
+
+
+@dataclass
+class QueryBudget:
+    use_case: Type[Any]
+    max_queries: Optional[int]
+    constant: bool
+    counts: List[int] = field(default_factory=list)
+
+    def check(self, statements: List[str]) -> None:
+        name = self.use_case.__name__
+        if self.max_queries is not None and len(statements) > self.max_queries:
+            self._fail(
+                f"{name} sent {len(statements)} statements, "
+                f"the budget is {self.max_queries}",
+                statements,
+            )
+        if self.constant and self.counts and len(statements) > self.counts[0]:
+            self._fail(
+                f"{name} sent {len(statements)} statements, "
+                f"{self.counts[0]} on its first call in this test",
+                statements,
+            )
+        self.counts.append(len(statements))
+
+    def _fail(self, message: str, statements: List[str]) -> None:
+        raise QueryBudgetExceeded("\n\n".join([message] + statements))
+
+
+def query_budget(
+    use_case: Type[Any], max_queries: Optional[int] = None, *, constant: bool = False
+) -> Callable[[T], T]:
+    def decorator(test: T) -> T:
+        @wraps(test)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            budget = QueryBudget(use_case, max_queries, constant)
+            original_call = use_case.__call__
+
+            def counted_call(use_case_instance: Any, *args: Any, **kwargs: Any) -> Any:
+                db.session.flush()
+                db.session.expire_all()
+                IdentityMap(db).clear()
+                with QueryCounter(db)() as statements:
+                    response = original_call(use_case_instance, *args, **kwargs)
+                budget.check(statements)
+                return response
+
+            with patch.object(use_case, "__call__", counted_call):
+                result = test(*args, **kwargs)
+            assert budget.counts, f"{use_case.__name__} was not called"
+            return result
+
+        return wrapper  # type: ignore
+
+    return decorator
@@ -1,3 +1,8 @@
+from typing import Any
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
 from arbeitszeit.entities import AccountTypes
 from arbeitszeit_flask.database.repositories import (
     AccountingRepository,
@@ -37,3 +42,43 @@ def test_can_get_owner_of_public_account(
 ) -> None:
     social_accounting = social_accounting_repository.get_or_create_social_accounting()
     assert repository.get_account_owner(social_accounting.account) == social_accounting
+
+
+@injection_test
+def test_can_get_names_of_owners_of_several_accounts(
+    repository: AccountOwnerRepository,
+    social_accounting_repository: AccountingRepository,
+    member_generator: MemberGenerator,
+    company_generator: CompanyGenerator,
+) -> None:
+    member = member_generator.create_member(name="test member")
+    company = company_generator.create_company(name="test company")
+    social_accounting = social_accounting_repository.get_or_create_social_accounting()
+    accounts = [member.account, company.product_account, social_accounting.account]
+    assert repository.get_account_owner_names(accounts) == {
+        member.account.id: "test member",
+        company.product_account.id: "test company",
+        social_accounting.account.id: social_accounting.get_name(),
+    }
+
+
+@injection_test
+def test_cached_company_names_are_not_queried_again(
+    repository: AccountOwnerRepository,
+    company_generator: CompanyGenerator,
+    db: SQLAlchemy,
+) -> None:
+    company = company_generator.create_company(name="test company")
+    repository.get_account_owner_names([company.product_account])
+    queries = []
+
+    def record(*args: Any) -> None:
+        queries.append(args)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        names = repository.get_account_owner_names([company.product_account])
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    assert names == {company.product_account.id: "test company"}
+    assert not queries
@@ -1,3 +1,6 @@
+from decimal import Decimal
+
+from arbeitszeit.entities import AccountTypes
 from arbeitszeit_flask.database.repositories import AccountRepository
 from tests.data_generators import AccountGenerator, TransactionGenerator
 
@@ -71,3 +74,66 @@ def test_the_account_balance_is_zero_when_sending_and_receiving_account_of_trans
         amount_received=10,
     )
     assert repository.get_account_balance(account) == 0
+
+
+@injection_test
+def test_no_account_balances_are_inconsistent_after_transactions_were_created(
+    repository: AccountRepository,
+    account_generator: AccountGenerator,
+    transaction_generator: TransactionGenerator,
+) -> None:
+    account = account_generator.create_account()
+    transaction_generator.create_transaction(sending_account=account, amount_sent=10)
+    transaction_generator.create_transaction(
+        receiving_account=account, amount_received=4
+    )
+    transaction_generator.create_transaction(
+        sending_account=account,
+        receiving_account=account,
+        amount_sent=3,
+        amount_received=3,
+    )
+    assert not repository.get_accounts_with_inconsistent_balance()
+
+
+@injection_test
+def test_account_with_manipulated_balance_is_reported_as_inconsistent(
+    repository: AccountRepository,
+    account_generator: AccountGenerator,
+    transaction_generator: TransactionGenerator,
+) -> None:
+    account = account_generator.create_account()
+    transaction_generator.create_transaction(sending_account=account, amount_sent=10)
+    repository.record_sent_amount(account, Decimal(1))
+    assert repository.get_accounts_with_inconsistent_balance() == [account.id]
+
+
+@injection_test
+def test_balances_are_summed_up_by_account_type(
+    repository: AccountRepository,
+    account_generator: AccountGenerator,
+    transaction_generator: TransactionGenerator,
+) -> None:
+    work_account_1 = account_generator.create_account(AccountTypes.a)
+    work_account_2 = account_generator.create_account(AccountTypes.a)
+    member_account = account_generator.create_account(AccountTypes.member)
+    transaction_generator.create_transaction(
+        sending_account=work_account_1,
+        receiving_account=member_account,
+        amount_sent=Decimal(3),
+        amount_received=Decimal(3),
+    )
+    transaction_generator.create_transaction(
+        receiving_account=work_account_2, amount_received=Decimal(5)
+    )
+    balances = repository.sum_of_balances_by_account_type()
+    assert balances[AccountTypes.a] == Decimal(2)
+    assert balances[AccountTypes.member] == Decimal(3)
+
+
+@injection_test
+def test_created_account_has_the_requested_account_type(
+    repository: AccountRepository,
+) -> None:
+    account = repository.create_account(AccountTypes.member)
+    assert account.account_type == AccountTypes.member
@@ -0,0 +1,251 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from flask import Flask
+
+from arbeitszeit.entities import Account
+from arbeitszeit.repositories import BalanceHistoryEntry
+from arbeitszeit_flask.database.balance_checkpoints import BalanceCheckpoints
+from arbeitszeit_flask.database.repositories import (
+    AccountRepository,
+    TransactionRepository,
+)
+from arbeitszeit_flask.models import AccountBalanceCheckpoint
+
+from ..data_generators import AccountGenerator
+from .dependency_injection import injection_test
+
+DAY = timedelta(days=1)
+
+
+def transfer(
+    repository: TransactionRepository,
+    date: datetime,
+    sender: Account,
+    receiver: Account,
+    amount: int,
+) -> None:
+    repository.create_transaction(
+        date=date,
+        sending_account=sender,
+        receiving_account=receiver,
+        amount_sent=Decimal(amount),
+        amount_received=Decimal(amount),
+        purpose="test purpose",
+    )
+
+
+@injection_test
+def test_one_checkpoint_is_written_per_account_and_day_with_transactions(
+    checkpoints: BalanceCheckpoints,
+    transaction_repository: TransactionRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    sender = account_generator.create_account()
+    receiver = account_generator.create_account()
+    transfer(transaction_repository, datetime(2021, 3, 1, 9), sender, receiver, 5)
+    transfer(transaction_repository, datetime(2021, 3, 1, 17), sender, receiver, 5)
+    transfer(transaction_repository, datetime(2021, 3, 4, 12), receiver, sender, 3)
+    written = checkpoints.write_checkpoints(now=datetime(2021, 3, 10), interval=DAY)
+    assert written == 4
+    timestamps = [
+        checkpoint.timestamp
+        for checkpoint in AccountBalanceCheckpoint.query.filter_by(
+            account_id=str(receiver.id)
+        ).order_by(AccountBalanceCheckpoint.timestamp)
+    ]
+    assert timestamps == [datetime(2021, 3, 2), datetime(2021, 3, 5)]
+
+
+@injection_test
+def test_intervals_that_have_not_ended_yet_are_not_checkpointed(
+    checkpoints: BalanceCheckpoints,
+    transaction_repository: TransactionRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    sender = account_generator.create_account()
+    receiver = account_generator.create_account()
+    transfer(transaction_repository, datetime(2021, 3, 1, 9), sender, receiver, 5)
+    assert not checkpoints.write_checkpoints(now=datetime(2021, 3, 1, 23), interval=DAY)
+    assert not checkpoints.write_checkpoints(
+        now=datetime(2021, 3, 2, 0, 0, 30), interval=DAY
+    )
+    assert checkpoints.write_checkpoints(now=datetime(2021, 3, 2, 1), interval=DAY)
+
+
+@injection_test
+def test_later_checkpoints_continue_from_earlier_ones(
+    checkpoints: BalanceCheckpoints,
+    transaction_repository: TransactionRepository,
+    repository: AccountRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    sender = account_generator.create_account()
+    receiver = account_generator.create_account()
+    transfer(transaction_repository, datetime(2021, 3, 1, 9), sender, receiver, 5)
+    checkpoints.write_checkpoints(now=datetime(2021, 3, 3), interval=DAY)
+    transfer(transaction_repository, datetime(2021, 3, 3, 9), sender, receiver, 2)
+    assert checkpoints.write_checkpoints(now=datetime(2021, 3, 3), interval=DAY) == 0
+    assert checkpoints.write_checkpoints(now=datetime(2021, 3, 5), interval=DAY) == 2
+    assert repository.get_balance_history(receiver) == [
+        BalanceHistoryEntry(date=datetime(2021, 3, 2), balance=Decimal(5)),
+        BalanceHistoryEntry(date=datetime(2021, 3, 4), balance=Decimal(7)),
+    ]
+
+
+@injection_test
+def test_history_consists_of_checkpoints_followed_by_later_transactions(
+    checkpoints: BalanceCheckpoints,
+    transaction_repository: TransactionRepository,
+    repository: AccountRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    account = account_generator.create_account()
+    other_account = account_generator.create_account()
+    transfer(transaction_repository, datetime(2021, 3, 1, 9), other_account, account, 5)
+    transfer(
+        transaction_repository, datetime(2021, 3, 1, 10), account, other_account, 1
+    )
+    checkpoints.write_checkpoints(now=datetime(2021, 3, 2, 12), interval=DAY)
+    transfer(
+        transaction_repository, datetime(2021, 3, 2, 13), other_account, account, 3
+    )
+    transfer(
+        transaction_repository, datetime(2021, 3, 2, 14), account, other_account, 2
+    )
+    history = repository.get_balance_history(account)
+    assert history == [
+        BalanceHistoryEntry(date=datetime(2021, 3, 2), balance=Decimal(4)),
+        BalanceHistoryEntry(date=datetime(2021, 3, 2, 13), balance=Decimal(7)),
+        BalanceHistoryEntry(date=datetime(2021, 3, 2, 14), balance=Decimal(5)),
+    ]
+    assert history[-1].balance == repository.get_account_balance(account)
+
+
+@injection_test
+def test_history_without_checkpoints_has_one_entry_per_transaction(
+    transaction_repository: TransactionRepository,
+    repository: AccountRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    account = account_generator.create_account()
+    other_account = account_generator.create_account()
+    transfer(transaction_repository, datetime(2021, 3, 1, 9), other_account, account, 5)
+    transfer(transaction_repository, datetime(2021, 3, 1, 10), account, account, 8)
+    transfer(
+        transaction_repository, datetime(2021, 3, 1, 11), account, other_account, 1
+    )
+    assert repository.get_balance_history(account) == [
+        BalanceHistoryEntry(date=datetime(2021, 3, 1, 9), balance=Decimal(5)),
+        BalanceHistoryEntry(date=datetime(2021, 3, 1, 11), balance=Decimal(4)),
+    ]
+
+
+@injection_test
+def test_balance_at_a_date_is_the_same_with_and_without_checkpoints(
+    checkpoints: BalanceCheckpoints,
+    transaction_repository: TransactionRepository,
+    repository: AccountRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    account = account_generator.create_account()
+    other_account = account_generator.create_account()
+    for day in range(1, 6):
+        transfer(
+            transaction_repository,
+            datetime(2021, 3, day, 9),
+            other_account,
+            account,
+            day,
+        )
+        transfer(
+            transaction_repository,
+            datetime(2021, 3, day, 18),
+            account,
+            other_account,
+            1,
+        )
+    dates = [datetime(2021, 2, 1)] + [
+        datetime(2021, 3, day, hour) for day in range(1, 7) for hour in [0, 12, 20]
+    ]
+    expected_balances = [
+        repository.get_account_balance_at(account, date) for date in dates
+    ]
+    checkpoints.write_checkpoints(now=datetime(2021, 3, 4), interval=DAY)
+    assert [
+        repository.get_account_balance_at(account, date) for date in dates
+    ] == expected_balances
+    assert expected_balances[0] == 0
+    assert expected_balances[dates.index(datetime(2021, 3, 3, 12))] == 4
+    assert expected_balances[-1] == repository.get_account_balance(account)
+
+
+@injection_test
+def test_rebuilt_checkpoints_equal_the_incrementally_written_ones(
+    checkpoints: BalanceCheckpoints,
+    transaction_repository: TransactionRepository,
+    repository: AccountRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    account = account_generator.create_account()
+    other_account = account_generator.create_account()
+    for day in range(1, 6):
+        transfer(
+            transaction_repository,
+            datetime(2021, 3, day, 9),
+            other_account,
+            account,
+            day,
+        )
+        checkpoints.write_checkpoints(now=datetime(2021, 3, day, 12), interval=DAY)
+    history = repository.get_balance_history(account)
+    checkpoints.delete_checkpoints()
+    checkpoints.write_checkpoints(now=datetime(2021, 3, 5, 12), interval=DAY)
+    assert repository.get_balance_history(account) == history
+
+
+@injection_test
+def test_command_writes_checkpoints_and_rebuilds_them(
+    app: Flask,
+    transaction_repository: TransactionRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    sender = account_generator.create_account()
+    receiver = account_generator.create_account()
+    transfer(transaction_repository, datetime(2021, 3, 1, 9), sender, receiver, 5)
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["write-balance-checkpoints"])
+    assert result.exit_code == 0
+    assert "Wrote 2 balance checkpoint(s)" in result.output
+    result = runner.invoke(args=["write-balance-checkpoints"])
+    assert "Wrote 0 balance checkpoint(s)" in result.output
+    result = runner.invoke(args=["write-balance-checkpoints", "--rebuild"])
+    assert "Wrote 2 balance checkpoint(s)" in result.output
+
+
+@injection_test
+def test_history_revision_changes_with_checkpoints_and_later_transactions(
+    checkpoints: BalanceCheckpoints,
+    transaction_repository: TransactionRepository,
+    repository: AccountRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    account = account_generator.create_account()
+    other_account = account_generator.create_account()
+    transfer(transaction_repository, datetime(2021, 3, 1, 9), other_account, account, 5)
+    revisions = [repository.get_balance_history_revision(account)]
+    checkpoints.write_checkpoints(now=datetime(2021, 3, 2, 12), interval=DAY)
+    revisions.append(repository.get_balance_history_revision(account))
+    transfer(
+        transaction_repository, datetime(2021, 3, 2, 13), account, other_account, 1
+    )
+    revisions.append(repository.get_balance_history_revision(account))
+    transfer(
+        transaction_repository,
+        datetime(2021, 3, 2, 14),
+        other_account,
+        other_account,
+        1,
+    )
+    assert repository.get_balance_history_revision(account) == revisions[-1]
+    assert len(set(revisions)) == 3
@@ -6,11 +6,14 @@ from pytest import raises
 from sqlalchemy.exc import IntegrityError
 
 from arbeitszeit.entities import AccountTypes, Company
+from arbeitszeit.pagination import PageRequest
+from arbeitszeit_flask.database.identity_map import IdentityMap
 from arbeitszeit_flask.database.repositories import AccountRepository, CompanyRepository
 from tests.data_generators import CompanyGenerator
 
 from .dependency_injection import injection_test
 from .flask import FlaskTestCase
+from .query_budget import QueryCounter
 
 
 def company_in_companies(company: Company, companies: List[Company]) -> bool:
@@ -114,7 +117,7 @@ def test_that_get_all_companies_returns_all_companies(
 ):
     expected_company1 = generator.create_company(email="company1@provider.de")
     expected_company2 = generator.create_company(email="company2@provider.de")
-    all_companies = list(repository.get_all_companies())
+    all_companies = repository.get_all_companies(PageRequest()).items
     assert company_in_companies(expected_company1, all_companies)
     assert company_in_companies(expected_company2, all_companies)
 
@@ -130,7 +133,9 @@ def test_query_companies_by_name_matching_exactly(
     unexpected_company = generator.create_company(
         name="Company2", email="company2@provider.de"
     )
-    companies_by_name = list(repository.query_companies_by_name("Company1"))
+    companies_by_name = repository.query_companies_by_name(
+        "Company1", PageRequest()
+    ).items
     assert company_in_companies(expected_company, companies_by_name)
     assert not company_in_companies(unexpected_company, companies_by_name)
 
@@ -146,7 +151,7 @@ def test_query_companies_by_name_with_matching_substring(
     unexpected_company = generator.create_company(
         name="Company Two", email="company2@provider.de"
     )
-    companies_by_name = list(repository.query_companies_by_name("One"))
+    companies_by_name = repository.query_companies_by_name("One", PageRequest()).items
     assert company_in_companies(expected_company, companies_by_name)
     assert not company_in_companies(unexpected_company, companies_by_name)
 
@@ -159,7 +164,9 @@ def test_query_companies_by_name_with_capitalization(
     expected_company = generator.create_company(
         name="COMPANY", email="company@provider.de"
     )
-    companies_result = list(repository.query_companies_by_name("company"))
+    companies_result = repository.query_companies_by_name(
+        "company", PageRequest()
+    ).items
     assert company_in_companies(expected_company, companies_result)
 
 
@@ -170,9 +177,9 @@ def test_query_companies_by_email_matching_exactly(
 ):
     expected_company = generator.create_company(email="company1@provider.de")
     unexpected_company = generator.create_company(email="company2@provider.de")
-    companies_by_email = list(
-        repository.query_companies_by_email("company1@provider.de")
-    )
+    companies_by_email = repository.query_companies_by_email(
+        "company1@provider.de", PageRequest()
+    ).items
     assert company_in_companies(expected_company, companies_by_email)
     assert not company_in_companies(unexpected_company, companies_by_email)
 
@@ -184,7 +191,7 @@ def test_query_companies_by_email_with_matching_substring(
 ):
     expected_company = generator.create_company(email="company.one@provider.de")
     unexpected_company = generator.create_company(email="company.two@provider.de")
-    companies_by_email = list(repository.query_companies_by_email("one"))
+    companies_by_email = repository.query_companies_by_email("one", PageRequest()).items
     assert company_in_companies(expected_company, companies_by_email)
     assert not company_in_companies(unexpected_company, companies_by_email)
 
@@ -195,7 +202,9 @@ def test_query_companies_by_email_with_capitalization(
     generator: CompanyGenerator,
 ):
     expected_company = generator.create_company(email="company@provider.de")
-    companies_result = list(repository.query_companies_by_email("COMPANY"))
+    companies_result = repository.query_companies_by_email(
+        "COMPANY", PageRequest()
+    ).items
     assert company_in_companies(expected_company, companies_result)
 
 
@@ -236,3 +245,52 @@ class ValidateCredentialsTest(FlaskTestCase):
             "wrong_password",
         )
         self.assertIsNone(company_id)
+
+
+@injection_test
+def test_that_all_companies_are_paginated_by_name(
+    repository: CompanyRepository,
+    generator: CompanyGenerator,
+):
+    for name in ["Company B", "Company A", "Company C"]:
+        generator.create_company(name=name)
+    first_page = repository.get_all_companies(PageRequest(size=2))
+    assert [company.name for company in first_page.items] == ["Company A", "Company B"]
+    second_page = repository.get_all_companies(
+        PageRequest(cursor=first_page.next_cursor, size=2)
+    )
+    assert [company.name for company in second_page.items] == ["Company C"]
+    assert second_page.next_cursor is None
+
+
+@injection_test
+def test_that_companies_with_the_same_name_are_not_skipped_between_pages(
+    repository: CompanyRepository,
+    generator: CompanyGenerator,
+):
+    companies = [generator.create_company(name="Company") for _ in range(3)]
+    first_page = repository.query_companies_by_name("Company", PageRequest(size=2))
+    second_page = repository.query_companies_by_name(
+        "Company", PageRequest(cursor=first_page.next_cursor, size=2)
+    )
+    assert sorted(company.id for company in first_page.items + second_page.items) == (
+        sorted(company.id for company in companies)
+    )
+
+
+@injection_test
+def test_loaded_companies_are_found_without_further_queries(
+    repository: CompanyRepository,
+    generator: CompanyGenerator,
+    query_counter: QueryCounter,
+    identity_map: IdentityMap,
+):
+    companies = [generator.create_company() for _ in range(3)]
+    identity_map.clear()
+    with query_counter() as statements:
+        repository.load_companies(company.id for company in companies)
+    assert len(statements) == 2
+    with query_counter() as statements:
+        loaded_companies = [repository.get_by_id(company.id) for company in companies]
+    assert not statements
+    assert loaded_companies == companies
@@ -1,5 +1,6 @@
 from uuid import uuid4
 
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit_flask.database.repositories import (
     CompanyWorkerRepository,
     MemberRepository,
@@ -58,3 +59,20 @@ def test_worker_that_was_added_shows_up_in_company_workers(
     member = member_generator.create_member()
     repo.add_worker_to_company(company=company, worker=member)
     assert member in repo.get_company_workers(company)
+
+
+@injection_test
+def test_that_company_workers_are_paginated_by_name(
+    company_generator: CompanyGenerator,
+    member_generator: MemberGenerator,
+    repo: CompanyWorkerRepository,
+):
+    workers = [member_generator.create_member(name=name) for name in ["b", "c", "a"]]
+    company = company_generator.create_company(workers=workers)
+    first_page = repo.get_page_of_company_workers(company, PageRequest(size=2))
+    assert [worker.name for worker in first_page.items] == ["a", "b"]
+    second_page = repo.get_page_of_company_workers(
+        company, PageRequest(cursor=first_page.next_cursor, size=2)
+    )
+    assert [worker.name for worker in second_page.items] == ["c"]
+    assert second_page.next_cursor is None
@@ -1,4 +1,5 @@
 from datetime import datetime
+from decimal import Decimal
 from unittest import TestCase
 
 import arbeitszeit.repositories
@@ -113,3 +114,45 @@ class CooperationRepositoryTests(TestCase):
             self.repo.create_cooperation(**self.DEFAULT_CREATE_ARGUMENTS)
         count = self.repo.count_cooperations()
         self.assertEqual(count, number_of_coops)
+
+    def test_cooperation_has_no_price_after_creation(self):
+        cooperation = self.repo.create_cooperation(**self.DEFAULT_CREATE_ARGUMENTS)
+        self.assertIsNone(self.repo.get_price_per_unit(cooperation.id))
+
+    def test_price_of_cooperation_can_be_stored(self):
+        cooperation = self.repo.create_cooperation(**self.DEFAULT_CREATE_ARGUMENTS)
+        self.repo.set_price_per_unit(cooperation.id, Decimal("2.5"))
+        self.assertEqual(self.repo.get_price_per_unit(cooperation.id), Decimal("2.5"))
+
+    def test_price_of_cooperation_can_be_reset(self):
+        cooperation = self.repo.create_cooperation(**self.DEFAULT_CREATE_ARGUMENTS)
+        self.repo.set_price_per_unit(cooperation.id, Decimal("2.5"))
+        self.repo.set_price_per_unit(cooperation.id, None)
+        self.assertIsNone(self.repo.get_price_per_unit(cooperation.id))
+
+    def test_storing_a_price_does_not_change_other_cooperations(self):
+        cooperation = self.repo.create_cooperation(**self.DEFAULT_CREATE_ARGUMENTS)
+        other_cooperation = self.repo.create_cooperation(
+            **self.DEFAULT_CREATE_ARGUMENTS
+        )
+        self.repo.set_price_per_unit(cooperation.id, Decimal("2.5"))
+        self.assertIsNone(self.repo.get_price_per_unit(other_cooperation.id))
+
+    def test_only_stored_prices_of_requested_cooperations_are_returned(self):
+        priced_cooperation = self.repo.create_cooperation(
+            **self.DEFAULT_CREATE_ARGUMENTS
+        )
+        unpriced_cooperation = self.repo.create_cooperation(
+            **self.DEFAULT_CREATE_ARGUMENTS
+        )
+        other_cooperation = self.repo.create_cooperation(
+            **self.DEFAULT_CREATE_ARGUMENTS
+        )
+        self.repo.set_price_per_unit(priced_cooperation.id, Decimal("2.5"))
+        self.repo.set_price_per_unit(other_cooperation.id, Decimal(1))
+        self.assertEqual(
+            self.repo.get_prices_per_unit(
+                [priced_cooperation.id, unpriced_cooperation.id]
+            ),
+            {priced_cooperation.id: Decimal("2.5")},
+        )
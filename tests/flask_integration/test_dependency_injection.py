@@ -0,0 +1,133 @@
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from arbeitszeit_flask.database import SocialAccountingCache
+from arbeitszeit_flask.database.repositories import AccountingRepository, PlanRepository
+from arbeitszeit_flask.dependency_injection import (
+    CompanyModule,
+    MemberModule,
+    with_injection,
+)
+
+from .dependency_injection import get_dependency_injector, injection_test
+from .flask import FlaskTestCase
+
+
+class WithInjectionTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        app_context = self.app.app_context()
+        app_context.push()
+        self.addCleanup(app_context.pop)
+
+    def test_injector_is_reused_for_following_calls(self) -> None:
+        first_injector = with_injection().get_injector()
+        second_injector = with_injection().get_injector()
+        self.assertIs(first_injector, second_injector)
+
+    def test_injectors_with_modules_are_children_of_the_root_injector(self) -> None:
+        root_injector = with_injection().get_injector()
+        member_injector = with_injection([MemberModule()]).get_injector()
+        self.assertIs(member_injector.parent, root_injector)
+
+    def test_injectors_with_different_modules_are_different(self) -> None:
+        member_injector = with_injection([MemberModule()]).get_injector()
+        company_injector = with_injection([CompanyModule()]).get_injector()
+        self.assertIsNot(member_injector, company_injector)
+
+    def test_injectors_with_the_same_modules_are_shared(self) -> None:
+        first_injector = with_injection([MemberModule()]).get_injector()
+        second_injector = with_injection([MemberModule()]).get_injector()
+        self.assertIs(first_injector, second_injector)
+
+    def test_apps_do_not_share_injectors(self) -> None:
+        first_injector = with_injection().get_injector()
+        other_app = get_dependency_injector().get(Flask)
+        with other_app.app_context():
+            second_injector = with_injection().get_injector()
+        self.assertIsNot(first_injector, second_injector)
+
+    def test_arguments_of_the_caller_are_passed_on(self) -> None:
+        @with_injection()
+        def function(argument: int, repository: PlanRepository) -> int:
+            return argument
+
+        self.assertEqual(function(1), 1)
+
+
+class RequestScopeTests(FlaskTestCase):
+    def test_repository_is_shared_within_a_request(self) -> None:
+        with self.app.test_request_context():
+            first_repository = self.get_plan_repository()
+            second_repository = self.get_plan_repository()
+        self.assertIs(first_repository, second_repository)
+
+    def test_repository_is_shared_between_root_and_child_injector(self) -> None:
+        with self.app.test_request_context():
+            first_repository = self.get_plan_repository()
+            second_repository = (
+                with_injection([MemberModule()]).get_injector().get(PlanRepository)
+            )
+        self.assertIs(first_repository, second_repository)
+
+    def test_repository_is_not_shared_between_requests(self) -> None:
+        with self.app.test_request_context():
+            first_repository = self.get_plan_repository()
+        with self.app.test_request_context():
+            second_repository = self.get_plan_repository()
+        self.assertIsNot(first_repository, second_repository)
+
+    def test_repository_is_not_shared_outside_of_requests(self) -> None:
+        with self.app.app_context():
+            first_repository = self.get_plan_repository()
+            second_repository = self.get_plan_repository()
+        self.assertIsNot(first_repository, second_repository)
+
+    def get_plan_repository(self) -> PlanRepository:
+        return with_injection().get_injector().get(PlanRepository)
+
+
+@injection_test
+def test_committed_social_accounting_is_cached(
+    cache: SocialAccountingCache,
+    repository: AccountingRepository,
+    db: SQLAlchemy,
+) -> None:
+    repository.get_or_create_social_accounting()
+    db.session.commit()
+    assert cache.get(repository) is cache.get(repository)
+
+
+@injection_test
+def test_social_accounting_created_by_current_transaction_is_not_cached(
+    cache: SocialAccountingCache,
+    repository: AccountingRepository,
+    db: SQLAlchemy,
+) -> None:
+    first_social_accounting = cache.get(repository)
+    db.session.flush()
+    assert cache.get(repository) is not first_social_accounting
+
+
+@injection_test
+def test_social_accounting_of_rolled_back_transaction_is_not_cached(
+    cache: SocialAccountingCache,
+    repository: AccountingRepository,
+    db: SQLAlchemy,
+) -> None:
+    first_social_accounting = cache.get(repository)
+    db.session.flush()
+    cache.get(repository)
+    db.session.rollback()
+    assert cache.get(repository).id != first_social_accounting.id
+
+
+@injection_test
+def test_social_accounting_is_cached_after_commit_of_its_creation(
+    cache: SocialAccountingCache,
+    repository: AccountingRepository,
+    db: SQLAlchemy,
+) -> None:
+    cache.get(repository)
+    db.session.commit()
+    assert cache.get(repository) is cache.get(repository)
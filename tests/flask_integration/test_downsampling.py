@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List, Tuple
+from unittest import TestCase
+
+import numpy as np
+
+from arbeitszeit_flask.plots.downsampling import (
+    downsample_time_series,
+    largest_triangle_three_buckets,
+)
+
+
+class DownsampleTimeSeriesTests(TestCase):
+    def test_short_series_is_returned_unchanged(self) -> None:
+        timestamps, values = self.create_series([1, 2, 3])
+        self.assertEqual(
+            downsample_time_series(timestamps, values, max_points=3),
+            (timestamps, values),
+        )
+
+    def test_long_series_is_reduced_to_max_points(self) -> None:
+        timestamps, values = self.create_series(range(1000))
+        sampled_timestamps, sampled_values = downsample_time_series(
+            timestamps, values, max_points=100
+        )
+        self.assertEqual(len(sampled_timestamps), 100)
+        self.assertEqual(len(sampled_values), 100)
+
+    def test_first_and_last_point_are_kept(self) -> None:
+        timestamps, values = self.create_series(range(1000))
+        sampled_timestamps, sampled_values = downsample_time_series(
+            timestamps, values, max_points=10
+        )
+        self.assertEqual(sampled_timestamps[0], timestamps[0])
+        self.assertEqual(sampled_timestamps[-1], timestamps[-1])
+        self.assertEqual(sampled_values[0], values[0])
+        self.assertEqual(sampled_values[-1], values[-1])
+
+    def test_sampled_points_are_points_of_the_series(self) -> None:
+        timestamps, values = self.create_series([i % 7 for i in range(1000)])
+        sampled_timestamps, sampled_values = downsample_time_series(
+            timestamps, values, max_points=50
+        )
+        for timestamp, value in zip(sampled_timestamps, sampled_values):
+            self.assertEqual(values[timestamps.index(timestamp)], value)
+
+    def test_peak_is_kept(self) -> None:
+        series = [0] * 1000
+        series[537] = 100
+        timestamps, values = self.create_series(series)
+        _, sampled_values = downsample_time_series(timestamps, values, max_points=10)
+        self.assertIn(Decimal(100), sampled_values)
+
+    def create_series(self, values) -> Tuple[List[datetime], List[Decimal]]:
+        start = datetime(2021, 1, 1)
+        return (
+            [start + timedelta(hours=i) for i in range(len(values))],
+            [Decimal(value) for value in values],
+        )
+
+
+class LargestTriangleThreeBucketsTests(TestCase):
+    def test_indices_are_ascending(self) -> None:
+        y = np.cumsum(np.random.default_rng(0).normal(size=1000))
+        indices = largest_triangle_three_buckets(np.arange(1000.0), y, 100)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+
+    def test_one_point_is_chosen_from_every_bucket(self) -> None:
+        # Between the first and the last point the series is split into
+        # the buckets [1, 3), [3, 6) and [6, 9).
+        indices = largest_triangle_three_buckets(
+            np.arange(10.0), np.array([0, 5, 0, 0, 5, 0, 0, 5, 0, 0.0]), 5
+        )
+        self.assertEqual(indices[0], 0)
+        self.assertIn(indices[1], range(1, 3))
+        self.assertIn(indices[2], range(3, 6))
+        self.assertIn(indices[3], range(6, 9))
+        self.assertEqual(indices[4], 9)
+
+    def test_threshold_below_three_keeps_first_and_last_point(self) -> None:
+        indices = largest_triangle_three_buckets(np.arange(10.0), np.arange(10.0), 2)
+        self.assertEqual(list(indices), [0, 9])
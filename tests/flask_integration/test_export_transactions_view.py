@@ -0,0 +1,108 @@
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+
+from arbeitszeit.entities import Account, AccountTypes
+from arbeitszeit_flask.database.repositories import TransactionRepository
+from tests.data_generators import AccountGenerator
+
+from .flask import ViewTestCase
+
+
+class ExportTransactionsViewTests(ViewTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.transaction_repository = self.injector.get(TransactionRepository)
+        account_generator = self.injector.get(AccountGenerator)
+        self.accounting_account = account_generator.create_account(
+            account_type=AccountTypes.accounting
+        )
+        self.product_account = account_generator.create_account(
+            account_type=AccountTypes.prd
+        )
+
+    def transfer(self, date: datetime, sender: Account, receiver: Account) -> None:
+        self.transaction_repository.create_transaction(
+            date=date,
+            sending_account=sender,
+            receiving_account=receiver,
+            amount_sent=Decimal(3),
+            amount_received=Decimal(3),
+            purpose="test purpose",
+        )
+
+    def test_company_gets_all_transactions_as_csv_oldest_first(self) -> None:
+        company, _, email = self.login_company()
+        self.confirm_company(company=company, email=email)
+        self.transfer(datetime(2021, 5, 2), company.means_account, self.product_account)
+        self.transfer(
+            datetime(2021, 5, 1), self.accounting_account, company.work_account
+        )
+        response = self.client.get("/company/my_accounts/all_transactions/export/csv")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "text/csv")
+        self.assertIn("attachment", response.headers["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+        self.assertEqual(
+            [(row["date"], row["account_type"]) for row in rows],
+            [("2021-05-01T00:00:00", "a"), ("2021-05-02T00:00:00", "p")],
+        )
+        self.assertEqual(Decimal(rows[1]["transaction_volume"]), Decimal(-3))
+
+    def test_member_gets_transactions_as_ndjson(self) -> None:
+        member, _, email = self.login_member()
+        self.confirm_member(member=member, email=email)
+        self.transfer(datetime(2021, 5, 1), self.accounting_account, member.account)
+        response = self.client.get("/member/my_account/export/ndjson")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["account_type"], "member")
+
+    def test_export_is_limited_to_date_range(self) -> None:
+        company, _, email = self.login_company()
+        self.confirm_company(company=company, email=email)
+        for day in [1, 2, 3, 4]:
+            self.transfer(
+                datetime(2021, 5, day, 12),
+                self.accounting_account,
+                company.work_account,
+            )
+        response = self.client.get(
+            "/company/my_accounts/all_transactions/export/ndjson"
+            "?start=2021-05-02&end=2021-05-03"
+        )
+        dates = [
+            json.loads(line)["date"]
+            for line in response.get_data(as_text=True).splitlines()
+        ]
+        self.assertEqual(dates, ["2021-05-02T12:00:00", "2021-05-03T12:00:00"])
+
+    def test_malformed_date_is_rejected(self) -> None:
+        company, _, email = self.login_company()
+        self.confirm_company(company=company, email=email)
+        response = self.client.get(
+            "/company/my_accounts/all_transactions/export/csv?start=yesterday"
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_format_is_not_found(self) -> None:
+        company, _, email = self.login_company()
+        self.confirm_company(company=company, email=email)
+        response = self.client.get("/company/my_accounts/all_transactions/export/xml")
+        self.assertEqual(response.status_code, 404)
+
+    def test_transaction_pages_link_to_the_exports(self) -> None:
+        company, _, email = self.login_company()
+        self.confirm_company(company=company, email=email)
+        response = self.client.get("/company/my_accounts/all_transactions")
+        self.assertIn(
+            b"/company/my_accounts/all_transactions/export/csv", response.data
+        )
+        member, _, email = self.login_member()
+        self.confirm_member(member=member, email=email)
+        response = self.client.get("/member/my_account")
+        self.assertIn(b"/member/my_account/export/ndjson", response.data)
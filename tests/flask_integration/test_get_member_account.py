@@ -0,0 +1,62 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, List, Tuple
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
+from arbeitszeit.entities import Member
+from arbeitszeit.use_cases import GetMemberAccount, GetMemberAccountResponse
+from arbeitszeit_flask.database.repositories import TransactionRepository
+from tests.data_generators import CompanyGenerator, MemberGenerator
+
+from .dependency_injection import injection_test
+
+
+def count_queries(
+    db: SQLAlchemy, use_case: GetMemberAccount, member: Member
+) -> Tuple[GetMemberAccountResponse, int]:
+    queries: List[Any] = []
+
+    def record(*args: Any) -> None:
+        queries.append(args)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        response = use_case(member.id)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    return response, len(queries)
+
+
+def buy_product(
+    repository: TransactionRepository,
+    member: Member,
+    company_generator: CompanyGenerator,
+) -> None:
+    repository.create_transaction(
+        datetime(2021, 1, 1),
+        sending_account=member.account,
+        receiving_account=company_generator.create_company().product_account,
+        amount_sent=Decimal(1),
+        amount_received=Decimal(1),
+        purpose="test purpose",
+    )
+
+
+@injection_test
+def test_number_of_queries_does_not_grow_with_number_of_transactions(
+    use_case: GetMemberAccount,
+    transaction_repository: TransactionRepository,
+    member_generator: MemberGenerator,
+    company_generator: CompanyGenerator,
+    db: SQLAlchemy,
+) -> None:
+    member = member_generator.create_member()
+    buy_product(transaction_repository, member, company_generator)
+    _, queries_for_one_transaction = count_queries(db, use_case, member)
+    for _ in range(5):
+        buy_product(transaction_repository, member, company_generator)
+    response, queries_for_six_transactions = count_queries(db, use_case, member)
+    assert len(response.transactions) == 6
+    assert queries_for_six_transactions <= queries_for_one_transaction
@@ -0,0 +1,93 @@
+from datetime import datetime
+
+from flask_sqlalchemy import SQLAlchemy
+
+from arbeitszeit_flask.database.repositories import (
+    CompanyRepository,
+    MemberRepository,
+    PlanCooperationRepository,
+    PlanRepository,
+)
+from tests.data_generators import (
+    CompanyGenerator,
+    CooperationGenerator,
+    MemberGenerator,
+    PlanGenerator,
+)
+
+from .dependency_injection import injection_test
+
+
+@injection_test
+def test_company_is_only_hydrated_once_per_session(
+    repository: CompanyRepository,
+    generator: CompanyGenerator,
+) -> None:
+    company = generator.create_company()
+    assert repository.get_by_id(company.id) is repository.get_by_id(company.id)
+
+
+@injection_test
+def test_member_is_only_hydrated_once_per_session(
+    repository: MemberRepository,
+    generator: MemberGenerator,
+) -> None:
+    member = generator.create_member()
+    assert repository.get_by_id(member.id) is repository.get_by_id(member.id)
+
+
+@injection_test
+def test_plans_of_the_same_company_share_the_planner_object(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+    company_generator: CompanyGenerator,
+) -> None:
+    planner = company_generator.create_company()
+    plan_1 = plan_generator.create_plan(planner=planner)
+    plan_2 = plan_generator.create_plan(planner=planner)
+    retrieved_1 = repository.get_plan_by_id(plan_1.id)
+    retrieved_2 = repository.get_plan_by_id(plan_2.id)
+    assert retrieved_1
+    assert retrieved_2
+    assert retrieved_1.planner is retrieved_2.planner
+
+
+@injection_test
+def test_hidden_plan_is_rehydrated_after_it_was_hidden(
+    repository: PlanRepository,
+    generator: PlanGenerator,
+) -> None:
+    plan = generator.create_plan()
+    assert repository.get_plan_by_id(plan.id)
+    repository.hide_plan(plan.id)
+    retrieved_plan = repository.get_plan_by_id(plan.id)
+    assert retrieved_plan
+    assert retrieved_plan.hidden_by_user
+
+
+@injection_test
+def test_plan_is_rehydrated_after_it_was_added_to_a_cooperation(
+    repository: PlanRepository,
+    plan_cooperation_repository: PlanCooperationRepository,
+    plan_generator: PlanGenerator,
+    cooperation_generator: CooperationGenerator,
+) -> None:
+    plan = plan_generator.create_plan(activation_date=datetime.min)
+    cooperation = cooperation_generator.create_cooperation()
+    assert repository.get_plan_by_id(plan.id)
+    plan_cooperation_repository.add_plan_to_cooperation(plan.id, cooperation.id)
+    retrieved_plan = repository.get_plan_by_id(plan.id)
+    assert retrieved_plan
+    assert retrieved_plan.cooperation == cooperation.id
+
+
+@injection_test
+def test_company_is_rehydrated_after_a_commit(
+    repository: CompanyRepository,
+    generator: CompanyGenerator,
+    db: SQLAlchemy,
+) -> None:
+    company = generator.create_company()
+    company_before_commit = repository.get_by_id(company.id)
+    db.session.commit()
+    assert repository.get_by_id(company.id) is not company_before_commit
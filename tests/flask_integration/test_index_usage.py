@@ -0,0 +1,123 @@
+from datetime import datetime
+
+from arbeitszeit_flask.database.index_usage import (
+    IndexUsageReport,
+    MethodIndexUsage,
+    QueryPlan,
+)
+from tests.data_generators import MemberGenerator, PlanGenerator
+
+from .dependency_injection import injection_test
+
+
+@injection_test
+def test_report_covers_methods_for_company_member_and_plan(
+    report: IndexUsageReport,
+    plan_generator: PlanGenerator,
+    member_generator: MemberGenerator,
+) -> None:
+    plan_generator.create_plan(activation_date=datetime.min)
+    member_generator.create_member()
+    methods = {usage.method for usage in report()}
+    assert "TransactionRepository.all_transactions_sent_by_account" in methods
+    assert "CompanyWorkerRepository.get_member_workplaces" in methods
+    assert "TransactionRepository.get_sales_balance_of_plan" in methods
+
+
+@injection_test
+def test_transactions_sent_by_account_are_looked_up_by_index(
+    report: IndexUsageReport,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan()
+    usage = {usage.method: usage for usage in report()}[
+        "TransactionRepository.all_transactions_sent_by_account"
+    ]
+    assert usage.uses_indexes
+    assert any(
+        "ix_transaction_sending_account" in line
+        for query in usage.queries
+        for line in query.plan
+    )
+
+
+@injection_test
+def test_active_plans_are_looked_up_by_index(
+    report: IndexUsageReport,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan(activation_date=datetime.min)
+    usage = {usage.method: usage for usage in report()}[
+        "PlanRepository.all_plans_approved_active_and_not_expired"
+    ]
+    assert usage.uses_indexes
+
+
+@injection_test
+def test_balance_history_is_looked_up_by_index(
+    report: IndexUsageReport,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan()
+    usage = {usage.method: usage for usage in report()}[
+        "AccountRepository.get_balance_history"
+    ]
+    assert usage.uses_indexes
+
+
+PLANNER_QUERY = 'SELECT "plan".id FROM "plan" WHERE "plan".planner = ?'
+
+
+def test_query_searching_the_filtered_table_by_index_uses_index() -> None:
+    query = QueryPlan(
+        PLANNER_QUERY, ["SEARCH plan USING INDEX ix_plan_planner (planner=?)"]
+    )
+    assert query.uses_index
+
+
+def test_query_scanning_the_filtered_table_through_an_index_uses_index() -> None:
+    query = QueryPlan(PLANNER_QUERY, ["SCAN plan USING INDEX ix_plan_active"])
+    assert query.uses_index
+
+
+def test_query_scanning_the_filtered_table_does_not_use_index() -> None:
+    query = QueryPlan(
+        'SELECT "plan".id, company.name FROM "plan" JOIN company '
+        'ON company.id = "plan".planner WHERE "plan".planner = ?',
+        [
+            "SCAN plan",
+            "SEARCH company USING INDEX sqlite_autoindex_company_1 (id=?)",
+        ],
+    )
+    assert not query.uses_index
+
+
+def test_query_building_an_automatic_index_does_not_use_index() -> None:
+    query = QueryPlan(
+        PLANNER_QUERY, ["SEARCH plan USING AUTOMATIC COVERING INDEX (planner=?)"]
+    )
+    assert not query.uses_index
+
+
+def test_query_with_postgres_seq_scan_on_filtered_table_does_not_use_index() -> None:
+    query = QueryPlan(
+        PLANNER_QUERY,
+        [
+            "Seq Scan on plan  (cost=0.00..1.10 rows=1 width=32)",
+            "  Filter: ((planner)::text = 'x'::text)",
+        ],
+    )
+    assert not query.uses_index
+
+
+def test_scans_of_tables_that_are_not_filtered_do_not_count() -> None:
+    query = QueryPlan(
+        "SELECT company.id FROM company ORDER BY company.name", ["SCAN company"]
+    )
+    assert query.uses_index
+
+
+def test_method_without_queries_is_not_probed() -> None:
+    usage = MethodIndexUsage(method="PlanRepository.get_plan_by_id", queries=[])
+    assert not usage.probed
+    assert not usage.uses_indexes
@@ -0,0 +1,166 @@
+import io
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, List
+
+from flask import Flask
+from flask_mail import Message
+from flask_sqlalchemy import SQLAlchemy
+
+from arbeitszeit_flask.extensions import mail
+from arbeitszeit_flask.mail_outbox import MAX_ATTEMPTS, MailOutbox
+from arbeitszeit_flask.mail_service import DebugMailSink, OutboxMailService
+from arbeitszeit_flask.models import OutgoingEmail
+from tests.datetime_service import FakeDatetimeService
+
+from .dependency_injection import injection_test
+
+
+class FakeTransport:
+    def __init__(self) -> None:
+        self.connections = 0
+        self.sent_messages: List[Message] = []
+        self.failing_recipients: List[str] = []
+        self.is_unreachable = False
+
+    @contextmanager
+    def connect(self) -> Iterator[Callable[[Message], None]]:
+        if self.is_unreachable:
+            raise ConnectionRefusedError()
+        self.connections += 1
+        yield self._send
+
+    def _send(self, message: Message) -> None:
+        if message.recipients[0] in self.failing_recipients:
+            raise ConnectionResetError()
+        self.sent_messages.append(message)
+
+
+def queue_email(mail_service: OutboxMailService, recipient: str) -> None:
+    mail_service.send_message(
+        subject="test subject",
+        recipients=[recipient],
+        html="<p>test</p>",
+        sender="sender@cp.org",
+    )
+
+
+@injection_test
+def test_sent_messages_are_queued_until_they_are_delivered(
+    mail_service: OutboxMailService,
+    outbox: MailOutbox,
+) -> None:
+    with mail.record_messages() as sent_messages:
+        queue_email(mail_service, "a@cp.org")
+        assert not sent_messages
+        assert OutgoingEmail.query.count() == 1
+        report = outbox.deliver_due_emails(batch_size=10)
+        assert report.delivered == 1
+        assert [message.recipients for message in sent_messages] == [["a@cp.org"]]
+    assert not OutgoingEmail.query.count()
+
+
+@injection_test
+def test_one_connection_is_used_for_a_batch(
+    mail_service: OutboxMailService,
+    db: SQLAlchemy,
+    datetime_service: FakeDatetimeService,
+) -> None:
+    transport = FakeTransport()
+    outbox = MailOutbox(db, transport, datetime_service)
+    for recipient in ["a@cp.org", "b@cp.org", "c@cp.org"]:
+        queue_email(mail_service, recipient)
+    assert outbox.deliver_due_emails(batch_size=2).delivered == 2
+    assert outbox.deliver_due_emails(batch_size=2).delivered == 1
+    assert outbox.deliver_due_emails(batch_size=2).processed == 0
+    assert transport.connections == 2
+    assert len(transport.sent_messages) == 3
+
+
+@injection_test
+def test_failed_emails_are_retried_with_growing_delays(
+    db: SQLAlchemy,
+    datetime_service: FakeDatetimeService,
+) -> None:
+    mail_service = OutboxMailService(db, datetime_service)
+    transport = FakeTransport()
+    transport.failing_recipients = ["a@cp.org"]
+    outbox = MailOutbox(db, transport, datetime_service)
+    now = datetime(2021, 1, 1)
+    datetime_service.freeze_time(now)
+    queue_email(mail_service, "a@cp.org")
+    queue_email(mail_service, "b@cp.org")
+    report = outbox.deliver_due_emails(batch_size=10)
+    assert (report.delivered, report.failed) == (1, 1)
+    [email] = OutgoingEmail.query.all()
+    assert email.attempts == 1
+    assert email.next_attempt_at == now + timedelta(minutes=1)
+    assert "ConnectionResetError" in email.last_error
+    assert not outbox.deliver_due_emails(batch_size=10).processed
+    datetime_service.freeze_time(now + timedelta(minutes=1))
+    outbox.deliver_due_emails(batch_size=10)
+    assert email.next_attempt_at == now + timedelta(minutes=3)
+
+
+@injection_test
+def test_delivery_is_given_up_after_max_attempts(
+    db: SQLAlchemy,
+    datetime_service: FakeDatetimeService,
+) -> None:
+    mail_service = OutboxMailService(db, datetime_service)
+    transport = FakeTransport()
+    transport.failing_recipients = ["a@cp.org"]
+    outbox = MailOutbox(db, transport, datetime_service)
+    now = datetime(2021, 1, 1)
+    datetime_service.freeze_time(now)
+    queue_email(mail_service, "a@cp.org")
+    for day in range(MAX_ATTEMPTS + 2):
+        datetime_service.freeze_time(now + timedelta(days=day))
+        outbox.deliver_due_emails(batch_size=10)
+    [email] = OutgoingEmail.query.all()
+    assert email.attempts == MAX_ATTEMPTS
+    assert email.next_attempt_at is None
+
+
+@injection_test
+def test_emails_are_retried_when_mail_server_is_unreachable(
+    mail_service: OutboxMailService,
+    db: SQLAlchemy,
+    datetime_service: FakeDatetimeService,
+) -> None:
+    transport = FakeTransport()
+    transport.is_unreachable = True
+    outbox = MailOutbox(db, transport, datetime_service)
+    queue_email(mail_service, "a@cp.org")
+    queue_email(mail_service, "b@cp.org")
+    assert outbox.deliver_due_emails(batch_size=10).failed == 2
+    assert all(email.attempts == 1 for email in OutgoingEmail.query)
+
+
+@injection_test
+def test_debug_sink_prints_delivered_emails(
+    mail_service: OutboxMailService,
+    db: SQLAlchemy,
+    datetime_service: FakeDatetimeService,
+) -> None:
+    queue_email(mail_service, "a@cp.org")
+    output = io.StringIO()
+    with redirect_stdout(output):
+        report = MailOutbox(db, DebugMailSink(), datetime_service).deliver_due_emails(
+            batch_size=10
+        )
+    assert report.delivered == 1
+    assert "recipients: a@cp.org" in output.getvalue()
+
+
+@injection_test
+def test_mail_worker_command_delivers_due_emails(
+    app: Flask,
+    mail_service: OutboxMailService,
+) -> None:
+    queue_email(mail_service, "a@cp.org")
+    with mail.record_messages() as sent_messages:
+        result = app.test_cli_runner().invoke(args=["mail-worker", "--once"])
+    assert result.exit_code == 0
+    assert "Delivered 1 email(s), 0 failed" in result.output
+    assert len(sent_messages) == 1
@@ -1,9 +1,14 @@
-from typing import Optional, Union
+from datetime import datetime
+from typing import Any, List, Optional, Union
 from unittest import TestCase
 from uuid import uuid4
 
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
 from arbeitszeit import repositories as interfaces
 from arbeitszeit.entities import Company, Member, Message, SocialAccounting
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit.use_cases import ReadMessage, ReadMessageRequest
 from arbeitszeit.user_action import UserAction, UserActionType
 from arbeitszeit_flask.database.repositories import (
@@ -28,6 +33,7 @@ class MessageRepositoryTests(TestCase):
         self.addressee = self.member_generator.create_member()
         self.sender = self.member_generator.create_member()
         self.read_message = self.injector.get(ReadMessage)
+        self.db = self.injector.get(SQLAlchemy)
 
     def test_dependency_injection_returns_correct_type(self) -> None:
         repo = self.injector.get(interfaces.MessageRepository)
@@ -160,21 +166,138 @@ class MessageRepositoryTests(TestCase):
         )
         self.assertFalse(self.repo.has_unread_messages_for_user(self.addressee.id))
 
+    def test_user_has_unread_messages_until_all_of_them_were_read(self) -> None:
+        first_message = self._create_message()
+        second_message = self._create_message()
+        self.repo.mark_as_read(first_message)
+        self.repo.mark_as_read(first_message)
+        self.assertTrue(self.repo.has_unread_messages_for_user(self.addressee.id))
+        self.repo.mark_as_read(second_message)
+        self.assertFalse(self.repo.has_unread_messages_for_user(self.addressee.id))
+
+    def test_company_has_unread_messages_after_receiving_one(self) -> None:
+        company = self.company_generator.create_company()
+        self.assertFalse(self.repo.has_unread_messages_for_user(company.id))
+        self._create_message(addressee=company)
+        self.assertTrue(self.repo.has_unread_messages_for_user(company.id))
+        self.assertFalse(self.repo.has_unread_messages_for_user(self.addressee.id))
+
     def test_no_user_messages_are_retrieved_when_none_were_created(self) -> None:
-        messages = list(self.repo.get_messages_to_user(self.addressee.id))
+        messages = self.repo.get_messages_to_user(
+            self.addressee.id, PageRequest()
+        ).items
         self.assertFalse(messages)
 
     def test_one_user_message_is_retrieved_if_one_was_created(self) -> None:
         self._create_message()
-        messages = list(self.repo.get_messages_to_user(self.addressee.id))
+        messages = self.repo.get_messages_to_user(
+            self.addressee.id, PageRequest()
+        ).items
         self.assertEqual(len(messages), 1)
 
+    def test_messages_to_user_are_paginated(self) -> None:
+        messages = [self._create_message() for _ in range(3)]
+        first_page = self.repo.get_messages_to_user(
+            self.addressee.id, PageRequest(size=2)
+        )
+        second_page = self.repo.get_messages_to_user(
+            self.addressee.id, PageRequest(cursor=first_page.next_cursor, size=2)
+        )
+        self.assertIsNone(second_page.next_cursor)
+        self.assertEqual(
+            sorted(message.id for message in first_page.items + second_page.items),
+            sorted(message.id for message in messages),
+        )
+
+    def test_messages_to_user_are_listed_newest_first(self) -> None:
+        messages = [
+            self._create_message(sent_on=datetime(2021, 1, day)) for day in [2, 3, 1]
+        ]
+        listed = self.repo.get_messages_to_user(self.addressee.id, PageRequest()).items
+        self.assertEqual(
+            [message.id for message in listed],
+            [messages[1].id, messages[0].id, messages[2].id],
+        )
+
+    def test_new_messages_do_not_show_up_on_following_pages(self) -> None:
+        older_messages = [
+            self._create_message(sent_on=datetime(2021, 1, day)) for day in [1, 2, 3]
+        ]
+        first_page = self.repo.get_messages_to_user(
+            self.addressee.id, PageRequest(size=2)
+        )
+        self._create_message(sent_on=datetime(2021, 1, 4))
+        second_page = self.repo.get_messages_to_user(
+            self.addressee.id, PageRequest(cursor=first_page.next_cursor, size=2)
+        )
+        self.assertEqual(
+            [message.id for message in second_page.items], [older_messages[0].id]
+        )
+
     def test_other_user(self) -> None:
         other_user = self.member_generator.create_member()
         self._create_message(addressee=other_user)
-        messages = list(self.repo.get_messages_to_user(self.addressee.id))
+        messages = self.repo.get_messages_to_user(
+            self.addressee.id, PageRequest()
+        ).items
         self.assertFalse(messages)
 
+    def test_listed_messages_show_the_names_of_their_senders(self) -> None:
+        company = self.company_generator.create_company(name="test company")
+        for sender in [self.sender, company, self.social_accounting]:
+            self._create_message(sender=sender)
+        messages = self.repo.get_messages_to_user(
+            self.addressee.id, PageRequest()
+        ).items
+        self.assertEqual(
+            sorted(message.sender_name for message in messages),
+            sorted(
+                [
+                    self.sender.get_name(),
+                    "test company",
+                    self.social_accounting.get_name(),
+                ]
+            ),
+        )
+
+    def test_messages_to_user_are_listed_with_a_single_query(self) -> None:
+        company = self.company_generator.create_company()
+        for sender in [self.sender, company, self.social_accounting] * 3:
+            self._create_message(
+                sender=sender,
+                user_action=UserAction(
+                    type=UserActionType.answer_invite, reference=uuid4()
+                ),
+            )
+        # Resolve the name of the social accounting once beforehand.
+        self.repo.get_messages_to_user(self.addressee.id, PageRequest())
+        queries: List[Any] = []
+
+        def record(*args: Any) -> None:
+            queries.append(args)
+
+        event.listen(self.db.engine, "before_cursor_execute", record)
+        try:
+            messages = self.repo.get_messages_to_user(
+                self.addressee.id, PageRequest()
+            ).items
+        finally:
+            event.remove(self.db.engine, "before_cursor_execute", record)
+        self.assertEqual(len(messages), 9)
+        self.assertEqual(len(queries), 1)
+
+    def test_message_retrieved_by_id_has_sender_of_the_right_kind(self) -> None:
+        for sender in [
+            self.sender,
+            self.company_generator.create_company(),
+            self.social_accounting,
+        ]:
+            with self.subTest(sender=sender):
+                message = self._create_message(sender=sender)
+                retrieved_message = self.repo.get_by_id(message.id)
+                assert retrieved_message
+                self.assertEqual(retrieved_message.sender, sender)
+
     def _create_message(
         self,
         sender: Union[None, Company, Member, SocialAccounting] = None,
@@ -183,11 +306,14 @@ class MessageRepositoryTests(TestCase):
         content: str = "test content",
         sender_remarks: Optional[str] = None,
         user_action: Optional[UserAction] = None,
+        sent_on: Optional[datetime] = None,
     ) -> Message:
         if sender is None:
             sender = self.sender
         if addressee is None:
             addressee = self.addressee
+        if sent_on is None:
+            sent_on = datetime.now()
         return self.repo.create_message(
             sender=sender,
             addressee=addressee,
@@ -195,4 +321,5 @@ class MessageRepositoryTests(TestCase):
             content=content,
             sender_remarks=sender_remarks,
             reference=user_action,
+            sent_on=sent_on,
         )
@@ -86,6 +86,75 @@ def test_possible_to_add_and_to_remove_plan_to_cooperation(
     assert plan_from_orm.cooperation is None
 
 
+@injection_test
+def test_stored_price_of_cooperation_is_reset_when_plan_is_added(
+    repository: PlanCooperationRepository,
+    plan_generator: PlanGenerator,
+    cooperation_repository: CooperationRepository,
+    company_generator: CompanyGenerator,
+):
+    cooperation = cooperation_repository.create_cooperation(
+        creation_timestamp=datetime.now(),
+        name="test name",
+        definition="test description",
+        coordinator=company_generator.create_company(),
+    )
+    cooperation_repository.set_price_per_unit(cooperation.id, Decimal(1))
+    repository.add_plan_to_cooperation(plan_generator.create_plan().id, cooperation.id)
+    assert cooperation_repository.get_price_per_unit(cooperation.id) is None
+
+
+@injection_test
+def test_stored_price_of_cooperation_is_reset_when_plan_is_removed(
+    repository: PlanCooperationRepository,
+    plan_generator: PlanGenerator,
+    cooperation_repository: CooperationRepository,
+    company_generator: CompanyGenerator,
+):
+    cooperation = cooperation_repository.create_cooperation(
+        creation_timestamp=datetime.now(),
+        name="test name",
+        definition="test description",
+        coordinator=company_generator.create_company(),
+    )
+    plan = plan_generator.create_plan()
+    repository.add_plan_to_cooperation(plan.id, cooperation.id)
+    cooperation_repository.set_price_per_unit(cooperation.id, Decimal(1))
+    repository.remove_plan_from_cooperation(plan.id)
+    assert cooperation_repository.get_price_per_unit(cooperation.id) is None
+
+
+@injection_test
+def test_plans_of_requested_cooperations_are_grouped_by_cooperation(
+    repository: PlanCooperationRepository,
+    plan_generator: PlanGenerator,
+    cooperation_repository: CooperationRepository,
+    company_generator: CompanyGenerator,
+):
+    coordinator = company_generator.create_company()
+    cooperation1, cooperation2, other_cooperation, empty_cooperation = [
+        cooperation_repository.create_cooperation(
+            creation_timestamp=datetime.now(),
+            name="test name",
+            definition="test description",
+            coordinator=coordinator,
+        )
+        for _ in range(4)
+    ]
+    plan1, plan2, plan3, other_plan = [plan_generator.create_plan() for _ in range(4)]
+    repository.add_plan_to_cooperation(plan1.id, cooperation1.id)
+    repository.add_plan_to_cooperation(plan2.id, cooperation1.id)
+    repository.add_plan_to_cooperation(plan3.id, cooperation2.id)
+    repository.add_plan_to_cooperation(other_plan.id, other_cooperation.id)
+    plans = repository.get_plans_in_cooperations(
+        [cooperation1.id, cooperation2.id, empty_cooperation.id]
+    )
+    assert {
+        cooperation: {plan.id for plan in cooperating_plans}
+        for cooperation, cooperating_plans in plans.items()
+    } == {cooperation1.id: {plan1.id, plan2.id}, cooperation2.id: {plan3.id}}
+
+
 @injection_test
 def test_correct_inbound_requests_are_returned(
     repository: PlanCooperationRepository,
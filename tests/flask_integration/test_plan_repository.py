@@ -4,6 +4,7 @@ from typing import Union
 from uuid import uuid4
 
 from arbeitszeit.entities import ProductionCosts
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit_flask.database.repositories import PlanRepository
 from tests.datetime_service import FakeDatetimeService
 
@@ -107,6 +108,93 @@ def test_sum_of_active_planned_means_calculated_correctly(
     assert plan_repository.sum_of_active_planned_means() == 5
 
 
+@injection_test
+def test_expired_plans_are_not_included_in_planned_work(
+    plan_repository: PlanRepository,
+    plan_generator: PlanGenerator,
+):
+    plan_generator.create_plan(
+        activation_date=datetime.min,
+        costs=production_costs(2, 0, 0),
+    )
+    plan_generator.create_plan(
+        activation_date=datetime.min,
+        costs=production_costs(3, 0, 0),
+        expired=True,
+    )
+    assert plan_repository.sum_of_active_planned_work() == 2
+    assert plan_repository.count_active_plans() == 1
+
+
+@injection_test
+def test_activating_an_active_plan_again_does_not_count_it_twice(
+    plan_repository: PlanRepository,
+    plan_generator: PlanGenerator,
+):
+    plan = plan_generator.create_plan(
+        activation_date=datetime.min,
+        costs=production_costs(2, 0, 0),
+    )
+    plan_repository.activate_plan(plan, datetime.min)
+    assert plan_repository.sum_of_active_planned_work() == 2
+    assert plan_repository.count_active_plans() == 1
+
+
+@injection_test
+def test_costs_per_day_of_active_productive_plans_are_summed_up(
+    plan_repository: PlanRepository,
+    plan_generator: PlanGenerator,
+):
+    assert plan_repository.sum_of_active_productive_costs_per_day() == (
+        production_costs(0, 0, 0)
+    )
+    plan_generator.create_plan(
+        activation_date=datetime.min, costs=production_costs(4, 6, 8), timeframe=2
+    )
+    plan_generator.create_plan(
+        activation_date=datetime.min, costs=production_costs(5, 5, 5), timeframe=5
+    )
+    plan_generator.create_plan(
+        activation_date=datetime.min,
+        costs=production_costs(9, 9, 9),
+        timeframe=1,
+        is_public_service=True,
+    )
+    plan_generator.create_plan(costs=production_costs(9, 9, 9), timeframe=1)
+    assert plan_repository.sum_of_active_productive_costs_per_day() == (
+        production_costs(3, 4, 5)
+    )
+
+
+@injection_test
+def test_costs_per_day_of_active_public_plans_are_summed_up(
+    plan_repository: PlanRepository,
+    plan_generator: PlanGenerator,
+):
+    assert plan_repository.sum_of_active_public_costs_per_day() == (
+        production_costs(0, 0, 0)
+    )
+    plan_generator.create_plan(
+        activation_date=datetime.min,
+        costs=production_costs(4, 6, 8),
+        timeframe=2,
+        is_public_service=True,
+    )
+    plan_generator.create_plan(
+        activation_date=datetime.min,
+        costs=production_costs(9, 9, 9),
+        timeframe=1,
+        is_public_service=True,
+        expired=True,
+    )
+    plan_generator.create_plan(
+        activation_date=datetime.min, costs=production_costs(9, 9, 9), timeframe=1
+    )
+    assert plan_repository.sum_of_active_public_costs_per_day() == (
+        production_costs(2, 3, 4)
+    )
+
+
 @injection_test
 def test_all_active_plans_get_retrieved(
     repository: PlanRepository,
@@ -253,9 +341,9 @@ def test_that_query_active_plans_by_exact_product_name_returns_plan(
     expected_plan = plan_generator.create_plan(
         activation_date=datetime.min, product_name="Delivery of goods"
     )
-    returned_plan = list(
-        repository.query_active_plans_by_product_name("Delivery of goods")
-    )
+    returned_plan = repository.query_active_plans_by_product_name(
+        "Delivery of goods", PageRequest()
+    ).items
     assert returned_plan
     assert returned_plan[0] == expected_plan
 
@@ -268,24 +356,108 @@ def test_that_query_active_plans_by_substring_of_product_name_returns_plan(
     expected_plan = plan_generator.create_plan(
         activation_date=datetime.min, product_name="Delivery of goods"
     )
-    returned_plan = list(repository.query_active_plans_by_product_name("very of go"))
+    returned_plan = repository.query_active_plans_by_product_name(
+        "very of go", PageRequest()
+    ).items
     assert returned_plan
     assert returned_plan[0] == expected_plan
 
 
 @injection_test
-def test_that_query_active_plans_by_substring_of_plan_id_returns_plan(
+def test_that_query_active_plans_by_prefix_of_plan_id_returns_plan(
     repository: PlanRepository,
     plan_generator: PlanGenerator,
 ) -> None:
     expected_plan = plan_generator.create_plan(activation_date=datetime.min)
     expected_plan_id = expected_plan.id
-    query = str(expected_plan_id)[3:8]
-    returned_plan = list(repository.query_active_plans_by_plan_id(query))
+    query = str(expected_plan_id)[:8]
+    returned_plan = repository.query_active_plans_by_plan_id(query, PageRequest()).items
     assert returned_plan
     assert returned_plan[0] == expected_plan
 
 
+@injection_test
+def test_that_query_active_plans_by_exact_plan_id_returns_plan(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    expected_plan = plan_generator.create_plan(activation_date=datetime.min)
+    returned_plan = repository.query_active_plans_by_plan_id(
+        str(expected_plan.id), PageRequest()
+    ).items
+    assert returned_plan == [expected_plan]
+
+
+@injection_test
+def test_that_query_active_plans_by_description_returns_plan(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    expected_plan = plan_generator.create_plan(
+        activation_date=datetime.min, description="Fresh bread from the oven"
+    )
+    returned_plan = repository.query_active_plans_by_product_name(
+        "the oven", PageRequest()
+    ).items
+    assert returned_plan == [expected_plan]
+
+
+@injection_test
+def test_that_plans_matching_the_product_name_are_ranked_first(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    description_match = plan_generator.create_plan(
+        activation_date=datetime.min,
+        product_name="Bread",
+        description="Goes well with butter",
+    )
+    name_match = plan_generator.create_plan(
+        activation_date=datetime.min,
+        product_name="Butter",
+        description="Made from milk",
+    )
+    returned_plans = repository.query_active_plans_by_product_name(
+        "butter", PageRequest()
+    ).items
+    assert returned_plans == [name_match, description_match]
+
+
+@injection_test
+def test_that_short_queries_for_product_names_return_plan(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    expected_plan = plan_generator.create_plan(
+        activation_date=datetime.min, product_name="Tea"
+    )
+    returned_plan = repository.query_active_plans_by_product_name(
+        "te", PageRequest()
+    ).items
+    assert expected_plan in returned_plan
+
+
+@injection_test
+def test_that_wildcards_in_product_name_queries_are_matched_literally(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan(activation_date=datetime.min, product_name="Tea")
+    assert not repository.query_active_plans_by_product_name("%", PageRequest()).items
+    assert not repository.query_active_plans_by_product_name("T_a", PageRequest()).items
+
+
+@injection_test
+def test_that_inactive_plans_are_not_found_by_product_name(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan(activation_date=None, product_name="Delivery of goods")
+    assert not repository.query_active_plans_by_product_name(
+        "Delivery", PageRequest()
+    ).items
+
+
 @injection_test
 def test_that_active_days_are_set(
     repository: PlanRepository,
@@ -312,6 +484,22 @@ def test_that_payout_count_is_increased_by_one(
     assert plan_from_repo.payout_count == 1
 
 
+@injection_test
+def test_that_payout_counts_of_several_plans_are_increased(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_1 = plan_generator.create_plan(activation_date=datetime.min)
+    plan_2 = plan_generator.create_plan(activation_date=datetime.min)
+    repository.increase_payout_counts([(plan_1, 3), (plan_2, 1)])
+    plan_1_from_repo = repository.get_plan_by_id(plan_1.id)
+    plan_2_from_repo = repository.get_plan_by_id(plan_2.id)
+    assert plan_1_from_repo
+    assert plan_2_from_repo
+    assert plan_1_from_repo.payout_count == 3
+    assert plan_2_from_repo.payout_count == 1
+
+
 @injection_test
 def test_that_availability_is_toggled_to_false(
     repository: PlanRepository,
@@ -357,3 +545,73 @@ def test_all_plans_approved_active_and_not_expired_returns_no_plans_with_empty_d
     repository: PlanRepository,
 ) -> None:
     assert not list(repository.all_plans_approved_active_and_not_expired())
+
+
+@injection_test
+def test_that_active_plans_are_paginated_by_product_name(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    for product_name in ["b", "c", "a"]:
+        plan_generator.create_plan(
+            activation_date=datetime.min, product_name=product_name
+        )
+    plan_generator.create_plan(activation_date=None, product_name="inactive")
+    first_page = repository.get_page_of_active_plans(PageRequest(size=2))
+    assert [plan.prd_name for plan in first_page.items] == ["a", "b"]
+    second_page = repository.get_page_of_active_plans(
+        PageRequest(cursor=first_page.next_cursor, size=2)
+    )
+    assert [plan.prd_name for plan in second_page.items] == ["c"]
+    assert second_page.next_cursor is None
+
+
+@injection_test
+def test_that_ranked_search_results_are_paginated_in_order_of_relevance(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    description_matches = [
+        plan_generator.create_plan(
+            activation_date=datetime.min,
+            product_name="Bread",
+            description="With butter",
+        )
+        for _ in range(2)
+    ]
+    name_match = plan_generator.create_plan(
+        activation_date=datetime.min, product_name="Butter", description="Salted"
+    )
+    returned_plans = []
+    page = PageRequest(size=1)
+    while True:
+        result = repository.query_active_plans_by_product_name("butter", page)
+        returned_plans += result.items
+        if result.next_cursor is None:
+            break
+        page = PageRequest(cursor=result.next_cursor, size=1)
+    assert returned_plans[0] == name_match
+    assert sorted(plan.id for plan in returned_plans[1:]) == sorted(
+        plan.id for plan in description_matches
+    )
+
+
+@injection_test
+def test_that_short_search_results_are_paginated(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    plans = [
+        plan_generator.create_plan(activation_date=datetime.min, product_name="Tea")
+        for _ in range(2)
+    ]
+    first_page = repository.query_active_plans_by_product_name(
+        "te", PageRequest(size=1)
+    )
+    second_page = repository.query_active_plans_by_product_name(
+        "te", PageRequest(cursor=first_page.next_cursor, size=1)
+    )
+    assert second_page.next_cursor is None
+    assert sorted(plan.id for plan in first_page.items + second_page.items) == sorted(
+        plan.id for plan in plans
+    )
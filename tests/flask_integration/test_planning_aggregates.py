@@ -0,0 +1,109 @@
+from datetime import datetime
+from decimal import Decimal
+
+from flask import Flask
+
+from arbeitszeit.entities import ProductionCosts
+from arbeitszeit_flask.database.planning_aggregates import (
+    PlanningAggregates,
+    PlanningTotals,
+)
+
+from ..data_generators import PlanGenerator
+from .dependency_injection import injection_test
+
+
+@injection_test
+def test_stored_totals_match_recalculated_totals(
+    aggregates: PlanningAggregates,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan(activation_date=datetime.min, timeframe=3)
+    plan_generator.create_plan(activation_date=datetime.min, timeframe=7)
+    plan_generator.create_plan(
+        activation_date=datetime.min, is_public_service=True, timeframe=6
+    )
+    plan_generator.create_plan(activation_date=datetime.min, expired=True)
+    plan_generator.create_plan()
+    for is_public_service, totals in aggregates.recalculate_totals().items():
+        assert aggregates.get_totals(is_public_service).is_close_to(totals)
+
+
+@injection_test
+def test_totals_of_all_plans_add_up_productive_and_public_plans(
+    aggregates: PlanningAggregates,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan(activation_date=datetime.min, timeframe=2)
+    plan_generator.create_plan(
+        activation_date=datetime.min, is_public_service=True, timeframe=4
+    )
+    totals = aggregates.get_totals_of_all_plans()
+    assert totals.active_plans == 2
+    assert totals.timeframe == 6
+
+
+@injection_test
+def test_manipulated_totals_differ_from_recalculated_totals(
+    aggregates: PlanningAggregates,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan(activation_date=datetime.min)
+    aggregates.store_totals({False: PlanningTotals.zero()})
+    recalculated_totals = aggregates.recalculate_totals()
+    assert not aggregates.get_totals(False).is_close_to(recalculated_totals[False])
+
+
+@injection_test
+def test_stored_totals_can_be_replaced_by_recalculated_totals(
+    aggregates: PlanningAggregates,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan(activation_date=datetime.min)
+    aggregates.store_totals({False: PlanningTotals.zero()})
+    recalculated_totals = aggregates.recalculate_totals()
+    aggregates.store_totals(recalculated_totals)
+    assert aggregates.get_totals(False).is_close_to(recalculated_totals[False])
+
+
+def test_totals_of_a_plan_contain_its_costs_per_day() -> None:
+    costs = ProductionCosts(Decimal(10), Decimal(20), Decimal(30))
+    totals = PlanningTotals.of_plan(costs, timeframe=10)
+    assert totals.costs_per_day == ProductionCosts(Decimal(1), Decimal(2), Decimal(3))
+
+
+@injection_test
+def test_check_command_succeeds_for_consistent_totals(
+    app: Flask,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan(activation_date=datetime.min)
+    result = app.test_cli_runner().invoke(args=["check-planning-aggregates"])
+    assert result.exit_code == 0
+
+
+@injection_test
+def test_check_command_fails_for_inconsistent_totals(
+    app: Flask,
+    aggregates: PlanningAggregates,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan(activation_date=datetime.min)
+    aggregates.store_totals({False: PlanningTotals.zero()})
+    result = app.test_cli_runner().invoke(args=["check-planning-aggregates"])
+    assert result.exit_code != 0
+
+
+@injection_test
+def test_check_command_repairs_inconsistent_totals(
+    app: Flask,
+    aggregates: PlanningAggregates,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan(activation_date=datetime.min)
+    aggregates.store_totals({False: PlanningTotals.zero()})
+    result = app.test_cli_runner().invoke(
+        args=["check-planning-aggregates", "--repair"]
+    )
+    assert result.exit_code == 0
+    assert aggregates.get_totals(False).active_plans == 1
@@ -0,0 +1,79 @@
+from tempfile import TemporaryDirectory
+from typing import Callable, List
+from unittest import TestCase
+
+from arbeitszeit_flask.plots.cache import PlotCache
+
+
+class PlotCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.cache = PlotCache(max_entries=2)
+        self.created_plots: List[str] = []
+
+    def test_plot_is_created_on_first_request(self) -> None:
+        png, source = self.cache.get_or_create("a", self.create_plot("a"))
+        self.assertEqual(png, b"a")
+        self.assertEqual(source, PlotCache.MISS)
+        self.assertEqual(self.cache.statistics.misses, 1)
+
+    def test_plot_is_taken_from_memory_on_second_request(self) -> None:
+        self.cache.get_or_create("a", self.create_plot("a"))
+        png, source = self.cache.get_or_create("a", self.create_plot("a"))
+        self.assertEqual(png, b"a")
+        self.assertEqual(source, PlotCache.MEMORY)
+        self.assertEqual(self.created_plots, ["a"])
+        self.assertEqual(self.cache.statistics.memory_hits, 1)
+
+    def test_least_recently_used_plot_is_evicted(self) -> None:
+        self.cache.get_or_create("a", self.create_plot("a"))
+        self.cache.get_or_create("b", self.create_plot("b"))
+        self.cache.get_or_create("a", self.create_plot("a"))
+        self.cache.get_or_create("c", self.create_plot("c"))
+        self.cache.get_or_create("a", self.create_plot("a"))
+        self.cache.get_or_create("b", self.create_plot("b"))
+        self.assertEqual(self.created_plots, ["a", "b", "c", "b"])
+
+    def test_plot_is_taken_from_disk_by_other_cache(self) -> None:
+        with TemporaryDirectory() as directory:
+            PlotCache(max_entries=2, directory=directory).get_or_create(
+                "a", self.create_plot("a")
+            )
+            other_cache = PlotCache(max_entries=2, directory=directory)
+            png, source = other_cache.get_or_create("a", self.create_plot("a"))
+        self.assertEqual(png, b"a")
+        self.assertEqual(source, PlotCache.DISK)
+        self.assertEqual(self.created_plots, ["a"])
+        self.assertEqual(other_cache.statistics.disk_hits, 1)
+
+    def test_number_of_plots_on_disk_is_limited(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = PlotCache(max_entries=0, directory=directory, max_disk_entries=1)
+            cache.get_or_create("a", self.create_plot("a"))
+            cache.get_or_create("b", self.create_plot("b"))
+            cache.get_or_create("a", self.create_plot("a"))
+        self.assertEqual(self.created_plots, ["a", "b", "a"])
+
+    def test_keys_of_equal_parameters_are_equal(self) -> None:
+        self.assertEqual(
+            PlotCache.key("bar", heights=[1, 2], fig_size=(5, 4)),
+            PlotCache.key("bar", fig_size=(5, 4), heights=[1, 2]),
+        )
+
+    def test_keys_of_different_parameters_differ(self) -> None:
+        self.assertNotEqual(
+            PlotCache.key("bar", heights=[1, 2]),
+            PlotCache.key("bar", heights=[2, 1]),
+        )
+
+    def test_keys_of_different_plot_kinds_differ(self) -> None:
+        self.assertNotEqual(
+            PlotCache.key("bar", heights=[1, 2]),
+            PlotCache.key("line", heights=[1, 2]),
+        )
+
+    def create_plot(self, content: str) -> Callable[[], bytes]:
+        def create() -> bytes:
+            self.created_plots.append(content)
+            return content.encode()
+
+        return create
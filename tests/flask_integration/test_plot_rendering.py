@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+import time
+from decimal import Decimal
+from typing import List, Union
+from unittest import TestCase
+
+from arbeitszeit_flask.flask_plotter import FlaskPlotter, render_bar_plot
+from arbeitszeit_flask.plots.rendering import PlotRenderer, PlotRenderingUnavailable
+
+
+def render_process_name() -> bytes:
+    return multiprocessing.current_process().name.encode()
+
+
+def render_slowly(seconds: float) -> bytes:
+    time.sleep(seconds)
+    return b"slow"
+
+
+def crash_in_pool() -> bytes:
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return b"inline"
+
+
+class InlineRenderingTests(TestCase):
+    def test_plot_is_rendered_in_calling_process_without_pool(self) -> None:
+        renderer = PlotRenderer(processes=0, max_queued_plots=1, timeout=1)
+        self.assertEqual(
+            renderer.render(render_process_name),
+            multiprocessing.current_process().name.encode(),
+        )
+
+    def test_plotter_returns_png(self) -> None:
+        plotter = FlaskPlotter(PlotRenderer(processes=0, max_queued_plots=1, timeout=1))
+        png = plotter.create_bar_plot(
+            x_coordinates=["a", "b"],
+            height_of_bars=[Decimal(1), Decimal(2)],
+            colors_of_bars=["red", "blue"],
+            fig_size=(5, 4),
+            y_label=None,
+        )
+        self.assertTrue(png.startswith(b"\x89PNG"))
+
+
+class PoolRenderingTests(TestCase):
+    def test_plot_is_rendered_in_other_process(self) -> None:
+        renderer = self.create_renderer(timeout=60)
+        self.assertNotEqual(
+            renderer.render(render_process_name),
+            multiprocessing.current_process().name.encode(),
+        )
+
+    def test_plot_rendered_in_pool_equals_plot_rendered_inline(self) -> None:
+        renderer = self.create_renderer(timeout=60)
+        x_coordinates: List[Union[int, str]] = ["a", "b"]
+        height_of_bars = [Decimal(1), Decimal(2)]
+        self.assertEqual(
+            renderer.render(
+                render_bar_plot,
+                x_coordinates,
+                height_of_bars,
+                ["red", "blue"],
+                (5, 4),
+                "Hours",
+            ),
+            render_bar_plot(
+                x_coordinates, height_of_bars, ["red", "blue"], (5, 4), "Hours"
+            ),
+        )
+
+    def test_plot_that_takes_too_long_blocks_the_queue(self) -> None:
+        renderer = self.create_renderer(timeout=60)
+        renderer.render(render_slowly, 0)
+        renderer.timeout = 0.1
+        with self.assertRaises(PlotRenderingUnavailable):
+            renderer.render(render_slowly, 1)
+        renderer.timeout = 60
+        with self.assertRaises(PlotRenderingUnavailable):
+            renderer.render(render_slowly, 0)
+
+    def test_plot_is_rendered_inline_when_pool_breaks(self) -> None:
+        renderer = self.create_renderer(timeout=60)
+        self.assertEqual(renderer.render(crash_in_pool), b"inline")
+        self.assertEqual(renderer.render(render_slowly, 0), b"slow")
+
+    def create_renderer(self, timeout: float) -> PlotRenderer:
+        renderer = PlotRenderer(processes=1, max_queued_plots=1, timeout=timeout)
+        self.addCleanup(renderer.shutdown)
+        return renderer
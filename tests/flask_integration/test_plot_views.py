@@ -0,0 +1,79 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from arbeitszeit.use_cases.get_company_account_history import GetCompanyAccountHistory
+from tests.data_generators import TransactionGenerator
+
+from .flask import ViewTestCase
+
+
+class GlobalBarplotForPlansTests(ViewTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.login_member()
+        self.url = "/plots/global_barplot_for_plans?productive_plans=3&public_plans=2"
+
+    def test_plot_is_drawn_on_first_request(self) -> None:
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "image/png")
+        self.assertEqual(response.headers["X-Plot-Cache"], "miss")
+
+    def test_plot_is_cached_for_second_request(self) -> None:
+        first_response = self.client.get(self.url)
+        second_response = self.client.get(self.url)
+        self.assertEqual(second_response.headers["X-Plot-Cache"], "memory")
+        self.assertEqual(first_response.data, second_response.data)
+
+    def test_response_has_strong_etag(self) -> None:
+        response = self.client.get(self.url)
+        etag, is_weak = response.get_etag()
+        self.assertTrue(etag)
+        self.assertFalse(is_weak)
+
+    def test_plots_with_different_data_have_different_etags(self) -> None:
+        response = self.client.get(self.url)
+        other_response = self.client.get(
+            "/plots/global_barplot_for_plans?productive_plans=4&public_plans=2"
+        )
+        self.assertNotEqual(response.get_etag(), other_response.get_etag())
+
+    def test_request_with_matching_etag_is_not_modified(self) -> None:
+        etag, _ = self.client.get(self.url).get_etag()
+        response = self.client.get(self.url, headers={"If-None-Match": f'"{etag}"'})
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(response.data)
+
+    def test_request_with_other_etag_gets_the_plot(self) -> None:
+        response = self.client.get(self.url, headers={"If-None-Match": '"other"'})
+        self.assertEqual(response.status_code, 200)
+
+
+class LinePlotOfCompanyAccountTests(ViewTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.company, _, _ = self.login_company()
+        self.transaction_generator = self.injector.get(TransactionGenerator)
+        self.url = f"/plots/line_plot_of_company_a_account?company_id={self.company.id}"
+
+    def test_plot_is_cached_for_second_request(self) -> None:
+        self.client.get(self.url)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["X-Plot-Cache"], "memory")
+
+    def test_revalidation_does_not_read_the_account_history(self) -> None:
+        etag, _ = self.client.get(self.url).get_etag()
+        with patch.object(GetCompanyAccountHistory, "__call__") as get_history:
+            response = self.client.get(self.url, headers={"If-None-Match": f'"{etag}"'})
+        self.assertEqual(response.status_code, 304)
+        get_history.assert_not_called()
+
+    def test_etag_changes_with_transactions_of_the_account(self) -> None:
+        etag = self.client.get(self.url).get_etag()
+        self.transaction_generator.create_transaction(
+            receiving_account=self.company.work_account, amount_received=Decimal(3)
+        )
+        response = self.client.get(self.url, headers={"If-None-Match": f'"{etag[0]}"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.get_etag(), etag)
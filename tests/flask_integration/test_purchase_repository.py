@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit_flask.database.repositories import PurchaseRepository
 from tests.data_generators import MemberGenerator, PurchaseGenerator
 
@@ -19,5 +20,33 @@ def test_repository(
     later_purchase = purchase_generator.create_purchase(
         buyer=user, purchase_date=datetime(2001, 2, 2)
     )
-    result = list(repository.get_purchases_descending_by_date(user))
+    result = repository.get_purchases_descending_by_date(user, PageRequest()).items
     assert [later_purchase, earlier_purchase] == result
+
+
+@injection_test
+def test_purchases_are_paginated_by_date_without_skipping_simultaneous_purchases(
+    repository: PurchaseRepository,
+    purchase_generator: PurchaseGenerator,
+    member_generator: MemberGenerator,
+) -> None:
+    user = member_generator.create_member()
+    latest_purchase = purchase_generator.create_purchase(
+        buyer=user, purchase_date=datetime(2001, 1, 1)
+    )
+    simultaneous_purchases = [
+        purchase_generator.create_purchase(
+            buyer=user, purchase_date=datetime(2000, 1, 1)
+        )
+        for _ in range(2)
+    ]
+    first_page = repository.get_purchases_descending_by_date(user, PageRequest(size=2))
+    assert first_page.items[0] == latest_purchase
+    second_page = repository.get_purchases_descending_by_date(
+        user, PageRequest(cursor=first_page.next_cursor, size=2)
+    )
+    assert second_page.next_cursor is None
+    assert [first_page.items[1], *second_page.items] in [
+        simultaneous_purchases,
+        list(reversed(simultaneous_purchases)),
+    ]
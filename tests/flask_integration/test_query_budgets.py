@@ -0,0 +1,144 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from arbeitszeit.use_cases import GetCompanySummary, PlanFilter, QueryPlans
+from arbeitszeit_flask.database.repositories import (
+    AccountingRepository,
+    TransactionRepository,
+)
+from tests.data_generators import (
+    CompanyGenerator,
+    CooperationGenerator,
+    MemberGenerator,
+    PlanGenerator,
+)
+from tests.use_cases.test_query_plans import make_request
+
+from .dependency_injection import injection_test
+from .query_budget import QueryBudgetExceeded, QueryCounter, query_budget
+
+
+@injection_test
+@query_budget(QueryPlans, max_queries=4, constant=True)
+def test_query_plans_does_not_query_per_plan(
+    query_plans: QueryPlans,
+    plan_generator: PlanGenerator,
+    cooperation_generator: CooperationGenerator,
+) -> None:
+    request = make_request(None, PlanFilter.by_product_name)
+    cooperation = cooperation_generator.create_cooperation()
+    plan_generator.create_plan(activation_date=datetime.min, cooperation=cooperation)
+    query_plans(request)
+    for _ in range(5):
+        plan_generator.create_plan(activation_date=datetime.min)
+        plan_generator.create_plan(
+            activation_date=datetime.min, cooperation=cooperation
+        )
+    assert len(query_plans(request).results) == 11
+
+
+@injection_test
+@query_budget(GetCompanySummary, max_queries=20, constant=True)
+def test_get_company_summary_does_not_query_per_plan_or_transaction(
+    get_company_summary: GetCompanySummary,
+    company_generator: CompanyGenerator,
+    member_generator: MemberGenerator,
+    plan_generator: PlanGenerator,
+    transaction_repository: TransactionRepository,
+    accounting_repository: AccountingRepository,
+) -> None:
+    company = company_generator.create_company()
+    social_accounting = accounting_repository.get_or_create_social_accounting()
+    plan_generator.create_plan(planner=company, activation_date=datetime.min)
+    get_company_summary(company.id)
+    for _ in range(3):
+        plan = plan_generator.create_plan(planner=company, activation_date=datetime.min)
+        for sending_account in [
+            member_generator.create_member().account,
+            company_generator.create_company().means_account,
+            social_accounting.account,
+        ]:
+            transaction_repository.create_transaction(
+                datetime.min,
+                sending_account=sending_account,
+                receiving_account=company.product_account,
+                amount_sent=Decimal(1),
+                amount_received=Decimal(1),
+                purpose="test purpose",
+                plan_id=plan.id,
+            )
+    response = get_company_summary(company.id)
+    assert response
+    assert len(response.plan_details) == 4
+
+
+@injection_test
+def test_statements_are_counted_while_counter_is_active(
+    query_counter: QueryCounter,
+    plan_generator: PlanGenerator,
+    query_plans: QueryPlans,
+) -> None:
+    plan_generator.create_plan(activation_date=datetime.min)
+    with query_counter() as statements:
+        query_plans(make_request(None, PlanFilter.by_product_name))
+    assert statements
+    count = len(statements)
+    query_plans(make_request(None, PlanFilter.by_product_name))
+    assert len(statements) == count
+
+
+@injection_test
+def test_exceeding_the_budget_fails_the_test(
+    plan_generator: PlanGenerator,
+    query_plans: QueryPlans,
+) -> None:
+    @query_budget(QueryPlans, max_queries=0)
+    def query_plans_test() -> None:
+        query_plans(make_request(None, PlanFilter.by_product_name))
+
+    plan_generator.create_plan(activation_date=datetime.min)
+    with pytest.raises(QueryBudgetExceeded):
+        query_plans_test()
+
+
+@injection_test
+def test_sending_more_statements_than_on_first_call_fails_constant_budget(
+    company_generator: CompanyGenerator,
+    get_company_summary: GetCompanySummary,
+) -> None:
+    company = company_generator.create_company()
+
+    @query_budget(GetCompanySummary, constant=True)
+    def get_company_summary_test() -> None:
+        get_company_summary(company.id)
+        # Simulate a query that is sent per seeded row.
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(
+                GetCompanySummary,
+                "_get_expectations",
+                count_twice(GetCompanySummary._get_expectations),
+            )
+            get_company_summary(company.id)
+
+    with pytest.raises(QueryBudgetExceeded):
+        get_company_summary_test()
+
+
+@injection_test
+def test_budget_fails_when_use_case_is_not_called(query_plans: QueryPlans) -> None:
+    @query_budget(QueryPlans, max_queries=10)
+    def test_without_call() -> None:
+        pass
+
+    with pytest.raises(AssertionError):
+        test_without_call()
+
+
+def count_twice(method):
+    def wrapper(self, *args, **kwargs):
+        method(self, *args, **kwargs)
+        return method(self, *args, **kwargs)
+
+    return wrapper
@@ -1,3 +1,9 @@
+import re
+from datetime import datetime
+from html import unescape
+
+from tests.data_generators import PlanGenerator
+
 from .flask import ViewTestCase
 
 
@@ -27,6 +33,24 @@ class AuthenticatedMemberTests(ViewTestCase):
         response = self.client.post(self.url, data=self.default_data)
         self.assertEqual(response.status_code, 400)
 
+    def test_following_page_of_search_results_is_linked(self):
+        plan_generator = self.injector.get(PlanGenerator)
+        for _ in range(2):
+            plan_generator.create_plan(
+                activation_date=datetime.min, product_name="Bread"
+            )
+        response = self.client.post(
+            self.url + "?page_size=1", data=dict(select="Produktname", search="Bread")
+        )
+        html = response.get_data(as_text=True)
+        self.assertIn("cursor=", html)
+        next_page_url = re.search(r'href="(\?[^"]*cursor=[^"]*)"', html)
+        assert next_page_url
+        response = self.client.get(self.url + unescape(next_page_url.group(1)))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Bread", response.get_data(as_text=True))
+        self.assertNotIn("cursor=", response.get_data(as_text=True))
+
     def test_get_redirected_when_trying_to_access_query_plans_for_company(self):
         response = self.client.get(self.company_url)
         self.assertEqual(response.status_code, 302)
@@ -50,6 +50,7 @@ class UnauthenticatedAndUnconfirmedMemberTests(ViewTestCase):
                 ),
             )
             self.assertEqual(response.status_code, 302)
+            self.deliver_emails()
             assert len(outbox) == 1
             assert outbox[0].sender == "test_sender@cp.org"
             assert outbox[0].recipients[0] == member_email
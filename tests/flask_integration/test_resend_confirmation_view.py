@@ -1,4 +1,5 @@
-from arbeitszeit_flask.extensions import mail
+from arbeitszeit_flask.extensions import db, mail
+from arbeitszeit_flask.models import OutgoingEmail
 from arbeitszeit_flask.token import FlaskTokenService
 
 from .flask import ViewTestCase
@@ -24,14 +25,36 @@ class AuthenticatedButUnconfirmedMemberTests(ViewTestCase):
         self,
     ):
         response = self.client.get(self.url)
+        self.deliver_emails()
         member_token = FlaskTokenService().generate_token(self.email)
         with mail.record_messages() as outbox:
             response = self.client.get(
                 self.url,
             )
             self.assertEqual(response.status_code, 302)
+            self.deliver_emails()
             assert len(outbox) == 1
             assert outbox[0].sender == "test_sender@cp.org"
             assert outbox[0].recipients[0] == self.email
             assert outbox[0].subject == "Please confirm your account"
             assert member_token in outbox[0].html
+
+    def test_queued_mail_outlives_the_session_of_the_request(self) -> None:
+        self.client.get(self.url)
+        # Flask-SQLAlchemy removes the session when the app context of a
+        # request ends, which discards everything that was not committed.
+        db.session.remove()
+        assert OutgoingEmail.query.filter_by(recipients=self.email).count() == 1
+
+
+class AuthenticatedButUnconfirmedCompanyTests(ViewTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.url = "/company/resend"
+        self.company, _, self.email = self.login_company()
+
+    def test_users_get_redirected_and_mail_gets_queued(self) -> None:
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 302)
+        db.session.remove()
+        assert OutgoingEmail.query.filter_by(recipients=self.email).count() == 1
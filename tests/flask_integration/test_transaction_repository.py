@@ -1,7 +1,11 @@
 from datetime import datetime
 from decimal import Decimal
 
-from arbeitszeit_flask.database.repositories import TransactionRepository
+from arbeitszeit.repositories import NewTransaction
+from arbeitszeit_flask.database.repositories import (
+    AccountRepository,
+    TransactionRepository,
+)
 from tests.data_generators import AccountGenerator, PlanGenerator
 
 from .dependency_injection import injection_test
@@ -61,5 +65,217 @@ def test_correct_sales_balance_of_plan_gets_returned(
         amount_sent=Decimal(12),
         amount_received=Decimal(10),
         purpose=f"test {plan.id} test",
+        plan_id=plan.id,
     )
     assert repository.get_sales_balance_of_plan(plan) == Decimal(10)
+
+
+@injection_test
+def test_sales_of_other_plans_of_the_same_company_are_not_counted(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan = plan_generator.create_plan()
+    other_plan = plan_generator.create_plan(planner=plan.planner)
+    repository.create_transaction(
+        datetime.now(),
+        sending_account=account_generator.create_account(),
+        receiving_account=plan.planner.product_account,
+        amount_sent=Decimal(12),
+        amount_received=Decimal(10),
+        purpose=f"Plan-Id: {other_plan.id}",
+        plan_id=other_plan.id,
+    )
+    assert repository.get_sales_balance_of_plan(plan) == Decimal(0)
+
+
+@injection_test
+def test_sales_balances_of_several_plans_are_returned_by_plan_id(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan = plan_generator.create_plan()
+    other_plan = plan_generator.create_plan()
+    plan_without_sales = plan_generator.create_plan(planner=plan.planner)
+    for sold_plan, receiving_account in [
+        (plan, plan.planner.product_account),
+        (plan, plan.planner.product_account),
+        (other_plan, other_plan.planner.product_account),
+        # Transfers to other accounts than the product account of the
+        # planner are no sales.
+        (other_plan, plan.planner.product_account),
+    ]:
+        repository.create_transaction(
+            datetime.now(),
+            sending_account=account_generator.create_account(),
+            receiving_account=receiving_account,
+            amount_sent=Decimal(12),
+            amount_received=Decimal(10),
+            purpose=f"Plan-Id: {sold_plan.id}",
+            plan_id=sold_plan.id,
+        )
+    assert repository.get_sales_balances_of_plans(
+        [plan, other_plan, plan_without_sales]
+    ) == {
+        plan.id: Decimal(20),
+        other_plan.id: Decimal(10),
+        plan_without_sales.id: Decimal(0),
+    }
+
+
+@injection_test
+def test_plan_reference_of_created_transaction_is_stored(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan = plan_generator.create_plan()
+    sender_account = account_generator.create_account()
+    repository.create_transaction(
+        datetime.now(),
+        sending_account=sender_account,
+        receiving_account=plan.planner.product_account,
+        amount_sent=Decimal(1),
+        amount_received=Decimal(1),
+        purpose="test purpose",
+        plan_id=plan.id,
+    )
+    [transaction] = repository.all_transactions_sent_by_account(sender_account)
+    assert transaction.plan_id == plan.id
+
+
+@injection_test
+def test_transactions_created_in_bulk_show_up_in_all_transactions_received_by_account(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    sender_account = account_generator.create_account()
+    receiver_account = account_generator.create_account()
+    repository.create_transactions(
+        [
+            NewTransaction(
+                date=datetime.now(),
+                sending_account=sender_account,
+                receiving_account=receiver_account,
+                amount_sent=Decimal(amount),
+                amount_received=Decimal(amount),
+                purpose="test purpose",
+            )
+            for amount in [1, 2]
+        ]
+    )
+    received = repository.all_transactions_received_by_account(receiver_account)
+    assert sorted(transaction.amount_received for transaction in received) == [1, 2]
+
+
+@injection_test
+def test_transactions_created_in_bulk_update_account_balances(
+    repository: TransactionRepository,
+    account_repository: AccountRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    sender_account = account_generator.create_account()
+    receiver_1 = account_generator.create_account()
+    receiver_2 = account_generator.create_account()
+    repository.create_transactions(
+        [
+            NewTransaction(
+                date=datetime.now(),
+                sending_account=sender_account,
+                receiving_account=receiver,
+                amount_sent=Decimal("1.5"),
+                amount_received=Decimal("1.5"),
+                purpose="test purpose",
+            )
+            for receiver in [receiver_1, receiver_2, receiver_2]
+        ]
+    )
+    assert account_repository.get_account_balance(sender_account) == Decimal("-4.5")
+    assert account_repository.get_account_balance(receiver_1) == Decimal("1.5")
+    assert account_repository.get_account_balance(receiver_2) == Decimal("3")
+    assert not account_repository.get_accounts_with_inconsistent_balance()
+
+
+@injection_test
+def test_transactions_of_accounts_are_ordered_by_date(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    account = account_generator.create_account()
+    other_account = account_generator.create_account()
+    unrelated_account = account_generator.create_account()
+    for date, sender, receiver in [
+        (datetime(2021, 1, 3), account, other_account),
+        (datetime(2021, 1, 1), other_account, account),
+        (datetime(2021, 1, 2), other_account, unrelated_account),
+    ]:
+        repository.create_transaction(
+            date,
+            sending_account=sender,
+            receiving_account=receiver,
+            amount_sent=Decimal(1),
+            amount_received=Decimal(1),
+            purpose="test purpose",
+        )
+    transactions = list(repository.get_transactions_of_accounts([account]))
+    assert [transaction.date for transaction in transactions] == [
+        datetime(2021, 1, 1),
+        datetime(2021, 1, 3),
+    ]
+    assert transactions[0].sending_account == other_account
+    assert transactions[0].receiving_account == account
+
+
+@injection_test
+def test_transactions_of_accounts_are_limited_to_date_range(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    account = account_generator.create_account()
+    other_account = account_generator.create_account()
+    for day in range(1, 6):
+        repository.create_transaction(
+            datetime(2021, 1, day),
+            sending_account=other_account,
+            receiving_account=account,
+            amount_sent=Decimal(1),
+            amount_received=Decimal(1),
+            purpose="test purpose",
+        )
+    transactions = repository.get_transactions_of_accounts(
+        [account], start=datetime(2021, 1, 2), end=datetime(2021, 1, 4)
+    )
+    assert [transaction.date for transaction in transactions] == [
+        datetime(2021, 1, 2),
+        datetime(2021, 1, 3),
+    ]
+
+
+@injection_test
+def test_transfers_between_queried_accounts_are_listed_once_newest_first(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    account = account_generator.create_account()
+    other_account = account_generator.create_account()
+    for day, sender, receiver in [
+        (1, account, other_account),
+        (2, other_account, account),
+    ]:
+        repository.create_transaction(
+            datetime(2021, 1, day),
+            sending_account=sender,
+            receiving_account=receiver,
+            amount_sent=Decimal(1),
+            amount_received=Decimal(1),
+            purpose="test purpose",
+        )
+    transactions = repository.get_transactions_of_accounts(
+        [account, other_account], newest_first=True
+    )
+    assert [transaction.date for transaction in transactions] == [
+        datetime(2021, 1, 2),
+        datetime(2021, 1, 1),
+    ]
@@ -0,0 +1,116 @@
+from typing import Any, List
+from uuid import uuid4
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
+from arbeitszeit_flask.dependency_injection import with_injection
+from arbeitszeit_flask.user_loader import Principal, PrincipalCache, UserLoader
+from tests.data_generators import AccountantGenerator, MemberGenerator
+
+from .dependency_injection import injection_test
+from .flask import ViewTestCase
+
+
+@injection_test
+def test_member_is_loaded_as_principal(
+    user_loader: UserLoader,
+    member_generator: MemberGenerator,
+) -> None:
+    member = member_generator.create_member(name="test name", email="test@cp.org")
+    principal = user_loader(str(member.id), "member")
+    assert principal == Principal(
+        id=str(member.id),
+        user_type="member",
+        name="test name",
+        email="test@cp.org",
+        confirmed_on=None,
+    )
+
+
+@injection_test
+def test_unknown_users_are_not_loaded(
+    user_loader: UserLoader,
+    member_generator: MemberGenerator,
+) -> None:
+    member = member_generator.create_member()
+    assert user_loader(str(uuid4()), "member") is None
+    assert user_loader(str(member.id), "company") is None
+    assert user_loader(str(member.id), "unknown type") is None
+    assert user_loader("not an id", "member") is None
+
+
+@injection_test
+def test_unconfirmed_members_are_not_cached(
+    user_loader: UserLoader,
+    member_generator: MemberGenerator,
+) -> None:
+    member = member_generator.create_member()
+    user_loader(str(member.id), "member")
+    assert user_loader.cache.get(str(member.id), "member") is None
+
+
+@injection_test
+def test_cached_accountant_is_loaded_without_queries(
+    user_loader: UserLoader,
+    accountant_generator: AccountantGenerator,
+    db: SQLAlchemy,
+) -> None:
+    accountant_id = str(accountant_generator.create_accountant())
+    principal = user_loader(accountant_id, "accountant")
+    queries: List[Any] = []
+
+    def record(*args: Any) -> None:
+        queries.append(args)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        assert user_loader(accountant_id, "accountant") == principal
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    assert not queries
+
+
+def test_cached_principals_expire() -> None:
+    cache = PrincipalCache(time_to_live=0)
+    cache.put(create_principal())
+    assert cache.get("id", "member") is None
+
+
+def test_invalidated_principals_are_removed_from_cache() -> None:
+    cache = PrincipalCache(time_to_live=60)
+    cache.put(create_principal())
+    assert cache.get("id", "member")
+    cache.invalidate("id")
+    assert cache.get("id", "member") is None
+
+
+def test_cache_does_not_grow_beyond_max_entries() -> None:
+    cache = PrincipalCache(time_to_live=60, max_entries=2)
+    for user_id in ["a", "b", "c"]:
+        cache.put(create_principal(user_id))
+    assert cache.get("c", "member")
+    assert len([id for id in "abc" if cache.get(id, "member")]) <= 2
+
+
+def create_principal(user_id: str = "id") -> Principal:
+    return Principal(
+        id=user_id,
+        user_type="member",
+        name="name",
+        email="email",
+        confirmed_on=None,
+    )
+
+
+class LogoutTests(ViewTestCase):
+    def test_confirmed_member_is_removed_from_cache_on_logout(self) -> None:
+        member, _, email = self.login_member()
+        self.confirm_member(member=member, email=email)
+        response = self.client.get("/member/profile")
+        self.assertEqual(response.status_code, 200)
+        with self.app.app_context():
+            cache = with_injection().get_injector().get(PrincipalCache)
+        self.assertTrue(cache.get(str(member.id), "member"))
+        self.client.get("/logout")
+        self.assertIsNone(cache.get(str(member.id), "member"))
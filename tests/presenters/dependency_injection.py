@@ -28,6 +28,7 @@ from arbeitszeit_web.presenters.end_cooperation_presenter import EndCooperationP
 from arbeitszeit_web.presenters.get_latest_activated_plans_presenter import (
     GetLatestActivatedPlansPresenter,
 )
+from arbeitszeit_web.presenters.list_workers_presenter import ListWorkersPresenter
 from arbeitszeit_web.presenters.log_in_member_presenter import LogInMemberPresenter
 from arbeitszeit_web.presenters.register_accountant_presenter import (
     RegisterAccountantPresenter,
@@ -282,9 +283,15 @@ class PresenterTestsInjector(Module):
 
     @provider
     def provide_list_messages_presenter(
-        self, messages_url_index: MessageUrlIndex
+        self, messages_url_index: MessageUrlIndex, request: FakeRequest
     ) -> ListMessagesPresenter:
-        return ListMessagesPresenter(url_index=messages_url_index)
+        return ListMessagesPresenter(url_index=messages_url_index, request=request)
+
+    @provider
+    def provide_list_workers_presenter(
+        self, request: FakeRequest
+    ) -> ListWorkersPresenter:
+        return ListWorkersPresenter(request=request)
 
     @provider
     def provide_pay_consumer_product_presenter(
@@ -327,11 +334,13 @@ class PresenterTestsInjector(Module):
         notifier: Notifier,
         company_url_index: CompanySummaryUrlIndex,
         translator: FakeTranslator,
+        request: FakeRequest,
     ) -> QueryCompaniesPresenter:
         return QueryCompaniesPresenter(
             user_notifier=notifier,
             company_url_index=company_url_index,
             translator=translator,
+            request=request,
         )
 
     @provider
@@ -341,12 +350,14 @@ class PresenterTestsInjector(Module):
         plan_url_index: PlanSummaryUrlIndexTestImpl,
         company_url_index: CompanySummaryUrlIndex,
         translator: FakeTranslator,
+        request: FakeRequest,
     ) -> QueryPlansPresenter:
         return QueryPlansPresenter(
             plan_url_index=plan_url_index,
             company_url_index=company_url_index,
             user_notifier=notifier,
             trans=translator,
+            request=request,
         )
 
     @provider
@@ -0,0 +1,73 @@
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from unittest import TestCase
+
+from arbeitszeit.entities import AccountTypes
+from arbeitszeit.transactions import TransactionTypes
+from arbeitszeit.use_cases.export_transactions import ExportTransactions
+from arbeitszeit_web.export_transactions import ExportTransactionsPresenter
+
+TRANSACTION = ExportTransactions.ExportedTransaction(
+    date=datetime(2021, 5, 1, 12, 30),
+    account_type=AccountTypes.p,
+    transaction_type=TransactionTypes.payment_of_fixed_means,
+    transaction_volume=Decimal("-12.5"),
+    purpose='Purpose with "quotes", commas\nand a line break',
+)
+
+
+class ExportTransactionsPresenterTests(TestCase):
+    def setUp(self) -> None:
+        self.presenter = ExportTransactionsPresenter()
+
+    def test_csv_without_transactions_has_only_a_header(self) -> None:
+        lines = list(
+            self.presenter.present_as_csv(ExportTransactions.Response(iter([])))
+        )
+        self.assertEqual(
+            lines,
+            ["date,account_type,transaction_type,transaction_volume,purpose\r\n"],
+        )
+
+    def test_csv_rows_can_be_read_back(self) -> None:
+        content = "".join(
+            self.presenter.present_as_csv(
+                ExportTransactions.Response(iter([TRANSACTION, TRANSACTION]))
+            )
+        )
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(
+            rows[0],
+            dict(
+                date="2021-05-01T12:30:00",
+                account_type="p",
+                transaction_type="payment_of_fixed_means",
+                transaction_volume="-12.5",
+                purpose=TRANSACTION.purpose,
+            ),
+        )
+
+    def test_ndjson_has_one_object_per_line(self) -> None:
+        lines = list(
+            self.presenter.present_as_ndjson(
+                ExportTransactions.Response(iter([TRANSACTION, TRANSACTION]))
+            )
+        )
+        self.assertEqual(len(lines), 2)
+        for line in lines:
+            self.assertTrue(line.endswith("\n"))
+            self.assertEqual(json.loads(line)["purpose"], TRANSACTION.purpose)
+
+    def test_transactions_are_presented_while_they_are_consumed(self) -> None:
+        def transactions():
+            yield TRANSACTION
+            raise AssertionError("Only the first transaction should be read")
+
+        lines = self.presenter.present_as_ndjson(
+            ExportTransactions.Response(transactions())
+        )
+        self.assertEqual(json.loads(next(lines))["account_type"], "p")
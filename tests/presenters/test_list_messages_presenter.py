@@ -18,7 +18,7 @@ class ListMessagesPresenterTests(TestCase):
         self.presenter = self.injector.get(ListMessagesPresenter)
 
     def test_view_model_contains_no_messages_when_non_were_provided(self) -> None:
-        response = ListMessagesResponse(messages=[])
+        response = ListMessagesResponse(messages=[], next_cursor=None)
         view_model = self.presenter.present(response)
         self.assertFalse(view_model.messages)
 
@@ -61,12 +61,23 @@ class ListMessagesPresenterTests(TestCase):
         )
         self.assertEqual(expected_url, view_model.messages[0].message_url)
 
+    def test_no_next_page_url_is_shown_on_the_last_page(self) -> None:
+        view_model = self.presenter.present(self._create_response_with_one_message())
+        self.assertIsNone(view_model.next_page_url)
+
+    def test_next_page_url_is_shown_when_there_are_more_messages(self) -> None:
+        view_model = self.presenter.present(
+            self._create_response_with_one_message(next_cursor="abc")
+        )
+        self.assertEqual(view_model.next_page_url, "?cursor=abc")
+
     def _create_response_with_one_message(
         self,
         title: str = "test title",
         sender_name: str = "sender name",
         is_read: bool = True,
         message_id: Optional[UUID] = None,
+        next_cursor: Optional[str] = None,
     ) -> ListMessagesResponse:
         if message_id is None:
             message_id = uuid4()
@@ -78,5 +89,6 @@ class ListMessagesPresenterTests(TestCase):
                     message_id=message_id,
                     is_read=is_read,
                 )
-            ]
+            ],
+            next_cursor=next_cursor,
         )
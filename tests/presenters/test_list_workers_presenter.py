@@ -57,15 +57,22 @@ class PresenterTests(TestCase):
             str(expected_id),
         )
 
+    def test_that_next_page_url_is_shown_when_there_are_more_workers(self) -> None:
+        response = self.create_response(workers=1)
+        response.next_cursor = "abc"
+        view_model = self.presenter.show_workers_list(response)
+        self.assertEqual(view_model.next_page_url, "?cursor=abc")
+
     def create_empty_response(self) -> ListWorkersResponse:
-        return ListWorkersResponse([])
+        return ListWorkersResponse([], next_cursor=None)
 
     def create_response(self, workers: int) -> ListWorkersResponse:
         return ListWorkersResponse(
             [
                 ListedWorker(id=uuid4(), name="test worker", email="test@mail.test")
                 for _ in range(workers)
-            ]
+            ],
+            next_cursor=None,
         )
 
     def create_one_worker_response(
@@ -74,5 +81,6 @@ class PresenterTests(TestCase):
         if id is None:
             id = uuid4()
         return ListWorkersResponse(
-            workers=[ListedWorker(id=id, name=name, email="test@test.test")]
+            workers=[ListedWorker(id=id, name=name, email="test@test.test")],
+            next_cursor=None,
         )
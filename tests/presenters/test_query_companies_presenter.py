@@ -3,11 +3,12 @@ from uuid import uuid4
 
 from arbeitszeit.use_cases.query_companies import CompanyQueryResponse, QueriedCompany
 from arbeitszeit_web.query_companies import QueryCompaniesPresenter
+from tests.request import FakeRequest
 
 from .dependency_injection import get_dependency_injector
 from .notifier import NotifierTestImpl
 
-RESPONSE_WITHOUT_RESULTS = CompanyQueryResponse(results=[])
+RESPONSE_WITHOUT_RESULTS = CompanyQueryResponse(results=[], next_cursor=None)
 RESPONSE_WITH_ONE_RESULT = CompanyQueryResponse(
     results=[
         QueriedCompany(
@@ -15,7 +16,8 @@ RESPONSE_WITH_ONE_RESULT = CompanyQueryResponse(
             company_name="Company",
             company_email="company@cp.org",
         )
-    ]
+    ],
+    next_cursor=None,
 )
 
 
@@ -23,6 +25,7 @@ class QueryCompaniesPresenterTests(TestCase):
     def setUp(self):
         self.injector = get_dependency_injector()
         self.notifier = self.injector.get(NotifierTestImpl)
+        self.request = self.injector.get(FakeRequest)
         self.presenter = self.injector.get(QueryCompaniesPresenter)
 
     def test_empty_view_model_does_not_show_results(self):
@@ -40,3 +43,19 @@ class QueryCompaniesPresenterTests(TestCase):
     def test_dont_show_notifications_when_results_are_found(self):
         self.presenter.present(RESPONSE_WITH_ONE_RESULT)
         self.assertFalse(self.notifier.warnings)
+
+    def test_no_next_page_url_is_shown_on_the_last_page(self):
+        presentation = self.presenter.present(RESPONSE_WITH_ONE_RESULT)
+        self.assertIsNone(presentation.next_page_url)
+
+    def test_next_page_url_keeps_search_form_fields(self):
+        self.request.set_form("select", "Email")
+        self.request.set_form("search", "cp.org")
+        presentation = self.presenter.present(
+            CompanyQueryResponse(
+                results=RESPONSE_WITH_ONE_RESULT.results, next_cursor="abc"
+            )
+        )
+        self.assertEqual(
+            presentation.next_page_url, "?select=Email&search=cp.org&cursor=abc"
+        )
@@ -5,6 +5,7 @@ from uuid import UUID, uuid4
 
 from arbeitszeit.use_cases.query_plans import PlanQueryResponse, QueriedPlan
 from arbeitszeit_web.query_plans import QueryPlansPresenter
+from tests.request import FakeRequest
 
 from .dependency_injection import get_dependency_injector
 from .notifier import NotifierTestImpl
@@ -22,6 +23,7 @@ class QueryPlansPresenterTests(TestCase):
         self.company_url_index = self.injector.get(CompanySummaryUrlIndex)
         self.coop_url_index = self.injector.get(CoopSummaryUrlIndexTestImpl)
         self.notifier = self.injector.get(NotifierTestImpl)
+        self.request = self.injector.get(FakeRequest)
         self.presenter = self.injector.get(QueryPlansPresenter)
 
     def test_presenting_empty_response_leads_to_not_showing_results(self):
@@ -33,6 +35,41 @@ class QueryPlansPresenterTests(TestCase):
         presentation = self.presenter.get_empty_view_model()
         self.assertFalse(presentation.show_results)
 
+    def test_no_next_page_url_is_shown_on_the_last_page(self):
+        response = self._get_response([self._get_queried_plan()])
+        presentation = self.presenter.present(response)
+        self.assertIsNone(presentation.next_page_url)
+
+    def test_next_page_url_contains_cursor_of_next_page(self):
+        response = self._get_response([self._get_queried_plan()])
+        response.next_cursor = "abc"
+        presentation = self.presenter.present(response)
+        self.assertEqual(presentation.next_page_url, "?cursor=abc")
+
+    def test_next_page_url_keeps_search_from_submitted_form(self):
+        self.request.set_form("select", "Produktname")
+        self.request.set_form("search", "bread & butter")
+        response = self._get_response([self._get_queried_plan()])
+        response.next_cursor = "abc"
+        presentation = self.presenter.present(response)
+        self.assertEqual(
+            presentation.next_page_url,
+            "?select=Produktname&search=bread+%26+butter&cursor=abc",
+        )
+
+    def test_next_page_url_keeps_search_and_page_size_from_query_arguments(self):
+        self.request.set_arg("select", "Plan-ID")
+        self.request.set_arg("search", "1234")
+        self.request.set_arg("page_size", "10")
+        self.request.set_arg("cursor", "previous")
+        response = self._get_response([self._get_queried_plan()])
+        response.next_cursor = "abc"
+        presentation = self.presenter.present(response)
+        self.assertEqual(
+            presentation.next_page_url,
+            "?select=Plan-ID&search=1234&page_size=10&cursor=abc",
+        )
+
     def test_non_empty_use_case_response_leads_to_showing_results(self):
         response = self._get_response([self._get_queried_plan()])
         presentation = self.presenter.present(response)
@@ -145,4 +182,6 @@ class QueryPlansPresenterTests(TestCase):
         )
 
     def _get_response(self, queried_plans: List[QueriedPlan]) -> PlanQueryResponse:
-        return PlanQueryResponse(results=[plan for plan in queried_plans])
+        return PlanQueryResponse(
+            results=[plan for plan in queried_plans], next_cursor=None
+        )
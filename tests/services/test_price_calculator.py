@@ -1,10 +1,15 @@
 from decimal import Decimal
+from typing import Tuple
 from unittest import TestCase
 
-from arbeitszeit.entities import ProductionCosts
-from arbeitszeit.price_calculator import calculate_price
-from tests.data_generators import PlanGenerator
+from arbeitszeit.entities import Plan, ProductionCosts
+from arbeitszeit.price_calculator import PriceCalculator, calculate_price
+from tests.data_generators import CooperationGenerator, PlanGenerator
 from tests.use_cases.dependency_injection import get_dependency_injector
+from tests.use_cases.repositories import (
+    CooperationRepository,
+    PlanCooperationRepository,
+)
 
 
 class TestPriceCalculator(TestCase):
@@ -77,3 +82,110 @@ class TestPriceCalculator(TestCase):
         self.assertEqual(
             price, Decimal(12)
         )  # coop price = 4h/day / 0,3333 pieces/day = 12h/piece
+
+
+class CooperativePriceTests(TestCase):
+    def setUp(self) -> None:
+        self.injector = get_dependency_injector()
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
+        self.cooperation_repository = self.injector.get(CooperationRepository)
+        self.price_calculator = self.injector.get(PriceCalculator)
+
+    def test_that_plan_without_cooperation_has_its_individual_price(self) -> None:
+        plan = self.plan_generator.create_plan()
+        self.assertEqual(
+            self.price_calculator.calculate_cooperative_price(plan),
+            self.price_calculator.calculate_individual_price(plan),
+        )
+
+    def test_that_price_is_calculated_when_cooperation_has_no_stored_price(
+        self,
+    ) -> None:
+        plan1, plan2 = self.create_plans()
+        self.cooperation_generator.create_cooperation(plans=[plan1, plan2])
+        self.assertEqual(
+            self.price_calculator.calculate_cooperative_price(plan1),
+            calculate_price([plan1, plan2]),
+        )
+
+    def test_that_stored_price_of_cooperation_is_used(self) -> None:
+        plan1, plan2 = self.create_plans()
+        cooperation = self.cooperation_generator.create_cooperation(
+            plans=[plan1, plan2]
+        )
+        self.cooperation_repository.set_price_per_unit(cooperation.id, Decimal(7))
+        self.assertEqual(
+            self.price_calculator.calculate_cooperative_price(plan1), Decimal(7)
+        )
+
+    def test_that_updating_the_cooperation_price_stores_it(self) -> None:
+        plan1, plan2 = self.create_plans()
+        cooperation = self.cooperation_generator.create_cooperation(
+            plans=[plan1, plan2]
+        )
+        self.price_calculator.update_cooperation_price(cooperation.id)
+        self.assertEqual(
+            self.cooperation_repository.get_price_per_unit(cooperation.id),
+            calculate_price([plan1, plan2]),
+        )
+
+    def test_that_cooperation_without_plans_has_no_stored_price(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.price_calculator.update_cooperation_price(cooperation.id)
+        self.assertIsNone(
+            self.cooperation_repository.get_price_per_unit(cooperation.id)
+        )
+
+    def test_that_stored_price_is_reset_when_plan_joins_cooperation(self) -> None:
+        plan1, plan2 = self.create_plans()
+        cooperation = self.cooperation_generator.create_cooperation(plans=[plan1])
+        self.price_calculator.update_cooperation_price(cooperation.id)
+        self.injector.get(PlanCooperationRepository).add_plan_to_cooperation(
+            plan2.id, cooperation.id
+        )
+        self.assertIsNone(
+            self.cooperation_repository.get_price_per_unit(cooperation.id)
+        )
+
+    def test_that_prices_of_many_plans_are_calculated_at_once(self) -> None:
+        plan1, plan2 = self.create_plans()
+        single_plan = self.plan_generator.create_plan()
+        self.cooperation_generator.create_cooperation(plans=[plan1, plan2])
+        self.assertEqual(
+            self.price_calculator.calculate_cooperative_prices(
+                [plan1, plan2, single_plan]
+            ),
+            {
+                plan1.id: calculate_price([plan1, plan2]),
+                plan2.id: calculate_price([plan1, plan2]),
+                single_plan.id: calculate_price([single_plan]),
+            },
+        )
+
+    def test_that_stored_and_calculated_prices_are_combined(self) -> None:
+        plan1, plan2 = self.create_plans()
+        stored_cooperation = self.cooperation_generator.create_cooperation(
+            plans=[plan1]
+        )
+        self.cooperation_repository.set_price_per_unit(
+            stored_cooperation.id, Decimal(7)
+        )
+        self.cooperation_generator.create_cooperation(plans=[plan2])
+        self.assertEqual(
+            self.price_calculator.calculate_cooperative_prices([plan1, plan2]),
+            {plan1.id: Decimal(7), plan2.id: calculate_price([plan2])},
+        )
+
+    def test_that_no_prices_are_calculated_for_no_plans(self) -> None:
+        self.assertEqual(self.price_calculator.calculate_cooperative_prices([]), {})
+
+    def create_plans(self) -> Tuple[Plan, Plan]:
+        return (
+            self.plan_generator.create_plan(
+                costs=ProductionCosts(Decimal(2), Decimal(2), Decimal(6)), amount=10
+            ),
+            self.plan_generator.create_plan(
+                costs=ProductionCosts(Decimal(1), Decimal(1), Decimal(1)), amount=6
+            ),
+        )
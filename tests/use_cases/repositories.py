@@ -6,7 +6,19 @@ from datetime import datetime
 from decimal import Decimal
 from itertools import islice
 from statistics import StatisticsError, mean
-from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from uuid import UUID, uuid4
 
 from injector import inject, singleton
@@ -31,8 +43,36 @@ from arbeitszeit.entities import (
     SocialAccounting,
     Transaction,
 )
+from arbeitszeit.pagination import Page, PageRequest, decode_cursor, encode_cursor
 from arbeitszeit.user_action import UserAction
 
+T = TypeVar("T")
+
+
+def paginate(
+    items: Iterable[T],
+    sort_key: Callable[[T], List[Any]],
+    page: PageRequest,
+    descending: bool = False,
+) -> Page[T]:
+    sorted_items = sorted(items, key=sort_key, reverse=descending)
+    if sorted_items:
+        after = decode_cursor(page.cursor, len(sort_key(sorted_items[0])))
+        if after is not None:
+            sorted_items = [
+                item
+                for item in sorted_items
+                if (sort_key(item) < after if descending else sort_key(item) > after)
+            ]
+    items_on_page = sorted_items[: page.size]
+    has_next_page = len(sorted_items) > page.size
+    return Page(
+        items=items_on_page,
+        next_cursor=encode_cursor(sort_key(items_on_page[-1]))
+        if has_next_page
+        else None,
+    )
+
 
 @singleton
 class PurchaseRepository(interfaces.PurchaseRepository):
@@ -60,16 +100,22 @@ class PurchaseRepository(interfaces.PurchaseRepository):
         self.purchases.append(purchase)
         return purchase
 
-    def get_purchases_descending_by_date(self, user: Union[Member, Company]):
-        # order purchases by purchase_date
-        self.purchases = sorted(
-            self.purchases, key=lambda x: x.purchase_date, reverse=True
+    def get_purchases_descending_by_date(
+        self, user: Union[Member, Company], page: PageRequest
+    ) -> Page[Purchase]:
+        # Purchases have no id, so the insertion order serves as the tie
+        # breaker for purchases made at the same time.
+        sort_keys = {
+            id(purchase): [purchase.purchase_date.isoformat(), index]
+            for index, purchase in enumerate(self.purchases)
+        }
+        return paginate(
+            (purchase for purchase in self.purchases if purchase.buyer is user),
+            sort_key=lambda purchase: sort_keys[id(purchase)],
+            page=page,
+            descending=True,
         )
 
-        for purchase in self.purchases:
-            if purchase.buyer is user:
-                yield purchase
-
 
 @singleton
 class TransactionRepository(interfaces.TransactionRepository):
@@ -85,6 +131,7 @@ class TransactionRepository(interfaces.TransactionRepository):
         amount_sent: Decimal,
         amount_received: Decimal,
         purpose: str,
+        plan_id: Optional[UUID] = None,
     ) -> Transaction:
         transaction = Transaction(
             id=uuid4(),
@@ -94,10 +141,25 @@ class TransactionRepository(interfaces.TransactionRepository):
             amount_sent=amount_sent,
             amount_received=amount_received,
             purpose=purpose,
+            plan_id=plan_id,
         )
         self.transactions.append(transaction)
         return transaction
 
+    def create_transactions(
+        self, transactions: List[interfaces.NewTransaction]
+    ) -> None:
+        for transaction in transactions:
+            self.create_transaction(
+                date=transaction.date,
+                sending_account=transaction.sending_account,
+                receiving_account=transaction.receiving_account,
+                amount_sent=transaction.amount_sent,
+                amount_received=transaction.amount_received,
+                purpose=transaction.purpose,
+                plan_id=transaction.plan_id,
+            )
+
     def all_transactions_sent_by_account(self, account: Account) -> List[Transaction]:
         all_sent = []
         for transaction in self.transactions:
@@ -114,15 +176,38 @@ class TransactionRepository(interfaces.TransactionRepository):
                 all_received.append(transaction)
         return all_received
 
+    def get_transactions_of_accounts(
+        self,
+        accounts: List[Account],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        newest_first: bool = False,
+    ) -> Iterator[Transaction]:
+        for transaction in sorted(
+            self.transactions, key=lambda t: t.date, reverse=newest_first
+        ):
+            if start is not None and transaction.date < start:
+                continue
+            if end is not None and transaction.date >= end:
+                continue
+            if (
+                transaction.sending_account in accounts
+                or transaction.receiving_account in accounts
+            ):
+                yield transaction
+
     def get_sales_balance_of_plan(self, plan: Plan) -> Decimal:
         balance = Decimal(0)
         for transaction in self.transactions:
             if (transaction.receiving_account == plan.planner.product_account) and (
-                str(plan.id) in transaction.purpose
+                transaction.plan_id == plan.id
             ):
                 balance += transaction.amount_received
         return balance
 
+    def get_sales_balances_of_plans(self, plans: List[Plan]) -> Dict[UUID, Decimal]:
+        return {plan.id: self.get_sales_balance_of_plan(plan) for plan in plans}
+
 
 @singleton
 class CompanyWorkerRepository(interfaces.CompanyWorkerRepository):
@@ -143,6 +228,15 @@ class CompanyWorkerRepository(interfaces.CompanyWorkerRepository):
             if member is not None:
                 yield member
 
+    def get_page_of_company_workers(
+        self, company: Company, page: PageRequest
+    ) -> Page[Member]:
+        return paginate(
+            self.get_company_workers(company),
+            sort_key=lambda member: [member.name, str(member.id)],
+            page=page,
+        )
+
     def get_member_workplaces(self, member: UUID) -> Iterable[Company]:
         for company_id, workers in self.company_workers.items():
             if member not in workers:
@@ -184,6 +278,43 @@ class AccountRepository(interfaces.AccountRepository):
             transaction.amount_received for transaction in received_transactions
         ) - decimal_sum(transaction.amount_sent for transaction in sent_transactions)
 
+    def sum_of_balances_by_account_type(self) -> Dict[AccountTypes, Decimal]:
+        balances: Dict[AccountTypes, Decimal] = defaultdict(Decimal)
+        for account in self.accounts:
+            balances[account.account_type] += self.get_account_balance(account)
+        return balances
+
+    def get_account_balance_at(self, account: Account, timestamp: datetime) -> Decimal:
+        balance = Decimal(0)
+        for entry in self.get_balance_history(account):
+            if entry.date > timestamp:
+                break
+            balance = entry.balance
+        return balance
+
+    def get_balance_history(
+        self, account: Account
+    ) -> List[interfaces.BalanceHistoryEntry]:
+        history = []
+        balance = Decimal(0)
+        for transaction in sorted(
+            self.transaction_repository.transactions, key=lambda t: t.date
+        ):
+            if transaction.sending_account == transaction.receiving_account:
+                continue
+            if transaction.sending_account == account:
+                balance -= transaction.amount_sent
+            elif transaction.receiving_account == account:
+                balance += transaction.amount_received
+            else:
+                continue
+            history.append(interfaces.BalanceHistoryEntry(transaction.date, balance))
+        return history
+
+    def get_balance_history_revision(self, account: Account) -> str:
+        history = self.get_balance_history(account)
+        return f"{len(history)}/{history[-1].date if history else None}"
+
     @classmethod
     def _remove_intersection(
         cls,
@@ -233,6 +364,12 @@ class AccountOwnerRepository(interfaces.AccountOwnerRepository):
         # raise a base exception
         raise Exception("Owner not found")
 
+    def get_account_owner_names(self, accounts: Iterable[Account]) -> Dict[UUID, str]:
+        return {
+            account.id: self.get_account_owner(account).get_name()
+            for account in accounts
+        }
+
 
 @singleton
 class MemberRepository(interfaces.MemberRepository):
@@ -333,18 +470,37 @@ class CompanyRepository(interfaces.CompanyRepository):
     def count_registered_companies(self) -> int:
         return len(self.companies)
 
-    def query_companies_by_name(self, query: str) -> Iterator[Company]:
-        for company in self.companies.values():
-            if query.lower() in company.name.lower():
-                yield company
+    def query_companies_by_name(self, query: str, page: PageRequest) -> Page[Company]:
+        return self._paginate_companies(
+            (
+                company
+                for company in self.companies.values()
+                if query.lower() in company.name.lower()
+            ),
+            page,
+        )
 
-    def query_companies_by_email(self, query: str) -> Iterator[Company]:
-        for email, company in self.companies.items():
-            if query.lower() in email.lower():
-                yield company
+    def query_companies_by_email(self, query: str, page: PageRequest) -> Page[Company]:
+        return self._paginate_companies(
+            (
+                company
+                for email, company in self.companies.items()
+                if query.lower() in email.lower()
+            ),
+            page,
+        )
 
-    def get_all_companies(self) -> Iterator[Company]:
-        yield from self.companies.values()
+    def get_all_companies(self, page: PageRequest) -> Page[Company]:
+        return self._paginate_companies(self.companies.values(), page)
+
+    def _paginate_companies(
+        self, companies: Iterable[Company], page: PageRequest
+    ) -> Page[Company]:
+        return paginate(
+            companies,
+            sort_key=lambda company: [company.name, str(company.id)],
+            page=page,
+        )
 
     def validate_credentials(self, email_address: str, password: str) -> Optional[UUID]:
         if company := self.companies.get(email_address):
@@ -411,11 +567,22 @@ class PlanRepository(interfaces.PlanRepository):
     def increase_payout_count_by_one(self, plan: Plan) -> None:
         plan.payout_count += 1
 
+    def increase_payout_counts(self, payout_counts: List[Tuple[Plan, int]]) -> None:
+        for plan, count in payout_counts:
+            plan.payout_count += count
+
     def get_active_plans(self) -> Iterator[Plan]:
         for plan in self.plans.values():
             if plan.is_active:
                 yield plan
 
+    def get_page_of_active_plans(self, page: PageRequest) -> Page[Plan]:
+        return paginate(
+            self.get_active_plans(),
+            sort_key=lambda plan: [plan.prd_name, str(plan.id)],
+            page=page,
+        )
+
     def get_three_latest_active_plans_ordered_by_activation_date(
         self,
     ) -> Iterator[Plan]:
@@ -476,6 +643,22 @@ class PlanRepository(interfaces.PlanRepository):
             )
         )
 
+    def sum_of_active_productive_costs_per_day(self) -> ProductionCosts:
+        return self._sum_of_costs_per_day(
+            self.all_productive_plans_approved_active_and_not_expired()
+        )
+
+    def sum_of_active_public_costs_per_day(self) -> ProductionCosts:
+        return self._sum_of_costs_per_day(
+            self.all_public_plans_approved_active_and_not_expired()
+        )
+
+    def _sum_of_costs_per_day(self, plans: Iterable[Plan]) -> ProductionCosts:
+        return sum(
+            (plan.production_costs / plan.timeframe for plan in plans),
+            start=ProductionCosts(Decimal(0), Decimal(0), Decimal(0)),
+        )
+
     def all_plans_approved_and_not_expired(self) -> Iterator[Plan]:
         for plan in self.plans.values():
             if plan.is_approved and not plan.expired:
@@ -564,15 +747,38 @@ class PlanRepository(interfaces.PlanRepository):
         self.plans[plan.id] = plan
         return plan
 
-    def query_active_plans_by_product_name(self, query: str) -> Iterator[Plan]:
-        for plan in self.plans.values():
-            if plan.is_active and (query.lower() in plan.prd_name.lower()):
-                yield plan
+    def query_active_plans_by_product_name(
+        self, query: str, page: PageRequest
+    ) -> Page[Plan]:
+        # Plans matching by product name rank before plans matching only
+        # by description.
+        query = query.lower()
+        return paginate(
+            (
+                plan
+                for plan in self.get_active_plans()
+                if query in plan.prd_name.lower() or query in plan.description.lower()
+            ),
+            sort_key=lambda plan: [
+                0 if query in plan.prd_name.lower() else 1,
+                str(plan.id),
+            ],
+            page=page,
+        )
 
-    def query_active_plans_by_plan_id(self, query: str) -> Iterator[Plan]:
-        for plan in self.plans.values():
-            if plan.is_active and (query in str(plan.id)):
-                yield plan
+    def query_active_plans_by_plan_id(
+        self, query: str, page: PageRequest
+    ) -> Page[Plan]:
+        query = query.strip().lower()
+        return paginate(
+            (
+                plan
+                for plan in self.get_active_plans()
+                if str(plan.id).startswith(query)
+            ),
+            sort_key=lambda plan: [str(plan.id)],
+            page=page,
+        )
 
     def toggle_product_availability(self, plan: Plan) -> None:
         plan.is_available = True if (plan.is_available == False) else False
@@ -699,6 +905,7 @@ class MessageRepository(interfaces.MessageRepository):
         content: str,
         sender_remarks: Optional[str],
         reference: Optional[UserAction],
+        sent_on: datetime,
     ) -> Message:
         message_id = uuid4()
         message = Message(
@@ -710,6 +917,7 @@ class MessageRepository(interfaces.MessageRepository):
             sender_remarks=sender_remarks,
             user_action=reference,
             is_read=False,
+            sent_on=sent_on,
         )
         self.messages[message_id] = message
         return message
@@ -726,10 +934,31 @@ class MessageRepository(interfaces.MessageRepository):
             for message in self.messages.values()
         )
 
-    def get_messages_to_user(self, user: UUID) -> Iterable[Message]:
-        for message in self.messages.values():
-            if message.addressee.id == user:
-                yield message
+    def get_messages_to_user(
+        self, user: UUID, page: PageRequest
+    ) -> Page[interfaces.MessageSummary]:
+        messages = paginate(
+            (
+                message
+                for message in self.messages.values()
+                if message.addressee.id == user
+            ),
+            sort_key=lambda message: [message.sent_on.isoformat(), str(message.id)],
+            page=page,
+            descending=True,
+        )
+        return Page(
+            items=[
+                interfaces.MessageSummary(
+                    id=message.id,
+                    title=message.title,
+                    sender_name=message.sender.get_name(),
+                    is_read=message.is_read,
+                )
+                for message in messages.items
+            ],
+            next_cursor=messages.next_cursor,
+        )
 
 
 @singleton
@@ -737,6 +966,7 @@ class CooperationRepository(interfaces.CooperationRepository):
     @inject
     def __init__(self) -> None:
         self.cooperations: Dict[UUID, Cooperation] = dict()
+        self.prices_per_unit: Dict[UUID, Decimal] = dict()
 
     def create_cooperation(
         self,
@@ -783,6 +1013,26 @@ class CooperationRepository(interfaces.CooperationRepository):
     def count_cooperations(self) -> int:
         return len(self.cooperations)
 
+    def get_price_per_unit(self, cooperation_id: UUID) -> Optional[Decimal]:
+        return self.prices_per_unit.get(cooperation_id)
+
+    def set_price_per_unit(
+        self, cooperation_id: UUID, price_per_unit: Optional[Decimal]
+    ) -> None:
+        if price_per_unit is None:
+            self.prices_per_unit.pop(cooperation_id, None)
+        else:
+            self.prices_per_unit[cooperation_id] = price_per_unit
+
+    def get_prices_per_unit(
+        self, cooperation_ids: Iterable[UUID]
+    ) -> Dict[UUID, Decimal]:
+        return {
+            cooperation_id: self.prices_per_unit[cooperation_id]
+            for cooperation_id in cooperation_ids
+            if cooperation_id in self.prices_per_unit
+        }
+
     def __len__(self) -> int:
         return len(self.cooperations)
 
@@ -833,10 +1083,13 @@ class PlanCooperationRepository(interfaces.PlanCooperationRepository):
         plan = self.plan_repository.get_plan_by_id(plan_id)
         assert plan
         plan.cooperation = cooperation_id
+        self.cooperation_repository.set_price_per_unit(cooperation_id, None)
 
     def remove_plan_from_cooperation(self, plan_id: UUID) -> None:
         plan = self.plan_repository.get_plan_by_id(plan_id)
         assert plan
+        if plan.cooperation:
+            self.cooperation_repository.set_price_per_unit(plan.cooperation, None)
         plan.cooperation = None
 
     def set_requested_cooperation(self, plan_id: UUID, cooperation_id: UUID) -> None:
@@ -862,6 +1115,16 @@ class PlanCooperationRepository(interfaces.PlanCooperationRepository):
             if plan.cooperation == cooperation_id:
                 yield plan
 
+    def get_plans_in_cooperations(
+        self, cooperation_ids: Iterable[UUID]
+    ) -> Dict[UUID, List[Plan]]:
+        requested_cooperations = set(cooperation_ids)
+        plans: Dict[UUID, List[Plan]] = dict()
+        for plan in self.plan_repository.plans.values():
+            if plan.cooperation and plan.cooperation in requested_cooperations:
+                plans.setdefault(plan.cooperation, []).append(plan)
+        return plans
+
 
 class AccountantRepositoryTestImpl:
     @dataclass
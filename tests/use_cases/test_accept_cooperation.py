@@ -8,7 +8,7 @@ from arbeitszeit.use_cases import AcceptCooperation, AcceptCooperationRequest
 from tests.data_generators import CompanyGenerator, CooperationGenerator, PlanGenerator
 
 from .dependency_injection import injection_test
-from .repositories import PlanCooperationRepository
+from .repositories import CooperationRepository, PlanCooperationRepository
 
 
 @injection_test
@@ -274,3 +274,26 @@ def test_that_attribute_requested_cooperation_is_set_to_none_after_start_of_coop
     assert plan.requested_cooperation == cooperation.id
     accept_cooperation(request)
     assert plan.requested_cooperation is None
+
+
+@injection_test
+def test_price_of_cooperation_is_stored_after_start_of_cooperation(
+    accept_cooperation: AcceptCooperation,
+    cooperation_generator: CooperationGenerator,
+    plan_generator: PlanGenerator,
+    company_generator: CompanyGenerator,
+    cooperation_repository: CooperationRepository,
+):
+    requester = company_generator.create_company()
+    cooperation = cooperation_generator.create_cooperation(coordinator=requester)
+    plan = plan_generator.create_plan(
+        activation_date=datetime.now(),
+        costs=ProductionCosts(Decimal(10), Decimal(5), Decimal(5)),
+        amount=10,
+        requested_cooperation=cooperation,
+    )
+    request = AcceptCooperationRequest(
+        requester_id=requester.id, plan_id=plan.id, cooperation_id=cooperation.id
+    )
+    accept_cooperation(request)
+    assert cooperation_repository.get_price_per_unit(cooperation.id) == Decimal(2)
@@ -178,3 +178,16 @@ def test_that_added_transactions_for_p_r_and_prd_have_correct_amounts_if_public_
     assert expected_amount_p == added_amount_p
     assert expected_amount_r == added_amount_r
     assert expected_amount_prd == added_amount_prd
+
+
+@injection_test
+def test_that_all_transactions_reference_the_activated_plan(
+    activate_plan: ActivatePlanAndGrantCredit,
+    plan_generator: PlanGenerator,
+    transaction_repository: TransactionRepository,
+):
+    plan = plan_generator.create_plan(approved=True)
+    activate_plan(plan.id)
+    assert transaction_repository.transactions
+    for transaction in transaction_repository.transactions:
+        assert transaction.plan_id == plan.id
@@ -1,3 +1,4 @@
+from datetime import datetime
 from unittest import TestCase
 from uuid import uuid4
 
@@ -8,7 +9,7 @@ from arbeitszeit.use_cases import (
     ReadMessage,
     ReadMessageRequest,
 )
-from tests.data_generators import MemberGenerator
+from tests.data_generators import CompanyGenerator, MemberGenerator, MessageGenerator
 
 from .dependency_injection import get_dependency_injector
 
@@ -28,6 +29,17 @@ class CheckForUnreadMessagesTests(TestCase):
         )
         self.assertFalse(response.has_unread_messages)
 
+    def test_company_has_unread_messages_after_receiving_one(self) -> None:
+        message_generator = self.injector.get(MessageGenerator)
+        company = self.injector.get(CompanyGenerator).create_company()
+        message_generator.create_message(addressee=company)
+        response = self.check_for_unread_messages(
+            CheckForUnreadMessagesRequest(
+                user=company.id,
+            )
+        )
+        self.assertTrue(response.has_unread_messages)
+
     def test_user_has_no_unread_messages_after_one_was_created_and_read(self) -> None:
         message_repo = self.injector.get(MessageRepository)  # type: ignore
         member_generator = self.injector.get(MemberGenerator)
@@ -41,6 +53,7 @@ class CheckForUnreadMessagesTests(TestCase):
             content="test content",
             sender_remarks=None,
             reference=None,
+            sent_on=datetime.now(),
         )
         read_message(
             ReadMessageRequest(
@@ -1,6 +1,7 @@
 from unittest import TestCase
 from uuid import uuid4
 
+from arbeitszeit.price_calculator import calculate_price
 from arbeitszeit.use_cases import (
     EndCooperation,
     EndCooperationRequest,
@@ -144,3 +145,19 @@ class TestEndCooperation(TestCase):
         response = self.end_cooperation(request)
         assert not response.is_rejected
         assert plan.cooperation is None
+
+    def test_price_of_cooperation_is_updated_after_plan_left_it(self) -> None:
+        plan = self.plan_generator.create_plan(planner=self.requester)
+        remaining_plan = self.plan_generator.create_plan()
+        cooperation = self.coop_generator.create_cooperation(
+            plans=[plan, remaining_plan]
+        )
+        request = EndCooperationRequest(
+            requester_id=self.requester.id,
+            plan_id=plan.id,
+            cooperation_id=cooperation.id,
+        )
+        self.end_cooperation(request)
+        assert self.cooperation_repository.get_price_per_unit(
+            cooperation.id
+        ) == calculate_price([remaining_plan])
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from arbeitszeit.entities import AccountTypes
+from arbeitszeit.transactions import TransactionTypes
+from arbeitszeit.use_cases.export_transactions import ExportTransactions
+from tests.data_generators import (
+    CompanyGenerator,
+    MemberGenerator,
+    SocialAccountingGenerator,
+    TransactionGenerator,
+)
+
+from .dependency_injection import injection_test
+
+
+@injection_test
+def test_nothing_is_exported_when_no_transactions_took_place(
+    export_transactions: ExportTransactions,
+    company_generator: CompanyGenerator,
+):
+    company = company_generator.create_company()
+    response = export_transactions(ExportTransactions.Request(user=company.id))
+    assert not list(response.transactions)
+
+
+@injection_test
+def test_transactions_of_all_company_accounts_are_exported_oldest_first(
+    export_transactions: ExportTransactions,
+    company_generator: CompanyGenerator,
+    transaction_generator: TransactionGenerator,
+    social_accounting_generator: SocialAccountingGenerator,
+):
+    company = company_generator.create_company()
+    other_company = company_generator.create_company()
+    social_accounting = social_accounting_generator.create_social_accounting()
+    transaction_generator.create_transaction(
+        sending_account=social_accounting.account,
+        receiving_account=company.work_account,
+        amount_received=Decimal(20),
+    )
+    transaction_generator.create_transaction(
+        sending_account=company.means_account,
+        receiving_account=other_company.product_account,
+        amount_sent=Decimal(5),
+    )
+    response = export_transactions(ExportTransactions.Request(user=company.id))
+    transactions = list(response.transactions)
+    assert [
+        (
+            transaction.account_type,
+            transaction.transaction_type,
+            transaction.transaction_volume,
+        )
+        for transaction in transactions
+    ] == [
+        (AccountTypes.a, TransactionTypes.credit_for_wages, Decimal(20)),
+        (AccountTypes.p, TransactionTypes.payment_of_fixed_means, Decimal(-5)),
+    ]
+
+
+@injection_test
+def test_transactions_of_members_are_exported(
+    export_transactions: ExportTransactions,
+    member_generator: MemberGenerator,
+    transaction_generator: TransactionGenerator,
+    social_accounting_generator: SocialAccountingGenerator,
+):
+    member = member_generator.create_member()
+    social_accounting = social_accounting_generator.create_social_accounting()
+    transaction_generator.create_transaction(
+        sending_account=social_accounting.account,
+        receiving_account=member.account,
+        amount_received=Decimal(8),
+    )
+    response = export_transactions(ExportTransactions.Request(user=member.id))
+    (transaction,) = response.transactions
+    assert transaction.account_type == AccountTypes.member
+    assert transaction.transaction_volume == Decimal(8)
+
+
+@injection_test
+def test_only_transactions_within_the_date_range_are_exported(
+    export_transactions: ExportTransactions,
+    member_generator: MemberGenerator,
+    transaction_generator: TransactionGenerator,
+    social_accounting_generator: SocialAccountingGenerator,
+):
+    member = member_generator.create_member()
+    social_accounting = social_accounting_generator.create_social_accounting()
+    transaction = transaction_generator.create_transaction(
+        sending_account=social_accounting.account,
+        receiving_account=member.account,
+    )
+    before = ExportTransactions.Request(user=member.id, end=transaction.date)
+    after = ExportTransactions.Request(
+        user=member.id, start=transaction.date + timedelta(seconds=1)
+    )
+    including = ExportTransactions.Request(
+        user=member.id, start=transaction.date, end=datetime.max
+    )
+    assert not list(export_transactions(before).transactions)
+    assert not list(export_transactions(after).transactions)
+    assert len(list(export_transactions(including).transactions)) == 1
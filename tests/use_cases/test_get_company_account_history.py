@@ -0,0 +1,52 @@
+from decimal import Decimal
+
+from arbeitszeit.entities import AccountTypes
+from arbeitszeit.use_cases.get_company_account_history import GetCompanyAccountHistory
+from tests.data_generators import CompanyGenerator, TransactionGenerator
+
+from .dependency_injection import injection_test
+
+
+@injection_test
+def test_history_is_empty_when_no_transactions_took_place(
+    get_company_account_history: GetCompanyAccountHistory,
+    company_generator: CompanyGenerator,
+):
+    company = company_generator.create_company()
+    response = get_company_account_history(
+        GetCompanyAccountHistory.Request(
+            company_id=company.id, account_type=AccountTypes.p
+        )
+    )
+    assert not response.timestamps
+    assert not response.balances
+
+
+@injection_test
+def test_history_shows_balance_after_each_transaction_of_the_requested_account(
+    get_company_account_history: GetCompanyAccountHistory,
+    company_generator: CompanyGenerator,
+    transaction_generator: TransactionGenerator,
+):
+    company = company_generator.create_company()
+    other_company = company_generator.create_company()
+    first = transaction_generator.create_transaction(
+        receiving_account=company.raw_material_account,
+        amount_received=Decimal(20),
+    )
+    transaction_generator.create_transaction(
+        sending_account=company.means_account,
+        receiving_account=other_company.product_account,
+    )
+    second = transaction_generator.create_transaction(
+        sending_account=company.raw_material_account,
+        receiving_account=other_company.product_account,
+        amount_sent=Decimal(5),
+    )
+    response = get_company_account_history(
+        GetCompanyAccountHistory.Request(
+            company_id=company.id, account_type=AccountTypes.r
+        )
+    )
+    assert response.timestamps == [first.date, second.date]
+    assert response.balances == [Decimal(20), Decimal(15)]
@@ -0,0 +1,44 @@
+from decimal import Decimal
+
+from arbeitszeit.entities import AccountTypes
+from arbeitszeit.use_cases.get_company_account_history_revision import (
+    GetCompanyAccountHistoryRevision,
+)
+from tests.data_generators import CompanyGenerator, TransactionGenerator
+
+from .dependency_injection import injection_test
+
+
+@injection_test
+def test_response_names_the_requested_account(
+    get_revision: GetCompanyAccountHistoryRevision,
+    company_generator: CompanyGenerator,
+):
+    company = company_generator.create_company()
+    response = get_revision(
+        GetCompanyAccountHistoryRevision.Request(
+            company_id=company.id, account_type=AccountTypes.r
+        )
+    )
+    assert response.account_id == company.raw_material_account.id
+
+
+@injection_test
+def test_revision_changes_with_transactions_of_the_account_only(
+    get_revision: GetCompanyAccountHistoryRevision,
+    company_generator: CompanyGenerator,
+    transaction_generator: TransactionGenerator,
+):
+    company = company_generator.create_company()
+    request = GetCompanyAccountHistoryRevision.Request(
+        company_id=company.id, account_type=AccountTypes.r
+    )
+    revision = get_revision(request).revision
+    transaction_generator.create_transaction(
+        sending_account=company.means_account, amount_sent=Decimal(5)
+    )
+    assert get_revision(request).revision == revision
+    transaction_generator.create_transaction(
+        receiving_account=company.raw_material_account, amount_received=Decimal(5)
+    )
+    assert get_revision(request).revision != revision
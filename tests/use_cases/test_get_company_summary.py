@@ -492,6 +492,7 @@ def test_returns_correct_sales_balance_if_plan_is_productive_and_one_transaction
         receiving_account=company.product_account,
         amount_received=Decimal(15),
         purpose=f"Plan ID: {plan.id}",
+        plan_id=plan.id,
     )
     response = get_company_summary(company.id)
     assert response
@@ -514,6 +515,7 @@ def test_returns_correct_infinite_sales_deviation_if_plan_is_productive_with_cos
         receiving_account=company.product_account,
         amount_received=Decimal(1),
         purpose=f"Plan ID: {plan.id}",
+        plan_id=plan.id,
     )
     response = get_company_summary(company.id)
     assert response
@@ -536,6 +538,7 @@ def test_returns_correct_sales_deviation_of_100_if_plan_is_productive_with_costs
         receiving_account=company.product_account,
         amount_received=Decimal(10),
         purpose=f"Plan ID: {plan.id}",
+        plan_id=plan.id,
     )
     response = get_company_summary(company.id)
     assert response
@@ -558,6 +561,7 @@ def test_returns_correct_sales_deviation_of_100_if_plan_is_productive_with_costs
         receiving_account=company.product_account,
         amount_received=Decimal(-10),
         purpose=f"Plan ID: {plan.id}",
+        plan_id=plan.id,
     )
     response = get_company_summary(company.id)
     assert response
@@ -597,6 +601,7 @@ def test_returns_correct_sales_deviation_of_infinite_if_plan_is_public_but_recei
         receiving_account=company.product_account,
         amount_received=Decimal(10),
         purpose=f"Plan ID: {plan.id}",
+        plan_id=plan.id,
     )
     response = get_company_summary(company.id)
     assert response
@@ -620,6 +625,7 @@ def test_returns_correct_sales_deviation_of_0_if_plan_is_public_with_balance_of_
         receiving_account=company.product_account,
         amount_received=Decimal(0),
         purpose=f"Plan ID: {plan.id}",
+        plan_id=plan.id,
     )
     response = get_company_summary(company.id)
     assert response
@@ -2,6 +2,7 @@ from typing import List, cast
 from unittest import TestCase
 from uuid import UUID, uuid4
 
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit.repositories import MessageRepository
 from arbeitszeit.use_cases import (
     AnswerCompanyWorkInvite,
@@ -122,7 +123,9 @@ class InviteWorkerTests(TestCase):
             )
         )
         message_repository = self.injector.get(MessageRepository)  # type: ignore
-        messages = list(message_repository.get_messages_to_user(self.member.id))
+        messages = message_repository.get_messages_to_user(
+            self.member.id, PageRequest()
+        ).items
         self.assertEqual(len(messages), 1)
         message = messages[0]
         self.assertEqual(
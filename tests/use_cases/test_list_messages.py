@@ -1,6 +1,8 @@
+from datetime import datetime
 from unittest import TestCase
 from uuid import uuid4
 
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit.use_cases import (
     ListMessages,
     ListMessagesRequest,
@@ -113,3 +115,40 @@ class ListMessagesTest(TestCase):
             )
         )
         self.assertTrue(response.messages[0].is_read)
+
+    def test_that_messages_are_listed_in_pages(self) -> None:
+        user = self.member_generator.create_member()
+        messages = [
+            self.message_generator.create_message(addressee=user) for _ in range(3)
+        ]
+        first_page = self.list_messages(
+            ListMessagesRequest(user=user.id, page=PageRequest(size=2))
+        )
+        self.assertEqual(len(first_page.messages), 2)
+        self.assertIsNotNone(first_page.next_cursor)
+        second_page = self.list_messages(
+            ListMessagesRequest(
+                user=user.id,
+                page=PageRequest(cursor=first_page.next_cursor, size=2),
+            )
+        )
+        self.assertEqual(len(second_page.messages), 1)
+        self.assertIsNone(second_page.next_cursor)
+        self.assertEqual(
+            {m.message_id for m in first_page.messages + second_page.messages},
+            {message.id for message in messages},
+        )
+
+    def test_that_newest_messages_are_listed_first(self) -> None:
+        user = self.member_generator.create_member()
+        older_message = self.message_generator.create_message(
+            addressee=user, sent_on=datetime(2021, 1, 1)
+        )
+        newer_message = self.message_generator.create_message(
+            addressee=user, sent_on=datetime(2021, 1, 2)
+        )
+        response = self.list_messages(ListMessagesRequest(user=user.id))
+        self.assertEqual(
+            [message.message_id for message in response.messages],
+            [newer_message.id, older_message.id],
+        )
@@ -1,6 +1,7 @@
 from uuid import UUID, uuid4
 
 from arbeitszeit.entities import Company, Member
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit.use_cases.list_workers import (
     ListWorkers,
     ListWorkersRequest,
@@ -67,3 +68,22 @@ def test_list_workers_response_includes_multiple_company_workers(
     company: Company = company_generator.create_company(workers=[worker1, worker2])
     response: ListWorkersResponse = list_workers(make_request(company=company.id))
     assert worker_in_results(worker1, response) and worker_in_results(worker2, response)
+
+
+@injection_test
+def test_list_workers_response_is_paginated_by_worker_name(
+    list_workers: ListWorkers,
+    company_generator: CompanyGenerator,
+    member_generator: MemberGenerator,
+):
+    workers = [member_generator.create_member(name=name) for name in ["b", "a", "c"]]
+    company: Company = company_generator.create_company(workers=workers)
+    first_page = list_workers(ListWorkersRequest(company.id, page=PageRequest(size=2)))
+    assert [worker.name for worker in first_page.workers] == ["a", "b"]
+    second_page = list_workers(
+        ListWorkersRequest(
+            company.id, page=PageRequest(cursor=first_page.next_cursor, size=2)
+        )
+    )
+    assert [worker.name for worker in second_page.workers] == ["c"]
+    assert second_page.next_cursor is None
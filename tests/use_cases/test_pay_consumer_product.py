@@ -63,6 +63,7 @@ class PayConsumerProductTests(TestCase):
         assert transaction_added.receiving_account == plan.planner.product_account
         assert transaction_added.amount_sent == expected_amount_sent
         assert transaction_added.amount_received == expected_amount_received
+        assert transaction_added.plan_id == plan.id
 
     def test_balances_are_adjusted_correctly(self) -> None:
         plan = self.plan_generator.create_plan(
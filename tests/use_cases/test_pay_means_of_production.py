@@ -266,6 +266,7 @@ def test_correct_transaction_added_if_means_of_production_were_paid(
     )
     assert transaction_repository.transactions[0].amount_sent == price_total
     assert transaction_repository.transactions[0].amount_received == price_total
+    assert transaction_repository.transactions[0].plan_id == plan.id
 
 
 @injection_test
@@ -300,6 +301,7 @@ def test_correct_transaction_added_if_raw_materials_were_paid(
     )
     assert transaction_repository.transactions[0].amount_sent == price_total
     assert transaction_repository.transactions[0].amount_received == price_total
+    assert transaction_repository.transactions[0].plan_id == plan.id
 
 
 @injection_test
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from arbeitszeit.entities import Company
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit.use_cases import (
     CompanyFilter,
     CompanyQueryResponse,
@@ -135,10 +136,50 @@ def test_that_capitalization_is_ignored_in_email(
     assert company_in_results(expected_company, response)
 
 
-def make_request(query: Optional[str], category: CompanyFilter):
+@injection_test
+def test_that_companies_are_returned_in_pages_ordered_by_name(
+    query_companies: QueryCompanies,
+    company_generator: CompanyGenerator,
+):
+    for name in ["Company C", "Company A", "Company B"]:
+        company_generator.create_company(name=name)
+    first_page = query_companies(
+        make_request("Company", CompanyFilter.by_name, PageRequest(size=2))
+    )
+    assert [result.company_name for result in first_page.results] == [
+        "Company A",
+        "Company B",
+    ]
+    second_page = query_companies(
+        make_request(
+            "Company",
+            CompanyFilter.by_name,
+            PageRequest(cursor=first_page.next_cursor, size=2),
+        )
+    )
+    assert [result.company_name for result in second_page.results] == ["Company C"]
+    assert second_page.next_cursor is None
+
+
+@injection_test
+def test_that_malformed_cursor_results_in_first_page(
+    query_companies: QueryCompanies,
+    company_generator: CompanyGenerator,
+):
+    expected_company = company_generator.create_company()
+    response = query_companies(
+        make_request(None, CompanyFilter.by_name, PageRequest(cursor="malformed"))
+    )
+    assert company_in_results(expected_company, response)
+
+
+def make_request(
+    query: Optional[str], category: CompanyFilter, page: Optional[PageRequest] = None
+):
     return QueryCompaniesRequestTestImpl(
         query=query,
         filter_category=category,
+        page=page or PageRequest(),
     )
 
 
@@ -146,9 +187,13 @@ def make_request(query: Optional[str], category: CompanyFilter):
 class QueryCompaniesRequestTestImpl(QueryCompaniesRequest):
     query: Optional[str]
     filter_category: CompanyFilter
+    page: PageRequest
 
     def get_query_string(self) -> Optional[str]:
         return self.query
 
     def get_filter_category(self) -> CompanyFilter:
         return self.filter_category
+
+    def get_page(self) -> PageRequest:
+        return self.page
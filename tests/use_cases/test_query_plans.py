@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 from arbeitszeit.entities import Plan
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit.use_cases import (
     PlanFilter,
     PlanQueryResponse,
@@ -71,16 +72,27 @@ def test_that_plans_where_id_is_exact_match_are_returned(
 
 
 @injection_test
-def test_query_with_substring_of_id_returns_correct_result(
+def test_query_with_prefix_of_id_returns_correct_result(
     query_plans: QueryPlans,
     plan_generator: PlanGenerator,
 ):
     expected_plan = plan_generator.create_plan(activation_date=datetime.min)
-    substring_query = str(expected_plan.id)[5:10]
-    response = query_plans(make_request(substring_query, PlanFilter.by_plan_id))
+    prefix_query = str(expected_plan.id)[:5]
+    response = query_plans(make_request(prefix_query, PlanFilter.by_plan_id))
     assert plan_in_results(expected_plan, response)
 
 
+@injection_test
+def test_query_with_substring_from_the_middle_of_id_returns_no_result(
+    query_plans: QueryPlans,
+    plan_generator: PlanGenerator,
+):
+    expected_plan = plan_generator.create_plan(activation_date=datetime.min)
+    substring_query = str(expected_plan.id)[9:13]
+    response = query_plans(make_request(substring_query, PlanFilter.by_plan_id))
+    assert not plan_in_results(expected_plan, response)
+
+
 @injection_test
 def test_that_plans_where_product_name_is_exact_match_are_returned(
     query_plans: QueryPlans,
@@ -120,10 +132,84 @@ def test_query_with_substring_of_product_is_case_insensitive(
     assert plan_in_results(expected_plan, response)
 
 
-def make_request(query: Optional[str], category: PlanFilter):
+@injection_test
+def test_query_for_product_name_also_finds_plans_by_description(
+    query_plans: QueryPlans,
+    plan_generator: PlanGenerator,
+):
+    expected_plan = plan_generator.create_plan(
+        product_name="Name XYZ",
+        description="Very tasty",
+        activation_date=datetime.min,
+    )
+    response = query_plans(make_request("tasty", PlanFilter.by_product_name))
+    assert plan_in_results(expected_plan, response)
+
+
+@injection_test
+def test_that_active_plans_are_returned_in_pages_ordered_by_product_name(
+    query_plans: QueryPlans,
+    plan_generator: PlanGenerator,
+):
+    for product_name in ["c", "a", "b"]:
+        plan_generator.create_plan(
+            product_name=product_name, activation_date=datetime.min
+        )
+    first_page = query_plans(
+        make_request(None, PlanFilter.by_product_name, PageRequest(size=2))
+    )
+    assert [result.product_name for result in first_page.results] == ["a", "b"]
+    assert first_page.next_cursor
+    second_page = query_plans(
+        make_request(
+            None,
+            PlanFilter.by_product_name,
+            PageRequest(cursor=first_page.next_cursor, size=2),
+        )
+    )
+    assert [result.product_name for result in second_page.results] == ["c"]
+    assert second_page.next_cursor is None
+
+
+@injection_test
+def test_that_plans_with_same_product_name_are_not_skipped_between_pages(
+    query_plans: QueryPlans,
+    plan_generator: PlanGenerator,
+):
+    plans = [
+        plan_generator.create_plan(product_name="Bread", activation_date=datetime.min)
+        for _ in range(3)
+    ]
+    seen_plans = []
+    page = PageRequest(size=1)
+    while True:
+        response = query_plans(make_request("Bread", PlanFilter.by_product_name, page))
+        seen_plans += [result.plan_id for result in response.results]
+        if response.next_cursor is None:
+            break
+        page = PageRequest(cursor=response.next_cursor, size=1)
+    assert sorted(seen_plans) == sorted(plan.id for plan in plans)
+
+
+@injection_test
+def test_that_search_by_plan_id_is_paginated(
+    query_plans: QueryPlans,
+    plan_generator: PlanGenerator,
+):
+    for _ in range(2):
+        plan_generator.create_plan(activation_date=datetime.min)
+    response = query_plans(make_request("", PlanFilter.by_plan_id, PageRequest(size=1)))
+    assert len(response.results) == 1
+    assert response.next_cursor
+
+
+def make_request(
+    query: Optional[str], category: PlanFilter, page: Optional[PageRequest] = None
+):
     return QueryPlansRequestTestImpl(
         query=query,
         filter_category=category,
+        page=page or PageRequest(),
     )
 
 
@@ -131,9 +217,13 @@ def make_request(query: Optional[str], category: PlanFilter):
 class QueryPlansRequestTestImpl(QueryPlansRequest):
     query: Optional[str]
     filter_category: PlanFilter
+    page: PageRequest
 
     def get_query_string(self) -> Optional[str]:
         return self.query
 
     def get_filter_category(self) -> PlanFilter:
         return self.filter_category
+
+    def get_page(self) -> PageRequest:
+        return self.page
@@ -1,6 +1,7 @@
 from typing import Iterable
 
 from arbeitszeit.entities import Purchase
+from arbeitszeit.pagination import PageRequest
 from arbeitszeit.use_cases import PurchaseQueryResponse, QueryPurchases
 from tests.data_generators import CompanyGenerator, MemberGenerator, PurchaseGenerator
 from tests.datetime_service import FakeDatetimeService
@@ -22,10 +23,10 @@ def test_that_no_purchase_is_returned_when_searching_an_empty_repo(
     company_generator: CompanyGenerator,
 ):
     member = member_generator.create_member()
-    results = list(query_purchases(member))
+    results = query_purchases(member).items
     assert not results
     company = company_generator.create_company()
-    results = list(query_purchases(company))
+    results = query_purchases(company).items
     assert not results
 
 
@@ -41,11 +42,11 @@ def test_that_correct_purchases_are_returned(
     company = company_generator.create_company()
     expected_purchase_member = purchase_generator.create_purchase(buyer=member)
     expected_purchase_company = purchase_generator.create_purchase(buyer=company)
-    results = list(query_purchases(member))
+    results = query_purchases(member).items
     assert len(results) == 1
     assert purchase_in_results(expected_purchase_member, results)
     assert not purchase_in_results(expected_purchase_company, results)
-    results = list(query_purchases(company))
+    results = query_purchases(company).items
     assert len(results) == 1
     assert purchase_in_results(expected_purchase_company, results)
     assert not purchase_in_results(expected_purchase_member, results)
@@ -67,7 +68,7 @@ def test_that_purchases_are_returned_in_correct_order_when_member_queries(
     expected_recent_purchase = purchase_generator.create_purchase(
         buyer=member, purchase_date=datetime_service.now_minus_one_day()
     )
-    results = list(query_purchases(member))
+    results = query_purchases(member).items
     assert purchase_in_results(
         expected_recent_purchase, [results[0]]
     )  # more recent purchase is first
@@ -89,7 +90,34 @@ def test_that_purchases_are_returned_in_correct_order_when_company_queries(
     expected_recent_purchase = purchase_generator.create_purchase(
         buyer=company, purchase_date=datetime_service.now_minus_one_day()
     )
-    results = list(query_purchases(company))
+    results = query_purchases(company).items
     assert purchase_in_results(
         expected_recent_purchase, [results[0]]
     )  # more recent purchase is first
+
+
+@injection_test
+def test_that_purchases_made_at_the_same_time_are_not_skipped_between_pages(
+    query_purchases: QueryPurchases,
+    member_generator: MemberGenerator,
+    purchase_generator: PurchaseGenerator,
+    datetime_service: FakeDatetimeService,
+):
+    member = member_generator.create_member()
+    purchases = [
+        purchase_generator.create_purchase(
+            buyer=member, purchase_date=datetime_service.now_minus_one_day()
+        )
+        for _ in range(3)
+    ]
+    first_page = query_purchases(member, PageRequest(size=2))
+    assert len(first_page.items) == 2
+    second_page = query_purchases(
+        member, PageRequest(cursor=first_page.next_cursor, size=2)
+    )
+    assert len(second_page.items) == 1
+    assert second_page.next_cursor is None
+    assert all(
+        purchase_in_results(purchase, first_page.items + second_page.items)
+        for purchase in purchases
+    )
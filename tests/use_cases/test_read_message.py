@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Callable, Optional, Union, cast
 from unittest import TestCase
 from uuid import uuid4
@@ -194,4 +195,5 @@ class ReadMessageTests(TestCase):
             content=content,
             sender_remarks=sender_remarks,
             reference=user_action,
+            sent_on=datetime.now(),
         )
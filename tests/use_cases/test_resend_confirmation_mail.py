@@ -1,6 +1,7 @@
 from unittest import TestCase
 
 from arbeitszeit.use_cases import ResendConfirmationMail, ResendConfirmationMailRequest
+from tests.token import TokenDeliveryService
 
 from .dependency_injection import get_dependency_injector
 
@@ -14,8 +15,10 @@ class UseCaseTests(TestCase):
     def setUp(self) -> None:
         self.injector = get_dependency_injector()
         self.use_case = self.injector.get(ResendConfirmationMail)
+        self.token_delivery = self.injector.get(TokenDeliveryService)
 
-    def test_that_resending_mail_is_possible(self):
+    def test_that_confirmation_token_is_delivered_to_recipient(self):
         request = ResendConfirmationMailRequest(**DEFAULT)
-        response = self.use_case(request)
-        assert not response.is_rejected
+        self.use_case(request)
+        [email] = self.token_delivery.delivered_tokens
+        assert email.email == DEFAULT["recipient"]
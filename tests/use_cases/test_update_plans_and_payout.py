@@ -1,15 +1,21 @@
 import datetime
 from decimal import Decimal
+from functools import partial
 from unittest import TestCase
 
 from arbeitszeit.entities import AccountTypes, Company, ProductionCosts
+from arbeitszeit.price_calculator import calculate_price
 from arbeitszeit.use_cases import UpdatePlansAndPayout
 from arbeitszeit.use_cases.show_my_accounts import ShowMyAccounts, ShowMyAccountsRequest
 from tests.data_generators import CompanyGenerator, CooperationGenerator, PlanGenerator
 from tests.datetime_service import FakeDatetimeService
 
 from .dependency_injection import get_dependency_injector
-from .repositories import AccountRepository, TransactionRepository
+from .repositories import (
+    AccountRepository,
+    CooperationRepository,
+    TransactionRepository,
+)
 
 
 class UseCaseTests(TestCase):
@@ -23,6 +29,7 @@ class UseCaseTests(TestCase):
         self.transaction_repository = self.injector.get(TransactionRepository)
         self.show_my_accounts = self.injector.get(ShowMyAccounts)
         self.company_generator = self.injector.get(CompanyGenerator)
+        self.cooperation_repository = self.injector.get(CooperationRepository)
 
     def test_that_a_plan_that_is_not_active_can_not_expire(self) -> None:
         plan = self.plan_generator.create_plan(activation_date=None)
@@ -162,6 +169,24 @@ class UseCaseTests(TestCase):
         assert not plan.is_active
         assert not plan.cooperation
 
+    def test_that_price_of_cooperation_is_updated_after_expiration_of_plan(
+        self,
+    ) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.plan_generator.create_plan(
+            timeframe=5,
+            activation_date=self.datetime_service.now_minus_ten_days(),
+            cooperation=cooperation,
+        )
+        remaining_plan = self.plan_generator.create_plan(
+            activation_date=self.datetime_service.now_minus_one_day(),
+            cooperation=cooperation,
+        )
+        self.payout()
+        assert self.cooperation_repository.get_price_per_unit(
+            cooperation.id
+        ) == calculate_price([remaining_plan])
+
     def test_that_wages_are_paid_out(self) -> None:
         self.plan_generator.create_plan(
             approved=True, activation_date=self.datetime_service.now_minus_one_day()
@@ -402,6 +427,20 @@ class UseCaseTests(TestCase):
             self.get_company_work_account_balance(planner), expected_wage_payout
         )
 
+    def test_that_payout_transactions_reference_the_plan(self) -> None:
+        plan = self.plan_generator.create_plan(
+            timeframe=5, activation_date=self.datetime_service.now()
+        )
+        self.payout()
+        payouts = [
+            transaction
+            for transaction in self.transaction_repository.transactions
+            if transaction.receiving_account == plan.planner.work_account
+        ]
+        assert payouts
+        for transaction in payouts:
+            assert transaction.plan_id == plan.id
+
     def get_company_work_account_balance(self, company: Company) -> Decimal:
         show_my_accounts_response = self.show_my_accounts(
             ShowMyAccountsRequest(company.id)
@@ -416,3 +455,12 @@ class UseCaseTests(TestCase):
                 if transaction.receiving_account.account_type == AccountTypes.a
             ]
         )
+
+
+class BulkPayoutTests(UseCaseTests):
+    """Run all tests above again with bulk payouts enabled, since both
+    modes must produce identical results."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.payout = partial(self.payout, use_bulk_payout=True)  # type: ignore